@@ -315,7 +315,7 @@ class Notification(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['user', 'is_read']),
-            models.Index(fields=['user', 'created_at']),
+            models.Index(fields=['user', 'created_at', 'id'], name='notif_user_created_id_idx'),
             models.Index(fields=['notification_type']),
         ]
     
@@ -0,0 +1,110 @@
+"""
+Tests for keyset pagination of history endpoints.
+"""
+from datetime import date, timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.models import Notification, User
+from accounts.views import list_notifications
+from numerology.models import DailyReading
+from numerology.views import get_reading_history
+from utils.pagination import encode_cursor
+
+
+class KeysetPaginationTest(TestCase):
+    """Test cases for cursor walking, legacy pages and counts."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.factory = APIRequestFactory()
+        self.user = User.objects.create(email='reader@example.com', full_name='Reader')
+        for i in range(25):
+            Notification.objects.create(
+                user=self.user, title=f'Note {i}', message='Hello', notification_type='info'
+            )
+        # Several notifications share a timestamp so the id tiebreaker matters
+        base = timezone.now()
+        for i, notification in enumerate(Notification.objects.order_by('title')):
+            Notification.objects.filter(pk=notification.pk).update(created_at=base - timedelta(minutes=i // 4))
+
+    def _get(self, view, params=None):
+        request = self.factory.get('/api/v1/history/', params or {})
+        force_authenticate(request, user=self.user)
+        return view(request)
+
+    def test_cursors_walk_every_row_once_in_both_directions(self):
+        """Following next then previous cursors visits all rows in (timestamp, id) order."""
+        expected = [
+            str(pk) for pk in Notification.objects.order_by('-created_at', '-id').values_list('id', flat=True)
+        ]
+
+        pages, params = [], {'page_size': 7}
+        while True:
+            response = self._get(list_notifications, params)
+            self.assertEqual(response.status_code, 200)
+            pages.append([n['id'] for n in response.data['results']])
+            if not response.data['next_cursor']:
+                break
+            params = {'page_size': 7, 'cursor': response.data['next_cursor']}
+        self.assertEqual([len(page) for page in pages], [7, 7, 7, 4])
+        self.assertEqual(sum(pages, []), expected)
+        self.assertNotIn('count', response.data)
+        first = self._get(list_notifications, {'page_size': 7})
+        self.assertEqual(first.data['count'], 25)
+        self.assertNotIn('count', self._get(list_notifications, {'page_size': 7, 'count': 'none'}).data)
+
+        back = self._get(list_notifications, {'page_size': 7, 'cursor': response.data['previous_cursor']})
+        self.assertEqual([n['id'] for n in back.data['results']], pages[2])
+        self.assertIn('cursor=', back.data['next'])
+
+    def test_deep_pages_do_not_offset_or_count(self):
+        """A cursor page is a single bounded query with no OFFSET and no COUNT."""
+        last = Notification.objects.order_by('created_at', 'id').first()
+        newest_but_one = Notification.objects.order_by('-created_at', '-id')[1]
+        cursor = encode_cursor('next', newest_but_one.created_at.isoformat(), str(newest_but_one.pk))
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self._get(list_notifications, {'cursor': cursor, 'page_size': 100})
+        self.assertEqual(len(response.data['results']), 23)
+        self.assertEqual(response.data['results'][-1]['id'], str(last.pk))
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('OFFSET', queries[0]['sql'].upper())
+        self.assertNotIn('COUNT', queries[0]['sql'].upper())
+
+        response = self._get(list_notifications, {'count': 'approximate', 'page_size': 5})
+        self.assertEqual(response.data['count'], 25)
+
+    def test_legacy_pages_and_bad_cursors(self):
+        """?page= keeps offset semantics and totals; malformed cursors are a client error."""
+        for i in range(12):
+            DailyReading.objects.create(
+                user=self.user, reading_date=date(2026, 1, 1) + timedelta(days=i),
+                personal_day_number=1, lucky_number=1, lucky_color='Red', auspicious_time='9am',
+                activity_recommendation='Plan', warning='None', affirmation='Yes', actionable_tip='Go'
+            )
+
+        response = self._get(get_reading_history, {'page': 2, 'page_size': 5})
+        self.assertEqual(response.data['count'], 12)
+        self.assertEqual(response.data['page'], 2)
+        self.assertEqual(
+            [r['reading_date'] for r in response.data['results']],
+            [(date(2026, 1, 7) - timedelta(days=i)).isoformat() for i in range(5)]
+        )
+
+        response = self._get(get_reading_history, {'cursor': response.data['next_cursor'], 'page_size': 5})
+        self.assertEqual([r['reading_date'] for r in response.data['results']], ['2026-01-02', '2026-01-01'])
+        self.assertIsNone(response.data['next_cursor'])
+
+        response = self._get(get_reading_history, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+
+        # Decodes, but carries values that are not a date and a UUID
+        for value, pk in (('garbage', str(self.user.pk)), ('2026-01-02', 'garbage'), (None, None)):
+            response = self._get(get_reading_history, {'cursor': encode_cursor('next', value, pk)})
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.data['error']['details'], {'cursor': 'Invalid cursor.'})
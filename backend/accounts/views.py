@@ -5,7 +5,6 @@ from rest_framework import status, generics
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.throttling import UserRateThrottle
 from rest_framework_simplejwt.tokens import RefreshToken as JWTRefreshToken
 from django.utils import timezone
@@ -22,6 +21,7 @@ from .serializers import (
 )
 from .utils import generate_otp, send_otp_email, generate_secure_token, send_password_reset_email
 from utils.request_utils import get_client_ip
+from utils.pagination import KeysetPagination
 import os
 
 logger = logging.getLogger(__name__)
@@ -679,9 +679,8 @@ def list_notifications(request):
     from django.db import ProgrammingError, OperationalError
     
     try:
-        notifications = Notification.objects.filter(user=request.user).order_by('-created_at')
-        paginator = PageNumberPagination()
-        paginator.page_size = 20
+        notifications = Notification.objects.filter(user=request.user)
+        paginator = KeysetPagination('created_at', page_size=20)
         result_page = paginator.paginate_queryset(notifications, request)
         serializer = NotificationSerializer(result_page, many=True)
         return paginator.get_paginated_response(serializer.data)
@@ -690,9 +689,10 @@ def list_notifications(request):
         if 'does not exist' in error_msg or 'relation' in error_msg.lower():
             logger.warning(f"Notifications table missing in list_notifications: {error_msg}")
             # Return empty response gracefully
-            paginator = PageNumberPagination()
-            paginator.page_size = 20
-            return paginator.get_paginated_response([])
+            return Response({
+                'next': None, 'previous': None, 'next_cursor': None,
+                'previous_cursor': None, 'page_size': 20, 'count': 0, 'results': []
+            })
         raise
     except Exception as e:
         logger.error(f"Error listing notifications: {str(e)}")
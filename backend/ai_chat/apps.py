@@ -2,4 +2,7 @@ from django.apps import AppConfig
 
 class AiChatConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'ai_chat'
\ No newline at end of file
+    name = 'ai_chat'
+
+    def ready(self):
+        import ai_chat.signals  # noqa
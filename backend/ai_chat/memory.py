@@ -0,0 +1,242 @@
+"""
+Bounded-context conversation memory for the AI numerologist.
+
+Each prompt is assembled from three parts that together stay within a token
+budget:
+
+1. the system instructions plus the user's cached numerology profile,
+2. a running summary of older turns, compacted in the background,
+3. as many of the most recent raw turns as still fit.
+
+Older turns are folded into ``AIConversation.summary`` by the
+``summarize_conversation`` task once enough unsummarized messages pile up, so
+long conversations keep their context without resending the full history.
+"""
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from numerology.services.llm_gateway import get_llm_gateway
+from .models import AIConversation, AIMessage
+
+logger = logging.getLogger(__name__)
+
+# Prompt budget for system prompt + summary + recent turns + new message.
+DEFAULT_PROMPT_TOKEN_BUDGET = 1500
+# Raw turns always kept out of the summary so the model sees exact wording.
+RECENT_MESSAGES = 6
+# Summarize once this many messages sit outside the summary.
+SUMMARY_TRIGGER_MESSAGES = 12
+SUMMARY_MAX_TOKENS = 300
+
+PROFILE_CONTEXT_CACHE_TTL = 60 * 60  # 1 hour
+
+SYSTEM_GUIDELINES = """
+Guidelines:
+1. Always reference the user's specific numbers in your responses
+2. Provide actionable advice, not just descriptions
+3. Be empathetic and supportive
+4. Keep responses concise (150-200 words)
+5. Suggest 2-3 follow-up questions at the end
+6. Never make medical, legal, or financial advice
+7. If unsure, acknowledge limitations and suggest consulting a human expert
+8. Reference conversation history when relevant to provide continuity
+9. Adapt your communication style based on the user's numbers (e.g., be direct for 1s, diplomatic for 2s)
+10. Connect different numbers to show how they interact in the user's life
+"""
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count (~4 characters per token for English text)."""
+    if not text:
+        return 0
+    return len(text) // 4 + 1
+
+
+def get_prompt_token_budget() -> int:
+    return getattr(settings, 'AI_CHAT_PROMPT_TOKEN_BUDGET', DEFAULT_PROMPT_TOKEN_BUDGET)
+
+
+def _profile_context_key(user_id) -> str:
+    return f"ai_chat:profile_context:{user_id}"
+
+
+def get_profile_context(user) -> Optional[str]:
+    """
+    Return the numerology profile section of the system prompt.
+
+    The rendered text is cached per user and invalidated when the
+    numerology profile is saved. Returns None if the user has no profile.
+    """
+    key = _profile_context_key(user.id)
+    context = cache.get(key)
+    if context is not None:
+        return context
+
+    from numerology.models import NumerologyProfile
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+    except NumerologyProfile.DoesNotExist:
+        return None
+
+    # Get user's full name safely
+    user_full_name = "User"
+    if hasattr(user, 'full_name') and user.full_name:
+        user_full_name = user.full_name
+
+    context = f"""
+You are an expert numerologist with 20+ years of experience. You are helping {user_full_name} understand their numerology profile.
+
+User's Numerology Profile:
+- Life Path Number: {profile.life_path_number} - Represents your life's purpose and path
+- Destiny Number: {profile.destiny_number} - Reveals your talents and life's mission
+- Soul Urge Number: {profile.soul_urge_number} - Shows your inner motivations and desires
+- Personality Number: {profile.personality_number} - How others perceive you
+- Personal Year Number: {profile.personal_year_number} - Current year's theme and energy
+"""
+    # Add karmic debt information if present
+    if profile.karmic_debt_number:
+        context += f"- Karmic Debt Number: {profile.karmic_debt_number} - Lessons and challenges to overcome\n"
+    # Add hidden passion information if present
+    if profile.hidden_passion_number:
+        context += f"- Hidden Passion Number: {profile.hidden_passion_number} - Untapped talents and interests\n"
+
+    cache.set(key, context, PROFILE_CONTEXT_CACHE_TTL)
+    return context
+
+
+def invalidate_profile_context(user_id) -> None:
+    cache.delete(_profile_context_key(user_id))
+
+
+def _unsummarized_messages(conversation: AIConversation):
+    messages = AIMessage.objects.filter(conversation=conversation)
+    if conversation.summarized_through:
+        messages = messages.filter(created_at__gt=conversation.summarized_through)
+    return messages
+
+
+def build_chat_messages(
+    conversation: AIConversation,
+    profile_context: str,
+    user_message: str,
+    token_budget: Optional[int] = None,
+) -> Tuple[List[Dict[str, str]], int]:
+    """
+    Assemble the LLM messages for a turn within ``token_budget``.
+
+    The system prompt and the new user message are always included. The
+    running summary is included next, then recent turns newest-first until
+    the budget is spent. The new user message must already be saved; it is
+    excluded from the history so it is not sent twice.
+
+    Returns ``(messages, estimated_prompt_tokens)``.
+    """
+    budget = token_budget or get_prompt_token_budget()
+
+    system_prompt = profile_context + SYSTEM_GUIDELINES
+    if conversation.summary:
+        system_prompt += f"\nSummary of the earlier conversation:\n{conversation.summary}\n"
+
+    used = estimate_tokens(system_prompt) + estimate_tokens(user_message)
+
+    recent = list(
+        _unsummarized_messages(conversation).order_by('-created_at')[:RECENT_MESSAGES + 1]
+    )
+    # Drop the message being answered; it is appended last below.
+    if recent and recent[0].role == 'user' and recent[0].content == user_message:
+        recent = recent[1:]
+
+    history = []
+    for msg in recent[:RECENT_MESSAGES]:
+        cost = estimate_tokens(msg.content)
+        if used + cost > budget:
+            break
+        history.append({'role': msg.role, 'content': msg.content})
+        used += cost
+    history.reverse()
+
+    messages = [{'role': 'system', 'content': system_prompt}]
+    messages.extend(history)
+    messages.append({'role': 'user', 'content': user_message})
+    return messages, used
+
+
+def needs_summary(conversation: AIConversation) -> bool:
+    """True when enough turns sit outside the summary to compact them."""
+    return _unsummarized_messages(conversation).count() >= SUMMARY_TRIGGER_MESSAGES
+
+
+def _fallback_summary(previous: str, messages: List[AIMessage]) -> str:
+    """Extractive summary used when the LLM is unavailable."""
+    lines = [previous] if previous else []
+    for msg in messages:
+        speaker = "User" if msg.role == 'user' else "Numerologist"
+        first_sentence = msg.content.strip().split('\n')[0].split('. ')[0]
+        lines.append(f"{speaker}: {first_sentence[:160]}")
+    summary = '\n'.join(lines)
+    # Keep the newest material when trimming to the size limit.
+    max_chars = SUMMARY_MAX_TOKENS * 4
+    return summary[-max_chars:]
+
+
+def _llm_summary(previous: str, messages: List[AIMessage]) -> Tuple[str, int]:
+    transcript = '\n'.join(
+        f"{'User' if msg.role == 'user' else 'Numerologist'}: {msg.content}"
+        for msg in messages
+    )
+    prompt = (
+        "Update the running summary of a numerology consultation. Keep the user's "
+        "questions, concerns, decisions and any advice already given. Write at most "
+        f"{SUMMARY_MAX_TOKENS // 2} words.\n\n"
+        f"Current summary:\n{previous or '(none)'}\n\nNew turns:\n{transcript}"
+    )
+    response = get_llm_gateway('openai').chat_completion(
+        'chat_summary',
+        model="gpt-4",
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=SUMMARY_MAX_TOKENS,
+        temperature=0.2,
+    )
+    tokens_used = response.usage.total_tokens if response.usage else 0
+    return (response.choices[0].message.content or '').strip(), tokens_used
+
+
+def summarize_conversation(conversation_id) -> bool:
+    """
+    Fold all but the most recent turns into the conversation summary.
+
+    The LLM call runs outside the row lock; the result is only written if no
+    other worker advanced the summary in the meantime. Returns True if the
+    summary was updated.
+    """
+    try:
+        conversation = AIConversation.objects.get(id=conversation_id)
+    except AIConversation.DoesNotExist:
+        return False
+
+    pending = list(_unsummarized_messages(conversation).order_by('created_at'))
+    to_compact = pending[:-RECENT_MESSAGES] if len(pending) > RECENT_MESSAGES else []
+    if not to_compact:
+        return False
+
+    try:
+        summary, tokens_used = _llm_summary(conversation.summary, to_compact)
+    except Exception as e:
+        logger.warning(f'Falling back to extractive summary for conversation {conversation_id}: {str(e)}')
+        summary, tokens_used = '', 0
+    if not summary:
+        summary = _fallback_summary(conversation.summary, to_compact)
+
+    with transaction.atomic():
+        locked = AIConversation.objects.select_for_update().get(id=conversation_id)
+        if locked.summarized_through != conversation.summarized_through:
+            return False
+        locked.summary = summary
+        locked.summarized_through = to_compact[-1].created_at
+        locked.summary_tokens_used += tokens_used
+        locked.save(update_fields=['summary', 'summarized_through', 'summary_tokens_used'])
+    return True
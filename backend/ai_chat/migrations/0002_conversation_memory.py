@@ -0,0 +1,38 @@
+# Generated by Django 4.2.16 on 2026-10-18 22:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_chat', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aiconversation',
+            name='summarized_through',
+            field=models.DateTimeField(blank=True, help_text='Created time of the last message folded into the summary', null=True),
+        ),
+        migrations.AddField(
+            model_name='aiconversation',
+            name='summary',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='aiconversation',
+            name='summary_tokens_used',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='aimessage',
+            name='completion_tokens',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='aimessage',
+            name='prompt_tokens',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+    ]
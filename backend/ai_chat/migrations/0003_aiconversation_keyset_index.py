@@ -0,0 +1,17 @@
+# Composite (owner, timestamp, id) index backing keyset pagination
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_chat', '0002_conversation_memory'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='aiconversation',
+            index=models.Index(fields=['user', 'started_at', 'id'], name='ai_conv_user_started_id_idx'),
+        ),
+    ]
@@ -15,11 +15,19 @@ class AIConversation(models.Model):
     message_count = models.IntegerField(default=0)
     is_active = models.BooleanField(default=True)
     
+    # Rolling memory: older turns compacted into a running summary
+    summary = models.TextField(blank=True, default='')
+    summarized_through = models.DateTimeField(null=True, blank=True, help_text="Created time of the last message folded into the summary")
+    summary_tokens_used = models.IntegerField(default=0)
+    
     class Meta:
         db_table = 'ai_conversations'
         verbose_name = 'AI Conversation'
         verbose_name_plural = 'AI Conversations'
         ordering = ['-started_at']
+        indexes = [
+            models.Index(fields=['user', 'started_at', 'id'], name='ai_conv_user_started_id_idx'),
+        ]
     
     def __str__(self):
         return f"AI Conversation with {self.user} started at {self.started_at}"
@@ -38,6 +46,8 @@ class AIMessage(models.Model):
     role = models.CharField(max_length=20, choices=ROLE_CHOICES)
     content = models.TextField()
     tokens_used = models.IntegerField(null=True, blank=True)
+    prompt_tokens = models.IntegerField(null=True, blank=True)
+    completion_tokens = models.IntegerField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
@@ -22,7 +22,8 @@ class AIMessageSerializer(serializers.ModelSerializer):
     class Meta:
         model = AIMessage
         fields = [
-            'id', 'conversation', 'role', 'content', 'tokens_used', 'created_at'
+            'id', 'conversation', 'role', 'content', 'tokens_used',
+            'prompt_tokens', 'completion_tokens', 'created_at'
         ]
         read_only_fields = ['id', 'created_at']
 
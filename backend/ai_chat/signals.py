@@ -0,0 +1,14 @@
+"""
+Signals for ai_chat app.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from numerology.models import NumerologyProfile
+from .memory import invalidate_profile_context
+
+
+@receiver(post_save, sender=NumerologyProfile)
+@receiver(post_delete, sender=NumerologyProfile)
+def invalidate_chat_profile_context(sender, instance, **kwargs):
+    """Drop the cached prompt profile section when the profile changes."""
+    invalidate_profile_context(instance.user_id)
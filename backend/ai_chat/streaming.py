@@ -0,0 +1,59 @@
+"""
+Token streaming for the AI numerologist chat.
+
+Completions are streamed through the shared LLM gateway's async client
+and relayed to the browser as Server-Sent Events while they arrive.
+"""
+import json
+import logging
+from django.core.serializers.json import DjangoJSONEncoder
+
+logger = logging.getLogger(__name__)
+
+
+def format_sse(event, data):
+    """Encode one Server-Sent Event frame."""
+    return f"event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n"
+
+
+class StreamResult:
+    """Text and token usage accumulated while a completion streams."""
+
+    def __init__(self):
+        self.parts = []
+        self.usage = {}
+        self.finished = False
+
+    @property
+    def content(self):
+        return ''.join(self.parts)
+
+
+async def stream_chat_completion(gateway, messages, result, model, max_tokens, temperature):
+    """
+    Yield content deltas from a streamed chat completion.
+
+    Deltas and the final usage block are also recorded on ``result`` so the
+    caller can persist the reply even if the consumer stops iterating early.
+    """
+    stream = gateway.astream_chat_completion(
+        'chat_stream',
+        model=model,
+        messages=messages,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        stream_options={'include_usage': True},
+    )
+    try:
+        async for chunk in stream:
+            if chunk.usage:
+                result.usage = chunk.usage.model_dump()
+            for choice in chunk.choices:
+                delta = choice.delta.content if choice.delta else None
+                if delta:
+                    result.parts.append(delta)
+                    yield delta
+        result.finished = True
+    finally:
+        # Release the upstream connection when the client goes away.
+        await stream.aclose()
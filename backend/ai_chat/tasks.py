@@ -0,0 +1,20 @@
+"""
+Celery tasks for ai_chat application.
+"""
+from celery import shared_task
+from .memory import summarize_conversation as compact_conversation
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def summarize_conversation(conversation_id):
+    """
+    Compact older turns of a conversation into its running summary.
+    Queued after a reply once enough unsummarized messages accumulate.
+    """
+    updated = compact_conversation(conversation_id)
+    if updated:
+        logger.info(f'Updated summary for AI conversation {conversation_id}')
+    return updated
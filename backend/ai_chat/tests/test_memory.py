@@ -0,0 +1,99 @@
+"""
+Unit tests for bounded-context AI chat memory.
+"""
+import os
+from unittest import mock
+from django.core.cache import cache
+from django.test import TestCase
+from accounts.models import User
+from ai_chat.memory import (
+    RECENT_MESSAGES,
+    build_chat_messages,
+    estimate_tokens,
+    get_profile_context,
+    needs_summary,
+    summarize_conversation,
+)
+from ai_chat.models import AIConversation, AIMessage
+from numerology.models import NumerologyProfile
+
+
+class ConversationMemoryTests(TestCase):
+    """Test cases for prompt assembly and summarization."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        cache.clear()
+        self.user = User.objects.create(email='memory@example.com', full_name='Memory User')
+        self.profile, _ = NumerologyProfile.objects.update_or_create(user=self.user, defaults={
+            'life_path_number': 7, 'destiny_number': 3, 'soul_urge_number': 5,
+            'personality_number': 1, 'attitude_number': 2, 'maturity_number': 1,
+            'balance_number': 4, 'personal_year_number': 9, 'personal_month_number': 6,
+        })
+        self.conversation = AIConversation.objects.create(user=self.user)
+
+        patcher = mock.patch.dict(os.environ, {'OPENAI_API_KEY': ''})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _add_turns(self, count, length=400):
+        for i in range(count):
+            AIMessage.objects.create(
+                conversation=self.conversation,
+                role='user' if i % 2 == 0 else 'assistant',
+                content=f'Turn {i}. ' + 'x' * length,
+            )
+
+    def test_prompt_stays_within_budget(self):
+        """Recent turns are dropped oldest-first once the budget is spent."""
+        self._add_turns(20)
+        context = get_profile_context(self.user)
+
+        messages, prompt_tokens = build_chat_messages(
+            self.conversation, context, 'What next?', token_budget=700
+        )
+
+        self.assertLessEqual(prompt_tokens, 700)
+        self.assertEqual(messages[0]['role'], 'system')
+        self.assertEqual(messages[-1], {'role': 'user', 'content': 'What next?'})
+        # The newest stored turn is kept, older ones are not.
+        self.assertTrue(messages[-2]['content'].startswith('Turn 19.'))
+        self.assertLess(len(messages) - 2, RECENT_MESSAGES)
+
+    def test_summary_replaces_compacted_turns(self):
+        """Older turns move into the summary instead of being resent verbatim."""
+        self._add_turns(20)
+        context = get_profile_context(self.user)
+        full_history_tokens = estimate_tokens(context) + sum(
+            estimate_tokens(msg.content) for msg in AIMessage.objects.all()
+        )
+        self.assertTrue(needs_summary(self.conversation))
+
+        # No API key configured: falls back to the extractive summary.
+        self.assertTrue(summarize_conversation(self.conversation.id))
+        self.conversation.refresh_from_db()
+
+        self.assertIn('Turn 0', self.conversation.summary)
+        self.assertFalse(needs_summary(self.conversation))
+        messages, after_tokens = build_chat_messages(
+            self.conversation, context, 'What next?', token_budget=100000
+        )
+        self.assertIn('Summary of the earlier conversation', messages[0]['content'])
+        self.assertEqual(len(messages) - 2, RECENT_MESSAGES)
+        self.assertLess(after_tokens, full_history_tokens / 2)
+
+    def test_profile_context_cached_and_invalidated(self):
+        """The rendered profile is cached until the profile is saved again."""
+        self.assertIn('Life Path Number: 7', get_profile_context(self.user))
+
+        with self.assertNumQueries(0):
+            get_profile_context(self.user)
+
+        self.profile.life_path_number = 4
+        self.profile.save()
+        self.assertIn('Life Path Number: 4', get_profile_context(self.user))
+
+    def test_estimate_tokens(self):
+        """Token estimates grow with text length."""
+        self.assertEqual(estimate_tokens(''), 0)
+        self.assertGreater(estimate_tokens('x' * 400), estimate_tokens('x' * 40))
@@ -0,0 +1,187 @@
+"""
+Unit tests for streamed AI chat responses against a local fake LLM server.
+"""
+import asyncio
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.test import TestCase, AsyncRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.models import User
+from ai_chat import views
+from ai_chat.models import AIMessage
+from ai_chat.views import ai_chat_stream
+from numerology.models import NumerologyProfile
+from numerology.services import llm_gateway
+
+FAKE_TOKENS = ['Your ', 'Life ', 'Path ', '7 ', 'favours ', 'reflection.']
+
+
+class FakeStreamingLLMHandler(BaseHTTPRequestHandler):
+    """Serves OpenAI-compatible streamed chat completions."""
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = json.loads(self.rfile.read(length))
+        self.server.requests.append(body)
+        stall = 'slow' in body['messages'][-1]['content']
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.end_headers()
+        for index, token in enumerate(FAKE_TOKENS):
+            if stall and index == 2:
+                # Hold the stream open until the test has disconnected.
+                self.server.release.wait(timeout=5)
+            self._send_chunk({
+                'index': 0,
+                'delta': {'role': 'assistant', 'content': token} if index == 0 else {'content': token},
+                'finish_reason': None,
+            })
+        self._send_chunk({'index': 0, 'delta': {}, 'finish_reason': 'stop'})
+        self._send_event({
+            'id': 'chatcmpl-test', 'object': 'chat.completion.chunk', 'created': 0,
+            'model': 'gpt-4', 'choices': [],
+            'usage': {'prompt_tokens': 40, 'completion_tokens': 6, 'total_tokens': 46},
+        })
+        self.wfile.write(b'data: [DONE]\n\n')
+
+    def _send_chunk(self, choice):
+        self._send_event({
+            'id': 'chatcmpl-test', 'object': 'chat.completion.chunk', 'created': 0,
+            'model': 'gpt-4', 'choices': [choice],
+        })
+
+    def _send_event(self, payload):
+        self.wfile.write(f'data: {json.dumps(payload)}\n\n'.encode())
+        self.wfile.flush()
+
+    def log_message(self, *args):
+        pass
+
+
+def parse_events(frames):
+    events = []
+    for frame in ''.join(frames).strip().split('\n\n'):
+        lines = dict(line.split(': ', 1) for line in frame.split('\n'))
+        events.append((lines['event'], json.loads(lines['data'])))
+    return events
+
+
+class AIChatStreamingTests(TestCase):
+    """Test cases for the streaming chat view."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), FakeStreamingLLMHandler)
+        cls.server.requests = []
+        cls.server.release = threading.Event()
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.user = User.objects.create(email='stream@example.com', full_name='Stream User')
+        NumerologyProfile.objects.update_or_create(user=self.user, defaults={
+            'life_path_number': 7, 'destiny_number': 3, 'soul_urge_number': 5,
+            'personality_number': 1, 'attitude_number': 2, 'maturity_number': 1,
+            'balance_number': 4, 'personal_year_number': 9, 'personal_month_number': 6,
+        })
+        self.token = str(AccessToken.for_user(self.user))
+
+        env = {
+            'OPENAI_API_KEY': 'test-key',
+            'OPENAI_BASE_URL': f'http://127.0.0.1:{self.server.server_port}/v1',
+        }
+        patcher = mock.patch.dict(os.environ, env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        llm_gateway.reset_gateways()
+        self.addCleanup(llm_gateway.reset_gateways)
+
+    def _request(self, message='What does my life path mean?'):
+        return AsyncRequestFactory().post(
+            '/api/v1/ai/chat/stream/',
+            data=json.dumps({'message': message}),
+            content_type='application/json',
+            headers={'Authorization': f'Bearer {self.token}'},
+        )
+
+    async def test_stream_relays_tokens_and_persists_reply(self):
+        """Tokens arrive as separate events and the full reply is saved at the end."""
+        response = await ai_chat_stream(self._request())
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+
+        frames = [frame async for frame in response.streaming_content]
+        events = parse_events([frame.decode() for frame in frames])
+
+        self.assertEqual(events[0][0], 'start')
+        tokens = [data['content'] for name, data in events if name == 'token']
+        self.assertEqual(tokens, FAKE_TOKENS)
+        self.assertEqual(events[-1][0], 'done')
+        self.assertEqual(events[-1][1]['content'], ''.join(FAKE_TOKENS))
+        self.assertEqual(events[-1][1]['tokens_used'], 46)
+
+        reply = await sync_to_async(AIMessage.objects.get)(role='assistant')
+        self.assertEqual(reply.content, ''.join(FAKE_TOKENS))
+        self.assertTrue(self.server.requests[-1]['stream'])
+
+    async def test_disconnect_persists_partial_reply(self):
+        """A client that goes away mid-stream still leaves the partial reply saved."""
+        response = await ai_chat_stream(self._request('slow answer please'))
+        received = []
+
+        async def consume():
+            async for frame in response.streaming_content:
+                received.append(frame)
+
+        # Cancelling the consumer is how the ASGI handler reacts to a disconnect.
+        task = asyncio.create_task(consume())
+        while len(received) < 3:  # start + two tokens
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.server.release.set()
+
+        reply = await sync_to_async(AIMessage.objects.get)(role='assistant')
+        self.assertEqual(reply.content, ''.join(FAKE_TOKENS[:2]))
+
+    async def test_failure_after_save_persists_reply_once(self):
+        """An error raised after the reply was saved does not save it again."""
+        complete_chat_turn = views._complete_chat_turn
+
+        def save_then_fail(*args):
+            complete_chat_turn(*args)
+            raise RuntimeError('usage update failed')
+
+        with mock.patch.object(views, '_complete_chat_turn', save_then_fail):
+            response = await ai_chat_stream(self._request())
+            frames = [frame async for frame in response.streaming_content]
+
+        events = parse_events([frame.decode() for frame in frames])
+        self.assertEqual(events[-1][0], 'error')
+        replies = await sync_to_async(list)(AIMessage.objects.filter(role='assistant'))
+        self.assertEqual([reply.content for reply in replies], [''.join(FAKE_TOKENS)])
+
+    async def test_requires_authentication(self):
+        """Requests without a bearer token are rejected before calling the LLM."""
+        request = AsyncRequestFactory().post(
+            '/api/v1/ai/chat/stream/',
+            data=json.dumps({'message': 'hi'}),
+            content_type='application/json',
+        )
+        response = await ai_chat_stream(request)
+        self.assertEqual(response.status_code, 401)
@@ -9,6 +9,7 @@ app_name = 'ai_chat'
 urlpatterns = [
     # AI Chat endpoints
     path('ai/chat/', views.ai_chat, name='ai-chat'),
+    path('ai/chat/stream/', views.ai_chat_stream, name='ai-chat-stream'),
     path('ai/conversations/', views.get_conversations, name='ai-conversations'),
     path('ai/conversations/<uuid:conversation_id>/messages/', views.get_conversation_messages, name='ai-conversation-messages'),
     # AI Co-Pilot endpoints
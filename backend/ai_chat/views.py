@@ -5,33 +5,115 @@ from rest_framework import status, generics
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from asgiref.sync import sync_to_async
 from django.utils import timezone
-from django.http import HttpResponse
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.views.decorators.csrf import csrf_exempt
 from datetime import timedelta, date, datetime
 from .models import AIConversation, AIMessage
 from .serializers import (
     AIConversationSerializer, AIMessageSerializer, ChatMessageSerializer
 )
+from .memory import build_chat_messages, get_profile_context, needs_summary
+from .streaming import StreamResult, format_sse, stream_chat_completion
+from numerology.services.llm_gateway import get_llm_gateway
 from utils.activity_logger import log_user_activity
-from openai import OpenAI
+from utils.pagination import KeysetPagination
+import asyncio
+import json
 import os
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-# Lazy initialization of OpenAI client
-_openai_client = None
+CHAT_MODEL = "gpt-4"
+CHAT_MAX_TOKENS = 500
+CHAT_TEMPERATURE = 0.7
 
-def get_openai_client():
-    """Get or create OpenAI client instance."""
-    global _openai_client
-    if _openai_client is None:
-        api_key = os.getenv('OPENAI_API_KEY')
-        if not api_key:
-            raise ValueError('OPENAI_API_KEY environment variable is not set')
-        _openai_client = OpenAI(api_key=api_key)
-    return _openai_client
+
+def _check_chat_rate_limit(user):
+    """Return True if the user may send another message (20/hour for free users)."""
+    if user.subscription_plan != 'free':
+        return True
+    one_hour_ago = timezone.now() - timedelta(hours=1)
+    message_count = AIMessage.objects.filter(
+        conversation__user=user,
+        created_at__gte=one_hour_ago
+    ).count()
+    return message_count < 20
+
+
+def _prepare_chat_turn(user, user_message):
+    """
+    Store the user's message and build the LLM prompt for this turn.
+    
+    The prompt combines the cached numerology profile, the conversation's
+    running summary and the most recent turns within the token budget.
+    
+    Returns ``(conversation, messages, error)``. ``error`` is a
+    ``(payload, status_code)`` tuple when the turn cannot proceed.
+    """
+    profile_context = get_profile_context(user)
+    if profile_context is None:
+        return None, None, ({
+            'error': 'Please complete your numerology profile first.'
+        }, status.HTTP_400_BAD_REQUEST)
+    
+    # Get or create conversation
+    conversation, created = AIConversation.objects.get_or_create(
+        user=user,
+        is_active=True,
+        defaults={'started_at': timezone.now()}
+    )
+    
+    # Create user message
+    AIMessage.objects.create(
+        conversation=conversation,
+        role='user',
+        content=user_message
+    )
+    
+    messages, _ = build_chat_messages(conversation, profile_context, user_message)
+    return conversation, messages, None
+
+
+def _complete_chat_turn(user, conversation, ai_response, usage):
+    """
+    Persist the assistant reply and update conversation metadata.
+    
+    ``usage`` is a dict with ``prompt_tokens``, ``completion_tokens`` and
+    ``total_tokens`` as reported by the provider.
+    """
+    tokens_used = usage.get('total_tokens', 0)
+    ai_msg = AIMessage.objects.create(
+        conversation=conversation,
+        role='assistant',
+        content=ai_response or "",
+        tokens_used=tokens_used,
+        prompt_tokens=usage.get('prompt_tokens'),
+        completion_tokens=usage.get('completion_tokens'),
+    )
+    
+    # Update conversation metadata
+    conversation.last_message_at = timezone.now()
+    conversation.message_count = conversation.messages.count()
+    conversation.save(update_fields=['last_message_at', 'message_count'])
+    
+    # Compact older turns in the background
+    if needs_summary(conversation):
+        from .tasks import summarize_conversation
+        summarize_conversation.delay(str(conversation.id))
+    
+    # Log activity
+    log_user_activity(user, 'ai_chat_used', {
+        'conversation_id': str(conversation.id),
+        'tokens_used': tokens_used,
+        'prompt_tokens': usage.get('prompt_tokens'),
+    })
+    return ai_msg
 
 
 @api_view(['POST'])
@@ -48,125 +130,25 @@ def ai_chat(request):
     user_message = serializer.validated_data['message']  # type: ignore
     
     # Check rate limit (20 messages per hour for free users)
-    if user.subscription_plan == 'free':
-        one_hour_ago = timezone.now() - timedelta(hours=1)
-        message_count = AIMessage.objects.filter(
-            conversation__user=user,
-            created_at__gte=one_hour_ago
-        ).count()
-        
-        if message_count >= 20:
-            return Response({
-                'error': 'Rate limit exceeded. You can send 20 messages per hour.'
-            }, status=status.HTTP_429_TOO_MANY_REQUESTS)
+    if not _check_chat_rate_limit(user):
+        return Response({
+            'error': 'Rate limit exceeded. You can send 20 messages per hour.'
+        }, status=status.HTTP_429_TOO_MANY_REQUESTS)
     
     try:
-        # Get or create conversation
-        conversation, created = AIConversation.objects.get_or_create(
-            user=user,
-            is_active=True,
-            defaults={'started_at': timezone.now()}
-        )
-        
-        if not created and conversation.message_count >= 50:
-            # Start a new conversation if current one is too long
-            conversation.is_active = False
-            conversation.save()
-            conversation = AIConversation.objects.create(
-                user=user,
-                started_at=timezone.now()
-            )
-        
-        # Create user message
-        user_msg = AIMessage.objects.create(
-            conversation=conversation,
-            role='user',
-            content=user_message
-        )
+        conversation, messages, error = _prepare_chat_turn(user, user_message)
+        if error:
+            payload, error_status = error
+            return Response(payload, status=error_status)
         
-        # Get user's numerology profile
+        # Call OpenAI API through the shared gateway (timeouts, retries, circuit breaker)
         try:
-            from numerology.models import NumerologyProfile
-            numerology_profile = NumerologyProfile.objects.get(user=user)
-            life_path = numerology_profile.life_path_number
-            destiny = numerology_profile.destiny_number
-            soul_urge = numerology_profile.soul_urge_number
-            personality = numerology_profile.personality_number
-            personal_year = numerology_profile.personal_year_number
-            
-            # Get additional numerology numbers for richer context
-            karmic_debt = getattr(numerology_profile, 'karmic_debt_number', None)
-            hidden_passion = getattr(numerology_profile, 'hidden_passion_number', None)
-        except NumerologyProfile.DoesNotExist:
-            return Response({
-                'error': 'Please complete your numerology profile first.'
-            }, status=status.HTTP_400_BAD_REQUEST)
-        
-        # Get recent conversation history for context
-        recent_messages = AIMessage.objects.filter(
-            conversation=conversation
-        ).order_by('-created_at')[:5]  # Last 5 messages
-        
-        conversation_history = ""
-        for msg in reversed(recent_messages):
-            role = "You" if msg.role == "user" else "Numerologist"
-            conversation_history += f"{role}: {msg.content}\n"
-        
-        # Get user's full name safely
-        user_full_name = "User"
-        if hasattr(user, 'full_name') and user.full_name:
-            user_full_name = user.full_name
-        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
-            user_full_name = user.profile.full_name
-        
-        # Prepare system prompt with enhanced context
-        system_prompt = f"""
-        You are an expert numerologist with 20+ years of experience. You are helping {user_full_name} understand their numerology profile.
-        
-        User's Numerology Profile:
-        - Life Path Number: {life_path} - Represents your life's purpose and path
-        - Destiny Number: {destiny} - Reveals your talents and life's mission
-        - Soul Urge Number: {soul_urge} - Shows your inner motivations and desires
-        - Personality Number: {personality} - How others perceive you
-        - Personal Year Number: {personal_year} - Current year's theme and energy
-        
-        """
-        
-        # Add karmic debt information if present
-        if karmic_debt:
-            system_prompt += f"- Karmic Debt Number: {karmic_debt} - Lessons and challenges to overcome\n"
-        
-        # Add hidden passion information if present
-        if hidden_passion:
-            system_prompt += f"- Hidden Passion Number: {hidden_passion} - Untapped talents and interests\n"
-        
-        system_prompt += """
-        Guidelines:
-        1. Always reference the user's specific numbers in your responses
-        2. Provide actionable advice, not just descriptions
-        3. Be empathetic and supportive
-        4. Keep responses concise (150-200 words)
-        5. Suggest 2-3 follow-up questions at the end
-        6. Never make medical, legal, or financial advice
-        7. If unsure, acknowledge limitations and suggest consulting a human expert
-        8. Reference conversation history when relevant to provide continuity
-        9. Adapt your communication style based on the user's numbers (e.g., be direct for 1s, diplomatic for 2s)
-        10. Connect different numbers to show how they interact in the user's life
-        
-        Conversation History:
-        """ + conversation_history
-        
-        # Call OpenAI API
-        try:
-            client = get_openai_client()
-            response = client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message}
-                ],
-                max_tokens=500,
-                temperature=0.7
+            response = get_llm_gateway('openai').chat_completion(
+                'chat',
+                model=CHAT_MODEL,
+                messages=messages,
+                max_tokens=CHAT_MAX_TOKENS,
+                temperature=CHAT_TEMPERATURE
             )
         except ValueError as ve:
             # API key not set
@@ -182,30 +164,9 @@ def ai_chat(request):
         
         ai_response = response.choices[0].message.content
         # Handle case where usage might be None
-        tokens_used = response.usage.total_tokens if response.usage else 0
+        usage = response.usage.model_dump() if response.usage else {}
         
-        # Handle case where ai_response is None
-        if ai_response is None:
-            ai_response = ""
-        
-        # Create AI message
-        ai_msg = AIMessage.objects.create(
-            conversation=conversation,
-            role='assistant',
-            content=ai_response,
-            tokens_used=tokens_used
-        )
-        
-        # Update conversation metadata
-        conversation.last_message_at = timezone.now()
-        conversation.message_count = conversation.messages.count()
-        conversation.save()
-        
-        # Log activity
-        log_user_activity(user, 'ai_chat_used', {
-            'conversation_id': str(conversation.id),
-            'tokens_used': tokens_used
-        })
+        ai_msg = _complete_chat_turn(user, conversation, ai_response, usage)
         
         serializer = AIMessageSerializer(ai_msg)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -219,32 +180,113 @@ def ai_chat(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+def _authenticate_stream_request(request):
+    """Resolve the user from the request's JWT bearer token."""
+    try:
+        auth = JWTAuthentication().authenticate(request)
+    except AuthenticationFailed:
+        return None
+    return auth[0] if auth else None
+
+
+@csrf_exempt
+async def ai_chat_stream(request):
+    """
+    Chat with AI numerologist, streaming the reply as Server-Sent Events.
+    
+    POST /api/v1/ai/chat/stream/
+    
+    Emits a ``start`` event with the conversation id, one ``token`` event per
+    content delta and a ``done`` event carrying the saved message. The reply
+    is persisted once the stream completes; if the client disconnects or the
+    provider fails mid-stream, the text generated so far is saved instead.
+    """
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=status.HTTP_405_METHOD_NOT_ALLOWED)
+    
+    user = await sync_to_async(_authenticate_stream_request)(request)
+    if user is None:
+        return JsonResponse({
+            'detail': 'Authentication credentials were not provided.'
+        }, status=status.HTTP_401_UNAUTHORIZED)
+    
+    try:
+        data = json.loads(request.body or b'{}')
+    except ValueError:
+        return JsonResponse({'error': 'Invalid JSON body'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    serializer = ChatMessageSerializer(data=data)
+    if not serializer.is_valid():
+        return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    user_message = serializer.validated_data['message']  # type: ignore
+    
+    if not await sync_to_async(_check_chat_rate_limit)(user):
+        return JsonResponse({
+            'error': 'Rate limit exceeded. You can send 20 messages per hour.'
+        }, status=status.HTTP_429_TOO_MANY_REQUESTS)
+    
+    gateway = get_llm_gateway('openai')
+    if not gateway.is_configured():
+        return JsonResponse({
+            'error': 'OpenAI API key is not configured. Please contact support.'
+        }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+    
+    conversation, messages, error = await sync_to_async(_prepare_chat_turn)(user, user_message)
+    if error:
+        payload, error_status = error
+        return JsonResponse(payload, status=error_status)
+    
+    async def event_stream():
+        result = StreamResult()
+        saved = False
+        yield format_sse('start', {'conversation_id': str(conversation.id)})
+        try:
+            async for delta in stream_chat_completion(
+                gateway, messages, result,
+                model=CHAT_MODEL,
+                max_tokens=CHAT_MAX_TOKENS,
+                temperature=CHAT_TEMPERATURE,
+            ):
+                yield format_sse('token', {'content': delta})
+            
+            # Set before awaiting: the save runs on to completion in its
+            # thread even if this task is cancelled or the save raises late.
+            saved = True
+            ai_msg = await sync_to_async(_complete_chat_turn)(
+                user, conversation, result.content, result.usage
+            )
+            yield format_sse('done', AIMessageSerializer(ai_msg).data)
+        except Exception as openai_error:
+            logger.error(f'OpenAI streaming error for user {user.id}: {str(openai_error)}')
+            yield format_sse('error', {
+                'error': 'AI service is temporarily unavailable. Please try again later.'
+            })
+        finally:
+            if not saved and result.parts:
+                # Client disconnected or the provider failed mid-stream;
+                # keep the text the user has already seen.
+                await asyncio.shield(sync_to_async(_complete_chat_turn)(
+                    user, conversation, result.content, result.usage
+                ))
+    
+    response = StreamingHttpResponse(event_stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # Disable buffering in nginx
+    return response
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def get_conversations(request):
-    """Get user's AI conversations."""
+    """Get user's AI conversations, newest first, with keyset pagination."""
     user = request.user
     
-    # Get pagination params
-    page = int(request.query_params.get('page', 1))
-    page_size = int(request.query_params.get('page_size', 10))
-    
-    # Get conversations
-    conversations = AIConversation.objects.filter(user=user).order_by('-started_at')
-    
-    # Paginate
-    start = (page - 1) * page_size
-    end = start + page_size
-    paginated_conversations = conversations[start:end]
+    conversations = AIConversation.objects.filter(user=user)
     
-    serializer = AIConversationSerializer(paginated_conversations, many=True)
-    
-    return Response({
-        'count': conversations.count(),
-        'page': page,
-        'page_size': page_size,
-        'results': serializer.data
-    }, status=status.HTTP_200_OK)
+    paginator = KeysetPagination('started_at')
+    page = paginator.paginate_queryset(conversations, request)
+    serializer = AIConversationSerializer(page, many=True)
+    return paginator.get_paginated_response(serializer.data)
 
 
 @api_view(['GET'])
@@ -10,6 +10,7 @@ from .models import (
     ABTest, ConversionFunnel, BusinessMetric
 )
 from accounts.models import User
+from utils.db_routing import replica_db
 import logging
 
 logger = logging.getLogger(__name__)
@@ -92,6 +93,7 @@ def track_event(user, event_name, event_category='engagement', event_properties=
         return None
 
 
+@replica_db()
 def get_user_behavior_metrics(user, days=30):
     """
     Get user behavior metrics for a specific user.
@@ -135,6 +137,7 @@ def get_user_behavior_metrics(user, days=30):
     }
 
 
+@replica_db()
 def get_conversion_funnel_metrics(funnel_name, days=30):
     """
     Get conversion funnel metrics.
@@ -190,6 +193,7 @@ def get_conversion_funnel_metrics(funnel_name, days=30):
     }
 
 
+@replica_db()
 def get_business_metrics(days=30, metric_category=None):
     """
     Get aggregated business metrics.
@@ -253,6 +257,7 @@ def get_business_metrics(days=30, metric_category=None):
     }
 
 
+@replica_db()
 def get_ab_test_results(experiment_id):
     """
     Get A/B test results.
@@ -254,4 +254,10 @@ PYTHON_SCRIPT
 echo "Collecting static files..."
 python manage.py collectstatic --no-input
 
+echo "Building birth-date feature table..."
+python manage.py build_date_features
+
+echo "Building encyclopedia retrieval index..."
+python manage.py ingest_numerology_encyclopedia
+
 echo "Build completed successfully!"
\ No newline at end of file
@@ -0,0 +1,19 @@
+# Chat message timestamps are assigned when the message is received
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultations', '0002_expertapplication_expertavailability_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='expertchatmessage',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
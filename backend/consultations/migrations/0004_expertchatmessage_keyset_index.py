@@ -0,0 +1,21 @@
+# Composite (owner, timestamp, id) index backing keyset pagination
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultations', '0003_expertchatmessage_created_at_default'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='expertchatmessage',
+            name='expert_chat_convers_0266a9_idx',
+        ),
+        migrations.AddIndex(
+            model_name='expertchatmessage',
+            index=models.Index(fields=['conversation', 'created_at', 'id'], name='chat_msg_conv_created_id_idx'),
+        ),
+    ]
@@ -399,7 +399,8 @@ class ExpertChatMessage(models.Model):
         blank=True,
         related_name='replies'
     )
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Set explicitly by the realtime write-behind so stored order matches broadcast order
+    created_at = models.DateTimeField(default=timezone.now)
     
     class Meta:
         db_table = 'expert_chat_messages'
@@ -407,7 +408,7 @@ class ExpertChatMessage(models.Model):
         verbose_name_plural = 'Expert Chat Messages'
         ordering = ['created_at']
         indexes = [
-            models.Index(fields=['conversation', 'created_at']),
+            models.Index(fields=['conversation', 'created_at', 'id'], name='chat_msg_conv_created_id_idx'),
             models.Index(fields=['conversation', 'is_read']),
             models.Index(fields=['sender_user', 'created_at']),
         ]
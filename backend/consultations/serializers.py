@@ -2,6 +2,7 @@
 Serializers for NumerAI consultations application.
 """
 from rest_framework import serializers
+from realtime.presence import online_statuses
 from .models import (
     Expert, Consultation, ConsultationReview, ExpertApplication,
     ExpertVerificationDocument, ExpertChatConversation, ExpertChatMessage,
@@ -13,16 +14,28 @@ class ExpertSerializer(serializers.ModelSerializer):
     """Serializer for expert."""
     is_verified = serializers.BooleanField(read_only=True)
     verification_status = serializers.CharField(read_only=True)
+    is_online = serializers.SerializerMethodField()
     
     class Meta:
         model = Expert
         fields = [
             'id', 'name', 'email', 'specialty', 'experience_years',
             'rating', 'bio', 'profile_picture_url', 'is_active',
-            'verification_status', 'is_verified',
+            'verification_status', 'is_verified', 'is_online',
             'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'is_verified']
+    
+    def get_is_online(self, obj):
+        """Live status from the ``presence`` context map built by ``with_presence``."""
+        return self.context.get('presence', {}).get(str(obj.user_id), False)
+
+
+def with_presence(experts, context=None):
+    """Serializer context carrying the live status of ``experts`` from one batch lookup."""
+    context = dict(context or {})
+    context['presence'] = online_statuses(expert.user_id for expert in experts)
+    return context
 
 
 class ConsultationSerializer(serializers.ModelSerializer):
@@ -19,8 +19,10 @@ from .serializers import (
     ConsultationRescheduleSerializer, ConsultationCancelSerializer,
     ExpertApplicationSerializer, ExpertVerificationDocumentSerializer,
     ExpertAvailabilitySerializer, ExpertChatConversationSerializer,
-    ExpertChatMessageSerializer, SendMessageSerializer
+    ExpertChatMessageSerializer, SendMessageSerializer, with_presence
 )
+from realtime.presence import get_presence_registry
+from utils.pagination import KeysetPagination
 from .services import JitsiService, SchedulingService
 from rest_framework.permissions import IsAdminUser
 import uuid
@@ -45,12 +47,16 @@ def get_experts(request):
     if specialty:
         experts = experts.filter(specialty=specialty)
     
+    # Only experts with a live session, if requested
+    if request.query_params.get('online') in ('1', 'true'):
+        experts = experts.filter(user_id__in=get_presence_registry().online_experts())
+    
     # Paginate
     start = (page - 1) * page_size
     end = start + page_size
-    paginated_experts = experts[start:end]
+    paginated_experts = list(experts[start:end])
     
-    serializer = ExpertSerializer(paginated_experts, many=True)
+    serializer = ExpertSerializer(paginated_experts, many=True, context=with_presence(paginated_experts))
     
     return Response({
         'count': experts.count(),
@@ -66,7 +72,7 @@ def get_expert(request, expert_id):
     """Get details of a specific expert."""
     try:
         expert = Expert.objects.get(id=expert_id, is_active=True)
-        serializer = ExpertSerializer(expert)
+        serializer = ExpertSerializer(expert, context=with_presence([expert]))
         return Response(serializer.data, status=status.HTTP_200_OK)
     except Expert.DoesNotExist:
         return Response({
@@ -187,14 +193,17 @@ def get_upcoming_consultations(request):
         user=user,
         scheduled_at__gte=timezone.now(),
         status__in=['pending', 'confirmed']
-    ).select_related('expert', 'user').prefetch_related('reviews').order_by('scheduled_at')
+    ).select_related('expert', 'user').order_by('scheduled_at')
     
     # Paginate
     start = (page - 1) * page_size
     end = start + page_size
-    paginated_consultations = consultations[start:end]
+    paginated_consultations = list(consultations[start:end])
     
-    serializer = ConsultationSerializer(paginated_consultations, many=True)
+    serializer = ConsultationSerializer(
+        paginated_consultations, many=True,
+        context=with_presence(c.expert for c in paginated_consultations)
+    )
     
     return Response({
         'count': consultations.count(),
@@ -225,9 +234,12 @@ def get_past_consultations(request):
     # Paginate
     start = (page - 1) * page_size
     end = start + page_size
-    paginated_consultations = consultations[start:end]
+    paginated_consultations = list(consultations[start:end])
     
-    serializer = ConsultationSerializer(paginated_consultations, many=True)
+    serializer = ConsultationSerializer(
+        paginated_consultations, many=True,
+        context=with_presence(c.expert for c in paginated_consultations)
+    )
     
     return Response({
         'count': consultations.count(),
@@ -533,7 +545,9 @@ def get_consultation(request, consultation_id):
                         'error': 'Permission denied'
                     }, status=status.HTTP_403_FORBIDDEN)
         
-        serializer = ConsultationDetailSerializer(consultation)
+        serializer = ConsultationDetailSerializer(
+            consultation, context=with_presence([consultation.expert])
+        )
         return Response(serializer.data, status=status.HTTP_200_OK)
     except Consultation.DoesNotExist:
         return Response({
@@ -1016,8 +1030,6 @@ def get_chat_messages(request, conversation_id):
             'error': 'Conversation not found'
         }, status=status.HTTP_404_NOT_FOUND)
     
-    page = int(request.query_params.get('page', 1))
-    page_size = int(request.query_params.get('page_size', 50))
     since = request.query_params.get('since')  # Get messages since timestamp
     
     messages = ExpertChatMessage.objects.filter(conversation=conversation)
@@ -1029,19 +1041,11 @@ def get_chat_messages(request, conversation_id):
         except (ValueError, AttributeError):
             pass
     
-    messages = messages.order_by('created_at')
-    
-    start = (page - 1) * page_size
-    end = start + page_size
-    paginated = messages[start:end]
-    
-    serializer = ExpertChatMessageSerializer(paginated, many=True)
-    return Response({
-        'count': messages.count(),
-        'page': page,
-        'page_size': page_size,
-        'results': serializer.data
-    }, status=status.HTTP_200_OK)
+    # Oldest first; keyset pagination keeps deep history pages cheap
+    paginator = KeysetPagination('created_at', descending=False, page_size=50)
+    page = paginator.paginate_queryset(messages, request)
+    serializer = ExpertChatMessageSerializer(page, many=True)
+    return paginator.get_paginated_response(serializer.data)
 
 
 @api_view(['POST'])
@@ -0,0 +1,130 @@
+"""
+Per-request batch loaders for the GraphQL API.
+
+Resolvers for foreign-key and one-to-one hops go through these loaders instead
+of touching the related manager on each object. Connections queue the keys of
+every node on the current page, so the first nested lookup fetches the whole
+page's relations in a single query and the remaining lookups are served from
+the request-local cache.
+"""
+from django.contrib.auth import get_user_model
+from accounts.models import UserProfile
+from numerology.models import NumerologyProfile
+from consultations.models import Consultation
+from payments.models import Subscription
+
+User = get_user_model()
+
+LOADERS_ATTR = '_graphql_loaders'
+
+
+class ModelLoader:
+    """
+    Batch loader for one model keyed by a unique field.
+
+    Keys are queued with ``queue()`` and fetched together on the first
+    ``load()`` that misses the cache. Missing rows are cached as ``None`` so
+    they are not queried again within the request.
+    """
+
+    def __init__(self, model, key_field='pk', on_load=None):
+        self.model = model
+        self.key_field = key_field
+        self.on_load = on_load
+        self.batch_count = 0
+        self._cache = {}
+        self._pending = set()
+
+    def queue(self, key):
+        """Schedule a key for the next batch without querying."""
+        if key is not None and key not in self._cache:
+            self._pending.add(key)
+
+    def queue_many(self, keys):
+        for key in keys:
+            self.queue(key)
+
+    def prime(self, key, obj):
+        """Seed the cache with an object that is already loaded."""
+        self._cache.setdefault(key, obj)
+        self._pending.discard(key)
+
+    def load(self, key):
+        """Return the object for ``key``, dispatching pending keys if needed."""
+        if key is None:
+            return None
+        if key not in self._cache:
+            self._pending.add(key)
+            self._dispatch()
+        return self._cache.get(key)
+
+    def load_many(self, keys):
+        keys = list(keys)
+        self.queue_many(keys)
+        if self._pending:
+            self._dispatch()
+        return [self._cache.get(key) for key in keys]
+
+    def _dispatch(self):
+        keys = list(self._pending)
+        self._pending.clear()
+        lookup = f'{self.key_field}__in'
+        objects = list(self.model.objects.filter(**{lookup: keys}))
+        self.batch_count += 1
+
+        for obj in objects:
+            self._cache[self._key_for(obj)] = obj
+        for key in keys:
+            self._cache.setdefault(key, None)
+
+        if self.on_load and objects:
+            self.on_load(objects)
+
+    def _key_for(self, obj):
+        if self.key_field == 'pk':
+            return obj.pk
+        return getattr(obj, self.key_field)
+
+
+class RequestLoaders:
+    """All loaders for a single GraphQL request."""
+
+    def __init__(self):
+        self.users = ModelLoader(User, on_load=self.queue_relations)
+        self.user_profiles = ModelLoader(UserProfile, key_field='user_id')
+        self.numerology_profiles = ModelLoader(NumerologyProfile, key_field='user_id')
+        self.subscriptions = ModelLoader(Subscription, key_field='user_id')
+        self.consultations = ModelLoader(Consultation, on_load=self.queue_relations)
+
+    def queue_relations(self, objects):
+        """
+        Queue the relation keys of a page of objects.
+
+        Forward hops queue the referenced primary key; users additionally
+        queue their reverse one-to-one rows (profile, numerology profile,
+        subscription).
+        """
+        for obj in objects:
+            if isinstance(obj, User):
+                self.users.prime(obj.pk, obj)
+                self.user_profiles.queue(obj.pk)
+                self.numerology_profiles.queue(obj.pk)
+                self.subscriptions.queue(obj.pk)
+                continue
+
+            user_id = getattr(obj, 'user_id', None)
+            if user_id is not None:
+                self.users.queue(user_id)
+
+            if isinstance(obj, Consultation):
+                self.consultations.prime(obj.pk, obj)
+                self.consultations.queue(obj.rescheduled_from_id)
+
+
+def get_loaders(context):
+    """Return the loaders bound to the request, creating them on first use."""
+    loaders = getattr(context, LOADERS_ATTR, None)
+    if loaders is None:
+        loaders = RequestLoaders()
+        setattr(context, LOADERS_ATTR, loaders)
+    return loaders
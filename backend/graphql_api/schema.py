@@ -11,17 +11,51 @@ from accounts.models import UserProfile
 from numerology.models import NumerologyProfile, DailyReading
 from consultations.models import Consultation
 from payments.models import Subscription
+from .loaders import get_loaders
 
 User = get_user_model()
 
 
+class BatchedConnection(graphene.relay.Connection):
+    """
+    Connection that queues the relation keys of every node on the page.
+
+    Nested foreign-key and one-to-one fields then resolve through the
+    request loaders with one query per relation instead of one per node.
+    """
+    class Meta:
+        abstract = True
+
+    def resolve_edges(self, info):
+        get_loaders(info.context).queue_relations(edge.node for edge in self.edges)
+        return self.edges
+
+
+def resolve_user_via_loader(root, info):
+    return get_loaders(info.context).users.load(root.user_id)
+
+
 # User Types
 class UserType(DjangoObjectType):
+    profile = graphene.Field(lambda: UserProfileType)
+    numerology_profile = graphene.Field(lambda: NumerologyProfileType)
+    subscription = graphene.Field(lambda: SubscriptionType)
+
     class Meta:
         model = User
         fields = ('id', 'email', 'full_name', 'is_premium', 'subscription_plan')
         filter_fields = ['email', 'is_premium']
         interfaces = (graphene.relay.Node,)
+        connection_class = BatchedConnection
+
+    def resolve_profile(self, info):
+        return get_loaders(info.context).user_profiles.load(self.pk)
+
+    def resolve_numerology_profile(self, info):
+        return get_loaders(info.context).numerology_profiles.load(self.pk)
+
+    def resolve_subscription(self, info):
+        return get_loaders(info.context).subscriptions.load(self.pk)
 
 
 class UserProfileType(DjangoObjectType):
@@ -29,6 +63,9 @@ class UserProfileType(DjangoObjectType):
         model = UserProfile
         fields = '__all__'
         interfaces = (graphene.relay.Node,)
+        connection_class = BatchedConnection
+
+    resolve_user = resolve_user_via_loader
 
 
 # Numerology Types
@@ -38,6 +75,9 @@ class NumerologyProfileType(DjangoObjectType):
         fields = '__all__'
         filter_fields = ['user', 'system']
         interfaces = (graphene.relay.Node,)
+        connection_class = BatchedConnection
+
+    resolve_user = resolve_user_via_loader
 
 
 class DailyReadingType(DjangoObjectType):
@@ -46,6 +86,9 @@ class DailyReadingType(DjangoObjectType):
         fields = '__all__'
         filter_fields = ['user', 'reading_date']
         interfaces = (graphene.relay.Node,)
+        connection_class = BatchedConnection
+
+    resolve_user = resolve_user_via_loader
 
 
 # Consultation Types
@@ -55,6 +98,12 @@ class ConsultationType(DjangoObjectType):
         fields = '__all__'
         filter_fields = ['user', 'expert', 'status']
         interfaces = (graphene.relay.Node,)
+        connection_class = BatchedConnection
+
+    resolve_user = resolve_user_via_loader
+
+    def resolve_rescheduled_from(self, info):
+        return get_loaders(info.context).consultations.load(self.rescheduled_from_id)
 
 
 # Subscription Types
@@ -64,6 +113,9 @@ class SubscriptionType(DjangoObjectType):
         fields = '__all__'
         filter_fields = ['user', 'status']
         interfaces = (graphene.relay.Node,)
+        connection_class = BatchedConnection
+
+    resolve_user = resolve_user_via_loader
 
 
 # Queries
@@ -153,9 +205,11 @@ class Query(graphene.ObjectType):
     def resolve_consultations(self, info, **kwargs):
         """Get consultations for authenticated user."""
         user = info.context.user
-        if user.is_staff:
-            return Consultation.objects.all()
-        return Consultation.objects.filter(user=user)
+        queryset = Consultation.objects.all()
+        if not user.is_staff:
+            queryset = queryset.filter(user=user)
+        # Stable ordering keeps relay cursors valid between pages.
+        return queryset.order_by('-scheduled_at', '-id')
     
     @login_required
     def resolve_subscription(self, info):
@@ -0,0 +1,105 @@
+"""
+Unit tests for GraphQL batching, query limits and persisted queries.
+"""
+import json
+from django.db import connection
+from django.test import TestCase, RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from accounts.models import User
+from graphql_api.schema import schema
+from graphql_api.views import NumerAIGraphQLView, document_cache, hash_query
+
+
+USERS_WITH_PROFILES = '''
+query {
+  users(first: 20) {
+    edges { node { email profile { timezone } numerologyProfile { id } } }
+  }
+}
+'''
+
+
+class GraphQLAPITests(TestCase):
+    """Test cases for the GraphQL endpoint."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.factory = RequestFactory()
+        self.view = NumerAIGraphQLView.as_view(schema=schema)
+        self.staff = User.objects.create(
+            email='staff@example.com',
+            full_name='Staff User',
+            is_staff=True,
+        )
+        document_cache.clear()
+
+    def _create_users(self, count, offset=0):
+        for i in range(offset, offset + count):
+            User.objects.create(email=f'user{i}@example.com', full_name=f'User {i}')
+
+    def _post(self, payload):
+        request = self.factory.post(
+            '/api/v1/graphql/',
+            data=json.dumps(payload),
+            content_type='application/json',
+        )
+        request.user = self.staff
+        response = self.view(request)
+        return json.loads(response.content)
+
+    def _count_queries(self, payload):
+        with CaptureQueriesContext(connection) as queries:
+            result = self._post(payload)
+        self.assertNotIn('errors', result)
+        return len(queries), result
+
+    def test_nested_profiles_are_batched(self):
+        """Nested one-to-one hops cost the same number of queries for any page size."""
+        self._create_users(2)
+        small_count, small_result = self._count_queries({'query': USERS_WITH_PROFILES})
+
+        self._create_users(6, offset=2)
+        large_count, large_result = self._count_queries({'query': USERS_WITH_PROFILES})
+
+        self.assertEqual(len(small_result['data']['users']['edges']), 3)
+        self.assertEqual(len(large_result['data']['users']['edges']), 9)
+        self.assertEqual(small_count, large_count)
+
+    @override_settings(GRAPHQL_MAX_QUERY_COST=50)
+    def test_expensive_query_rejected(self):
+        """Documents over the cost budget are rejected before execution."""
+        with CaptureQueriesContext(connection) as queries:
+            result = self._post({'query': USERS_WITH_PROFILES})
+
+        self.assertIn('errors', result)
+        self.assertIn('estimated cost', result['errors'][0]['message'])
+        self.assertEqual(len(queries), 0)
+
+    @override_settings(GRAPHQL_MAX_QUERY_DEPTH=3)
+    def test_deep_query_rejected(self):
+        """Documents nested beyond the depth limit are rejected."""
+        result = self._post({'query': USERS_WITH_PROFILES})
+
+        self.assertIn('errors', result)
+        self.assertIn('maximum operation depth', result['errors'][0]['message'])
+
+    def test_persisted_query(self):
+        """A registered document can be executed by hash alone."""
+        query_hash = hash_query(USERS_WITH_PROFILES)
+        extensions = {'persistedQuery': {'version': 1, 'sha256Hash': query_hash}}
+
+        missing = self._post({'extensions': extensions})
+        self.assertEqual(missing['errors'][0]['message'], 'PersistedQueryNotFound')
+
+        registered = self._post({'query': USERS_WITH_PROFILES, 'extensions': extensions})
+        self.assertNotIn('errors', registered)
+
+        by_hash = self._post({'extensions': extensions})
+        self.assertEqual(by_hash['data'], registered['data'])
+
+    def test_persisted_query_hash_mismatch(self):
+        """A hash that does not match the document is rejected."""
+        extensions = {'persistedQuery': {'version': 1, 'sha256Hash': 'not-a-hash'}}
+        result = self._post({'query': USERS_WITH_PROFILES, 'extensions': extensions})
+
+        self.assertIn('does not match', result['errors'][0]['message'])
@@ -0,0 +1,127 @@
+"""
+Static query analysis for the GraphQL API.
+
+Documents are rejected during validation, before any resolver runs, when they
+nest too deeply or when their estimated cost exceeds the configured budget.
+"""
+from django.conf import settings
+from graphene.validation import depth_limit_validator
+from graphql import GraphQLError, get_named_type
+from graphql.language import (
+    FieldNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    IntValueNode,
+    OperationDefinitionNode,
+    VariableNode,
+)
+from graphql.validation import ValidationRule
+
+DEFAULT_MAX_QUERY_DEPTH = 10
+DEFAULT_MAX_QUERY_COST = 5000
+
+PAGE_SIZE_ARGUMENTS = ('first', 'last')
+
+
+def _page_size(field_node, field_def, variables, default_page_size):
+    """
+    Return the multiplier for a list field.
+
+    Connection fields are multiplied by their ``first``/``last`` argument.
+    Variables are resolved from their default value when one is declared;
+    otherwise the field is assumed to return a full page.
+    """
+    if not field_def or not any(arg in field_def.args for arg in PAGE_SIZE_ARGUMENTS):
+        return 1
+
+    for argument in field_node.arguments or ():
+        if argument.name.value not in PAGE_SIZE_ARGUMENTS:
+            continue
+        value = argument.value
+        if isinstance(value, VariableNode):
+            value = variables.get(value.name.value)
+        if isinstance(value, IntValueNode):
+            return max(0, min(int(value.value), default_page_size))
+    return default_page_size
+
+
+def calculate_cost(selection_set, parent_type, context, variables, default_page_size, visited=()):
+    """Estimate the number of objects a selection set can resolve."""
+    if selection_set is None:
+        return 0
+
+    cost = 0
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            name = selection.name.value
+            if name.startswith('__'):
+                continue
+            fields = getattr(parent_type, 'fields', {}) or {}
+            field_def = fields.get(name)
+            child_type = get_named_type(field_def.type) if field_def else None
+            child_cost = calculate_cost(
+                selection.selection_set, child_type, context, variables, default_page_size, visited
+            )
+            multiplier = _page_size(selection, field_def, variables, default_page_size)
+            cost += 1 + multiplier * child_cost
+        elif isinstance(selection, InlineFragmentNode):
+            fragment_type = parent_type
+            if selection.type_condition:
+                fragment_type = context.schema.get_type(selection.type_condition.name.value)
+            cost += calculate_cost(
+                selection.selection_set, fragment_type, context, variables, default_page_size, visited
+            )
+        elif isinstance(selection, FragmentSpreadNode):
+            name = selection.name.value
+            fragment = context.get_fragment(name)
+            if fragment is None or name in visited:
+                continue
+            fragment_type = context.schema.get_type(fragment.type_condition.name.value)
+            cost += calculate_cost(
+                fragment.selection_set, fragment_type, context, variables,
+                default_page_size, visited + (name,)
+            )
+    return cost
+
+
+def query_cost_validator(max_cost, default_page_size):
+    """Build a validation rule rejecting operations whose cost exceeds ``max_cost``."""
+
+    class QueryCostValidator(ValidationRule):
+        def enter_operation_definition(self, node: OperationDefinitionNode, *args):
+            schema = self.context.schema
+            root_type = schema.get_root_type(node.operation)
+            variables = {
+                definition.variable.name.value: definition.default_value
+                for definition in node.variable_definitions or ()
+                if definition.default_value is not None
+            }
+            cost = calculate_cost(
+                node.selection_set, root_type, self.context, variables, default_page_size
+            )
+            if cost > max_cost:
+                name = node.name.value if node.name else 'anonymous'
+                self.report_error(
+                    GraphQLError(
+                        f"'{name}' has an estimated cost of {cost}, "
+                        f"exceeding the maximum of {max_cost}.",
+                        node,
+                    )
+                )
+
+    return QueryCostValidator
+
+
+def get_validation_rules():
+    """Return the depth and cost rules configured in settings."""
+    graphene_settings = getattr(settings, 'GRAPHENE', {})
+    default_page_size = graphene_settings.get('RELAY_CONNECTION_MAX_LIMIT', 100)
+    return [
+        depth_limit_validator(
+            max_depth=getattr(settings, 'GRAPHQL_MAX_QUERY_DEPTH', DEFAULT_MAX_QUERY_DEPTH)
+        ),
+        query_cost_validator(
+            max_cost=getattr(settings, 'GRAPHQL_MAX_QUERY_COST', DEFAULT_MAX_QUERY_COST),
+            default_page_size=default_page_size,
+        ),
+    ]
@@ -1,6 +1,197 @@
 """
 GraphQL views for NumerAI API.
 """
-from django.views.decorators.csrf import csrf_exempt
-from graphene_django.views import GraphQLView
+import hashlib
+import json
+import threading
+from collections import OrderedDict
 
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.http import HttpResponseNotAllowed
+from graphene_django.constants import MUTATION_ERRORS_FLAG
+from graphene_django.settings import graphene_settings
+from graphene_django.views import GraphQLView, HttpError
+from graphql import (
+    ExecutionResult,
+    GraphQLError,
+    execute,
+    get_operation_ast,
+    parse,
+    specified_rules,
+    validate,
+)
+from graphql.language import OperationType
+
+from .validation import get_validation_rules
+
+# Apollo-style automatic persisted queries: clients may send only the
+# sha256 hash of a document once the server has seen the full text.
+PERSISTED_QUERY_CACHE_PREFIX = 'graphql:persisted_query:'
+PERSISTED_QUERY_TIMEOUT = 60 * 60 * 24 * 7  # 7 days
+PERSISTED_QUERY_NOT_FOUND = 'PersistedQueryNotFound'
+
+# Parsed and validated documents kept per worker process.
+DOCUMENT_CACHE_SIZE = 500
+
+
+class DocumentCache:
+    """Bounded LRU of parsed documents and their validation errors."""
+
+    def __init__(self, max_size=DOCUMENT_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+document_cache = DocumentCache()
+
+
+def hash_query(query):
+    return hashlib.sha256(query.encode('utf-8')).hexdigest()
+
+
+class NumerAIGraphQLView(GraphQLView):
+    """
+    GraphQL view with persisted queries and static cost analysis.
+
+    Each distinct document is parsed and validated (including the depth and
+    cost rules) once per worker; later requests for the same document reuse
+    the cached AST and go straight to execution.
+    """
+
+    def get_persisted_query_hash(self, data):
+        extensions = data.get('extensions')
+        if isinstance(extensions, str):
+            try:
+                extensions = json.loads(extensions)
+            except ValueError:
+                return None
+        if not isinstance(extensions, dict):
+            return None
+        persisted_query = extensions.get('persistedQuery') or {}
+        return persisted_query.get('sha256Hash')
+
+    def resolve_query(self, data, query):
+        """
+        Return ``(query, query_hash)`` after applying persisted-query rules.
+
+        Raises ``GraphQLError`` when the hash is unknown or does not match
+        the supplied document.
+        """
+        query_hash = self.get_persisted_query_hash(data)
+
+        if query_hash and not query:
+            query = cache.get(f'{PERSISTED_QUERY_CACHE_PREFIX}{query_hash}')
+            if query is None:
+                raise GraphQLError(PERSISTED_QUERY_NOT_FOUND)
+            return query, query_hash
+
+        if not query:
+            return query, None
+
+        actual_hash = hash_query(query)
+        if query_hash:
+            if query_hash != actual_hash:
+                raise GraphQLError('Provided sha256Hash does not match query.')
+            cache.set(f'{PERSISTED_QUERY_CACHE_PREFIX}{query_hash}', query, PERSISTED_QUERY_TIMEOUT)
+        return query, actual_hash
+
+    def get_document(self, query, query_hash):
+        """Parse and validate ``query``, memoized by its hash."""
+        entry = document_cache.get(query_hash)
+        if entry is None:
+            document = parse(query)
+            errors = validate(
+                self.schema.graphql_schema,
+                document,
+                rules=(*specified_rules, *get_validation_rules()),
+            )
+            entry = (document, errors)
+            document_cache.set(query_hash, entry)
+        return entry
+
+    def execute_graphql_request(
+        self, request, data, query, variables, operation_name, show_graphiql=False
+    ):
+        try:
+            query, query_hash = self.resolve_query(data, query)
+        except GraphQLError as e:
+            return ExecutionResult(errors=[e])
+
+        if not query:
+            if show_graphiql:
+                return None
+            return super().execute_graphql_request(
+                request, data, query, variables, operation_name, show_graphiql
+            )
+
+        try:
+            document, validation_errors = self.get_document(query, query_hash)
+        except Exception as e:
+            return ExecutionResult(errors=[e])
+
+        if validation_errors:
+            return ExecutionResult(data=None, errors=validation_errors)
+
+        operation_ast = get_operation_ast(document, operation_name)
+        if request.method.lower() == 'get':
+            if operation_ast and operation_ast.operation != OperationType.QUERY:
+                if show_graphiql:
+                    return None
+                raise HttpError(
+                    HttpResponseNotAllowed(
+                        ['POST'],
+                        'Can only perform a {} operation from a POST request.'.format(
+                            operation_ast.operation.value
+                        ),
+                    )
+                )
+
+        options = {
+            'schema': self.schema.graphql_schema,
+            'document': document,
+            'root_value': self.get_root_value(request),
+            'variable_values': variables,
+            'operation_name': operation_name,
+            'context_value': self.get_context(request),
+            'middleware': self.get_middleware(request),
+        }
+        if self.execution_context_class:
+            options['execution_context_class'] = self.execution_context_class
+
+        try:
+            if (
+                operation_ast
+                and operation_ast.operation == OperationType.MUTATION
+                and (
+                    graphene_settings.ATOMIC_MUTATIONS is True
+                    or connection.settings_dict.get('ATOMIC_MUTATIONS', False) is True
+                )
+            ):
+                with transaction.atomic():
+                    result = execute(**options)
+                    if getattr(request, MUTATION_ERRORS_FLAG, False) is True:
+                        transaction.set_rollback(True)
+                return result
+            return execute(**options)
+        except Exception as e:
+            return ExecutionResult(errors=[e])
@@ -7,6 +7,9 @@ from celery.schedules import crontab
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'numerai.settings.production')
+# Skip Django system checks at worker boot: the URL checks import every view
+# (and their PDF/LLM dependencies) that no task uses. Web deploys still run them.
+os.environ.setdefault('CELERY_SKIP_CHECKS', 'true')
 
 app = Celery('numerai')
 
@@ -19,6 +22,9 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 # Load task modules from all registered Django apps.
 app.autodiscover_tasks()
 
+# Record how long each task waits in its queue
+import utils.task_metrics  # noqa: E402,F401
+
 # Celery Beat schedule for periodic tasks
 app.conf.beat_schedule = {
     'generate-daily-readings': {
@@ -12,9 +12,11 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 
 from pathlib import Path
 from decouple import config
+import dj_database_url
 import os
 from datetime import timedelta
 from celery.schedules import crontab
+from kombu import Exchange, Queue
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -86,6 +88,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'utils.db_routing.ReplicaRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'allauth.account.middleware.AccountMiddleware',
@@ -126,6 +129,28 @@ DATABASES = {
     }
 }
 
+# Read replicas (utils.db_routing): comma-separated database URLs, added to
+# DATABASES as replica_1, replica_2, ... by replica_databases()
+DATABASE_REPLICA_URLS = config('DATABASE_REPLICA_URLS', default='', cast=lambda v: [s.strip() for s in v.split(',') if s.strip()])
+# Seconds a user's reads stay on the primary after one of their requests wrote
+DATABASE_REPLICA_STICKY_SECONDS = config('DATABASE_REPLICA_STICKY_SECONDS', default=15, cast=int)
+
+
+def replica_databases(primary):
+    """DATABASES entries for DATABASE_REPLICA_URLS, inheriting the primary's options."""
+    return {
+        f'replica_{index}': {
+            **primary,
+            **dj_database_url.parse(url, conn_max_age=primary.get('CONN_MAX_AGE', 0)),
+            'TEST': {'MIRROR': 'default'},
+        }
+        for index, url in enumerate(DATABASE_REPLICA_URLS, start=1)
+    }
+
+
+DATABASES.update(replica_databases(DATABASES['default']))
+DATABASE_ROUTERS = ['utils.db_routing.ReplicaRouter']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -266,8 +291,54 @@ GRAPHENE = {
     'MIDDLEWARE': [
         'graphql_jwt.middleware.JSONWebTokenMiddleware',
     ],
+    'RELAY_CONNECTION_MAX_LIMIT': 100,
 }
 
+# Static limits applied to GraphQL documents before execution
+GRAPHQL_MAX_QUERY_DEPTH = config('GRAPHQL_MAX_QUERY_DEPTH', default=10, cast=int)
+GRAPHQL_MAX_QUERY_COST = config('GRAPHQL_MAX_QUERY_COST', default=5000, cast=int)
+
+# LLM gateway: per-process limits for provider calls (numerology.services.llm_gateway)
+LLM_REQUEST_TIMEOUT = config('LLM_REQUEST_TIMEOUT', default=30.0, cast=float)
+LLM_CONNECT_TIMEOUT = config('LLM_CONNECT_TIMEOUT', default=5.0, cast=float)
+LLM_MAX_CONCURRENCY = config('LLM_MAX_CONCURRENCY', default=8, cast=int)
+# Seconds a caller waits for a free concurrency slot before falling back
+LLM_QUEUE_TIMEOUT = config('LLM_QUEUE_TIMEOUT', default=10.0, cast=float)
+LLM_MAX_RETRIES = config('LLM_MAX_RETRIES', default=2, cast=int)
+LLM_RETRY_BACKOFF = config('LLM_RETRY_BACKOFF', default=0.5, cast=float)
+LLM_CIRCUIT_FAILURE_THRESHOLD = config('LLM_CIRCUIT_FAILURE_THRESHOLD', default=5, cast=int)
+LLM_CIRCUIT_RESET_TIMEOUT = config('LLM_CIRCUIT_RESET_TIMEOUT', default=30.0, cast=float)
+
+# Reuse stored LLM explanations for near-identical numerology contexts
+EXPLANATION_SEMANTIC_CACHE_ENABLED = config('EXPLANATION_SEMANTIC_CACHE_ENABLED', default=True, cast=bool)
+EXPLANATION_SEMANTIC_CACHE_THRESHOLD = config('EXPLANATION_SEMANTIC_CACHE_THRESHOLD', default=0.95, cast=float)
+# 'hashing' (local, deterministic) or 'openai'
+EXPLANATION_EMBEDDING_BACKEND = config('EXPLANATION_EMBEDDING_BACKEND', default='hashing')
+
+# Memory-mapped encyclopedia index built by `manage.py ingest_numerology_encyclopedia`
+NUMEROLOGY_RAG_INDEX_DIR = config('NUMEROLOGY_RAG_INDEX_DIR', default=str(BASE_DIR / 'rag_index'))
+
+# Memory-mapped birth-date feature table built by `manage.py build_date_features`
+NUMEROLOGY_DATE_FEATURES_DIR = config('NUMEROLOGY_DATE_FEATURES_DIR', default=str(BASE_DIR / 'feature_tables'))
+
+# Bulk people import: uploads up to the sync limit are imported in the request,
+# larger ones (up to the max) by the import_people_file Celery task
+PEOPLE_IMPORT_SYNC_MAX_BYTES = config('PEOPLE_IMPORT_SYNC_MAX_BYTES', default=256 * 1024, cast=int)
+PEOPLE_IMPORT_MAX_BYTES = config('PEOPLE_IMPORT_MAX_BYTES', default=20 * 1024 * 1024, cast=int)
+
+# Realtime chat write-behind (realtime.chat_persistence)
+CHAT_WRITE_BEHIND_BATCH_SIZE = config('CHAT_WRITE_BEHIND_BATCH_SIZE', default=200, cast=int)
+# Seconds between background flushes; bounds how long a broadcast message is not yet durable
+CHAT_WRITE_BEHIND_FLUSH_INTERVAL = config('CHAT_WRITE_BEHIND_FLUSH_INTERVAL', default=0.05, cast=float)
+CHAT_WRITE_BEHIND_MAX_PENDING = config('CHAT_WRITE_BEHIND_MAX_PENDING', default=5000, cast=int)
+CHAT_WRITE_BEHIND_MAX_RETRIES = config('CHAT_WRITE_BEHIND_MAX_RETRIES', default=3, cast=int)
+
+# Realtime presence registry (realtime.presence): 'redis' or 'local' (single process only)
+PRESENCE_BACKEND = config('PRESENCE_BACKEND', default='redis')
+PRESENCE_REDIS_URL = config('PRESENCE_REDIS_URL', default=config('REDIS_URL', default='redis://localhost:6379/0'))
+# Seconds without a heartbeat before a session counts as offline; clients heartbeat well within this
+PRESENCE_TTL = config('PRESENCE_TTL', default=60, cast=int)
+
 # DRF Spectacular (OpenAPI) Settings
 SPECTACULAR_SETTINGS = {
     'TITLE': 'NumerAI API',
@@ -332,6 +403,42 @@ CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 60  # 30 minutes
 
+# Celery queues by workload class. Production runs one worker per pool so a
+# long batch never delays reminders or interactive reports:
+#   celery -A numerai worker -n priority@%h -Q priority,default -P prefork -c 2 --prefetch-multiplier 1
+#   celery -A numerai worker -n batch@%h -Q batch -P prefork --prefetch-multiplier 1
+#   celery -A numerai worker -n io@%h -Q llm,notifications -P threads -c 16 --prefetch-multiplier 4
+# A worker started without -Q consumes every queue (local development).
+# acks_late: acknowledge after the task finishes, so a task whose worker dies
+# is redelivered; only for queues whose tasks are safe to run twice.
+TASK_QUEUE_ACKS_LATE = {
+    'priority': False,  # consultation reminders; a redelivery would notify twice
+    'batch': True,  # CPU-bound scheduled jobs and imports; chunks skip existing rows
+    'llm': True,  # report generation; finished results are reused from the result store
+    'notifications': False,  # push fan-out; a redelivery would notify twice
+    'default': False,
+}
+CELERY_TASK_DEFAULT_QUEUE = 'default'
+CELERY_TASK_QUEUES = tuple(Queue(name, Exchange(name), routing_key=name) for name in TASK_QUEUE_ACKS_LATE)
+CELERY_TASK_ROUTES = {
+    'consultations.tasks.send_consultation_reminders': {'queue': 'priority'},
+    'consultations.tasks.check_upcoming_consultations': {'queue': 'priority'},
+    'numerology.tasks.generate_daily_readings': {'queue': 'batch'},
+    'numerology.tasks.generate_weekly_reports': {'queue': 'batch'},
+    'numerology.tasks.generate_weekly_reports_chunk': {'queue': 'batch'},
+    'numerology.tasks.generate_yearly_reports': {'queue': 'batch'},
+    'numerology.tasks.generate_yearly_reports_chunk': {'queue': 'batch'},
+    'numerology.tasks.import_people_file': {'queue': 'batch'},
+    'numerology.tasks.generate_name_report': {'queue': 'llm'},
+    'numerology.tasks.generate_phone_report': {'queue': 'llm'},
+    'numerology.tasks.generate_detailed_readings_for_profile': {'queue': 'llm'},
+    'ai_chat.tasks.summarize_conversation': {'queue': 'llm'},
+    'numerology.tasks.send_daily_reading_notifications': {'queue': 'notifications'},
+}
+CELERY_TASK_ANNOTATIONS = {
+    task: {'acks_late': TASK_QUEUE_ACKS_LATE[route['queue']]} for task, route in CELERY_TASK_ROUTES.items()
+}
+
 # Celery Beat Schedule
 CELERY_BEAT_SCHEDULE = {
     'generate-daily-readings': {
@@ -358,6 +465,10 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'accounts.tasks.cleanup_expired_tokens',
         'schedule': timedelta(hours=24),  # Run daily
     },
+    'sweep-presence': {
+        'task': 'realtime.tasks.sweep_presence',
+        'schedule': timedelta(seconds=30),  # Expire stale presence sessions
+    },
 }
 
 # Cache Configuration
@@ -23,6 +23,7 @@ DATABASES = {
         }
     }
 }
+DATABASES.update(replica_databases(DATABASES['default']))
 
 # Cache Configuration with fallback for development
 try:
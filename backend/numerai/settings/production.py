@@ -60,6 +60,7 @@ else:
             }
         }
     }
+DATABASES.update(replica_databases(DATABASES['default']))
 
 # CORS Settings for production
 # Supports Vercel frontend deployments (both preview and production)
@@ -1,20 +1,15 @@
 """
 AI-powered detailed numerology reading generator.
 """
-import os
 import logging
-import openai
 from typing import Dict, Optional
-from django.conf import settings
 from accounts.models import User
 from numerology.models import NumerologyProfile, DetailedReading
 from numerology.interpretations import get_interpretation
+from numerology.services.llm_gateway import LLMUnavailableError, get_llm_gateway
 
 logger = logging.getLogger(__name__)
 
-# Initialize OpenAI client
-openai.api_key = os.getenv('OPENAI_API_KEY', getattr(settings, 'OPENAI_API_KEY', None))
-
 
 def generate_detailed_reading(
     user: User,
@@ -34,7 +29,8 @@ def generate_detailed_reading(
     Returns:
         DetailedReading instance or None if generation fails
     """
-    if not openai.api_key:
+    gateway = get_llm_gateway('openai')
+    if not gateway.is_configured():
         logger.warning("OpenAI API key not configured. Cannot generate detailed readings.")
         return None
     
@@ -109,22 +105,27 @@ def generate_detailed_reading(
         """
         
         # Call OpenAI API
-        response = openai.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert numerologist. Provide detailed, personalized numerology readings in JSON format."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            max_tokens=2000,
-            temperature=0.7,
-            response_format={"type": "json_object"}
-        )
+        try:
+            response = gateway.chat_completion(
+                'detailed_reading',
+                model="gpt-4",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert numerologist. Provide detailed, personalized numerology readings in JSON format."
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                max_tokens=2000,
+                temperature=0.7,
+                response_format={"type": "json_object"}
+            )
+        except LLMUnavailableError as e:
+            logger.warning(f"LLM unavailable, using template reading for {number_type}: {str(e)}")
+            return _template_detailed_reading(user, number_type, number_value, basic_interpretation)
         
         # Parse response
         import json
@@ -155,6 +156,34 @@ def generate_detailed_reading(
         return None
 
 
+def _template_detailed_reading(
+    user: User,
+    number_type: str,
+    number_value: int,
+    interpretation: Optional[Dict]
+) -> Optional[DetailedReading]:
+    """Build a reading from the static interpretations without replacing an AI reading."""
+    if not interpretation:
+        return None
+    existing = DetailedReading.objects.filter(
+        user=user, reading_type=number_type, number=number_value
+    ).first()
+    if existing:
+        return existing
+    return DetailedReading.objects.create(
+        user=user,
+        reading_type=number_type,
+        number=number_value,
+        detailed_interpretation=interpretation['description'],
+        career_insights=f"Suitable paths include: {', '.join(interpretation['career'])}.",
+        relationship_insights=interpretation['relationships'],
+        life_purpose=interpretation['life_purpose'],
+        challenges_and_growth=f"Watch for: {', '.join(interpretation['challenges'])}.",
+        personalized_advice=f"Lean on your strengths: {', '.join(interpretation['strengths'])}.",
+        generated_by_ai=False,
+    )
+
+
 def generate_all_detailed_readings(user: User) -> Dict[str, Optional[DetailedReading]]:
     """
     Generate detailed readings for all core numerology numbers.
@@ -102,4 +102,48 @@ class NumerologyCache:
             date_str: Date string (YYYY-MM-DD)
         """
         key = cls._generate_key(user_id, f'daily_reading:{date_str}')
-        cache.delete(key)
\ No newline at end of file
+        cache.delete(key)
+
+    @staticmethod
+    def _chart_key(full_name: str, birth_date: str, system: str) -> str:
+        """
+        Generate cache key for a chart without putting the name in the key.
+        
+        Args:
+            full_name: Full name
+            birth_date: Birth date (YYYY-MM-DD)
+            system: Calculation system
+        
+        Returns:
+            Cache key string
+        """
+        digest = hashlib.sha256(f'{full_name}\x00{birth_date}\x00{system}'.encode('utf-8')).hexdigest()
+        return f"numerology:chart:{digest}"
+    
+    @classmethod
+    def get_chart(cls, full_name: str, birth_date: str, system: str) -> Optional[dict]:
+        """
+        Get cached date-independent chart numbers.
+        
+        Args:
+            full_name: Full name
+            birth_date: Birth date (YYYY-MM-DD)
+            system: Calculation system
+        
+        Returns:
+            Cached numbers or None
+        """
+        return cache.get(cls._chart_key(full_name, birth_date, system))
+    
+    @classmethod
+    def set_chart(cls, full_name: str, birth_date: str, system: str, numbers: dict) -> None:
+        """
+        Cache date-independent chart numbers.
+        
+        Args:
+            full_name: Full name
+            birth_date: Birth date (YYYY-MM-DD)
+            system: Calculation system
+            numbers: Numbers to cache
+        """
+        cache.set(cls._chart_key(full_name, birth_date, system), numbers, cls.CACHE_TTL)
@@ -0,0 +1,204 @@
+"""
+Lazily evaluated numerology chart for one person.
+
+A NumerologyChart wraps a (full name, birth date, system) triple and
+computes each derived number on first access, memoizing it for the life of
+the chart. Services accept a chart in place of raw name and date arguments,
+so a view that renders several of them builds the chart once with
+``get_chart(..., request=request)`` and every service reuses the same
+numbers instead of each running ``calculate_all`` again.
+
+Charts from ``get_chart`` are also seeded from, and written back to, the
+Django cache for the date-independent numbers.
+"""
+import copy
+from datetime import date
+from typing import Any, Callable, Dict, Optional
+
+from .cache import NumerologyCache
+from .date_features import get_birth_date_features
+from .numerology import NumerologyCalculator
+
+# calculate_all() keys, in its order
+CALCULATE_ALL_FIELDS = (
+    'life_path_number', 'destiny_number', 'soul_urge_number', 'personality_number',
+    'attitude_number', 'birthday_number', 'maturity_number', 'balance_number',
+    'personal_year_number', 'personal_month_number', 'personal_day_number',
+    'hidden_passion_number', 'subconscious_self_number', 'karmic_debt_numbers', 'karmic_lessons',
+    'pinnacles', 'challenges', 'driver_number', 'conductor_number', 'driver_conductor_compatibility',
+)
+# Numbers that depend on today's date are never cached across requests
+TODAY_FIELDS = ('personal_year_number', 'personal_month_number', 'personal_day_number')
+CACHED_FIELDS = tuple(field for field in CALCULATE_ALL_FIELDS if field not in TODAY_FIELDS)
+
+
+def _derived(name: str, compute: Callable[['NumerologyChart'], Any]) -> property:
+    def getter(chart):
+        values = chart._values
+        if name not in values:
+            values[name] = compute(chart)
+        return values[name]
+    getter.__name__ = name
+    return property(getter)
+
+
+def _date_feature(name: str) -> property:
+    return _derived(name, lambda chart: chart._date_features[name])
+
+
+class NumerologyChart:
+    """
+    Numbers derived from one full name and birth date under one system.
+
+    The inputs are fixed at construction; each number is computed the first
+    time it is read. Values equal those of ``NumerologyCalculator.calculate_all``.
+    """
+    __slots__ = ('full_name', 'birth_date', 'system', 'calculator', '_values', '_cache_on_complete')
+
+    def __init__(self, full_name: str, birth_date: date, system: str = 'pythagorean',
+                 calculator: Optional[NumerologyCalculator] = None, values: Optional[Dict[str, Any]] = None,
+                 cache: bool = False):
+        """
+        Args:
+            full_name: Full name
+            birth_date: Date of birth
+            system: Calculation system, ignored when ``calculator`` is given
+            calculator: Calculator to compute with
+            values: Already known numbers, e.g. from the cache
+            cache: Write the date-independent numbers to the cache the first
+                time as_dict() computes them
+        """
+        calculator = calculator or NumerologyCalculator(system)
+        object.__setattr__(self, 'full_name', full_name)
+        object.__setattr__(self, 'birth_date', birth_date)
+        object.__setattr__(self, 'system', calculator.system)
+        object.__setattr__(self, 'calculator', calculator)
+        object.__setattr__(self, '_values', dict(values or {}))
+        object.__setattr__(self, '_cache_on_complete', cache)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self):
+        return f"<NumerologyChart {self.birth_date} {self.system}>"
+
+    _date_features = _derived(
+        '_date_features',
+        lambda chart: get_birth_date_features(chart.birth_date, chart.calculator)
+    )
+
+    life_path_number = _date_feature('life_path_number')
+    attitude_number = _date_feature('attitude_number')
+    birthday_number = _date_feature('birthday_number')
+    driver_number = _date_feature('driver_number')
+    conductor_number = _date_feature('conductor_number')
+    pinnacles = _date_feature('pinnacles')
+    challenges = _date_feature('challenges')
+
+    destiny_number = _derived(
+        'destiny_number', lambda chart: chart.calculator.calculate_destiny_number(chart.full_name)
+    )
+    soul_urge_number = _derived(
+        'soul_urge_number', lambda chart: chart.calculator.calculate_soul_urge_number(chart.full_name)
+    )
+    personality_number = _derived(
+        'personality_number', lambda chart: chart.calculator.calculate_personality_number(chart.full_name)
+    )
+    maturity_number = _derived(
+        'maturity_number',
+        lambda chart: chart.calculator.calculate_maturity_number(chart.life_path_number, chart.destiny_number)
+    )
+    balance_number = _derived(
+        'balance_number', lambda chart: chart.calculator.calculate_balance_number(chart.full_name)
+    )
+    hidden_passion_number = _derived(
+        'hidden_passion_number', lambda chart: chart.calculator.calculate_hidden_passion_number(chart.full_name)
+    )
+    subconscious_self_number = _derived(
+        'subconscious_self_number', lambda chart: chart.calculator.calculate_subconscious_self_number(chart.full_name)
+    )
+    karmic_debt_numbers = _derived(
+        'karmic_debt_numbers',
+        lambda chart: chart.calculator.calculate_karmic_debt_numbers(chart.birth_date, chart.full_name)
+    )
+    karmic_lessons = _derived(
+        'karmic_lessons', lambda chart: chart.calculator.calculate_karmic_lessons(chart.full_name)
+    )
+    driver_conductor_compatibility = _derived(
+        'driver_conductor_compatibility',
+        lambda chart: chart.calculator.calculate_driver_conductor_compatibility(chart.birth_date)
+    )
+    personal_year_number = _derived(
+        'personal_year_number', lambda chart: chart.calculator.calculate_personal_year_number(chart.birth_date)
+    )
+    personal_month_number = _derived(
+        'personal_month_number', lambda chart: chart.calculator.calculate_personal_month_number(chart.birth_date)
+    )
+    personal_day_number = _derived(
+        'personal_day_number', lambda chart: chart.calculator.calculate_personal_day_number(chart.birth_date)
+    )
+    lo_shu_grid = _derived(
+        'lo_shu_grid', lambda chart: chart.calculator.calculate_lo_shu_grid(chart.full_name, chart.birth_date)
+    )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        All calculate_all() numbers, as a dict the caller may modify.
+        """
+        numbers = {}
+        for field in CALCULATE_ALL_FIELDS:
+            value = getattr(self, field)
+            numbers[field] = value if isinstance(value, int) else copy.deepcopy(value)
+        if self._cache_on_complete:
+            NumerologyCache.set_chart(
+                self.full_name, self.birth_date.isoformat(), self.system,
+                {field: numbers[field] for field in CACHED_FIELDS}
+            )
+            object.__setattr__(self, '_cache_on_complete', False)
+        return numbers
+
+
+def get_chart(full_name: str, birth_date: date, system: str = 'pythagorean', request=None) -> NumerologyChart:
+    """
+    Return the chart for a person, built at most once per request.
+
+    Args:
+        full_name: Full name
+        birth_date: Date of birth
+        system: Calculation system
+        request: Current request; charts are memoized on it when given
+
+    Returns:
+        NumerologyChart, seeded from the cache when its numbers are cached
+    """
+    system = system.lower()
+    key = (full_name, birth_date, system)
+    # DRF wraps the Django request; memoize on the underlying one so both see it
+    request = getattr(request, '_request', request)
+    charts = getattr(request, '_numerology_charts', None) if request is not None else None
+    if charts is not None and key in charts:
+        return charts[key]
+
+    cached = NumerologyCache.get_chart(full_name, birth_date.isoformat(), system)
+    chart = NumerologyChart(full_name, birth_date, system, values=cached, cache=cached is None)
+
+    if request is not None:
+        if charts is None:
+            charts = {}
+            request._numerology_charts = charts
+        charts[key] = chart
+    return chart
+
+
+def resolve_chart(chart: Optional[NumerologyChart], full_name: Optional[str], birth_date: Optional[date],
+                  calculator: NumerologyCalculator) -> NumerologyChart:
+    """
+    The chart a service method should use: the one it was given, or one
+    built from the raw name and date arguments with the service's calculator.
+    """
+    if chart is not None:
+        return chart
+    return NumerologyChart(full_name, birth_date, calculator=calculator)
@@ -3,9 +3,10 @@ Compatibility analysis engine for NumerAI.
 Enhanced compatibility algorithms using multiple numerology factors.
 """
 from datetime import date
-from typing import Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from .numerology import NumerologyCalculator
 from .interpretations import get_interpretation
+from .lookup_tables import core_index, get_compatibility_tables
 
 
 class CompatibilityAnalyzer:
@@ -168,6 +169,53 @@ class CompatibilityAnalyzer:
         else:  # diff >= 6
             return 40
     
+    def _calculate_element_modifier(self, user_life_path: int, partner_life_path: int) -> int:
+        """
+        Modifier for complementary Life Path elements.
+        
+        Args:
+            user_life_path: User's Life Path number
+            partner_life_path: Partner's Life Path number
+            
+        Returns:
+            The complementary elements modifier, or 0
+        """
+        # Reduce master numbers for element calculation
+        if user_life_path > 9:
+            user_element_num = user_life_path - 9 if user_life_path in {11, 22, 33} else user_life_path % 9 or 9
+        else:
+            user_element_num = user_life_path
+            
+        if partner_life_path > 9:
+            partner_element_num = partner_life_path - 9 if partner_life_path in {11, 22, 33} else partner_life_path % 9 or 9
+        else:
+            partner_element_num = partner_life_path
+        
+        user_element = self.NUMBER_ELEMENTS.get(user_element_num, 'fire')
+        partner_element = self.NUMBER_ELEMENTS.get(partner_element_num, 'fire')
+        
+        # Fire (1,4,7) complements Water (2,5,8) complements Air (3,6,9)
+        if (user_element == 'fire' and partner_element == 'water') or \
+           (user_element == 'water' and partner_element == 'air') or \
+           (user_element == 'air' and partner_element == 'fire'):
+            return self.COMPATIBILITY_MODIFIERS['complementary_elements']
+        return 0
+    
+    def _rule_strength(self, factor: str, user_num: int, partner_num: int) -> Optional[str]:
+        """
+        Strength named by COMPATIBILITY_RULES for a pair of numbers, if any.
+        
+        Args:
+            factor: Weight key, e.g. 'life_path'
+            user_num: User's number for this factor
+            partner_num: Partner's number for this factor
+            
+        Returns:
+            The rule's strength text, or None
+        """
+        rule = self.COMPATIBILITY_RULES.get(factor, {}).get((min(user_num, partner_num), max(user_num, partner_num)))
+        return rule['strength'] if rule else None
+    
     def _calculate_advanced_compatibility(self, user_numbers: Dict[str, int], 
                                         partner_numbers: Dict[str, int]) -> int:
         """
@@ -206,26 +254,11 @@ class CompatibilityAnalyzer:
             # Check for complementary elements (based on Life Path primarily)
             user_life_path = user_numbers.get('life_path_number', 1)
             partner_life_path = partner_numbers.get('life_path_number', 1)
-            
-            # Reduce master numbers for element calculation
-            if user_life_path > 9:
-                user_element_num = user_life_path - 9 if user_life_path in {11, 22, 33} else user_life_path % 9 or 9
-            else:
-                user_element_num = user_life_path
-                
-            if partner_life_path > 9:
-                partner_element_num = partner_life_path - 9 if partner_life_path in {11, 22, 33} else partner_life_path % 9 or 9
+            i, j = core_index(user_life_path), core_index(partner_life_path)
+            if i is not None and j is not None:
+                modifier += get_compatibility_tables().element_modifier(i, j)
             else:
-                partner_element_num = partner_life_path
-            
-            user_element = self.NUMBER_ELEMENTS.get(user_element_num, 'fire')
-            partner_element = self.NUMBER_ELEMENTS.get(partner_element_num, 'fire')
-            
-            # Fire (1,4,7) complements Water (2,5,8) complements Air (3,6,9)
-            if (user_element == 'fire' and partner_element == 'water') or \
-               (user_element == 'water' and partner_element == 'air') or \
-               (user_element == 'air' and partner_element == 'fire'):
-                modifier += self.COMPATIBILITY_MODIFIERS['complementary_elements']
+                modifier += self._calculate_element_modifier(user_life_path, partner_life_path)
             
             # Check for karmic debt
             # Handle both single values and lists
@@ -280,6 +313,7 @@ class CompatibilityAnalyzer:
                 'attitude': 'attitude_number'
             }
             
+            tables = get_compatibility_tables()
             total_score = 0
             max_possible_score = 0
             strengths = []
@@ -296,23 +330,26 @@ class CompatibilityAnalyzer:
                     if not isinstance(user_num, int) or not isinstance(partner_num, int):
                         continue
                     
-                    # Base compatibility score (0-100)
-                    factor_score = self._calculate_factor_compatibility(user_num, partner_num)
+                    i, j = core_index(user_num), core_index(partner_num)
+                    if i is not None and j is not None:
+                        # Core numbers: precomputed score and rule
+                        factor_score = tables.factor_score(i, j)
+                        strength = tables.rule_strength(factor, i, j)
+                    else:
+                        factor_score = self._calculate_factor_compatibility(user_num, partner_num)
+                        try:
+                            strength = self._rule_strength(factor, user_num, partner_num)
+                        except Exception:
+                            # Skip rule checking if there's an error
+                            strength = None
                     
                     # Apply relationship-specific weight
                     weighted_score = factor_score * weight
                     total_score += weighted_score
                     max_possible_score += 100 * weight
                     
-                    # Check for special compatibility rules
-                    try:
-                        rule_key = (min(user_num, partner_num), max(user_num, partner_num))
-                        if factor in self.COMPATIBILITY_RULES and rule_key in self.COMPATIBILITY_RULES.get(factor, {}):
-                            rule = self.COMPATIBILITY_RULES[factor][rule_key]
-                            strengths.append(rule['strength'])
-                    except Exception:
-                        # Skip rule checking if there's an error
-                        pass
+                    if strength is not None:
+                        strengths.append(strength)
             
             # Apply advanced compatibility modifiers
             try:
@@ -0,0 +1,175 @@
+"""
+Precomputed birth-date features.
+
+Everything NumerologyCalculator derives from a birth date alone is a pure
+function of that date, so it is computed once for every date from
+1900-01-01 to 2100-12-31 by ``manage.py build_date_features`` and stored as
+a struct-of-arrays ``uint8`` matrix:
+
+    <features_dir>/birth_date_features.v<FORMAT_VERSION>.npy
+
+Row ``c`` holds column ``COLUMNS[c]`` for every date and column ``i``
+holds the date with ordinal ``FIRST_DATE.toordinal() + i``. Workers open
+the file as a read-only memory map, so all gunicorn and Celery processes
+share one page-cache copy, and a lookup is a single index by ordinal.
+Dates outside the range, or a missing table, fall back to live
+computation with identical results.
+
+Bump FORMAT_VERSION whenever a date-derived calculation or the column
+layout changes, so stale tables are ignored until rebuilt.
+"""
+import logging
+import os
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+import numpy as np
+from django.conf import settings
+
+from .numerology import NumerologyCalculator
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+FIRST_DATE = date(1900, 1, 1)
+LAST_DATE = date(2100, 12, 31)
+FIRST_ORDINAL = FIRST_DATE.toordinal()
+DAY_COUNT = LAST_DATE.toordinal() - FIRST_ORDINAL + 1
+
+SCALAR_COLUMNS = (
+    'life_path_number', 'attitude_number', 'birthday_number', 'driver_number', 'conductor_number',
+)
+PINNACLE_COLUMNS = tuple(f'pinnacle_{i}' for i in range(1, 5))
+CHALLENGE_COLUMNS = tuple(f'challenge_{i}' for i in range(1, 5))
+LO_SHU_COLUMNS = tuple(f'lo_shu_{n}' for n in range(1, 10))
+# Bit i of the arrow columns is arrow ARROW_NAMES[i]
+ARROW_NAMES = tuple(NumerologyCalculator.PERSONALITY_ARROWS)
+COLUMNS = (
+    SCALAR_COLUMNS + PINNACLE_COLUMNS + CHALLENGE_COLUMNS + LO_SHU_COLUMNS
+    + ('arrows_present', 'arrows_absent')
+)
+_INDEX = {name: i for i, name in enumerate(COLUMNS)}
+
+
+def get_table_path(features_dir: Optional[Path] = None) -> Path:
+    features_dir = Path(features_dir or settings.NUMEROLOGY_DATE_FEATURES_DIR)
+    return features_dir / f'birth_date_features.v{FORMAT_VERSION}.npy'
+
+
+def compute_row(calculator: NumerologyCalculator, birth_date: date) -> List[int]:
+    """Compute every column for one date with the live calculator."""
+    counts = calculator.calculate_lo_shu_digit_counts(birth_date)
+    present = absent = 0
+    for arrow in calculator._detect_personality_arrows(counts):
+        bit = 1 << ARROW_NAMES.index(arrow['name'])
+        if arrow['is_strength']:
+            present |= bit
+        else:
+            absent |= bit
+    return [
+        calculator.calculate_life_path_number(birth_date),
+        calculator.calculate_attitude_number(birth_date),
+        calculator.calculate_birthday_number(birth_date),
+        calculator.calculate_driver_number(birth_date),
+        calculator.calculate_conductor_number(birth_date),
+        *calculator.calculate_pinnacles(birth_date),
+        *calculator.calculate_challenges(birth_date),
+        *(counts.get(n, 0) for n in range(1, 10)),
+        present,
+        absent,
+    ]
+
+
+def build_feature_table(features_dir: Optional[Path] = None) -> Path:
+    """Compute the table for every date in range and atomically write it."""
+    path = get_table_path(features_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    calculator = NumerologyCalculator()
+
+    matrix = np.empty((len(COLUMNS), DAY_COUNT), dtype=np.uint8)
+    for offset in range(DAY_COUNT):
+        matrix[:, offset] = compute_row(calculator, date.fromordinal(FIRST_ORDINAL + offset))
+
+    staging = path.parent / f'.tmp-{uuid4().hex}.npy'
+    try:
+        np.save(staging, matrix)
+        os.replace(staging, path)
+    finally:
+        if staging.exists():
+            staging.unlink()
+    return path
+
+
+class BirthDateFeatures:
+    """Read-only, memory-mapped view of a built feature table."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.matrix = np.load(self.path, mmap_mode='r')
+        if self.matrix.shape != (len(COLUMNS), DAY_COUNT) or self.matrix.dtype != np.uint8:
+            raise ValueError(f'Unexpected feature table layout {self.matrix.shape} {self.matrix.dtype}')
+
+    def row(self, birth_date: date) -> Optional[List[int]]:
+        """Column values for ``birth_date``, or None outside the table's range."""
+        offset = birth_date.toordinal() - FIRST_ORDINAL
+        if not 0 <= offset < DAY_COUNT:
+            return None
+        return self.matrix[:, offset].tolist()
+
+
+def features_from_row(row: List[int], calculator: NumerologyCalculator) -> Dict[str, Any]:
+    """Expand stored column values into the calculator's output shapes."""
+    features = {name: row[_INDEX[name]] for name in SCALAR_COLUMNS}
+    features['pinnacles'] = [row[_INDEX[name]] for name in PINNACLE_COLUMNS]
+    features['challenges'] = [row[_INDEX[name]] for name in CHALLENGE_COLUMNS]
+    features['lo_shu_counts'] = {
+        n: row[_INDEX[name]] for n, name in enumerate(LO_SHU_COLUMNS, start=1) if row[_INDEX[name]]
+    }
+    present, absent = row[_INDEX['arrows_present']], row[_INDEX['arrows_absent']]
+    features['personality_arrows'] = [
+        calculator._personality_arrow(arrow_name, present=bool(present >> bit & 1))
+        for bit, arrow_name in enumerate(ARROW_NAMES)
+        if (present | absent) >> bit & 1
+    ]
+    return features
+
+
+_loaded: Dict[str, Optional[BirthDateFeatures]] = {}
+_loaded_lock = threading.Lock()
+
+
+def get_feature_table(features_dir: Optional[Path] = None) -> Optional[BirthDateFeatures]:
+    """Return this process's feature table, or None if it has not been built."""
+    path = get_table_path(features_dir)
+    key = str(path)
+    if key in _loaded:
+        return _loaded[key]
+    with _loaded_lock:
+        if key not in _loaded:
+            try:
+                _loaded[key] = BirthDateFeatures(path)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Birth date feature table unavailable, computing live: {str(e)}")
+                _loaded[key] = None
+    return _loaded[key]
+
+
+def get_birth_date_features(
+    birth_date: date, calculator: Optional[NumerologyCalculator] = None
+) -> Dict[str, Any]:
+    """
+    All birth-date-derived numbers for ``birth_date``.
+
+    Returns life path, attitude, birthday, driver and conductor numbers,
+    ``pinnacles``, ``challenges``, ``lo_shu_counts`` (digit -> count, zero
+    counts omitted) and ``personality_arrows``.
+    """
+    calculator = calculator or NumerologyCalculator()
+    table = get_feature_table()
+    row = table.row(birth_date) if table is not None else None
+    if row is None:
+        row = compute_row(calculator, birth_date)
+    return features_from_row(row, calculator)
@@ -0,0 +1,127 @@
+"""
+Bit-packed Lo Shu grids.
+
+A Lo Shu grid depends only on how often each digit 1-9 occurs in a birth
+date. LoShuBits packs those nine counts into one integer, four bits per
+digit (digit ``d`` at bit ``4 * (d - 1)``), alongside a 9-bit presence mask
+with bit ``d - 1`` set when ``d`` occurs at least once.
+
+Arrows are precomputed per presence mask by an ArrowTable, so detecting
+them is a single index, and comparing two grids reduces to AND/XOR of
+their masks and a popcount. Counts saturate at 15; a birth date has at
+most eight digits, so real grids never reach that.
+"""
+from datetime import date
+from typing import Any, Dict, Iterable, Mapping, NamedTuple, Sequence, Tuple
+
+DIGITS = range(1, 10)
+FULL_MASK = (1 << 9) - 1
+MAX_COUNT = 15
+_COUNT_BITS = 4
+
+# Digits set in each of the 512 presence masks, ascending
+_MASK_DIGITS = tuple(tuple(d for d in DIGITS if mask >> (d - 1) & 1) for mask in range(FULL_MASK + 1))
+
+
+def digit_mask(numbers: Iterable[int]) -> int:
+    """Presence mask with the bits of ``numbers`` set."""
+    mask = 0
+    for number in numbers:
+        mask |= 1 << (int(number) - 1)
+    return mask
+
+
+def mask_digits(mask: int) -> Tuple[int, ...]:
+    """Digits set in ``mask``, ascending."""
+    return _MASK_DIGITS[mask & FULL_MASK]
+
+
+class LoShuBits(NamedTuple):
+    """Packed digit counts and presence mask of one Lo Shu grid."""
+    counts: int
+    present: int
+
+    @classmethod
+    def from_counts(cls, number_counts: Mapping[Any, int]) -> 'LoShuBits':
+        """Pack a digit -> count mapping; keys may be strings, as after a JSON round trip."""
+        counts = present = 0
+        for number, count in number_counts.items():
+            digit = int(number)
+            if count and 1 <= digit <= 9:
+                counts |= min(int(count), MAX_COUNT) << (_COUNT_BITS * (digit - 1))
+                present |= 1 << (digit - 1)
+        return cls(counts, present)
+
+    @classmethod
+    def from_birth_date(cls, birth_date: date) -> 'LoShuBits':
+        """Count the digits 1-9 of ``birth_date``, as NumerologyCalculator.calculate_lo_shu_digit_counts does."""
+        counts = present = 0
+        for char in f'{birth_date.day}{birth_date.month}{birth_date.year}':
+            digit = ord(char) - 48
+            if digit:
+                counts += 1 << (_COUNT_BITS * (digit - 1))
+                present |= 1 << (digit - 1)
+        return cls(counts, present)
+
+    @classmethod
+    def from_grid(cls, grid_data: Mapping[str, Any]) -> 'LoShuBits':
+        """
+        Pack a grid as returned by NumerologyCalculator.calculate_lo_shu_grid.
+
+        Uses ``number_frequency`` and falls back to the counts of the
+        positions in ``grid``.
+        """
+        frequency = grid_data.get('number_frequency')
+        if frequency is None:
+            frequency = {
+                position['number']: position.get('count', 0)
+                for position in grid_data.get('grid', {}).values()
+                if 'number' in position
+            }
+        return cls.from_counts(frequency)
+
+    @property
+    def missing(self) -> int:
+        return FULL_MASK & ~self.present
+
+    def count(self, digit: int) -> int:
+        return self.counts >> (_COUNT_BITS * (digit - 1)) & MAX_COUNT
+
+    def as_dict(self) -> Dict[int, int]:
+        """Count of every digit 1-9, zeros included."""
+        return {d: self.count(d) for d in DIGITS}
+
+
+class ArrowTable:
+    """
+    Arrows of every presence mask, in definition order.
+
+    An arrow is present when all of its digits are present and absent when
+    all of them are missing; otherwise it is not formed.
+    """
+
+    def __init__(self, arrows: Mapping[str, Sequence[int]]):
+        masks = [(name, digit_mask(numbers)) for name, numbers in arrows.items()]
+        self.masks: Dict[str, int] = dict(masks)
+        self._formed = tuple(
+            tuple((name, present & mask == mask) for name, mask in masks if present & mask in (0, mask))
+            for present in range(FULL_MASK + 1)
+        )
+        self._present = tuple(
+            tuple(name for name, is_present in formed if is_present) for formed in self._formed
+        )
+        self._absent = tuple(
+            tuple(name for name, is_present in formed if not is_present) for formed in self._formed
+        )
+
+    def formed(self, present: int) -> Tuple[Tuple[str, bool], ...]:
+        """``(name, is_present)`` for each arrow formed by ``present``."""
+        return self._formed[present]
+
+    def present(self, present: int) -> Tuple[str, ...]:
+        """Names of the arrows whose digits are all in ``present``."""
+        return self._present[present]
+
+    def absent(self, present: int) -> Tuple[str, ...]:
+        """Names of the arrows whose digits are all missing from ``present``."""
+        return self._absent[present]
@@ -0,0 +1,150 @@
+"""
+Dense lookup tables for Raj Yog detection and compatibility scoring.
+
+Core numbers only take the values 1-9, 11, 22 and 33, so every rule
+evaluation over them can be enumerated once per process and stored as small
+numpy arrays indexed by ``core_index(number)``:
+
+- RajYogTable: the matched and strongest combinations for each (life path,
+  destiny) pair and the strength score for each (life path, destiny, soul urge,
+  personality), where the last soul urge/personality index means "not given".
+- CompatibilityTables: per-pair factor scores, COMPATIBILITY_RULES strengths
+  and Life Path element modifiers.
+
+The tables are generated from the same rule methods that handle inputs
+outside the core range, so both paths always agree. Scalar lookups go
+through nested-list views of the arrays, which index several times faster
+than numpy scalars. Combination names and descriptions are only turned into
+text when a result is returned.
+"""
+import threading
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+CORE_NUMBERS = (1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 22, 33)
+NOT_GIVEN = len(CORE_NUMBERS)
+_CORE_INDEX = {number: i for i, number in enumerate(CORE_NUMBERS)}
+
+
+def core_index(number) -> Optional[int]:
+    """Table index of a core number, or None for anything else."""
+    return _CORE_INDEX.get(number)
+
+
+class RajYogTable:
+    """Raj Yog detection results for every combination of core numbers."""
+
+    def __init__(self, calculator):
+        self.keys = tuple(calculator.RAJ_YOG_COMBINATIONS)
+        size = len(CORE_NUMBERS)
+        optional = CORE_NUMBERS + (None,)
+        # Bit k set when RAJ_YOG_COMBINATIONS key k is detected
+        self.combinations = np.zeros((size, size), dtype=np.uint16)
+        # Index into keys of the combination that names the yog, -1 for none
+        self.primary = np.full((size, size), -1, dtype=np.int8)
+        self.strengths = np.zeros((size, size, size + 1, size + 1), dtype=np.uint8)
+
+        for i, life_path in enumerate(CORE_NUMBERS):
+            for j, destiny in enumerate(CORE_NUMBERS):
+                matched = calculator._match_raj_yog(life_path, destiny)
+                self.combinations[i, j] = sum(1 << self.keys.index(key) for key in matched)
+                if matched:
+                    self.primary[i, j] = self.keys.index(calculator._strongest_raj_yog(matched))
+                for k, soul_urge in enumerate(optional):
+                    for m, personality in enumerate(optional):
+                        self.strengths[i, j, k, m] = calculator._raj_yog_strength(
+                            life_path, destiny, matched, soul_urge, personality
+                        )
+
+        self._matched = [
+            [tuple(key for bit, key in enumerate(self.keys) if mask >> bit & 1) for mask in row]
+            for row in self.combinations.tolist()
+        ]
+        self._primary = [[self.keys[k] if k >= 0 else None for k in row] for row in self.primary.tolist()]
+        self._strengths = self.strengths.tolist()
+
+    def lookup(self, life_path, destiny, soul_urge=None,
+               personality=None) -> Optional[Tuple[Tuple[str, ...], Optional[str], int]]:
+        """
+        Matched combination keys, the strongest key and the strength score,
+        or None if any input is not a core number.
+        """
+        i, j = core_index(life_path), core_index(destiny)
+        k = NOT_GIVEN if soul_urge is None else core_index(soul_urge)
+        m = NOT_GIVEN if personality is None else core_index(personality)
+        if i is None or j is None or k is None or m is None:
+            return None
+        return self._matched[i][j], self._primary[i][j], self._strengths[i][j][k][m]
+
+
+class CompatibilityTables:
+    """Per-factor compatibility results for every pair of core numbers."""
+
+    def __init__(self, analyzer):
+        size = len(CORE_NUMBERS)
+        self.factor_scores = np.zeros((size, size), dtype=np.uint8)
+        self.element_modifiers = np.zeros((size, size), dtype=np.int8)
+        self.strength_texts = tuple(dict.fromkeys(
+            rule['strength'] for rules in analyzer.COMPATIBILITY_RULES.values() for rule in rules.values()
+        ))
+        # Index into strength_texts, -1 where no rule applies
+        self.rule_strengths: Dict[str, np.ndarray] = {
+            factor: np.full((size, size), -1, dtype=np.int8) for factor in analyzer.COMPATIBILITY_RULES
+        }
+
+        for i, user_num in enumerate(CORE_NUMBERS):
+            for j, partner_num in enumerate(CORE_NUMBERS):
+                self.factor_scores[i, j] = analyzer._calculate_factor_compatibility(user_num, partner_num)
+                self.element_modifiers[i, j] = analyzer._calculate_element_modifier(user_num, partner_num)
+                for factor, strengths in self.rule_strengths.items():
+                    strength = analyzer._rule_strength(factor, user_num, partner_num)
+                    if strength is not None:
+                        strengths[i, j] = self.strength_texts.index(strength)
+
+        self._factor_scores = self.factor_scores.tolist()
+        self._element_modifiers = self.element_modifiers.tolist()
+        self._rule_strengths = {
+            factor: [[self.strength_texts[t] if t >= 0 else None for t in row] for row in strengths.tolist()]
+            for factor, strengths in self.rule_strengths.items()
+        }
+
+    def factor_score(self, i: int, j: int) -> int:
+        """Factor compatibility score (0-100) for core indices ``i`` and ``j``."""
+        return self._factor_scores[i][j]
+
+    def element_modifier(self, i: int, j: int) -> int:
+        """Life Path element modifier for core indices ``i`` and ``j``."""
+        return self._element_modifiers[i][j]
+
+    def rule_strength(self, factor: str, i: int, j: int) -> Optional[str]:
+        """Strength text of the rule for core indices ``i`` and ``j``, if any."""
+        strengths = self._rule_strengths.get(factor)
+        return strengths[i][j] if strengths is not None else None
+
+
+_raj_yog_table: Optional[RajYogTable] = None
+_compatibility_tables: Optional[CompatibilityTables] = None
+_lock = threading.Lock()
+
+
+def get_raj_yog_table(calculator) -> RajYogTable:
+    """Return this process's RajYogTable, building it from ``calculator`` on first use."""
+    global _raj_yog_table
+    if _raj_yog_table is None:
+        with _lock:
+            if _raj_yog_table is None:
+                _raj_yog_table = RajYogTable(calculator)
+    return _raj_yog_table
+
+
+def get_compatibility_tables() -> CompatibilityTables:
+    """Return this process's CompatibilityTables, building them on first use."""
+    global _compatibility_tables
+    if _compatibility_tables is None:
+        from .compatibility import CompatibilityAnalyzer
+
+        with _lock:
+            if _compatibility_tables is None:
+                _compatibility_tables = CompatibilityTables(CompatibilityAnalyzer())
+    return _compatibility_tables
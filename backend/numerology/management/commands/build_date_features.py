@@ -0,0 +1,28 @@
+"""
+Management command to build the precomputed birth-date feature table.
+An existing table for the current format version is left in place.
+"""
+from django.core.management.base import BaseCommand
+from numerology.date_features import FIRST_DATE, LAST_DATE, build_feature_table, get_table_path
+
+
+class Command(BaseCommand):
+    help = 'Precompute birth-date-derived numbers for every date in range into a memory-mapped table'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--features-dir', help='Directory to write the table to')
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Rebuild even if the table already exists',
+        )
+
+    def handle(self, *args, **options):
+        path = get_table_path(options['features_dir'])
+        if path.exists() and not options['force']:
+            self.stdout.write(f"Feature table {path.name} is up to date.")
+            return
+        path = build_feature_table(options['features_dir'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Built {path} covering {FIRST_DATE.isoformat()} to {LAST_DATE.isoformat()}"
+        ))
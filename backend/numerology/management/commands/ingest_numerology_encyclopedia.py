@@ -0,0 +1,33 @@
+"""
+Management command to build the numerology encyclopedia retrieval index.
+Only chunks whose text changed since the last run are embedded again.
+"""
+from django.core.management.base import BaseCommand
+from numerology.rag_ingestion import ingest_numerology_data
+
+
+class Command(BaseCommand):
+    help = 'Chunk and embed data/numerology_encyclopedia.json into the local vector index'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--source', help='Path to an encyclopedia JSON file')
+        parser.add_argument('--index-dir', help='Directory to write the index to')
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Rebuild even if the source has not changed',
+        )
+
+    def handle(self, *args, **options):
+        stats = ingest_numerology_data(
+            json_path=options['source'],
+            index_dir=options['index_dir'],
+            force=options['force'],
+        )
+        if stats['unchanged']:
+            self.stdout.write(f"Index {stats['version']} is up to date.")
+            return
+        self.stdout.write(self.style.SUCCESS(
+            f"Published index {stats['version']}: {stats['added']} embedded, "
+            f"{stats['reused']} reused, {stats['removed']} removed"
+        ))
@@ -0,0 +1,47 @@
+# Shared, content-addressed name and phone computations
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('numerology', '0008_add_chaldean_zodiac_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NumerologyResult',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('name', 'Name'), ('phone', 'Phone')], max_length=10)),
+                ('digest', models.CharField(help_text='SHA-256 of the normalized input', max_length=64, unique=True)),
+                ('inputs', models.JSONField(help_text='Normalized input the digest was computed from')),
+                ('result', models.JSONField(help_text='compute_name_numbers / compute_phone_numerology output')),
+                ('explanation', models.JSONField(blank=True, help_text='Shared LLM explanation', null=True)),
+                ('explanation_error', models.TextField(blank=True, help_text='Error message if LLM explanation failed', null=True)),
+                ('tokens_used', models.IntegerField(default=0, help_text='LLM tokens spent on the explanation')),
+                ('hit_count', models.IntegerField(default=0, help_text='Reports served from this row after the first')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_used_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Numerology Result',
+                'verbose_name_plural': 'Numerology Results',
+                'db_table': 'numerology_results',
+                'indexes': [models.Index(fields=['kind', 'last_used_at'], name='numerology__kind_8d1e93_idx')],
+            },
+        ),
+        migrations.AddField(
+            model_name='namereport',
+            name='shared_result',
+            field=models.ForeignKey(blank=True, help_text='Shared computation this report was built from', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='name_reports', to='numerology.numerologyresult'),
+        ),
+        migrations.AddField(
+            model_name='phonereport',
+            name='shared_result',
+            field=models.ForeignKey(blank=True, help_text='Shared computation this report was built from', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='phone_reports', to='numerology.numerologyresult'),
+        ),
+    ]
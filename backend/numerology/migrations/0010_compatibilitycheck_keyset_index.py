@@ -0,0 +1,21 @@
+# Composite (owner, timestamp, id) index backing keyset pagination
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('numerology', '0009_numerologyresult_shared_reports'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='compatibilitycheck',
+            name='compatibili_user_id_cae1ee_idx',
+        ),
+        migrations.AddIndex(
+            model_name='compatibilitycheck',
+            index=models.Index(fields=['user', 'created_at', 'id'], name='compat_user_created_id_idx'),
+        ),
+    ]
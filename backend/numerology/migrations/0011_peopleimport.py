@@ -0,0 +1,42 @@
+# Bulk people import jobs
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('numerology', '0010_compatibilitycheck_keyset_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PeopleImport',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('file', models.FileField(blank=True, help_text='Queued upload, deleted once processed', null=True, upload_to='people_imports/%Y/%m/')),
+                ('file_format', models.CharField(choices=[('csv', 'CSV'), ('json', 'JSON')], max_length=10)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed')], default='queued', max_length=20)),
+                ('processed_rows', models.IntegerField(default=0)),
+                ('created_count', models.IntegerField(default=0)),
+                ('duplicate_count', models.IntegerField(default=0)),
+                ('error_count', models.IntegerField(default=0)),
+                ('errors', models.JSONField(blank=True, default=list, help_text='Per-row validation errors, capped')),
+                ('error_message', models.TextField(blank=True, help_text='Why the file could not be processed', null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='people_imports', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'People Import',
+                'verbose_name_plural': 'People Imports',
+                'db_table': 'people_imports',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['user', 'created_at'], name='people_impo_user_id_651187_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Queued people import uploads are stored in the database so workers in
+# other containers can read them
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('numerology', '0011_peopleimport'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='peopleimport',
+            name='file',
+        ),
+        migrations.AddField(
+            model_name='peopleimport',
+            name='payload',
+            field=models.BinaryField(blank=True, editable=False, help_text='Queued upload, cleared once processed', null=True),
+        ),
+    ]
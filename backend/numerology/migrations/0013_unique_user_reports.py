@@ -0,0 +1,47 @@
+# Partial unique constraints for the user's own weekly and yearly reports;
+# duplicates left by concurrent batch runs are removed first, keeping the
+# most recently generated report
+
+from django.db import migrations, models
+
+
+def remove_duplicate_user_reports(apps, schema_editor):
+    for model_name, period in (('WeeklyReport', 'week_start_date'), ('YearlyReport', 'year')):
+        model = apps.get_model('numerology', model_name)
+        seen = set()
+        duplicates = []
+        rows = model.objects.filter(person__isnull=True).order_by('user_id', period, '-generated_at')
+        for pk, user_id, value in rows.values_list('pk', 'user_id', period).iterator():
+            if (user_id, value) in seen:
+                duplicates.append(pk)
+            else:
+                seen.add((user_id, value))
+        for start in range(0, len(duplicates), 1000):
+            model.objects.filter(pk__in=duplicates[start:start + 1000]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('numerology', '0012_peopleimport_payload'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_user_reports, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='weeklyreport',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('person__isnull', True)),
+                fields=('user', 'week_start_date'),
+                name='unique_user_weekly_report',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='yearlyreport',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('person__isnull', True)),
+                fields=('user', 'year'),
+                name='unique_user_yearly_report',
+            ),
+        ),
+    ]
@@ -144,7 +144,7 @@ class CompatibilityCheck(models.Model):
         verbose_name_plural = 'Compatibility Checks'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['user', 'created_at']),
+            models.Index(fields=['user', 'created_at', 'id'], name='compat_user_created_id_idx'),
             models.Index(fields=['relationship_type']),
         ]
     
@@ -405,6 +405,52 @@ class PersonNumerologyProfile(models.Model):
         return f"Numerology Profile for {self.person.name}"
 
 
+class PeopleImport(models.Model):
+    """Bulk import of people from an uploaded CSV or JSON file."""
+    
+    FORMAT_CHOICES = [
+        ('csv', 'CSV'),
+        ('json', 'JSON'),
+    ]
+    
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('processing', 'Processing'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey('accounts.User', on_delete=models.CASCADE, related_name='people_imports')
+    # Kept in the database rather than MEDIA_ROOT so Celery workers in other containers can read it
+    payload = models.BinaryField(null=True, blank=True, editable=False, help_text="Queued upload, cleared once processed")
+    file_format = models.CharField(max_length=10, choices=FORMAT_CHOICES)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='queued')
+    
+    # Progress, saved after every chunk
+    processed_rows = models.IntegerField(default=0)
+    created_count = models.IntegerField(default=0)
+    duplicate_count = models.IntegerField(default=0)
+    error_count = models.IntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True, help_text="Per-row validation errors, capped")
+    error_message = models.TextField(null=True, blank=True, help_text="Why the file could not be processed")
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        db_table = 'people_imports'
+        verbose_name = 'People Import'
+        verbose_name_plural = 'People Imports'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', 'created_at']),
+        ]
+    
+    def __str__(self):
+        return f"People import {self.id} ({self.status}) for {self.user}"
+
+
 class RajYogDetection(models.Model):
     """Raj Yog detection results for a numerology profile."""
     
@@ -561,6 +607,15 @@ class WeeklyReport(models.Model):
             models.Index(fields=['person', 'week_start_date']),
             models.Index(fields=['year', 'week_number']),
         ]
+        constraints = [
+            # unique_together never matches NULL persons, so the user's own
+            # report needs its own constraint
+            models.UniqueConstraint(
+                fields=['user', 'week_start_date'],
+                condition=models.Q(person__isnull=True),
+                name='unique_user_weekly_report'
+            )
+        ]
     
     def __str__(self):
         person_name = self.person.name if self.person else "User"
@@ -614,12 +669,64 @@ class YearlyReport(models.Model):
             models.Index(fields=['person', 'year']),
             models.Index(fields=['year']),
         ]
+        constraints = [
+            # unique_together never matches NULL persons, so the user's own
+            # report needs its own constraint
+            models.UniqueConstraint(
+                fields=['user', 'year'],
+                condition=models.Q(person__isnull=True),
+                name='unique_user_yearly_report'
+            )
+        ]
     
     def __str__(self):
         person_name = self.person.name if self.person else "User"
         return f"Yearly Report for {person_name} - {self.year}"
 
 
+class NumerologyResult(models.Model):
+    """
+    Computed numbers and LLM explanation shared by every report with the same input.
+
+    Rows are content-addressed: ``digest`` hashes the normalized input
+    (normalized name, name type and system, or E.164 number and method) and
+    the algorithm version, so identical requests from different users reuse
+    one computation and one LLM explanation.
+    """
+    
+    KIND_CHOICES = [
+        ('name', 'Name'),
+        ('phone', 'Phone'),
+    ]
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    digest = models.CharField(max_length=64, unique=True, help_text="SHA-256 of the normalized input")
+    inputs = models.JSONField(help_text="Normalized input the digest was computed from")
+    
+    # Deterministic computation and its explanation
+    result = models.JSONField(help_text="compute_name_numbers / compute_phone_numerology output")
+    explanation = models.JSONField(null=True, blank=True, help_text="Shared LLM explanation")
+    explanation_error = models.TextField(null=True, blank=True, help_text="Error message if LLM explanation failed")
+    tokens_used = models.IntegerField(default=0, help_text="LLM tokens spent on the explanation")
+    
+    # Usage
+    hit_count = models.IntegerField(default=0, help_text="Reports served from this row after the first")
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'numerology_results'
+        verbose_name = 'Numerology Result'
+        verbose_name_plural = 'Numerology Results'
+        indexes = [
+            models.Index(fields=['kind', 'last_used_at']),
+        ]
+    
+    def __str__(self):
+        return f"{self.kind} result {self.digest[:12]}"
+
+
 class NameReport(models.Model):
     """Name numerology report for a user."""
     
@@ -650,6 +757,10 @@ class NameReport(models.Model):
     # LLM explanation
     explanation = models.JSONField(null=True, blank=True, help_text="LLM result: short_summary, long_explanation, action_points")
     explanation_error = models.TextField(null=True, blank=True, help_text="Error message if LLM explanation failed")
+    shared_result = models.ForeignKey(
+        NumerologyResult, on_delete=models.SET_NULL, null=True, blank=True,
+        related_name='name_reports', help_text="Shared computation this report was built from"
+    )
     
     # Metadata
     computed_at = models.DateTimeField(auto_now_add=True)
@@ -696,6 +807,10 @@ class PhoneReport(models.Model):
     # LLM explanation
     explanation = models.JSONField(null=True, blank=True, help_text="LLM-generated explanation JSON")
     explanation_error = models.TextField(null=True, blank=True, help_text="Error message if LLM explanation failed")
+    shared_result = models.ForeignKey(
+        NumerologyResult, on_delete=models.SET_NULL, null=True, blank=True,
+        related_name='phone_reports', help_text="Shared computation this report was built from"
+    )
     
     # Metadata
     computed_at = models.DateTimeField(auto_now_add=True)
@@ -0,0 +1,99 @@
+"""
+Single-pass letter analysis shared by the name calculations.
+
+A LetterTable compiles a system's letter values into 256-byte translation
+tables, so a name is converted to per-letter codes with one C-level
+``bytes.translate`` call instead of a Python loop with dict lookups. The
+codes are counted once into a NameProfile, a histogram of letter values
+split into vowels and consonants, plus the value of the initials. Destiny,
+soul urge, personality, balance, hidden passion, karmic lessons and karmic
+debt sums are all derived from that profile.
+
+Only the letters A-Z carry a value. Non-ASCII input is uppercased before
+encoding (so e.g. 'ß' counts as 'SS', as ``str.upper`` has it) and
+anything that is still not A-Z is dropped.
+"""
+from typing import Dict, Mapping, NamedTuple, Tuple
+
+# Consonant codes are offset so one byte carries both value and vowel flag.
+CONSONANT_OFFSET = 16
+MAX_LETTER_VALUE = 9
+_ASCII_LETTERS = frozenset(b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz')
+_DELETE = bytes(b for b in range(256) if b not in _ASCII_LETTERS)
+_VOWEL_CODES = tuple(bytes([value]) for value in range(1, MAX_LETTER_VALUE + 1))
+_CONSONANT_CODES = tuple(bytes([CONSONANT_OFFSET + value]) for value in range(1, MAX_LETTER_VALUE + 1))
+
+
+class NameProfile(NamedTuple):
+    """Letter-value histogram of a name; index ``v`` counts letters worth ``v``."""
+    vowel_counts: Tuple[int, ...]
+    consonant_counts: Tuple[int, ...]
+    initials_total: int
+
+    @property
+    def vowel_total(self) -> int:
+        return sum(value * count for value, count in enumerate(self.vowel_counts))
+
+    @property
+    def consonant_total(self) -> int:
+        return sum(value * count for value, count in enumerate(self.consonant_counts))
+
+    @property
+    def total(self) -> int:
+        return self.vowel_total + self.consonant_total
+
+    @property
+    def value_counts(self) -> Tuple[int, ...]:
+        return tuple(v + c for v, c in zip(self.vowel_counts, self.consonant_counts))
+
+
+class LetterTable:
+    """Translation tables for one letter-value system."""
+
+    def __init__(self, letter_values: Mapping[str, int], vowels: str = 'AEIOU'):
+        vowels = vowels.upper()
+        codes = bytearray(256)
+        values = bytearray(256)
+        for letter, value in letter_values.items():
+            code = value if letter.upper() in vowels else CONSONANT_OFFSET + value
+            for byte in (ord(letter.upper()), ord(letter.lower())):
+                codes[byte] = code
+                values[byte] = value
+        self._codes = bytes(codes)
+        self._values = bytes(values)
+
+    @staticmethod
+    def _ascii(text: str) -> bytes:
+        if text.isascii():
+            return text.encode('ascii')
+        return text.upper().encode('ascii', 'ignore')
+
+    def encode(self, text: str) -> bytes:
+        """Per-letter codes: the value for vowels, ``CONSONANT_OFFSET + value`` for consonants."""
+        return self._ascii(text).translate(self._codes, _DELETE)
+
+    def total(self, text: str) -> int:
+        """Sum of the letter values in ``text``."""
+        return sum(self._ascii(text).translate(self._values, _DELETE))
+
+    def analyze(self, name: str) -> NameProfile:
+        """Build the NameProfile of ``name`` in a single pass over its letters."""
+        coded = self.encode(name)
+        initials = ''.join(word[0] for word in name.split())
+        return NameProfile(
+            (0, *map(coded.count, _VOWEL_CODES)),
+            (0, *map(coded.count, _CONSONANT_CODES)),
+            self.total(initials),
+        )
+
+
+_tables: Dict[tuple, LetterTable] = {}
+
+
+def get_letter_table(letter_values: Mapping[str, int], vowels: str = 'AEIOU') -> LetterTable:
+    """Return the compiled LetterTable for a letter-value mapping, building it once."""
+    key = (tuple(sorted(letter_values.items())), vowels.upper())
+    table = _tables.get(key)
+    if table is None:
+        table = _tables[key] = LetterTable(letter_values, vowels)
+    return table
@@ -0,0 +1,140 @@
+"""
+Compiled name normalization shared by the name calculations.
+
+A NameNormalizer compiles a transliteration config once, so normalizing a
+name costs a couple of C-level string passes instead of regex passes and
+Python loops over every character:
+
+- punctuation removal, NFKD decomposition, dropping combining marks,
+  lowercasing and single-character rules all act on one character at a
+  time, so their combined result is memoized per character in a
+  ``str.translate`` table filled on first sight;
+- multi-character rules (e.g. Cyrillic digraphs) go into a trie that is
+  walked once over the decomposed name, taking the longest rule at each
+  position.
+
+Rules are matched against the decomposed, lowercased name, exactly as the
+per-character loop they replace did. Recent results are kept in a bounded
+LRU cache; ``normalize_many`` normalizes a batch without flooding it.
+"""
+import re
+import sys
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional
+
+CACHE_SIZE = 8192
+
+_APOSTROPHE_HYPHEN = str.maketrans("'-", '  ')
+_PUNCTUATION = re.compile(r'[^\w\s]')
+_NON_LATIN = re.compile(r'[^a-z\s]')
+# Trie node key holding the replacement of the rule ending at that node
+_END = ''
+
+_combining_marks: Optional[Dict[int, None]] = None
+
+
+def _combining_table() -> Dict[int, None]:
+    """``str.translate`` table deleting every combining character, built on first use."""
+    global _combining_marks
+    if _combining_marks is None:
+        _combining_marks = {
+            codepoint: None for codepoint in range(sys.maxunicode + 1) if unicodedata.combining(chr(codepoint))
+        }
+    return _combining_marks
+
+
+class TransliterationTrie:
+    """Longest-match, single-pass substitution of transliteration rules."""
+
+    def __init__(self, rules: Mapping[str, str]):
+        self.root: Dict[str, dict] = {}
+        for source, target in rules.items():
+            node = self.root
+            for char in source:
+                node = node.setdefault(char, {})
+            node[_END] = target
+        self.first_chars = frozenset(self.root)
+
+    def apply(self, text: str) -> str:
+        """Replace rule matches in ``text``; characters matching no rule are kept."""
+        root = self.root
+        out = []
+        i, length = 0, len(text)
+        while i < length:
+            node = root.get(text[i])
+            match, end = None, i + 1
+            j = i
+            while node is not None:
+                j += 1
+                if _END in node:
+                    match, end = node[_END], j
+                node = node.get(text[j]) if j < length else None
+            out.append(text[i] if match is None else match)
+            i = end
+        return ''.join(out)
+
+
+class _CharFolds(dict):
+    """
+    ``str.translate`` table filled on first sight of each character.
+
+    Every normalization step except multi-character transliteration acts on
+    one character at a time (NFKD only reorders combining marks, which are
+    dropped), so the whole pipeline for a character can be memoized.
+    """
+
+    def __init__(self, fold):
+        super().__init__()
+        self.fold = fold
+
+    def __missing__(self, codepoint: int) -> str:
+        folded = self[codepoint] = self.fold(chr(codepoint))
+        return folded
+
+
+class NameNormalizer:
+    """Normalization of names for one transliteration config."""
+
+    def __init__(self, rules: Optional[Mapping[str, str]] = None, cache_size: int = CACHE_SIZE):
+        rules = {source: target for source, target in (rules or {}).items() if source}
+        self.char_table = str.maketrans({source: target for source, target in rules.items() if len(source) == 1})
+        # Single-character rules go in the trie too so a name is walked once
+        self.trie = TransliterationTrie(rules) if any(len(source) > 1 for source in rules) else None
+        # Decomposed and lowercased, before transliteration
+        self._decomposed = _CharFolds(self._decompose)
+        # The whole pipeline, used when there are no multi-character rules
+        self._folded = _CharFolds(self._fold)
+        # normalize.cache_info() / normalize.cache_clear() are available
+        self.normalize = lru_cache(maxsize=cache_size)(self._normalize)
+
+    @staticmethod
+    def _decompose(char: str) -> str:
+        char = _PUNCTUATION.sub('', char.translate(_APOSTROPHE_HYPHEN))
+        return unicodedata.normalize('NFKD', char).translate(_combining_table()).lower()
+
+    def _fold(self, char: str) -> str:
+        return _NON_LATIN.sub('', self._decompose(char).translate(self.char_table))
+
+    def _normalize(self, name: str) -> str:
+        if not name:
+            return ''
+        name = ' '.join(name.split())
+        if self.trie is None:
+            return ' '.join(name.translate(self._folded).split())
+
+        name = name.translate(self._decomposed)
+        if not self.trie.first_chars.isdisjoint(name):
+            name = self.trie.apply(name)
+        return ' '.join(_NON_LATIN.sub('', name).split())
+
+    def normalize_many(self, names: Iterable[str]) -> List[str]:
+        """
+        Normalize a batch of names, computing each distinct name once.
+
+        Bypasses the LRU cache so a bulk import does not evict the names
+        interactive requests keep hitting.
+        """
+        names = list(names)
+        normalized = {name: self._normalize(name) for name in dict.fromkeys(names)}
+        return [normalized[name] for name in names]
@@ -2,13 +2,14 @@
 Pure deterministic logic for name numerology calculations.
 No side effects, fully testable.
 """
-import unicodedata
-import re
 import json
 import os
-from typing import Dict, List, Optional, Literal, Tuple
+from typing import Dict, Iterable, List, Optional, Literal, Tuple
 from pathlib import Path
 
+from .name_kernel import CONSONANT_OFFSET, get_letter_table
+from .name_normalizer import NameNormalizer
+
 
 # Letter-to-number mappings
 PYTHAGOREAN_MAP = {
@@ -45,6 +46,12 @@ def _load_transliteration_map() -> Dict[str, str]:
 TRANSLITERATION_MAP = _load_transliteration_map()
 
 
+_NORMALIZERS = {
+    True: NameNormalizer(TRANSLITERATION_MAP),
+    False: NameNormalizer(),
+}
+
+
 def normalize_name(name: str, transliterate: bool = True) -> str:
     """
     Normalize a name for numerology calculation.
@@ -57,6 +64,9 @@ def normalize_name(name: str, transliterate: bool = True) -> str:
     5. Lowercase result
     6. Apply transliteration map if enabled
     
+    The steps are compiled once per process by NameNormalizer and recent
+    results are cached.
+    
     Args:
         name: Input name string
         transliterate: Whether to apply transliteration mapping
@@ -64,44 +74,21 @@ def normalize_name(name: str, transliterate: bool = True) -> str:
     Returns:
         Normalized name string
     """
-    if not name:
-        return ""
-    
-    # Step 1 & 2: Strip and collapse whitespace
-    name = ' '.join(name.split())
-    
-    # Step 3: Remove punctuation (keep apostrophes for now, convert to space)
-    # Convert apostrophes and hyphens to spaces
-    name = re.sub(r"[''-]", ' ', name)
-    # Remove other punctuation
-    name = re.sub(r'[^\w\s]', '', name)
-    
-    # Step 4: Strip diacritics using Unicode normalization
-    # Normalize to NFKD (decomposed form) then remove combining characters
-    name = unicodedata.normalize('NFKD', name)
-    name = ''.join(char for char in name if not unicodedata.combining(char))
-    
-    # Step 5: Lowercase
-    name = name.lower()
-    
-    # Step 6: Apply transliteration if enabled
-    if transliterate and TRANSLITERATION_MAP:
-        # Apply transliteration character by character
-        transliterated = []
-        for char in name:
-            if char in TRANSLITERATION_MAP:
-                transliterated.append(TRANSLITERATION_MAP[char])
-            else:
-                transliterated.append(char)
-        name = ''.join(transliterated)
-    
-    # Final cleanup: remove any remaining non-Latin characters that aren't letters or spaces
-    name = re.sub(r'[^a-z\s]', '', name)
-    
-    # Collapse spaces again after transliteration
-    name = ' '.join(name.split())
+    return _NORMALIZERS[bool(transliterate)].normalize(name)
+
+
+def normalize_names(names: Iterable[str], transliterate: bool = True) -> List[str]:
+    """
+    Normalize many names at once, e.g. to deduplicate a bulk people import.
     
-    return name
+    Args:
+        names: Input name strings
+        transliterate: Whether to apply transliteration mapping
+        
+    Returns:
+        Normalized names, in input order
+    """
+    return _NORMALIZERS[bool(transliterate)].normalize_many(names)
 
 
 def letter_value(letter: str, system: Literal["pythagorean", "chaldean"]) -> Optional[int]:
@@ -197,42 +184,36 @@ def compute_name_numbers(
     else:
         raise ValueError(f"Unknown system: {system}")
     
+    table = get_letter_table(letter_map)
+    
     # Break into words
     words = normalized.split()
     
+    # Sums come from the letter histogram; the normalized name holds only a-z
+    # and spaces, so its letters line up one-to-one with the encoded codes
+    profile = table.analyze(normalized)
+    all_letters_sum = profile.total
+    vowels_sum = profile.vowel_total
+    consonants_sum = profile.consonant_total
+    
     # Build letter-by-letter breakdown
     breakdown = []
-    all_letters_sum = 0
-    vowels_sum = 0
-    consonants_sum = 0
     vowels_letters = []
     consonants_letters = []
     
-    for char in normalized:
-        if char == ' ':
-            continue
-        
-        value = letter_map.get(char)
-        if value is None:
-            continue
-        
-        is_vowel = char in VOWELS
-        is_consonant = not is_vowel
+    for char, code in zip(normalized.replace(' ', ''), table.encode(normalized)):
+        is_vowel = code < CONSONANT_OFFSET
         
         breakdown.append({
             'letter': char,
-            'value': value,
+            'value': code if is_vowel else code - CONSONANT_OFFSET,
             'is_vowel': is_vowel,
-            'is_consonant': is_consonant
+            'is_consonant': not is_vowel
         })
         
-        all_letters_sum += value
-        
         if is_vowel:
-            vowels_sum += value
             vowels_letters.append(char)
         else:
-            consonants_sum += value
             consonants_letters.append(char)
     
     # Compute expression (sum of all letters)
@@ -250,7 +231,7 @@ def compute_name_numbers(
     # Compute per-word totals
     word_totals = []
     for word in words:
-        word_sum = sum(letter_map.get(char, 0) for char in word if char.isalpha())
+        word_sum = table.total(word)
         word_reduced, _ = reduce_number(word_sum, keep_master)
         word_totals.append({
             'word': word,
@@ -5,7 +5,9 @@ Supports Pythagorean, Chaldean, and Vedic systems.
 from datetime import datetime, date
 from typing import Dict, Optional, Tuple, List, Set, Any
 import re
-import collections
+from .lookup_tables import get_raj_yog_table
+from .lo_shu_kernel import ArrowTable, LoShuBits, mask_digits
+from .name_kernel import NameProfile, get_letter_table
 
 
 class NumerologyCalculator:
@@ -38,6 +40,63 @@ class NumerologyCalculator:
     MASTER_NUMBERS = {11, 22, 33}
     KARMIC_DEBT_NUMBERS = {13, 14, 16, 19}
     
+    # Lo Shu arrows: rows, columns and diagonals of the 4 9 2 / 3 5 7 / 8 1 6 grid
+    PERSONALITY_ARROWS = {
+        # Rows
+        'mental_plane': {'numbers': [4, 9, 2], 'type': 'row', 'position': 'top', 
+                        'present_meaning': 'Arrow of Planning - Strong mental abilities, good memory, analytical thinking',
+                        'absent_meaning': 'Arrow of Confusion - May struggle with planning, needs to develop mental clarity'},
+        'emotional_plane': {'numbers': [3, 5, 7], 'type': 'row', 'position': 'middle',
+                           'present_meaning': 'Arrow of Emotional Balance - Emotionally stable, good intuition, spiritual awareness',
+                           'absent_meaning': 'Arrow of Sensitivity - Highly sensitive, may experience emotional ups and downs'},
+        'practical_plane': {'numbers': [8, 1, 6], 'type': 'row', 'position': 'bottom',
+                           'present_meaning': 'Arrow of Practicality - Grounded, hardworking, good with material matters',
+                           'absent_meaning': 'Arrow of Impracticality - May struggle with practical matters, needs grounding'},
+        
+        # Columns
+        'thought_plane': {'numbers': [4, 3, 8], 'type': 'column', 'position': 'left',
+                         'present_meaning': 'Arrow of Thought - Strong analytical abilities, logical thinking',
+                         'absent_meaning': 'Arrow of Hesitation - May overthink or hesitate in decision-making'},
+        'will_plane': {'numbers': [9, 5, 1], 'type': 'column', 'position': 'center',
+                      'present_meaning': 'Arrow of Will - Strong determination, leadership abilities',
+                      'absent_meaning': 'Arrow of Weak Will - May need to develop stronger willpower'},
+        'action_plane': {'numbers': [2, 7, 6], 'type': 'column', 'position': 'right',
+                        'present_meaning': 'Arrow of Activity - Action-oriented, gets things done',
+                        'absent_meaning': 'Arrow of Passivity - May need motivation to take action'},
+        
+        # Diagonals
+        'determination': {'numbers': [4, 5, 6], 'type': 'diagonal', 'position': 'left-to-right',
+                         'present_meaning': 'Arrow of Determination - Persistent, achieves goals through dedication',
+                         'absent_meaning': 'Arrow of Frustration - May experience setbacks, needs patience'},
+        'spirituality': {'numbers': [2, 5, 8], 'type': 'diagonal', 'position': 'right-to-left',
+                        'present_meaning': 'Arrow of Spirituality - Spiritual awareness, intuitive abilities',
+                        'absent_meaning': 'Arrow of Skepticism - May be skeptical of spiritual matters'},
+    }
+    _PERSONALITY_ARROW_TABLE = ArrowTable({name: arrow['numbers'] for name, arrow in PERSONALITY_ARROWS.items()})
+    
+    # Raj Yog combinations in detection order; 'numbers' is the reduced (life path, destiny) pair
+    RAJ_YOG_COMBINATIONS = {
+        'master': {'type': 'master', 'name': 'Master Number Raj Yog', 'strength': 90,
+                   'description': 'Powerful combination with master numbers indicating spiritual mastery and high potential'},
+        'leadership': {'type': 'leadership', 'name': 'Leadership Raj Yog', 'numbers': (1, 8), 'strength': 85,
+                       'description': 'Natural leadership abilities with material success and authority'},
+        'material': {'type': 'material', 'name': 'Material Raj Yog', 'numbers': (8, 1), 'strength': 80,
+                     'description': 'Material abundance and success with leadership qualities'},
+        'spiritual': {'type': 'spiritual', 'name': 'Spiritual Raj Yog', 'numbers': (7, 9), 'strength': 85,
+                      'description': 'Deep spiritual wisdom combined with humanitarian service'},
+        'creative': {'type': 'creative', 'name': 'Creative Raj Yog', 'numbers': (3, 6), 'strength': 75,
+                     'description': 'Creative expression combined with nurturing and service'},
+        'service': {'type': 'service', 'name': 'Service Raj Yog', 'numbers': (6, 3), 'strength': 75,
+                    'description': 'Service and nurturing combined with creative expression'},
+        'harmony': {'type': 'other', 'name': 'Harmony Raj Yog', 'numbers': (2, 7), 'strength': 70,
+                    'description': 'Diplomatic harmony combined with spiritual wisdom'},
+        'completion': {'type': 'other', 'name': 'Completion Raj Yog', 'strength': 65,
+                       'description': 'Numbers that sum to 9 indicate completion and fulfillment'},
+        'complementary': {'type': 'other', 'name': 'Complementary Raj Yog ({life_path}-{destiny})', 'strength': 60,
+                          'description': 'Complementary numbers {life_path} and {destiny} create balance and harmony'},
+    }
+    COMPLEMENTARY_PAIRS = {(1, 8), (8, 1), (2, 7), (7, 2), (3, 6), (6, 3), (4, 5), (5, 4)}
+    
     def __init__(self, system: str = 'pythagorean'):
         """
         Initialize calculator with specified system.
@@ -55,6 +114,8 @@ class NumerologyCalculator:
             self.letter_values = self.CHALDEAN
         else:
             self.letter_values = self.VEDIC
+        self._letter_table = get_letter_table(self.letter_values)
+        self._last_profile = None
     
     def _reduce_to_single_digit(self, number: int, preserve_master: bool = True) -> int:
         """
@@ -79,23 +140,25 @@ class NumerologyCalculator:
     
     def _sum_name(self, name: str, vowels_only: bool = False, consonants_only: bool = False) -> int:
         """Sum the numeric values of letters in a name."""
-        name = name.upper()
-        total = 0
-        
-        for char in name:
-            if not char.isalpha():
-                continue
-            
-            is_vowel = char in self.VOWELS
-            
-            if vowels_only and not is_vowel:
-                continue
-            if consonants_only and is_vowel:
-                continue
-            
-            total += self._get_letter_value(char)
+        if vowels_only:
+            return self.analyze_name(name).vowel_total
+        if consonants_only:
+            return self.analyze_name(name).consonant_total
+        return self._letter_table.total(name)
+    
+    def analyze_name(self, full_name: str) -> NameProfile:
+        """
+        Letter-value histogram of a name, from which every name number is derived.
         
-        return total
+        The profile of the most recent name is kept, so calculating several
+        numbers for the same name scans it only once.
+        """
+        last = self._last_profile
+        if last is not None and last[0] == full_name:
+            return last[1]
+        profile = self._letter_table.analyze(full_name)
+        self._last_profile = (full_name, profile)
+        return profile
     
     def calculate_life_path_number(self, birth_date: date) -> int:
         """
@@ -111,17 +174,17 @@ class NumerologyCalculator:
     
     def calculate_destiny_number(self, full_name: str) -> int:
         """Calculate Destiny Number (Expression Number)."""
-        total = self._sum_name(full_name)
+        total = self.analyze_name(full_name).total
         return self._reduce_to_single_digit(total, preserve_master=True)
     
     def calculate_soul_urge_number(self, full_name: str) -> int:
         """Calculate Soul Urge Number (Heart's Desire)."""
-        total = self._sum_name(full_name, vowels_only=True)
+        total = self.analyze_name(full_name).vowel_total
         return self._reduce_to_single_digit(total, preserve_master=True)
     
     def calculate_personality_number(self, full_name: str) -> int:
         """Calculate Personality Number."""
-        total = self._sum_name(full_name, consonants_only=True)
+        total = self.analyze_name(full_name).consonant_total
         return self._reduce_to_single_digit(total, preserve_master=True)
     
     def calculate_attitude_number(self, birth_date: date) -> int:
@@ -279,9 +342,7 @@ class NumerologyCalculator:
     
     def calculate_balance_number(self, full_name: str) -> int:
         """Calculate Balance Number."""
-        words = full_name.strip().split()
-        initials = ''.join(word[0] for word in words if word)
-        total = self._sum_name(initials)
+        total = self.analyze_name(full_name).initials_total
         return self._reduce_to_single_digit(total, preserve_master=False)
     
     def calculate_personal_year_number(self, birth_date: date, target_year: Optional[int] = None) -> int:
@@ -354,22 +415,24 @@ class NumerologyCalculator:
         elif check_reduction_path(lp_sum):
             debts.add(check_reduction_path(lp_sum))
             
+        profile = self.analyze_name(full_name)
+        
         # Expression Check
-        ex_sum = self._sum_name(full_name)
+        ex_sum = profile.total
         if ex_sum in self.KARMIC_DEBT_NUMBERS:
             debts.add(ex_sum)
         elif check_reduction_path(ex_sum):
             debts.add(check_reduction_path(ex_sum))
             
         # Soul Urge Check
-        su_sum = self._sum_name(full_name, vowels_only=True)
+        su_sum = profile.vowel_total
         if su_sum in self.KARMIC_DEBT_NUMBERS:
             debts.add(su_sum)
         elif check_reduction_path(su_sum):
             debts.add(check_reduction_path(su_sum))
             
         # Personality Check
-        pn_sum = self._sum_name(full_name, consonants_only=True)
+        pn_sum = profile.consonant_total
         if pn_sum in self.KARMIC_DEBT_NUMBERS:
             debts.add(pn_sum)
         elif check_reduction_path(pn_sum):
@@ -381,40 +444,20 @@ class NumerologyCalculator:
         """
         Identify missing digits (1-9) in the name.
         """
-        present_numbers = set()
-        name = full_name.upper()
-        for char in name:
-            if char.isalpha():
-                val = self._get_letter_value(char)
-                if val > 0:
-                    present_numbers.add(val)
-        
-        missing = []
-        for i in range(1, 10):
-            if i not in present_numbers:
-                missing.append(i)
-        return missing
+        counts = self.analyze_name(full_name).value_counts
+        return [i for i in range(1, 10) if not counts[i]]
 
     def calculate_hidden_passion_number(self, full_name: str) -> int:
         """
         Calculate Hidden Passion Number: The number that appears most frequently in the name.
         """
-        name = full_name.upper()
-        counts = collections.defaultdict(int)
-        
-        for char in name:
-            if char.isalpha():
-                val = self._get_letter_value(char)
-                if val > 0:
-                    counts[val] += 1
-        
-        if not counts:
+        counts = self.analyze_name(full_name).value_counts
+        max_freq = max(counts)
+        if not max_freq:
             return 0
-            
-        # Find max frequency
-        max_freq = max(counts.values())
-        candidates = [num for num, count in counts.items() if count == max_freq]
-        return max(candidates)
+        
+        # Ties go to the highest number
+        return max(num for num in range(1, 10) if counts[num] == max_freq)
 
     def calculate_subconscious_self_number(self, full_name: str) -> int:
         """Calculate Subconscious Self Number (9 - count of karmic lessons)."""
@@ -504,6 +547,19 @@ class NumerologyCalculator:
             "details": details
         }
 
+    def calculate_lo_shu_digit_counts(self, birth_date: date) -> Dict[int, int]:
+        """
+        Count each digit 1-9 in the birth date (day, month, then year digits).
+        
+        Keys appear in order of first occurrence; zeros are not counted.
+        """
+        number_counts = {}
+        for d in f'{birth_date.day}{birth_date.month}{birth_date.year}':
+            num = int(d)
+            if num:
+                number_counts[num] = number_counts.get(num, 0) + 1
+        return number_counts
+    
     def calculate_lo_shu_grid(self, full_name: str, birth_date: date) -> Dict[str, Any]:
         """
         Calculate Lo Shu Grid (Magic Square) for a person.
@@ -515,30 +571,13 @@ class NumerologyCalculator:
         
         Returns a dictionary with grid positions and interpretations.
         """
-        # Extract digits from birth date - include all individual digits
-        day = birth_date.day
-        month = birth_date.month
-        year = birth_date.year
-        
-        # Get all individual digits from birth date
-        date_digits = []
-        for d in str(day):
-            date_digits.append(int(d))
-        for d in str(month):
-            date_digits.append(int(d))
-        for d in str(year):
-            date_digits.append(int(d))
-        
         # Standard Lo Shu Grid layout (Magic Square)
         # 4 9 2
         # 3 5 7
         # 8 1 6
         
         # Count frequency of each number (1-9) from birth date digits
-        number_counts = {}
-        for num in date_digits:
-            if 1 <= num <= 9:
-                number_counts[num] = number_counts.get(num, 0) + 1
+        number_counts = self.calculate_lo_shu_digit_counts(birth_date)
         
         # Standard Lo Shu positions
         grid_positions = {
@@ -559,8 +598,10 @@ class NumerologyCalculator:
                 'meaning': self._get_lo_shu_meaning(grid_number, position)
             }
         
+        bits = LoShuBits.from_counts(number_counts)
+        
         # Calculate missing numbers (weak areas)
-        missing_numbers = [n for n in range(1, 10) if n not in number_counts or number_counts[n] == 0]
+        missing_numbers = list(mask_digits(bits.missing))
         
         # Calculate strong numbers (appear 2+ times)
         strong_numbers = [n for n, count in number_counts.items() if count >= 2]
@@ -569,7 +610,7 @@ class NumerologyCalculator:
         repeating_numbers = [n for n, count in number_counts.items() if count >= 3]
         
         # Detect personality arrows
-        personality_arrows = self._detect_personality_arrows(number_counts)
+        personality_arrows = self._personality_arrows_for_mask(bits.present)
         
         # Get detailed missing number meanings
         missing_number_details = self._get_missing_number_details(missing_numbers)
@@ -601,68 +642,27 @@ class NumerologyCalculator:
         3 5 7
         8 1 6
         """
-        arrows = []
-        
-        # Define all possible arrows (rows, columns, diagonals)
-        arrow_definitions = {
-            # Rows
-            'mental_plane': {'numbers': [4, 9, 2], 'type': 'row', 'position': 'top', 
-                            'present_meaning': 'Arrow of Planning - Strong mental abilities, good memory, analytical thinking',
-                            'absent_meaning': 'Arrow of Confusion - May struggle with planning, needs to develop mental clarity'},
-            'emotional_plane': {'numbers': [3, 5, 7], 'type': 'row', 'position': 'middle',
-                               'present_meaning': 'Arrow of Emotional Balance - Emotionally stable, good intuition, spiritual awareness',
-                               'absent_meaning': 'Arrow of Sensitivity - Highly sensitive, may experience emotional ups and downs'},
-            'practical_plane': {'numbers': [8, 1, 6], 'type': 'row', 'position': 'bottom',
-                               'present_meaning': 'Arrow of Practicality - Grounded, hardworking, good with material matters',
-                               'absent_meaning': 'Arrow of Impracticality - May struggle with practical matters, needs grounding'},
-            
-            # Columns
-            'thought_plane': {'numbers': [4, 3, 8], 'type': 'column', 'position': 'left',
-                             'present_meaning': 'Arrow of Thought - Strong analytical abilities, logical thinking',
-                             'absent_meaning': 'Arrow of Hesitation - May overthink or hesitate in decision-making'},
-            'will_plane': {'numbers': [9, 5, 1], 'type': 'column', 'position': 'center',
-                          'present_meaning': 'Arrow of Will - Strong determination, leadership abilities',
-                          'absent_meaning': 'Arrow of Weak Will - May need to develop stronger willpower'},
-            'action_plane': {'numbers': [2, 7, 6], 'type': 'column', 'position': 'right',
-                            'present_meaning': 'Arrow of Activity - Action-oriented, gets things done',
-                            'absent_meaning': 'Arrow of Passivity - May need motivation to take action'},
-            
-            # Diagonals
-            'determination': {'numbers': [4, 5, 6], 'type': 'diagonal', 'position': 'left-to-right',
-                             'present_meaning': 'Arrow of Determination - Persistent, achieves goals through dedication',
-                             'absent_meaning': 'Arrow of Frustration - May experience setbacks, needs patience'},
-            'spirituality': {'numbers': [2, 5, 8], 'type': 'diagonal', 'position': 'right-to-left',
-                            'present_meaning': 'Arrow of Spirituality - Spiritual awareness, intuitive abilities',
-                            'absent_meaning': 'Arrow of Skepticism - May be skeptical of spiritual matters'},
+        return self._personality_arrows_for_mask(LoShuBits.from_counts(number_counts).present)
+    
+    def _personality_arrows_for_mask(self, present: int) -> List[Dict[str, Any]]:
+        """Personality arrows of a Lo Shu presence mask (bit d-1 set when d occurs)."""
+        return [
+            self._personality_arrow(arrow_name, present=is_present)
+            for arrow_name, is_present in self._PERSONALITY_ARROW_TABLE.formed(present)
+        ]
+    
+    def _personality_arrow(self, arrow_name: str, present: bool) -> Dict[str, Any]:
+        """Describe one Lo Shu arrow as present (strength) or absent (weakness)."""
+        arrow_def = self.PERSONALITY_ARROWS[arrow_name]
+        return {
+            'name': arrow_name,
+            'numbers': arrow_def['numbers'],
+            'type': arrow_def['type'],
+            'position': arrow_def['position'],
+            'status': 'present' if present else 'absent',
+            'meaning': arrow_def['present_meaning' if present else 'absent_meaning'],
+            'is_strength': present
         }
-        
-        for arrow_name, arrow_def in arrow_definitions.items():
-            numbers = arrow_def['numbers']
-            all_present = all(number_counts.get(n, 0) > 0 for n in numbers)
-            all_absent = all(number_counts.get(n, 0) == 0 for n in numbers)
-            
-            if all_present:
-                arrows.append({
-                    'name': arrow_name,
-                    'numbers': numbers,
-                    'type': arrow_def['type'],
-                    'position': arrow_def['position'],
-                    'status': 'present',
-                    'meaning': arrow_def['present_meaning'],
-                    'is_strength': True
-                })
-            elif all_absent:
-                arrows.append({
-                    'name': arrow_name,
-                    'numbers': numbers,
-                    'type': arrow_def['type'],
-                    'position': arrow_def['position'],
-                    'status': 'absent',
-                    'meaning': arrow_def['absent_meaning'],
-                    'is_strength': False
-                })
-        
-        return arrows
     
     def _get_missing_number_details(self, missing_numbers: List[int]) -> List[Dict[str, Any]]:
         """Get detailed karmic lesson meanings for missing numbers."""
@@ -882,6 +882,9 @@ class NumerologyCalculator:
         - Humanitarian Raj Yog: Life Path 9 + Destiny 9
         - Master Number Raj Yog: Any combination with 11, 22, or 33
         
+        Core numbers (1-9, 11, 22, 33) are looked up in a precomputed table;
+        anything else is evaluated directly.
+        
         Args:
             life_path: Life Path Number
             destiny: Destiny Number (Expression Number)
@@ -897,205 +900,102 @@ class NumerologyCalculator:
             - detected_combinations: List of detected combinations
             - contributing_numbers: Dict of contributing numbers
         """
-        # Normalize master numbers for comparison (keep original for display)
-        lp_normalized = self._reduce_to_single_digit(life_path, preserve_master=False)
-        dest_normalized = self._reduce_to_single_digit(destiny, preserve_master=False)
+        entry = get_raj_yog_table(self).lookup(life_path, destiny, soul_urge, personality)
+        if entry is None:
+            matched = self._match_raj_yog(life_path, destiny)
+            entry = (
+                matched,
+                self._strongest_raj_yog(matched),
+                self._raj_yog_strength(life_path, destiny, matched, soul_urge, personality),
+            )
+        matched, strongest, strength_score = entry
         
-        detected_combinations = []
         contributing_numbers = {
             'life_path': life_path,
             'destiny': destiny,
         }
-        
         if soul_urge is not None:
             contributing_numbers['soul_urge'] = soul_urge
         if personality is not None:
             contributing_numbers['personality'] = personality
         
-        strength_score = 0
-        yog_type = None
-        yog_name = None
-        
-        # Check for Master Number Raj Yog (highest priority)
-        if life_path in self.MASTER_NUMBERS or destiny in self.MASTER_NUMBERS:
-            detected_combinations.append({
-                'type': 'master',
-                'name': 'Master Number Raj Yog',
-                'numbers': {'life_path': life_path, 'destiny': destiny},
-                'description': 'Powerful combination with master numbers indicating spiritual mastery and high potential'
-            })
-            strength_score = 90
-            yog_type = 'master'
-            yog_name = 'Master Number Raj Yog'
-        
-        # Leadership Raj Yog: Life Path 1 + Destiny 8
-        if lp_normalized == 1 and dest_normalized == 8:
-            detected_combinations.append({
-                'type': 'leadership',
-                'name': 'Leadership Raj Yog',
-                'numbers': {'life_path': life_path, 'destiny': destiny},
-                'description': 'Natural leadership abilities with material success and authority'
-            })
-            if strength_score < 85:
-                strength_score = 85
-                yog_type = 'leadership'
-                yog_name = 'Leadership Raj Yog'
-        
-        # Material Raj Yog: Life Path 8 + Destiny 1 (reverse of Leadership)
-        if lp_normalized == 8 and dest_normalized == 1:
-            detected_combinations.append({
-                'type': 'material',
-                'name': 'Material Raj Yog',
-                'numbers': {'life_path': life_path, 'destiny': destiny},
-                'description': 'Material abundance and success with leadership qualities'
-            })
-            if strength_score < 80:
-                strength_score = 80
-                yog_type = 'material'
-                yog_name = 'Material Raj Yog'
-        
-        # Spiritual Raj Yog: Life Path 7 + Destiny 9
-        if lp_normalized == 7 and dest_normalized == 9:
-            detected_combinations.append({
-                'type': 'spiritual',
-                'name': 'Spiritual Raj Yog',
-                'numbers': {'life_path': life_path, 'destiny': destiny},
-                'description': 'Deep spiritual wisdom combined with humanitarian service'
-            })
-            if strength_score < 85:
-                strength_score = 85
-                yog_type = 'spiritual'
-                yog_name = 'Spiritual Raj Yog'
-        
-        # Creative Raj Yog: Life Path 3 + Destiny 6
-        if lp_normalized == 3 and dest_normalized == 6:
-            detected_combinations.append({
-                'type': 'creative',
-                'name': 'Creative Raj Yog',
-                'numbers': {'life_path': life_path, 'destiny': destiny},
-                'description': 'Creative expression combined with nurturing and service'
-            })
-            if strength_score < 75:
-                strength_score = 75
-                yog_type = 'creative'
-                yog_name = 'Creative Raj Yog'
-        
-        # Service Raj Yog: Life Path 6 + Destiny 3 (reverse of Creative)
-        if lp_normalized == 6 and dest_normalized == 3:
-            detected_combinations.append({
-                'type': 'service',
-                'name': 'Service Raj Yog',
-                'numbers': {'life_path': life_path, 'destiny': destiny},
-                'description': 'Service and nurturing combined with creative expression'
-            })
-            if strength_score < 75:
-                strength_score = 75
-                yog_type = 'service'
-                yog_name = 'Service Raj Yog'
-        
-        # Harmony Raj Yog: Life Path 2 + Destiny 7
-        if lp_normalized == 2 and dest_normalized == 7:
-            detected_combinations.append({
-                'type': 'other',
-                'name': 'Harmony Raj Yog',
-                'numbers': {'life_path': life_path, 'destiny': destiny},
-                'description': 'Diplomatic harmony combined with spiritual wisdom'
-            })
-            if strength_score < 70:
-                strength_score = 70
-                yog_type = 'other'
-                yog_name = 'Harmony Raj Yog'
-        
-        # Additional combinations that sum to 9 (completion)
-        if lp_normalized + dest_normalized == 9 or (lp_normalized + dest_normalized) % 9 == 0:
-            if not detected_combinations:  # Only if no other Raj Yog detected
-                detected_combinations.append({
-                    'type': 'other',
-                    'name': 'Completion Raj Yog',
-                    'numbers': {'life_path': life_path, 'destiny': destiny},
-                    'description': 'Numbers that sum to 9 indicate completion and fulfillment'
-                })
-                if strength_score < 65:
-                    strength_score = 65
-                    yog_type = 'other'
-                    yog_name = 'Completion Raj Yog'
-        
-        # Check for complementary numbers (1-8, 2-7, 3-6, 4-5)
-        complementary_pairs = [
-            (1, 8), (8, 1),
-            (2, 7), (7, 2),
-            (3, 6), (6, 3),
-            (4, 5), (5, 4),
+        detected_combinations = [
+            self._raj_yog_combination(key, life_path, destiny) for key in matched
         ]
-        
-        if (lp_normalized, dest_normalized) in complementary_pairs:
-            if not detected_combinations:  # Only if no other Raj Yog detected
-                pair_name = f"Complementary Raj Yog ({lp_normalized}-{dest_normalized})"
-                detected_combinations.append({
-                    'type': 'other',
-                    'name': pair_name,
-                    'numbers': {'life_path': life_path, 'destiny': destiny},
-                    'description': f'Complementary numbers {lp_normalized} and {dest_normalized} create balance and harmony'
-                })
-                if strength_score < 60:
-                    strength_score = 60
-                    yog_type = 'other'
-                    yog_name = pair_name
-        
-        # Boost strength if soul_urge or personality also align
-        if soul_urge is not None:
-            su_normalized = self._reduce_to_single_digit(soul_urge, preserve_master=False)
-            if su_normalized == lp_normalized or su_normalized == dest_normalized:
-                strength_score = min(100, strength_score + 5)
-        
-        if personality is not None:
-            pn_normalized = self._reduce_to_single_digit(personality, preserve_master=False)
-            if pn_normalized == lp_normalized or pn_normalized == dest_normalized:
-                strength_score = min(100, strength_score + 5)
-        
-        is_detected = len(detected_combinations) > 0
+        primary = detected_combinations[matched.index(strongest)] if strongest else None
         
         return {
-            'is_detected': is_detected,
-            'yog_type': yog_type,
-            'yog_name': yog_name,
+            'is_detected': bool(detected_combinations),
+            'yog_type': primary['type'] if primary else None,
+            'yog_name': primary['name'] if primary else None,
             'strength_score': strength_score,
             'detected_combinations': detected_combinations,
             'contributing_numbers': contributing_numbers,
         }
     
+    def _match_raj_yog(self, life_path: int, destiny: int) -> List[str]:
+        """Keys of RAJ_YOG_COMBINATIONS formed by a life path and destiny, in detection order."""
+        pair = (
+            self._reduce_to_single_digit(life_path, preserve_master=False),
+            self._reduce_to_single_digit(destiny, preserve_master=False),
+        )
+        matched = []
+        if life_path in self.MASTER_NUMBERS or destiny in self.MASTER_NUMBERS:
+            matched.append('master')
+        matched.extend(
+            key for key, combination in self.RAJ_YOG_COMBINATIONS.items()
+            if combination.get('numbers') == pair
+        )
+        # Completion and complementary pairs only count when nothing else applies
+        if not matched and sum(pair) % 9 == 0:
+            matched.append('completion')
+        if not matched and pair in self.COMPLEMENTARY_PAIRS:
+            matched.append('complementary')
+        return matched
+    
+    def _strongest_raj_yog(self, matched: List[str]) -> Optional[str]:
+        """First of the strongest matched combinations, which names the yog."""
+        if not matched:
+            return None
+        return max(matched, key=lambda key: self.RAJ_YOG_COMBINATIONS[key]['strength'])
+    
+    def _raj_yog_strength(self, life_path: int, destiny: int, matched: List[str],
+                          soul_urge: Optional[int] = None, personality: Optional[int] = None) -> int:
+        """Strength of the strongest matched combination, boosted by aligned soul urge and personality."""
+        strength_score = max((self.RAJ_YOG_COMBINATIONS[key]['strength'] for key in matched), default=0)
+        aligned = (
+            self._reduce_to_single_digit(life_path, preserve_master=False),
+            self._reduce_to_single_digit(destiny, preserve_master=False),
+        )
+        for number in (soul_urge, personality):
+            if number is not None and self._reduce_to_single_digit(number, preserve_master=False) in aligned:
+                strength_score = min(100, strength_score + 5)
+        return strength_score
+    
+    def _raj_yog_combination(self, key: str, life_path: int, destiny: int) -> Dict[str, Any]:
+        """Describe one detected combination."""
+        combination = self.RAJ_YOG_COMBINATIONS[key]
+        name, description = combination['name'], combination['description']
+        if '{' in name:
+            reduced = {
+                'life_path': self._reduce_to_single_digit(life_path, preserve_master=False),
+                'destiny': self._reduce_to_single_digit(destiny, preserve_master=False),
+            }
+            name, description = name.format(**reduced), description.format(**reduced)
+        return {
+            'type': combination['type'],
+            'name': name,
+            'numbers': {'life_path': life_path, 'destiny': destiny},
+            'description': description,
+        }
+    
     def calculate_all(self, full_name: str, birth_date: date) -> Dict[str, Any]:
         """
         Calculate all numerology numbers at once.
         """
-        life_path = self.calculate_life_path_number(birth_date)
-        destiny = self.calculate_destiny_number(full_name)
-        
-        result = {
-            'life_path_number': life_path,
-            'destiny_number': destiny,
-            'soul_urge_number': self.calculate_soul_urge_number(full_name),
-            'personality_number': self.calculate_personality_number(full_name),
-            'attitude_number': self.calculate_attitude_number(birth_date),
-            'birthday_number': self.calculate_birthday_number(birth_date),
-            'maturity_number': self.calculate_maturity_number(life_path, destiny),
-            'balance_number': self.calculate_balance_number(full_name),
-            'personal_year_number': self.calculate_personal_year_number(birth_date),
-            'personal_month_number': self.calculate_personal_month_number(birth_date),
-            'personal_day_number': self.calculate_personal_day_number(birth_date),
-            'hidden_passion_number': self.calculate_hidden_passion_number(full_name),
-            'subconscious_self_number': self.calculate_subconscious_self_number(full_name),
-            'karmic_debt_numbers': self.calculate_karmic_debt_numbers(birth_date, full_name),
-            'karmic_lessons': self.calculate_karmic_lessons(full_name),
-            'pinnacles': self.calculate_pinnacles(birth_date),
-            'challenges': self.calculate_challenges(birth_date),
-            # Chaldean-specific numbers
-            'driver_number': self.calculate_driver_number(birth_date),
-            'conductor_number': self.calculate_conductor_number(birth_date),
-            'driver_conductor_compatibility': self.calculate_driver_conductor_compatibility(birth_date),
-        }
-        
-        return result
+        from .chart import NumerologyChart
+
+        return NumerologyChart(full_name, birth_date, calculator=self).as_dict()
 
 
 def validate_name(name: str) -> bool:
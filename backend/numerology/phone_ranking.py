@@ -0,0 +1,242 @@
+"""
+Bulk ranking of candidate phone numbers.
+
+Pure deterministic logic, like phone_numerology: candidates are sanitized,
+packed into a digit matrix and scored with numpy in one pass. Per-number
+values (core number, repeated digits, dominant digit, compatibility with
+the owner's number) match compute_phone_numerology and
+compute_compatibility_score exactly.
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .phone_numerology import (
+    MAX_DIGITS,
+    compute_phone_numerology,
+    sanitize_and_validate_phone,
+)
+
+MAX_CANDIDATES = 20000
+DEFAULT_TOP_K = 20
+MASTER_NUMBERS = (11, 22, 33)
+
+# Ranking weights: compatibility is 0-100; without an owner number every
+# candidate gets the neutral midpoint so the other signals decide.
+NEUTRAL_COMPATIBILITY = 50
+VIBRATION_MATCH_BONUS = 20
+REPEAT_WEIGHT = 5
+MAX_REPEAT_SCORE = 5
+
+# Candidates that are already plain international numbers skip the full
+# sanitizer; anything else (letters, extensions, unicode) goes through it.
+_SEPARATORS = re.compile(r'[()\s.\-]')
+_PLAIN_INTERNATIONAL = re.compile(r'(?:\+|00)[0-9]+')
+_MISSING = 255
+
+
+def expand_candidate_range(prefix: str, range_start: str, range_end: str) -> List[str]:
+    """
+    Expand a prefix plus numeric suffix range into candidate numbers.
+
+    ``range_start`` and ``range_end`` must have the same number of digits;
+    suffixes are zero-padded to that width (e.g. '0000'-'0099').
+
+    Raises:
+        ValueError: If the range is malformed or exceeds MAX_CANDIDATES
+    """
+    if not (range_start.isdigit() and range_end.isdigit()) or len(range_start) != len(range_end):
+        raise ValueError('range_start and range_end must be digit strings of equal length')
+    start, end = int(range_start), int(range_end)
+    if end < start:
+        raise ValueError('range_end must not be smaller than range_start')
+    if end - start + 1 > MAX_CANDIDATES:
+        raise ValueError(f'Range expands to more than {MAX_CANDIDATES} candidates')
+    width = len(range_start)
+    return [f'{prefix}{suffix:0{width}d}' for suffix in range(start, end + 1)]
+
+
+def sanitize_candidates(
+    candidates: Iterable[str],
+    country_hint: Optional[str] = None,
+    convert_vanity: bool = False
+) -> Dict:
+    """
+    Sanitize many phone numbers, de-duplicating by E.164.
+
+    Returns:
+        Dict with ``valid`` (E.164 strings in first-seen order) and
+        ``invalid`` (list of {'phone', 'reason'})
+    """
+    valid = []
+    seen = set()
+    invalid = []
+    for raw in candidates:
+        phone = _SEPARATORS.sub('', raw.strip()) if raw else ''
+        if _PLAIN_INTERNATIONAL.fullmatch(phone):
+            e164 = '+' + phone[2:] if phone.startswith('00') else phone
+            digit_count = len(e164) - 1
+            if not 6 <= digit_count <= MAX_DIGITS:
+                result = sanitize_and_validate_phone(raw, country_hint, convert_vanity)
+                invalid.append({'phone': raw, 'reason': result['reason']})
+                continue
+        else:
+            result = sanitize_and_validate_phone(raw, country_hint, convert_vanity)
+            if not result['valid']:
+                invalid.append({'phone': raw, 'reason': result['reason']})
+                continue
+            # Scoring works on ASCII digits; compute_phone_numerology reads
+            # unicode digits the same way and ignores anything else.
+            e164 = '+' + ''.join(str(int(char)) for char in result['e164'] if char.isdecimal())
+        if e164 not in seen:
+            seen.add(e164)
+            valid.append(e164)
+    return {'valid': valid, 'invalid': invalid}
+
+
+def _national_offsets(numbers: Sequence[str], lengths: np.ndarray) -> np.ndarray:
+    """Digits to skip for core_scope='national' (mirrors compute_phone_numerology)."""
+    prefixes = np.array([number[:3] for number in numbers])
+    offsets = np.where(lengths > 10, 1, 0)
+    offsets = np.where(np.char.startswith(prefixes, '+1'), 1, offsets)
+    offsets = np.where(np.isin(prefixes, ['+44', '+91']), 2, offsets)
+    return offsets
+
+
+def _digit_matrix(numbers: Sequence[str]):
+    """Pack E.164 numbers into a (n, MAX_DIGITS) uint8 matrix of national digits."""
+    raw = np.full((len(numbers), MAX_DIGITS + 2), ord('0') + _MISSING, dtype=np.uint16)
+    lengths = np.fromiter((len(number) - 1 for number in numbers), dtype=np.int64, count=len(numbers))
+    joined = np.frombuffer(''.join(number[1:] for number in numbers).encode('ascii'), dtype=np.uint8)
+    rows = np.repeat(np.arange(len(numbers)), lengths)
+    cols = np.arange(len(joined)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    raw[rows, cols] = joined
+
+    # Shift each row left by its country-code offset.
+    offsets = _national_offsets(numbers, lengths)
+    shifted = np.arange(MAX_DIGITS)[None, :] + offsets[:, None]
+    digits = np.take_along_axis(raw, shifted, axis=1) - ord('0')
+    national_lengths = lengths - offsets
+    mask = np.arange(MAX_DIGITS)[None, :] < national_lengths[:, None]
+    digits = np.where(mask, digits, _MISSING).astype(np.uint8)
+    return digits, mask
+
+
+def reduce_numbers(totals: np.ndarray, keep_master: bool = False) -> np.ndarray:
+    """Vectorized phone_numerology.reduce_number (reduced value only)."""
+    current = totals.astype(np.int64)
+    while True:
+        pending = current >= 10
+        if keep_master:
+            pending &= ~np.isin(current, MASTER_NUMBERS)
+        if not pending.any():
+            return current
+        values = current[pending]
+        digit_sum = np.zeros_like(values)
+        while values.any():
+            digit_sum += values % 10
+            values //= 10
+        current[pending] = digit_sum
+
+
+def score_candidates(
+    numbers: Sequence[str],
+    owner_e164: Optional[str] = None,
+    preferred_numbers: Optional[Iterable[int]] = None,
+    keep_master: bool = False
+) -> Dict[str, np.ndarray]:
+    """
+    Compute numerology scores for many E.164 numbers at once.
+
+    Args:
+        numbers: Sanitized E.164 numbers
+        owner_e164: Owner's number for compatibility scoring
+        preferred_numbers: Core numbers that earn a vibration bonus
+        keep_master: Whether to preserve master numbers in reductions
+
+    Returns:
+        Dict of arrays: raw_total, core_number, dominant_digit (-1 if none),
+        repeat_score, compatibility_score (-1 without owner) and score
+    """
+    digits, mask = _digit_matrix(numbers)
+    raw_total = np.where(mask, digits, 0).sum(axis=1, dtype=np.int64)
+    core = reduce_numbers(raw_total, keep_master)
+
+    # Per-digit counts and first positions, in the order digits first appear.
+    one_hot = digits[:, :, None] == np.arange(10)[None, None, :]
+    counts = one_hot.sum(axis=1)
+    first_position = np.where(counts > 0, one_hot.argmax(axis=1), MAX_DIGITS)
+    dominant_position = np.where(counts >= 3, first_position, MAX_DIGITS)
+    dominant = np.where(
+        dominant_position.min(axis=1) < MAX_DIGITS, dominant_position.argmin(axis=1), -1
+    )
+    repeat_score = np.minimum(np.maximum(counts - 1, 0).sum(axis=1), MAX_REPEAT_SCORE)
+
+    if owner_e164:
+        owner = compute_phone_numerology(owner_e164, core_scope='national', keep_master=keep_master)
+        owner_core = owner['core_number']['reduced']
+        owner_digits = np.zeros(10, dtype=bool)
+        owner_digits[[int(d) for d in owner['repeated_digits']]] = True
+        base = np.clip(100 - np.abs(core - owner_core) * 11, 0, 100)
+        shared = ((counts > 0) & owner_digits[None, :]).sum(axis=1)
+        compatibility = np.minimum(100, base + np.minimum(15, shared * 5))
+        ranking_base = compatibility
+    else:
+        compatibility = np.full(len(numbers), -1)
+        ranking_base = np.full(len(numbers), NEUTRAL_COMPATIBILITY)
+
+    preferred = list(preferred_numbers or [])
+    vibration_bonus = np.where(np.isin(core, preferred), VIBRATION_MATCH_BONUS, 0) if preferred else 0
+    score = ranking_base + vibration_bonus + repeat_score * REPEAT_WEIGHT
+
+    return {
+        'raw_total': raw_total,
+        'core_number': core,
+        'dominant_digit': dominant,
+        'repeat_score': repeat_score,
+        'compatibility_score': compatibility,
+        'score': score,
+    }
+
+
+def rank_phone_candidates(
+    candidates: Iterable[str],
+    owner_e164: Optional[str] = None,
+    preferred_numbers: Optional[Iterable[int]] = None,
+    top_k: int = DEFAULT_TOP_K,
+    country_hint: Optional[str] = None,
+    convert_vanity: bool = False
+) -> Dict:
+    """
+    Sanitize, score and rank candidate phone numbers.
+
+    Ties are broken by input order so rankings are reproducible.
+
+    Returns:
+        Dict with counts, invalid candidates and the top ``top_k`` results
+    """
+    sanitized = sanitize_candidates(candidates, country_hint, convert_vanity)
+    numbers = sanitized['valid']
+    results = []
+    if numbers:
+        scores = score_candidates(numbers, owner_e164, preferred_numbers)
+        order = np.lexsort((np.arange(len(numbers)), -scores['score']))[:top_k]
+        for index in order:
+            dominant = int(scores['dominant_digit'][index])
+            compatibility = int(scores['compatibility_score'][index])
+            results.append({
+                'phone_e164': numbers[index],
+                'score': int(scores['score'][index]),
+                'core_number': int(scores['core_number'][index]),
+                'raw_total': int(scores['raw_total'][index]),
+                'dominant_digit': str(dominant) if dominant >= 0 else None,
+                'repeat_score': int(scores['repeat_score'][index]),
+                'compatibility_score': compatibility if compatibility >= 0 else None,
+            })
+    return {
+        'total_candidates': len(numbers) + len(sanitized['invalid']),
+        'valid_candidates': len(numbers),
+        'invalid_candidates': sanitized['invalid'],
+        'results': results,
+    }
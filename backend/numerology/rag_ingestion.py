@@ -1,96 +1,498 @@
-# Requirements: openai or your embedding client, chromadb/pinecone client, requests
+"""
+Retrieval over the numerology encyclopedia.
+
+``data/numerology_encyclopedia.json`` is split into paragraph-level chunks,
+embedded, and written to an on-disk index:
+
+    <index_dir>/CURRENT                  name of the active version directory
+    <index_dir>/<version>/vectors.f32    row-major float32 matrix (unit rows)
+    <index_dir>/<version>/chunks.json    id, text and metadata per row
+    <index_dir>/<version>/manifest.json  source hash, embedder, shape
+
+Each version directory is written once and never modified; ingestion
+publishes a new version by atomically replacing ``CURRENT``. Readers open
+the matrix as a read-only memory map, so every gunicorn worker shares the
+same page-cache copy, and pick up new versions on their next lookup.
+
+Re-ingestion is incremental: chunk ids are content hashes, so only chunks
+whose text changed are embedded again.
+"""
+import hashlib
 import json
+import logging
 import os
+import re
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from uuid import uuid4
-# from some_embedding_lib import embed_text_batch
-# from vector_store_lib import VectorStoreClient  # pseudocode
 
-# Placeholder for actual embedding and vector store libraries
-# You would replace these with actual implementations, e.g., OpenAI and Pinecone/ChromaDB
+import numpy as np
+from django.conf import settings
+from django.utils import timezone
+
+from .services.semantic_cache import HashingEmbedder, get_embedder
+
+logger = logging.getLogger(__name__)
+
+ENCYCLOPEDIA_PATH = Path(__file__).resolve().parent / 'data' / 'numerology_encyclopedia.json'
+
+# Matches the encyclopedia's own ingestion_recommendations.
+CHUNK_SIZE = 800
+CHUNK_OVERLAP = 100
+
+SYSTEMS = ('pythagorean', 'chaldean', 'vedic')
+FILTER_FIELDS = ('section', 'system', 'path')
+
+_STOPWORDS = frozenset(
+    'a an and are as at be by for from has in is it its of on or that the this to with'.split()
+)
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def get_index_dir() -> Path:
+    return Path(getattr(settings, 'NUMEROLOGY_RAG_INDEX_DIR', settings.BASE_DIR / 'rag_index'))
+
+
+# ---------------------------------------------------------------------------
+# Chunking
+# ---------------------------------------------------------------------------
+
+def _is_scalar(value: Any) -> bool:
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+def _render(value: Any, indent: str = '') -> str:
+    """Render a JSON subtree as indented ``key: value`` lines."""
+    if isinstance(value, dict):
+        lines = []
+        for key, item in value.items():
+            if _is_scalar(item) or (isinstance(item, list) and all(_is_scalar(i) for i in item)):
+                lines.append(f"{indent}{key}: {_render(item)}")
+            else:
+                lines.append(f"{indent}{key}:\n{_render(item, indent + '  ')}")
+        return '\n'.join(lines)
+    if isinstance(value, list):
+        if all(_is_scalar(item) for item in value):
+            return ', '.join(str(item) for item in value)
+        return '\n'.join(f"{indent}- {_render(item, indent + '  ').lstrip()}" for item in value)
+    return str(value)
+
+
+def _split_text(text: str) -> List[str]:
+    """Split long text on paragraphs, then sentences, with a small overlap."""
+    paragraphs = [p.strip() for p in re.split(r'\n\s*\n', text) if p.strip()]
+    pieces = []
+    for paragraph in paragraphs:
+        if len(paragraph) <= CHUNK_SIZE:
+            pieces.append(paragraph)
+            continue
+        current = ''
+        for sentence in re.split(r'(?<=[.!?])\s+', paragraph):
+            if current and len(current) + len(sentence) + 1 > CHUNK_SIZE:
+                pieces.append(current)
+                current = current[-CHUNK_OVERLAP:].lstrip()
+            current = f"{current} {sentence}".strip()
+        if current:
+            pieces.append(current)
+    return pieces
+
+
+def _pack(lines: List[str]) -> List[str]:
+    """Group short lines into paragraphs of at most CHUNK_SIZE characters."""
+    paragraphs, current = [], ''
+    for line in lines:
+        if current and len(current) + len(line) + 1 > CHUNK_SIZE:
+            paragraphs.append(current)
+            current = ''
+        current = f"{current}\n{line}" if current else line
+    if current:
+        paragraphs.append(current)
+    return paragraphs
+
+
+def _walk(path: Tuple[str, ...], value: Any) -> Iterable[Tuple[Tuple[str, ...], str]]:
+    """Yield ``(path, paragraph)`` pairs for a JSON subtree."""
+    if not isinstance(value, (dict, list)):
+        for piece in _split_text(str(value)):
+            yield path, piece
+        return
+
+    rendered = _render(value)
+    if len(rendered) <= CHUNK_SIZE:
+        # Small record (e.g. a letter mapping or one digit's meanings)
+        if rendered:
+            yield path, rendered
+        return
+
+    items = value.items() if isinstance(value, dict) else enumerate(value)
+    short_lines = []
+    for key, item in items:
+        if _is_scalar(item) and len(str(item)) < CHUNK_SIZE // 4:
+            # Runs of short entries (e.g. compound number meanings) share a paragraph
+            short_lines.append(f"{key}: {item}")
+        else:
+            yield from _walk(path + (str(key),), item)
+    for paragraph in _pack(short_lines):
+        yield path, paragraph
 
-def embed_text_batch(texts, model="text-embedding-3-large"):
+
+def chunk_encyclopedia(data: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
-    Placeholder for embedding function.
-    Replace with actual call to OpenAI or other provider.
+    Split the encyclopedia into paragraph-level chunks.
+
+    Each chunk's text starts with its heading path so that the section and
+    system names contribute to its embedding.
     """
-    print(f"Embedding {len(texts)} chunks with model {model}...")
-    # Return dummy embeddings for demonstration
-    return [[0.1] * 1536 for _ in texts]
+    version = data.get('meta', {}).get('version')
+    chunks = []
+    for path, paragraph in _walk((), data):
+        title = ' > '.join(path)
+        text = f"{title}\n{paragraph}" if title else paragraph
+        system = next((part for part in path if part in SYSTEMS), None)
+        chunks.append({
+            'id': hashlib.sha256(text.encode('utf-8')).hexdigest()[:32],
+            'text': text,
+            'metadata': {
+                'section': path[0] if path else None,
+                'path': '.'.join(path),
+                'system': system,
+                'version': version,
+            },
+        })
+    return chunks
+
+
+# ---------------------------------------------------------------------------
+# Embedding
+# ---------------------------------------------------------------------------
+
+def text_features(text: str) -> List[str]:
+    """Distinct word unigrams and bigrams used by the hashing embedder."""
+    # Single letters (mapping tables) carry no meaning on their own.
+    words = [
+        w for w in _TOKEN_RE.findall(text.lower())
+        if w not in _STOPWORDS and not (len(w) == 1 and w.isalpha())
+    ]
+    return list(dict.fromkeys(words + [f"{a}_{b}" for a, b in zip(words, words[1:])]))
+
+
+def chunk_features(text: str) -> List[str]:
+    """Features of a chunk, counting its heading line twice."""
+    heading, _, body = text.partition('\n')
+    return text_features(heading) * 2 + text_features(body)
+
+
+def embed_text_batch(texts: List[str], embedder=None) -> np.ndarray:
+    """Embed chunk ``texts`` into an ``(n, dimensions)`` float32 matrix of unit rows."""
+    embedder = embedder or get_embedder()
+    matrix = np.zeros((len(texts), embedder.dimensions), dtype=np.float32)
+    for row, text in enumerate(texts):
+        matrix[row] = embedder.embed(chunk_features(text))
+    return matrix
+
+
+def _embedder_for(name: str):
+    if name == HashingEmbedder.name:
+        return HashingEmbedder()
+    embedder = get_embedder()
+    if embedder.name != name:
+        raise ValueError(f"Index was built with embedder {name}, configured embedder is {embedder.name}")
+    return embedder
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+class VectorIndex:
+    """Read-only view of one published index version."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path / 'manifest.json') as f:
+            self.manifest = json.load(f)
+        with open(self.path / 'chunks.json') as f:
+            self.chunks = json.load(f)
+
+        count, dimensions = self.manifest['count'], self.manifest['dimensions']
+        if count:
+            self.vectors = np.memmap(
+                self.path / 'vectors.f32', dtype=np.float32, mode='r', shape=(count, dimensions)
+            )
+        else:
+            self.vectors = np.zeros((0, dimensions), dtype=np.float32)
+        self.embedder = _embedder_for(self.manifest['embedder'])
+
+        # Inverted index per filterable field: value -> sorted row numbers
+        self._postings: Dict[str, Dict[Any, np.ndarray]] = {}
+        for field in FILTER_FIELDS:
+            rows: Dict[Any, List[int]] = {}
+            for row, chunk in enumerate(self.chunks):
+                rows.setdefault(chunk['metadata'].get(field), []).append(row)
+            self._postings[field] = {value: np.asarray(r, dtype=np.intp) for value, r in rows.items()}
+
+    def __len__(self):
+        return len(self.chunks)
+
+    def _candidate_rows(self, filter: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """Rows allowed by ``filter`` (None means all rows)."""
+        if not filter:
+            return None
+        rows = None
+        for field, condition in filter.items():
+            postings = self._postings.get(field)
+            if postings is None:
+                raise ValueError(f"Cannot filter on metadata field: {field}")
+            values = condition['$in'] if isinstance(condition, dict) else [condition]
+            matched = [postings[v] for v in values if v in postings]
+            field_rows = np.unique(np.concatenate(matched)) if matched else np.zeros(0, dtype=np.intp)
+            rows = field_rows if rows is None else np.intersect1d(rows, field_rows, assume_unique=True)
+        return rows
+
+    def search_vector(
+        self,
+        vector: np.ndarray,
+        top_k: int = 8,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Top-k chunks by cosine similarity, optionally restricted by metadata."""
+        rows = self._candidate_rows(filter)
+        matrix = self.vectors if rows is None else self.vectors[rows]
+        if not len(matrix) or top_k <= 0:
+            return []
+
+        scores = matrix @ vector
+        k = min(top_k, len(scores))
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best])]
+
+        hits = []
+        for position in best:
+            row = int(position if rows is None else rows[position])
+            chunk = self.chunks[row]
+            hits.append({
+                'id': chunk['id'],
+                'text': chunk['text'],
+                'metadata': chunk['metadata'],
+                'score': float(scores[position]),
+            })
+        return hits
 
-class VectorStoreClient:
+    def search(self, query: str, top_k: int = 8, filter: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Top-k chunks for a text query.
+
+        ``filter`` maps metadata fields to a value or ``{"$in": [values]}``.
+        """
+        return self.search_vector(self.embedder.embed(text_features(query)), top_k, filter)
+
+
+def _read_current(index_dir: Path) -> Optional[str]:
+    try:
+        return (index_dir / 'CURRENT').read_text().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+_loaded: Dict[str, Tuple[str, VectorIndex]] = {}
+_loaded_lock = threading.Lock()
+
+
+def get_vector_index(index_dir: Optional[Path] = None) -> Optional[VectorIndex]:
     """
-    Placeholder for Vector Store Client.
-    Replace with actual client (Pinecone, Weaviate, ChromaDB, etc.)
+    Return the active index for this process, or None if nothing is ingested.
+
+    The index is reopened only when ``CURRENT`` points at a new version.
     """
-    def __init__(self, namespace="numerology_v1"):
-        self.namespace = namespace
-        print(f"Initialized VectorStoreClient with namespace {namespace}")
-
-    def upsert(self, docs):
-        print(f"Upserting {len(docs)} documents into {self.namespace}...")
-        # Actual upsert logic here
-
-    def similarity_search(self, query, top_k=8, filter=None):
-        print(f"Searching for: '{query}' with top_k={top_k}, filter={filter}")
-        # Return dummy hits
-        return [
-            {"text": "Dummy context 1", "metadata": {"section": "algorithms"}},
-            {"text": "Dummy context 2", "metadata": {"section": "interpretations"}}
-        ]
-
-def ingest_numerology_data():
-    # Load JSON
-    json_path = os.path.join(os.path.dirname(__file__), "data", "numerology_encyclopedia.json")
+    index_dir = Path(index_dir or get_index_dir())
+    version = _read_current(index_dir)
+    if version is None:
+        return None
+
+    key = str(index_dir)
+    loaded = _loaded.get(key)
+    if loaded and loaded[0] == version:
+        return loaded[1]
+
+    with _loaded_lock:
+        loaded = _loaded.get(key)
+        if not loaded or loaded[0] != version:
+            loaded = (version, VectorIndex(index_dir / version))
+            _loaded[key] = loaded
+    return loaded[1]
+
+
+def _write_version(target: Path, chunks: List[Dict[str, Any]], vectors: np.ndarray, manifest: Dict[str, Any]):
+    """Write a version directory under a temporary name, then rename it into place."""
+    staging = target.parent / f".tmp-{uuid4().hex}"
+    staging.mkdir(parents=True)
     try:
-        with open(json_path, "r") as f:
-            data = json.load(f)
-    except FileNotFoundError:
-        print(f"Error: File not found at {json_path}")
-        return
+        if len(vectors):
+            matrix = np.memmap(staging / 'vectors.f32', dtype=np.float32, mode='w+', shape=vectors.shape)
+            matrix[:] = vectors
+            matrix.flush()
+            del matrix
+        else:
+            (staging / 'vectors.f32').touch()
+        with open(staging / 'chunks.json', 'w') as f:
+            json.dump(chunks, f, ensure_ascii=False)
+        with open(staging / 'manifest.json', 'w') as f:
+            json.dump(manifest, f)
+        os.replace(staging, target)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
+        if not target.exists():
+            raise
+
+
+def _publish(index_dir: Path, version: str) -> None:
+    pointer = index_dir / f".CURRENT-{uuid4().hex}"
+    pointer.write_text(version)
+    os.replace(pointer, index_dir / 'CURRENT')
+
+
+def _prune(index_dir: Path, keep: Iterable[str]) -> None:
+    """Remove old versions, keeping ``keep`` for workers still reading them."""
+    keep = set(keep)
+    for entry in index_dir.iterdir():
+        if entry.is_dir() and not entry.name.startswith('.') and entry.name not in keep:
+            shutil.rmtree(entry, ignore_errors=True)
+
+
+def ingest_numerology_data(
+    json_path: Optional[Path] = None,
+    index_dir: Optional[Path] = None,
+    embedder=None,
+    force: bool = False,
+) -> Dict[str, Any]:
+    """
+    Build or refresh the encyclopedia index.
+
+    Unchanged sources are skipped. When the source changes, embeddings of
+    chunks whose text is unchanged are copied from the active version and
+    only new chunks are embedded.
+
+    Returns counts of ``added``, ``reused`` and ``removed`` chunks plus the
+    published ``version``.
+    """
+    json_path = Path(json_path or ENCYCLOPEDIA_PATH)
+    index_dir = Path(index_dir or get_index_dir())
+    embedder = embedder or get_embedder()
+
+    raw = json_path.read_bytes()
+    source_hash = hashlib.sha256(raw).hexdigest()
+    version = f"{source_hash[:16]}-{embedder.name}"
+    current = _read_current(index_dir)
+
+    if current == version and not force:
+        return {'version': version, 'added': 0, 'reused': 0, 'removed': 0, 'unchanged': True}
+
+    chunks = chunk_encyclopedia(json.loads(raw))
+
+    previous_rows: Dict[str, np.ndarray] = {}
+    if current and (index_dir / current).is_dir():
+        try:
+            previous = VectorIndex(index_dir / current)
+            if previous.manifest['embedder'] == embedder.name:
+                previous_rows = {
+                    chunk['id']: previous.vectors[row] for row, chunk in enumerate(previous.chunks)
+                }
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable RAG index {current}: {str(e)}")
+
+    vectors = np.zeros((len(chunks), embedder.dimensions), dtype=np.float32)
+    missing = [row for row, chunk in enumerate(chunks) if chunk['id'] not in previous_rows]
+    if missing:
+        vectors[missing] = embed_text_batch([chunks[row]['text'] for row in missing], embedder)
+    for row, chunk in enumerate(chunks):
+        if chunk['id'] in previous_rows:
+            vectors[row] = previous_rows[chunk['id']]
+
+    index_dir.mkdir(parents=True, exist_ok=True)
+    target = index_dir / version
+    if force and target.exists():
+        shutil.rmtree(target)
+    if not target.exists():
+        _write_version(target, chunks, vectors, {
+            'source_sha256': source_hash,
+            'embedder': embedder.name,
+            'dimensions': embedder.dimensions,
+            'count': len(chunks),
+            'created_at': timezone.now().isoformat(),
+        })
+    _publish(index_dir, version)
+    _prune(index_dir, keep=[version, current] if current else [version])
+
+    new_ids = {chunk['id'] for chunk in chunks}
+    stats = {
+        'version': version,
+        'added': len(missing),
+        'reused': len(chunks) - len(missing),
+        'removed': len(set(previous_rows) - new_ids),
+        'unchanged': False,
+    }
+    logger.info(f"Published numerology RAG index {version}: {stats}")
+    return stats
+
+
+# ---------------------------------------------------------------------------
+# Query flow
+# ---------------------------------------------------------------------------
+
+def retrieve(query: str, top_k: int = 4, filter: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Top-k encyclopedia chunks for ``query`` (empty if no index is built)."""
+    index = get_vector_index()
+    if index is None:
+        return []
+    return index.search(query, top_k=top_k, filter=filter)
+
+
+def retrieve_context(query: str, top_k: int = 4, filter: Optional[Dict[str, Any]] = None) -> str:
+    """Retrieved chunks joined into a prompt section."""
+    return '\n\n'.join(hit['text'] for hit in retrieve(query, top_k=top_k, filter=filter))
+
+
+# Sections that ground an explanation prompt; the rest are schemas and prompts
+REFERENCE_FILTER = {'section': {'$in': ['algorithms', 'systems', 'interpretations']}}
+
+
+def reference_query(topic: str, numbers: Iterable[Any], system: Optional[str] = None) -> str:
+    """
+    Retrieval query for an explanation prompt about ``numbers``.
+
+    Each number becomes ``number N`` so it matches the digit interpretation
+    chunks; empty values and repeats are dropped.
+    """
+    parts = [topic]
+    if system:
+        parts.append(system)
+    parts.extend(f'number {number}' for number in dict.fromkeys(numbers) if number not in (None, ''))
+    return ' '.join(parts)
+
 
-    # Flatten into chunks (simple: by top-level keys)
-    chunks = []
-    for key, value in data.items():
-        # We can further chunk if the value is large, but for now top-level keys
-        text = json.dumps({key: value}, ensure_ascii=False, indent=2)
-        chunks.append({"id": str(uuid4()), "text": text, "metadata": {"section": key}})
-
-    # Create embeddings
-    texts = [c["text"] for c in chunks]
-    embeddings = embed_text_batch(texts, model="text-embedding-3-large")
-
-    # Upsert into vector DB
-    vs = VectorStoreClient(namespace="numerology_v1")
-    docs = []
-    for c, emb in zip(chunks, embeddings):
-        docs.append({"id": c["id"], "embedding": emb, "metadata": c["metadata"], "text": c["text"]})
-    vs.upsert(docs)
-    print("Ingestion complete.")
-
-# Query flow: compute profile
 def compute_profile_rag(name, birthdate, system="pythagorean"):
     """
-    Example function to demonstrate RAG query flow.
+    Ask the LLM for a full profile grounded in retrieved encyclopedia rules.
+
+    Returns the LLM service result, or None when no LLM is configured.
     """
-    # Step 1: create retrieval query
-    vs = VectorStoreClient(namespace="numerology_v1")
-    q = f"Rules to compute life path, expression, soul urge, personality, pinnacles, challenges for system {system}"
-    hits = vs.similarity_search(q, top_k=8, filter={"section":{"$in":["algorithms","systems","interpretations","examples"]}})
-    context = "\n\n".join([h["text"] for h in hits])
-    
-    # Step 2: compose system+user prompt
-    system_prompt = "You are a deterministic numerology engine. Use only the provided context to compute numbers, show steps, and produce JSON output."
-    user_prompt = f"CONTEXT:\n{context}\n\nUSER INPUT:\nname:{name}\nbirthdate:{birthdate}\nsystem:{system}\n\nReturn JSON with computed numbers + interpretations."
-    
-    # Step 3: call LLM (use your platform client)
-    print("--- Prompt to LLM ---")
-    print(f"System: {system_prompt}")
-    print(f"User: {user_prompt}")
-    
-    # resp = openai.chat.completions.create(model="gpt-4o-mini", messages=[{"role":"system","content":system_prompt},{"role":"user","content":user_prompt}], stream=False)
-    # return resp
-    return "LLM Response Placeholder"
-
-if __name__ == "__main__":
-    ingest_numerology_data()
-    print(compute_profile_rag("Jane Doe", "1992-07-24", "pythagorean"))
+    from .services.llm_service import get_llm_service
+
+    llm_service = get_llm_service()
+    if not llm_service.is_available():
+        return None
+
+    query = f"Rules to compute life path, expression, soul urge, personality, pinnacles, challenges for system {system}"
+    user_prompt = (
+        f"Compute the full numerology profile for:\nname: {name}\nbirthdate: {birthdate}\nsystem: {system}\n\n"
+        "Show the calculation steps and return JSON with computed numbers and interpretations."
+    )
+    return llm_service.generate_explanation(
+        prompt=user_prompt,
+        reference_query=query,
+        reference_filter={'section': {'$in': ['algorithms', 'systems', 'interpretations', 'examples']}},
+        max_tokens=1200,
+        temperature=0.2,
+    )
@@ -4,10 +4,11 @@ Serializers for NumerAI numerology application.
 from rest_framework import serializers
 from .models import (
     NumerologyProfile, DailyReading, CompatibilityCheck, Remedy, RemedyTracking,
-    Person, PersonNumerologyProfile, RajYogDetection, Explanation, NameReport,
+    Person, PersonNumerologyProfile, PeopleImport, RajYogDetection, Explanation, NameReport,
     WeeklyReport, YearlyReport, PhoneReport, HealthNumerologyProfile, NameCorrection,
     SpiritualNumerologyProfile, PredictiveCycle
 )
+from .phone_ranking import DEFAULT_TOP_K, MAX_CANDIDATES, expand_candidate_range
 
 
 class NumerologyProfileSerializer(serializers.ModelSerializer):
@@ -176,6 +177,19 @@ class PersonNumerologyProfileSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'calculated_at', 'updated_at']
 
 
+class PeopleImportSerializer(serializers.ModelSerializer):
+    """Serializer for people import progress and results."""
+    
+    class Meta:
+        model = PeopleImport
+        fields = [
+            'id', 'file_format', 'status', 'processed_rows', 'created_count',
+            'duplicate_count', 'error_count', 'errors', 'error_message',
+            'created_at', 'completed_at'
+        ]
+        read_only_fields = fields
+
+
 class NumerologyReportSerializer(serializers.Serializer):
     """Serializer for comprehensive numerology report."""
     user_profile = serializers.DictField()
@@ -309,6 +323,43 @@ class PhoneNumerologyGenerateSerializer(serializers.Serializer):
     convert_vanity = serializers.BooleanField(default=False)
 
 
+class PhoneCandidateRankingSerializer(serializers.Serializer):
+    """Serializer for bulk phone candidate ranking request."""
+    candidates = serializers.ListField(
+        child=serializers.CharField(max_length=50, allow_blank=True),
+        required=False,
+        max_length=MAX_CANDIDATES
+    )
+    prefix = serializers.CharField(required=False, max_length=20)
+    range_start = serializers.CharField(required=False, max_length=10)
+    range_end = serializers.CharField(required=False, max_length=10)
+    owner_phone = serializers.CharField(required=False, max_length=50, allow_blank=True)
+    preferred_numbers = serializers.ListField(
+        child=serializers.IntegerField(min_value=1, max_value=33),
+        required=False
+    )
+    top_k = serializers.IntegerField(default=DEFAULT_TOP_K, min_value=1, max_value=500)
+    country_hint = serializers.CharField(required=False, max_length=10, allow_blank=True)
+    convert_vanity = serializers.BooleanField(default=False)
+
+    def validate(self, data):
+        has_range = any(data.get(field) for field in ('prefix', 'range_start', 'range_end'))
+        if data.get('candidates') and has_range:
+            raise serializers.ValidationError('Provide either candidates or a prefix range, not both.')
+        if has_range:
+            if not all(data.get(field) for field in ('prefix', 'range_start', 'range_end')):
+                raise serializers.ValidationError('prefix, range_start and range_end are required together.')
+            try:
+                data['candidates'] = expand_candidate_range(
+                    data['prefix'], data['range_start'], data['range_end']
+                )
+            except ValueError as e:
+                raise serializers.ValidationError(str(e))
+        if not data.get('candidates'):
+            raise serializers.ValidationError('Provide candidates or a prefix range.')
+        return data
+
+
 class LoShuGridComparisonSerializer(serializers.Serializer):
     """Serializer for Lo Shu Grid comparison request."""
     person1_id = serializers.CharField(required=True, help_text="Person 1 ID or 'self' for current user")
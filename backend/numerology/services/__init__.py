@@ -1,34 +1,35 @@
 """
 Numerology services package.
+
+Services are imported from their modules on first access, so importing one
+service (e.g. the LLM gateway from a signal handler) does not load them all.
 """
-from .essence_cycles import EssenceCycleCalculator
-from .cycle_visualization import CycleVisualizationService
-from .universal_cycles import UniversalCycleCalculator
-from .lo_shu_service import LoShuGridService
-from .asset_numerology import AssetNumerologyService
-from .relationship_numerology import RelationshipNumerologyService
-from .timing_numerology import TimingNumerologyService
-from .health_numerology import HealthNumerologyService
-from .name_correction import NameCorrectionService
-from .spiritual_numerology import SpiritualNumerologyService
-from .predictive_numerology import PredictiveNumerologyService
-from .generational import GenerationalAnalyzer
-from .feng_shui_hybrid import FengShuiHybridService
-from .mental_state_ai import MentalStateAIService
+import importlib
+
+_SERVICE_MODULES = {
+    'EssenceCycleCalculator': 'essence_cycles',
+    'CycleVisualizationService': 'cycle_visualization',
+    'UniversalCycleCalculator': 'universal_cycles',
+    'LoShuGridService': 'lo_shu_service',
+    'AssetNumerologyService': 'asset_numerology',
+    'RelationshipNumerologyService': 'relationship_numerology',
+    'TimingNumerologyService': 'timing_numerology',
+    'HealthNumerologyService': 'health_numerology',
+    'NameCorrectionService': 'name_correction',
+    'SpiritualNumerologyService': 'spiritual_numerology',
+    'PredictiveNumerologyService': 'predictive_numerology',
+    'GenerationalAnalyzer': 'generational',
+    'FengShuiHybridService': 'feng_shui_hybrid',
+    'MentalStateAIService': 'mental_state_ai',
+}
+
+__all__ = list(_SERVICE_MODULES)
+
 
-__all__ = [
-    'EssenceCycleCalculator',
-    'CycleVisualizationService',
-    'UniversalCycleCalculator',
-    'LoShuGridService',
-    'AssetNumerologyService',
-    'RelationshipNumerologyService',
-    'TimingNumerologyService',
-    'HealthNumerologyService',
-    'NameCorrectionService',
-    'SpiritualNumerologyService',
-    'PredictiveNumerologyService',
-    'GenerationalAnalyzer',
-    'FengShuiHybridService',
-    'MentalStateAIService',
-]
+def __getattr__(name):
+    module = _SERVICE_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    service = getattr(importlib.import_module(f'{__name__}.{module}'), name)
+    globals()[name] = service
+    return service
@@ -9,7 +9,10 @@ from django.core.cache import cache
 from django.utils import timezone
 from datetime import timedelta
 
+from utils.single_flight import single_flight
 from .llm_service import get_llm_service
+from ..rag_ingestion import REFERENCE_FILTER, reference_query
+from .semantic_cache import SemanticExplanationCache
 from ..models import Explanation
 
 logger = logging.getLogger(__name__)
@@ -26,6 +29,7 @@ class ExplanationGenerator:
             llm_provider: LLM provider to use ('openai' or 'anthropic')
         """
         self.llm_service = get_llm_service(provider=llm_provider)
+        self.semantic_cache = SemanticExplanationCache()
         self.cache_ttl = 86400  # 24 hours
     
     def generate_raj_yog_explanation(
@@ -55,6 +59,32 @@ class ExplanationGenerator:
             if explanation:
                 return explanation
         
+        # Concurrent misses for the same context share one generation
+        return single_flight(
+            cache_key,
+            lambda: self._create_raj_yog_explanation(user, cache_key, raj_yog_data, numerology_profile),
+            operation='explanation_raj_yog',
+        )
+    
+    def _create_raj_yog_explanation(
+        self,
+        user,
+        cache_key: str,
+        raj_yog_data: Dict[str, Any],
+        numerology_profile: Dict[str, Any]
+    ) -> Explanation:
+        """Generate, store and cache a Raj Yog explanation after a cache miss."""
+        context_data = {
+            'raj_yog_data': raj_yog_data,
+            'numerology_profile': numerology_profile
+        }
+        # Reuse an explanation generated for a near-identical context
+        vector = self.semantic_cache.embed('raj_yog', raj_yog_data, numerology_profile)
+        similar = self.semantic_cache.lookup(user, 'raj_yog', vector, cache_key, context_data)
+        if similar:
+            cache.set(cache_key, {'explanation_id': str(similar.id)}, self.cache_ttl)
+            return similar
+        
         # Generate prompt
         prompt = self._build_raj_yog_prompt(raj_yog_data, numerology_profile)
         
@@ -83,7 +113,11 @@ class ExplanationGenerator:
                     prompt=prompt,
                     context=context,
                     max_tokens=600,  # Increased for richer explanations
-                    temperature=0.7
+                    temperature=0.7,
+                    reference_query=reference_query('raj yog life path destiny', [
+                        context['life_path'], context['destiny'], context['soul_urge'], context['personality']
+                    ]),
+                    reference_filter=REFERENCE_FILTER,
                 )
                 content = llm_data['content']
         except Exception as e:
@@ -107,12 +141,10 @@ class ExplanationGenerator:
             llm_model=llm_data.get('model', 'template'),
             tokens_used=llm_data.get('tokens_used', 0),
             cost=llm_data.get('cost', 0),
-            context_data={
-                'raj_yog_data': raj_yog_data,
-                'numerology_profile': numerology_profile
-            },
+            context_data=context_data,
             is_cached=False,
             cache_key=cache_key,
+            embedding=self.semantic_cache.embedding_for(vector, llm_data.get('provider', 'template')),
             expires_at=timezone.now() + timedelta(days=30)
         )
         
@@ -150,6 +182,38 @@ class ExplanationGenerator:
             if explanation:
                 return explanation
         
+        # Concurrent misses for the same context share one generation
+        return single_flight(
+            cache_key,
+            lambda: self._create_daily_explanation(
+                user, cache_key, daily_reading, numerology_profile, raj_yog_status
+            ),
+            operation='explanation_daily',
+        )
+    
+    def _create_daily_explanation(
+        self,
+        user,
+        cache_key: str,
+        daily_reading: Dict[str, Any],
+        numerology_profile: Dict[str, Any],
+        raj_yog_status: Optional[str]
+    ) -> Explanation:
+        """Generate, store and cache a daily explanation after a cache miss."""
+        context_data = {
+            'daily_reading': daily_reading,
+            'numerology_profile': numerology_profile,
+            'raj_yog_status': raj_yog_status
+        }
+        # Reuse an explanation generated for a near-identical context
+        vector = self.semantic_cache.embed(
+            'daily', {**daily_reading, 'raj_yog_status': raj_yog_status}, numerology_profile
+        )
+        similar = self.semantic_cache.lookup(user, 'daily', vector, cache_key, context_data)
+        if similar:
+            cache.set(cache_key, {'explanation_id': str(similar.id)}, self.cache_ttl)
+            return similar
+        
         # Generate prompt
         prompt = self._build_daily_prompt(daily_reading, numerology_profile, raj_yog_status)
         
@@ -176,7 +240,11 @@ class ExplanationGenerator:
                     prompt=prompt,
                     context=context,
                     max_tokens=400,  # Increased for richer explanations
-                    temperature=0.7
+                    temperature=0.7,
+                    reference_query=reference_query('personal day life path', [
+                        context['personal_day_number'], context['life_path']
+                    ]),
+                    reference_filter=REFERENCE_FILTER,
                 )
                 content = llm_data['content']
         except Exception as e:
@@ -200,13 +268,10 @@ class ExplanationGenerator:
             llm_model=llm_data.get('model', 'template'),
             tokens_used=llm_data.get('tokens_used', 0),
             cost=llm_data.get('cost', 0),
-            context_data={
-                'daily_reading': daily_reading,
-                'numerology_profile': numerology_profile,
-                'raj_yog_status': raj_yog_status
-            },
+            context_data=context_data,
             is_cached=False,
             cache_key=cache_key,
+            embedding=self.semantic_cache.embedding_for(vector, llm_data.get('provider', 'template')),
             expires_at=timezone.now() + timedelta(days=1)  # Daily explanations expire after 1 day
         )
         
@@ -240,6 +305,29 @@ class ExplanationGenerator:
             if explanation:
                 return explanation
         
+        # Concurrent misses for the same context share one generation
+        return single_flight(
+            cache_key,
+            lambda: self._create_weekly_explanation(user, cache_key, weekly_report, numerology_profile),
+            operation='explanation_weekly',
+        )
+    
+    def _create_weekly_explanation(
+        self,
+        user,
+        cache_key: str,
+        weekly_report: Dict[str, Any],
+        numerology_profile: Dict[str, Any]
+    ) -> Explanation:
+        """Generate, store and cache a weekly explanation after a cache miss."""
+        context_data = {'weekly_report': weekly_report, 'numerology_profile': numerology_profile}
+        # Reuse an explanation generated for a near-identical context
+        vector = self.semantic_cache.embed('weekly', weekly_report, numerology_profile)
+        similar = self.semantic_cache.lookup(user, 'weekly', vector, cache_key, context_data)
+        if similar:
+            cache.set(cache_key, {'explanation_id': str(similar.id)}, self.cache_ttl)
+            return similar
+        
         prompt = self._build_weekly_prompt(weekly_report, numerology_profile)
         
         try:
@@ -256,7 +344,11 @@ class ExplanationGenerator:
                     prompt=prompt,
                     context=context,
                     max_tokens=500,
-                    temperature=0.7
+                    temperature=0.7,
+                    reference_query=reference_query('weekly number life path', [
+                        context['weekly_number'], context['life_path']
+                    ]),
+                    reference_filter=REFERENCE_FILTER,
                 )
                 content = llm_data['content']
         except Exception as e:
@@ -273,9 +365,10 @@ class ExplanationGenerator:
             llm_model=llm_data.get('model', 'template'),
             tokens_used=llm_data.get('tokens_used', 0),
             cost=llm_data.get('cost', 0),
-            context_data={'weekly_report': weekly_report, 'numerology_profile': numerology_profile},
+            context_data=context_data,
             is_cached=False,
             cache_key=cache_key,
+            embedding=self.semantic_cache.embedding_for(vector, llm_data.get('provider', 'template')),
             expires_at=timezone.now() + timedelta(days=7)
         )
         
@@ -307,6 +400,29 @@ class ExplanationGenerator:
             if explanation:
                 return explanation
         
+        # Concurrent misses for the same context share one generation
+        return single_flight(
+            cache_key,
+            lambda: self._create_yearly_explanation(user, cache_key, yearly_report, numerology_profile),
+            operation='explanation_yearly',
+        )
+    
+    def _create_yearly_explanation(
+        self,
+        user,
+        cache_key: str,
+        yearly_report: Dict[str, Any],
+        numerology_profile: Dict[str, Any]
+    ) -> Explanation:
+        """Generate, store and cache a yearly explanation after a cache miss."""
+        context_data = {'yearly_report': yearly_report, 'numerology_profile': numerology_profile}
+        # Reuse an explanation generated for a near-identical context
+        vector = self.semantic_cache.embed('yearly', yearly_report, numerology_profile)
+        similar = self.semantic_cache.lookup(user, 'yearly', vector, cache_key, context_data)
+        if similar:
+            cache.set(cache_key, {'explanation_id': str(similar.id)}, self.cache_ttl)
+            return similar
+        
         prompt = self._build_yearly_prompt(yearly_report, numerology_profile)
         
         try:
@@ -323,7 +439,11 @@ class ExplanationGenerator:
                     prompt=prompt,
                     context=context,
                     max_tokens=800,  # Longer for yearly reports
-                    temperature=0.7
+                    temperature=0.7,
+                    reference_query=reference_query('personal year cycle life path', [
+                        context['personal_year'], context['life_path']
+                    ]),
+                    reference_filter=REFERENCE_FILTER,
                 )
                 content = llm_data['content']
         except Exception as e:
@@ -340,9 +460,10 @@ class ExplanationGenerator:
             llm_model=llm_data.get('model', 'template'),
             tokens_used=llm_data.get('tokens_used', 0),
             cost=llm_data.get('cost', 0),
-            context_data={'yearly_report': yearly_report, 'numerology_profile': numerology_profile},
+            context_data=context_data,
             is_cached=False,
             cache_key=cache_key,
+            embedding=self.semantic_cache.embedding_for(vector, llm_data.get('provider', 'template')),
             expires_at=timezone.now() + timedelta(days=365)
         )
         
@@ -4,6 +4,7 @@ Health numerology service for health cycles, stress/vitality numbers, and medica
 from typing import Dict, List, Any, Optional
 from datetime import date, timedelta
 from numerology.numerology import NumerologyCalculator
+from numerology.chart import NumerologyChart, resolve_chart
 from numerology.services.timing_numerology import TimingNumerologyService
 
 
@@ -16,10 +17,11 @@ class HealthNumerologyService:
     
     def calculate_health_cycles(
         self,
-        birth_date: date,
-        full_name: str,
+        birth_date: Optional[date] = None,
+        full_name: Optional[str] = None,
         start_year: Optional[int] = None,
-        end_year: Optional[int] = None
+        end_year: Optional[int] = None,
+        chart: Optional[NumerologyChart] = None
     ) -> Dict[str, Any]:
         """
         Calculate health risk cycles and vitality periods.
@@ -29,6 +31,7 @@ class HealthNumerologyService:
             full_name: Full name
             start_year: Start year for analysis
             end_year: End year for analysis
+            chart: NumerologyChart to use instead of birth_date and full_name
             
         Returns:
             Health cycle analysis
@@ -38,13 +41,16 @@ class HealthNumerologyService:
         if not end_year:
             end_year = start_year + 9
         
+        chart = resolve_chart(chart, full_name, birth_date, self.calculator)
+        birth_date = chart.birth_date
+        
         # Calculate Life Path
-        life_path = self.calculator.calculate_life_path_number(birth_date)
+        life_path = chart.life_path_number
         
         # Calculate health numbers
-        health_number = self._calculate_health_number(birth_date, full_name)
-        vitality_number = self._calculate_vitality_number(birth_date, full_name)
-        stress_number = self._calculate_stress_number(birth_date, full_name)
+        health_number = self._calculate_health_number(chart)
+        vitality_number = self._calculate_vitality_number(chart)
+        stress_number = self._calculate_stress_number(chart)
         
         # Calculate yearly health windows
         yearly_health = []
@@ -151,8 +157,9 @@ class HealthNumerologyService:
     
     def calculate_emotional_vulnerabilities(
         self,
-        birth_date: date,
-        full_name: str
+        birth_date: Optional[date] = None,
+        full_name: Optional[str] = None,
+        chart: Optional[NumerologyChart] = None
     ) -> Dict[str, Any]:
         """
         Calculate emotional vulnerabilities based on numerology.
@@ -160,14 +167,17 @@ class HealthNumerologyService:
         Args:
             birth_date: Date of birth
             full_name: Full name
+            chart: NumerologyChart to use instead of birth_date and full_name
             
         Returns:
             Emotional vulnerability analysis
         """
+        chart = resolve_chart(chart, full_name, birth_date, self.calculator)
+        
         # Calculate key numbers
-        life_path = self.calculator.calculate_life_path_number(birth_date)
-        soul_urge = self.calculator.calculate_soul_urge_number(full_name)
-        personality = self.calculator.calculate_personality_number(full_name)
+        life_path = chart.life_path_number
+        soul_urge = chart.soul_urge_number
+        personality = chart.personality_number
         
         # Identify vulnerabilities
         vulnerabilities = []
@@ -242,26 +252,25 @@ class HealthNumerologyService:
             'emotional_strengths': self._identify_emotional_strengths(life_path, soul_urge, personality)
         }
     
-    def _calculate_health_number(self, birth_date: date, full_name: str) -> int:
+    def _calculate_health_number(self, chart: NumerologyChart) -> int:
         """Calculate health number from birth date."""
         # Health number = reduce(month + day)
-        month = self.calculator._reduce_to_single_digit(birth_date.month, preserve_master=False)
-        day = self.calculator._reduce_to_single_digit(birth_date.day, preserve_master=False)
+        month = self.calculator._reduce_to_single_digit(chart.birth_date.month, preserve_master=False)
+        day = self.calculator._reduce_to_single_digit(chart.birth_date.day, preserve_master=False)
         health_sum = month + day
         return self.calculator._reduce_to_single_digit(health_sum, preserve_master=True)
     
-    def _calculate_vitality_number(self, birth_date: date, full_name: str) -> int:
+    def _calculate_vitality_number(self, chart: NumerologyChart) -> int:
         """Calculate vitality number."""
         # Vitality = Life Path + Health Number
-        life_path = self.calculator.calculate_life_path_number(birth_date)
-        health_number = self._calculate_health_number(birth_date, full_name)
-        vitality_sum = life_path + health_number
+        health_number = self._calculate_health_number(chart)
+        vitality_sum = chart.life_path_number + health_number
         return self.calculator._reduce_to_single_digit(vitality_sum, preserve_master=True)
     
-    def _calculate_stress_number(self, birth_date: date, full_name: str) -> int:
+    def _calculate_stress_number(self, chart: NumerologyChart) -> int:
         """Calculate stress number."""
         # Stress = Challenges from birth date
-        challenges = self.calculator.calculate_challenges(birth_date)
+        challenges = chart.challenges
         # Use first challenge as stress indicator
         return challenges[0] if challenges else 1
     
@@ -594,9 +603,10 @@ class HealthNumerologyService:
     
     def identify_health_risk_cycles(
         self,
-        birth_date: date,
-        full_name: str,
-        years_ahead: int = 10
+        birth_date: Optional[date] = None,
+        full_name: Optional[str] = None,
+        years_ahead: int = 10,
+        chart: Optional[NumerologyChart] = None
     ) -> Dict[str, Any]:
         """
         Identify health risk cycles over a period.
@@ -605,6 +615,7 @@ class HealthNumerologyService:
             birth_date: Date of birth
             full_name: Full name
             years_ahead: Number of years to analyze (default 10)
+            chart: NumerologyChart to use instead of birth_date and full_name
             
         Returns:
             Dictionary with risk cycles and warnings
@@ -614,7 +625,8 @@ class HealthNumerologyService:
             birth_date,
             full_name,
             current_year,
-            current_year + years_ahead
+            current_year + years_ahead,
+            chart=chart
         )
         
         risk_periods = []
@@ -638,9 +650,10 @@ class HealthNumerologyService:
     
     def calculate_wellness_windows(
         self,
-        birth_date: date,
-        full_name: str,
-        years_ahead: int = 10
+        birth_date: Optional[date] = None,
+        full_name: Optional[str] = None,
+        years_ahead: int = 10,
+        chart: Optional[NumerologyChart] = None
     ) -> Dict[str, Any]:
         """
         Calculate optimal wellness windows for health improvements.
@@ -649,6 +662,7 @@ class HealthNumerologyService:
             birth_date: Date of birth
             full_name: Full name
             years_ahead: Number of years to analyze (default 10)
+            chart: NumerologyChart to use instead of birth_date and full_name
             
         Returns:
             Dictionary with wellness windows
@@ -658,7 +672,8 @@ class HealthNumerologyService:
             birth_date,
             full_name,
             current_year,
-            current_year + years_ahead
+            current_year + years_ahead,
+            chart=chart
         )
         
         wellness_windows = []
@@ -0,0 +1,438 @@
+"""
+Shared gateway for every LLM provider call.
+
+All call sites (explanations, name/phone reports, detailed readings,
+mental state recommendations, embeddings and AI chat) go through one
+gateway per provider and process, which:
+
+- keeps pooled sync and async clients with connect/read timeouts;
+- bounds concurrent provider calls, so a slow provider makes callers wait
+  briefly for a slot instead of tying up every gunicorn or Celery worker;
+- retries 429, 5xx, timeout and connection errors with jittered
+  exponential backoff;
+- opens a circuit breaker after repeated failures so callers fail fast to
+  their template fallbacks;
+- records latency, token and error metrics per provider and operation.
+"""
+import asyncio
+import logging
+import random
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from decouple import config
+from django.conf import settings
+
+from utils import metrics
+
+logger = logging.getLogger(__name__)
+
+PROVIDER_CREDENTIALS = {
+    'openai': ('OPENAI_API_KEY', 'OPENAI_BASE_URL'),
+    'anthropic': ('ANTHROPIC_API_KEY', 'ANTHROPIC_BASE_URL'),
+}
+# Upper bound for a single backoff sleep, including Retry-After hints.
+MAX_BACKOFF = 8.0
+
+
+class LLMNotConfiguredError(ValueError):
+    """No API key (or client package) is available for the provider."""
+
+
+class LLMUnavailableError(Exception):
+    """The provider is failing or saturated; callers should use a fallback."""
+
+
+class CircuitOpenError(LLMUnavailableError):
+    """Raised without contacting the provider while the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After ``failure_threshold`` provider failures in a row the circuit opens
+    and calls are rejected for ``reset_timeout`` seconds. Then a single probe
+    call is let through: success closes the circuit, failure reopens it.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None and (self._probing or self._cooling_down())
+
+    def _cooling_down(self) -> bool:
+        return self._opened_at is not None and time.monotonic() - self._opened_at < self.reset_timeout
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed (reserving the probe if half-open)."""
+        return self.admit() is not None
+
+    def admit(self) -> Optional[bool]:
+        """
+        Admit a call, reserving the probe if half-open.
+
+        Returns:
+            None if the call may not proceed, else whether it is the probe
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            if self._cooling_down() or self._probing:
+                return None
+            self._probing = True
+            return True
+
+    def abandon_probe(self):
+        """Release a probe that ended with no outcome (e.g. cancelled) by reopening."""
+        with self._lock:
+            if self._probing:
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> bool:
+        """Count a provider failure; return True if this opened the circuit."""
+        with self._lock:
+            self._failures += 1
+            was_closed = self._opened_at is None
+            if not was_closed or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                self._probing = False
+                return was_closed
+            return False
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """Rate limits, server errors, timeouts and dropped connections are transient."""
+    status = getattr(exc, 'status_code', None)
+    if status is not None:
+        return status == 429 or status >= 500
+    return type(exc).__name__ in ('APITimeoutError', 'APIConnectionError')
+
+
+def _backoff(attempt: int, exc: Exception) -> float:
+    """Full-jitter exponential backoff, honouring Retry-After when sent."""
+    response = getattr(exc, 'response', None)
+    retry_after = response.headers.get('retry-after') if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), MAX_BACKOFF) + random.uniform(0, 0.25)
+        except ValueError:
+            pass
+    return random.uniform(0, min(settings.LLM_RETRY_BACKOFF * 2 ** attempt, MAX_BACKOFF))
+
+
+def _usage_tokens(response: Any) -> int:
+    usage = getattr(response, 'usage', None)
+    if usage is None:
+        return 0
+    total = getattr(usage, 'total_tokens', None)
+    if total is None:
+        # Anthropic reports input and output separately.
+        total = (getattr(usage, 'input_tokens', 0) or 0) + (getattr(usage, 'output_tokens', 0) or 0)
+    return total or 0
+
+
+class LLMGateway:
+    """Pooled, rate-limited and circuit-broken access to one LLM provider."""
+
+    def __init__(self, provider: str):
+        """
+        Initialize gateway.
+
+        Args:
+            provider: 'openai' or 'anthropic'
+        """
+        self.provider = provider.lower()
+        self.breaker = CircuitBreaker(
+            settings.LLM_CIRCUIT_FAILURE_THRESHOLD, settings.LLM_CIRCUIT_RESET_TIMEOUT
+        )
+        self._semaphore = threading.BoundedSemaphore(settings.LLM_MAX_CONCURRENCY)
+        self._async_semaphores = weakref.WeakKeyDictionary()
+        self._clients = {}
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    # Clients
+
+    def _credentials(self) -> Tuple[str, Optional[str]]:
+        if self.provider not in PROVIDER_CREDENTIALS:
+            raise LLMNotConfiguredError(f"Unknown LLM provider: {self.provider}")
+        key_name, url_name = PROVIDER_CREDENTIALS[self.provider]
+        api_key = config(key_name, default='')
+        if not api_key:
+            raise LLMNotConfiguredError(f"{key_name} is not set")
+        return api_key, config(url_name, default='') or None
+
+    def is_configured(self) -> bool:
+        """Return True if an API key is set for the provider."""
+        try:
+            self._credentials()
+        except LLMNotConfiguredError:
+            return False
+        return True
+
+    def is_available(self) -> bool:
+        """Return True if calls are expected to reach the provider."""
+        return self.is_configured() and not self.breaker.is_open
+
+    def _build_client(self, api_key: str, base_url: Optional[str], use_async: bool):
+        import httpx
+
+        timeout = httpx.Timeout(settings.LLM_REQUEST_TIMEOUT, connect=settings.LLM_CONNECT_TIMEOUT)
+        limits = httpx.Limits(
+            max_connections=settings.LLM_MAX_CONCURRENCY,
+            max_keepalive_connections=settings.LLM_MAX_CONCURRENCY,
+        )
+        # Retries are handled here so they share the circuit breaker.
+        options = {'api_key': api_key, 'base_url': base_url, 'timeout': timeout, 'max_retries': 0}
+        try:
+            if self.provider == 'openai':
+                import openai
+                if use_async:
+                    return openai.AsyncOpenAI(
+                        http_client=openai.DefaultAsyncHttpxClient(limits=limits, timeout=timeout), **options
+                    )
+                return openai.OpenAI(http_client=openai.DefaultHttpxClient(limits=limits, timeout=timeout), **options)
+            import anthropic
+            return (anthropic.AsyncAnthropic if use_async else anthropic.Anthropic)(**options)
+        except ImportError:
+            raise LLMNotConfiguredError(f"{self.provider} package not installed")
+
+    def get_client(self):
+        """Return the pooled sync client for the current credentials."""
+        credentials = self._credentials()
+        with self._lock:
+            client = self._clients.get(credentials)
+            if client is None:
+                client = self._clients[credentials] = self._build_client(*credentials, use_async=False)
+            return client
+
+    def get_async_client(self):
+        """Return the pooled async client bound to the running event loop."""
+        credentials = self._credentials()
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._async_clients.setdefault(loop, {})
+            client = clients.get(credentials)
+            if client is None:
+                client = clients[credentials] = self._build_client(*credentials, use_async=True)
+            return client
+
+    def _get_async_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._async_semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._async_semaphores[loop] = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+            return semaphore
+
+    # Bookkeeping
+
+    def _tags(self, operation: str) -> Dict[str, str]:
+        return {'provider': self.provider, 'operation': operation}
+
+    def _check_circuit(self, operation: str):
+        if self.breaker.is_open:
+            metrics.increment('llm.circuit_rejected', **self._tags(operation))
+            raise CircuitOpenError(f"{self.provider} circuit is open")
+
+    def _before_attempt(self, operation: str) -> bool:
+        """Admit one attempt; returns whether it is the half-open probe."""
+        probe = self.breaker.admit()
+        if probe is None:
+            metrics.increment('llm.circuit_rejected', **self._tags(operation))
+            raise CircuitOpenError(f"{self.provider} circuit is open")
+        return probe
+
+    def _record_success(self, operation: str, response: Any, started: float):
+        self.breaker.record_success()
+        tags = self._tags(operation)
+        metrics.increment('llm.calls', **tags)
+        metrics.observe('llm.latency_ms', (time.monotonic() - started) * 1000, **tags)
+        self.record_tokens(operation, _usage_tokens(response))
+
+    def _record_failure(self, operation: str, exc: Exception):
+        metrics.increment('llm.errors', error=type(exc).__name__, **self._tags(operation))
+        if not _is_retryable(exc):
+            # The provider answered; the request itself was bad.
+            self.breaker.record_success()
+            return
+        if self.breaker.record_failure():
+            logger.error(f"LLM circuit opened for {self.provider} after repeated failures: {str(exc)}")
+            metrics.increment('llm.circuit_opened', provider=self.provider)
+
+    def record_tokens(self, operation: str, tokens: int):
+        """Add token usage for calls whose usage arrives after the call returns (streams)."""
+        if tokens:
+            metrics.increment('llm.tokens', tokens, **self._tags(operation))
+
+    # Calls
+
+    def call(self, operation: str, request: Callable[[Any], Any]) -> Any:
+        """
+        Run ``request(client)`` with concurrency limits, retries and circuit breaking.
+
+        Args:
+            operation: Metric tag naming the call site
+            request: Callable receiving the pooled sync client
+
+        Raises:
+            LLMNotConfiguredError: No API key is set
+            LLMUnavailableError: Circuit open or no concurrency slot freed up in time
+        """
+        client = self.get_client()
+        self._check_circuit(operation)
+        if not self._semaphore.acquire(timeout=settings.LLM_QUEUE_TIMEOUT):
+            metrics.increment('llm.saturated', **self._tags(operation))
+            raise LLMUnavailableError(f"No {self.provider} capacity available")
+        try:
+            for attempt in range(settings.LLM_MAX_RETRIES + 1):
+                self._before_attempt(operation)
+                started = time.monotonic()
+                try:
+                    response = request(client)
+                except Exception as e:
+                    self._record_failure(operation, e)
+                    if not _is_retryable(e) or attempt == settings.LLM_MAX_RETRIES:
+                        raise
+                    time.sleep(_backoff(attempt, e))
+                    continue
+                self._record_success(operation, response, started)
+                return response
+        finally:
+            self._semaphore.release()
+
+    async def acall(self, operation: str, request: Callable[[Any], Any]) -> Any:
+        """Async counterpart of :meth:`call`; ``request`` returns an awaitable."""
+        client = self.get_async_client()
+        self._check_circuit(operation)
+        semaphore = self._get_async_semaphore()
+        try:
+            await asyncio.wait_for(semaphore.acquire(), settings.LLM_QUEUE_TIMEOUT)
+        except asyncio.TimeoutError:
+            metrics.increment('llm.saturated', **self._tags(operation))
+            raise LLMUnavailableError(f"No {self.provider} capacity available")
+        probe = False
+        try:
+            for attempt in range(settings.LLM_MAX_RETRIES + 1):
+                probe = self._before_attempt(operation)
+                started = time.monotonic()
+                try:
+                    response = await request(client)
+                except Exception as e:
+                    probe = False
+                    self._record_failure(operation, e)
+                    if not _is_retryable(e) or attempt == settings.LLM_MAX_RETRIES:
+                        raise
+                    await asyncio.sleep(_backoff(attempt, e))
+                    continue
+                probe = False
+                self._record_success(operation, response, started)
+                return response
+        finally:
+            # Cancelled mid-probe: neither outcome was recorded
+            if probe:
+                self.breaker.abandon_probe()
+            semaphore.release()
+
+    def chat_completion(self, operation: str, **kwargs) -> Any:
+        """OpenAI ``chat.completions.create`` through the gateway."""
+        return self.call(operation, lambda client: client.chat.completions.create(**kwargs))
+
+    def create_message(self, operation: str, **kwargs) -> Any:
+        """Anthropic ``messages.create`` through the gateway."""
+        return self.call(operation, lambda client: client.messages.create(**kwargs))
+
+    def create_embedding(self, operation: str, **kwargs) -> Any:
+        """OpenAI ``embeddings.create`` through the gateway."""
+        return self.call(operation, lambda client: client.embeddings.create(**kwargs))
+
+    async def astream_chat_completion(self, operation: str, **kwargs):
+        """
+        Yield chunks of a streamed OpenAI chat completion.
+
+        Opening the stream is retried like any other call; the concurrency
+        slot is held until the stream ends or the consumer stops iterating.
+        """
+        client = self.get_async_client()
+        self._check_circuit(operation)
+        semaphore = self._get_async_semaphore()
+        try:
+            await asyncio.wait_for(semaphore.acquire(), settings.LLM_QUEUE_TIMEOUT)
+        except asyncio.TimeoutError:
+            metrics.increment('llm.saturated', **self._tags(operation))
+            raise LLMUnavailableError(f"No {self.provider} capacity available")
+        probe = False
+        try:
+            stream = None
+            for attempt in range(settings.LLM_MAX_RETRIES + 1):
+                probe = self._before_attempt(operation)
+                started = time.monotonic()
+                try:
+                    stream = await client.chat.completions.create(stream=True, **kwargs)
+                    break
+                except Exception as e:
+                    probe = False
+                    self._record_failure(operation, e)
+                    if not _is_retryable(e) or attempt == settings.LLM_MAX_RETRIES:
+                        raise
+                    await asyncio.sleep(_backoff(attempt, e))
+            tokens = 0
+            try:
+                async for chunk in stream:
+                    if chunk.usage:
+                        tokens = chunk.usage.total_tokens or 0
+                    yield chunk
+            except Exception as e:
+                probe = False
+                self._record_failure(operation, e)
+                raise
+            finally:
+                # Release the upstream connection when the consumer goes away.
+                await stream.close()
+            probe = False
+            self._record_success(operation, None, started)
+            self.record_tokens(operation, tokens)
+        finally:
+            # A probe whose consumer disconnected or was cancelled has no
+            # outcome; without this the circuit would stay half-open for good
+            if probe:
+                self.breaker.abandon_probe()
+            semaphore.release()
+
+
+_gateways: Dict[str, LLMGateway] = {}
+_gateways_lock = threading.Lock()
+
+
+def get_llm_gateway(provider: Optional[str] = None) -> LLMGateway:
+    """Return the process-wide gateway for ``provider`` (default: OPENAI_LLM_PROVIDER)."""
+    provider = (provider or config('OPENAI_LLM_PROVIDER', default='openai')).lower()
+    with _gateways_lock:
+        gateway = _gateways.get(provider)
+        if gateway is None:
+            gateway = _gateways[provider] = LLMGateway(provider)
+        return gateway
+
+
+def reset_gateways():
+    """Drop all gateways (clients, limits and circuit state); used by tests."""
+    with _gateways_lock:
+        _gateways.clear()
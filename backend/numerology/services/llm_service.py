@@ -7,6 +7,8 @@ from typing import Dict, Optional, Any
 from django.conf import settings
 from decouple import config
 
+from .llm_gateway import get_llm_gateway
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,41 +23,19 @@ class LLMService:
             provider: 'openai' or 'anthropic'. Defaults to OPENAI_LLM_PROVIDER setting.
         """
         self.provider = provider or config('OPENAI_LLM_PROVIDER', default='openai')
-        self._client = None
-        self._initialize_client()
-    
-    def _initialize_client(self):
-        """Initialize the LLM client based on provider."""
-        if self.provider.lower() == 'openai':
-            try:
-                import openai
-                api_key = config('OPENAI_API_KEY', default='')
-                if not api_key:
-                    logger.warning("OPENAI_API_KEY not set. LLM features will not work.")
-                self._client = openai.OpenAI(api_key=api_key) if api_key else None
-            except ImportError:
-                logger.error("openai package not installed. Install with: pip install openai")
-                self._client = None
-        elif self.provider.lower() == 'anthropic':
-            try:
-                import anthropic
-                api_key = config('ANTHROPIC_API_KEY', default='')
-                if not api_key:
-                    logger.warning("ANTHROPIC_API_KEY not set. LLM features will not work.")
-                self._client = anthropic.Anthropic(api_key=api_key) if api_key else None
-            except ImportError:
-                logger.error("anthropic package not installed. Install with: pip install anthropic")
-                self._client = None
-        else:
-            logger.warning(f"Unknown LLM provider: {self.provider}")
-            self._client = None
+        # Clients, timeouts, retries and circuit breaking live in the shared gateway
+        self._gateway = get_llm_gateway(self.provider)
+        if not self._gateway.is_configured():
+            logger.warning(f"{self.provider} LLM is not configured. LLM features will not work.")
     
     def generate_explanation(
         self,
         prompt: str,
         context: Optional[Dict[str, Any]] = None,
         max_tokens: int = 500,
-        temperature: float = 0.7
+        temperature: float = 0.7,
+        reference_query: Optional[str] = None,
+        reference_filter: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Generate explanation using LLM.
@@ -65,6 +45,8 @@ class LLMService:
             context: Additional context data
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature (0-1)
+            reference_query: Optional query for encyclopedia passages to include
+            reference_filter: Metadata filter for the reference passages
         
         Returns:
             Dictionary with:
@@ -73,14 +55,16 @@ class LLMService:
             - cost: Estimated cost
             - model: Model used
         """
-        if not self._client:
+        if not self._gateway.is_configured():
             raise ValueError(f"LLM client not initialized for provider: {self.provider}")
         
+        system_message = self._build_system_message(context, reference_query, reference_filter)
+        
         try:
             if self.provider.lower() == 'openai':
-                return self._generate_openai(prompt, context, max_tokens, temperature)
+                return self._generate_openai(prompt, system_message, max_tokens, temperature)
             elif self.provider.lower() == 'anthropic':
-                return self._generate_anthropic(prompt, context, max_tokens, temperature)
+                return self._generate_anthropic(prompt, system_message, max_tokens, temperature)
         except Exception as e:
             logger.error(f"Error generating explanation with {self.provider}: {str(e)}")
             raise
@@ -88,24 +72,20 @@ class LLMService:
     def _generate_openai(
         self,
         prompt: str,
-        context: Optional[Dict[str, Any]],
+        system_message: str,
         max_tokens: int,
         temperature: float
     ) -> Dict[str, Any]:
         """Generate using OpenAI API."""
         model = config('OPENAI_MODEL', default='gpt-3.5-turbo')
         
-        # Build system message with context
-        system_message = "You are a numerology expert providing warm, encouraging, and practical insights."
-        if context:
-            system_message += f"\n\nContext: {self._format_context(context)}"
-        
         messages = [
             {"role": "system", "content": system_message},
             {"role": "user", "content": prompt}
         ]
         
-        response = self._client.chat.completions.create(
+        response = self._gateway.chat_completion(
+            'explanation',
             model=model,
             messages=messages,
             max_tokens=max_tokens,
@@ -130,21 +110,17 @@ class LLMService:
     def _generate_anthropic(
         self,
         prompt: str,
-        context: Optional[Dict[str, Any]],
+        system_message: str,
         max_tokens: int,
         temperature: float
     ) -> Dict[str, Any]:
         """Generate using Anthropic API."""
         model = config('ANTHROPIC_MODEL', default='claude-3-haiku-20240307')
         
-        # Build system message with context
-        system_message = "You are a numerology expert providing warm, encouraging, and practical insights."
-        if context:
-            system_message += f"\n\nContext: {self._format_context(context)}"
-        
         message = f"{system_message}\n\n{prompt}"
         
-        response = self._client.messages.create(
+        response = self._gateway.create_message(
+            'explanation',
             model=model,
             max_tokens=max_tokens,
             temperature=temperature,
@@ -168,6 +144,27 @@ class LLMService:
             'provider': 'anthropic'
         }
     
+    def _build_system_message(
+        self,
+        context: Optional[Dict[str, Any]],
+        reference_query: Optional[str],
+        reference_filter: Optional[Dict[str, Any]]
+    ) -> str:
+        """Build system message with context and retrieved reference passages."""
+        system_message = "You are a numerology expert providing warm, encouraging, and practical insights."
+        if context:
+            system_message += f"\n\nContext: {self._format_context(context)}"
+        if reference_query:
+            from ..rag_ingestion import retrieve_context
+            try:
+                reference = retrieve_context(reference_query, filter=reference_filter)
+            except Exception as e:
+                logger.warning(f"Reference retrieval failed: {str(e)}")
+                reference = ''
+            if reference:
+                system_message += f"\n\nReference material:\n{reference}"
+        return system_message
+    
     def _format_context(self, context: Dict[str, Any]) -> str:
         """Format context dictionary into readable string."""
         parts = []
@@ -179,8 +176,8 @@ class LLMService:
         return ", ".join(parts)
     
     def is_available(self) -> bool:
-        """Check if LLM service is available."""
-        return self._client is not None
+        """Check if LLM service is configured and its circuit is closed."""
+        return self._gateway.is_available()
 
 
 def get_llm_service(provider: Optional[str] = None) -> LLMService:
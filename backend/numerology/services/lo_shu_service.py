@@ -1,9 +1,11 @@
 """
 Enhanced Lo Shu Grid service with arrows and comparison features.
 """
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Iterable, Optional, Tuple
 from datetime import date
 from numerology.numerology import NumerologyCalculator
+from numerology.chart import NumerologyChart, resolve_chart
+from numerology.lo_shu_kernel import ArrowTable, FULL_MASK, LoShuBits, mask_digits
 
 
 class LoShuGridService:
@@ -41,14 +43,17 @@ class LoShuGridService:
             'missing_emotional': [4, 5, 6],
         }
     }
+    _STRENGTH_ARROWS = ArrowTable(ARROW_PATTERNS['strength'])
+    _WEAKNESS_ARROWS = ArrowTable(ARROW_PATTERNS['weakness'])
     
     def __init__(self, calculation_system: str = 'pythagorean'):
         self.calculator = NumerologyCalculator(calculation_system)
     
     def calculate_enhanced_grid(
         self,
-        full_name: str,
-        birth_date: date
+        full_name: Optional[str] = None,
+        birth_date: Optional[date] = None,
+        chart: Optional[NumerologyChart] = None
     ) -> Dict[str, Any]:
         """
         Calculate enhanced Lo Shu Grid with arrows and interpretations.
@@ -56,19 +61,21 @@ class LoShuGridService:
         Args:
             full_name: Full name
             birth_date: Date of birth
+            chart: NumerologyChart to use instead of full_name and birth_date
             
         Returns:
             Enhanced grid data with arrows
         """
         # Get basic grid
-        basic_grid = self.calculator.calculate_lo_shu_grid(full_name, birth_date)
+        basic_grid = resolve_chart(chart, full_name, birth_date, self.calculator).lo_shu_grid
         
         # Build position grid
-        position_grid = self._build_position_grid(basic_grid)
+        bits = LoShuBits.from_grid(basic_grid)
+        position_grid = bits.as_dict()
         
         # Calculate arrows
-        strength_arrows = self._calculate_strength_arrows(position_grid)
-        weakness_arrows = self._calculate_weakness_arrows(position_grid, basic_grid)
+        strength_arrows = self._calculate_strength_arrows(bits)
+        weakness_arrows = self._calculate_weakness_arrows(bits)
         
         # Generate enhanced interpretation
         enhanced_interpretation = self._generate_enhanced_interpretation(
@@ -107,42 +114,20 @@ class LoShuGridService:
         Returns:
             Comparison analysis
         """
-        pos1 = grid1.get('position_grid', self._build_position_grid(grid1))
-        pos2 = grid2.get('position_grid', self._build_position_grid(grid2))
+        present1 = LoShuBits.from_grid(grid1).present
+        present2 = LoShuBits.from_grid(grid2).present
         
-        # Compare positions
-        matching_positions = []
-        complementary_positions = []
-        conflicting_positions = []
+        # Compare positions: present in both, in exactly one, in neither
+        matching_positions = list(mask_digits(present1 & present2))
+        complementary_positions = list(mask_digits(present1 ^ present2))
+        conflicting_positions = list(mask_digits(FULL_MASK & ~(present1 | present2)))
         
-        for num in range(1, 10):
-            pos1_val = pos1.get(num, 0)
-            pos2_val = pos2.get(num, 0)
-            
-            if pos1_val > 0 and pos2_val > 0:
-                matching_positions.append(num)
-            elif (pos1_val > 0 and pos2_val == 0) or (pos1_val == 0 and pos2_val > 0):
-                complementary_positions.append(num)
-            elif pos1_val == 0 and pos2_val == 0:
-                conflicting_positions.append(num)
-        
-        # Compare arrows
-        arrows1 = grid1.get('strength_arrows', [])
-        arrows2 = grid2.get('strength_arrows', [])
-        common_strength = [a for a in arrows1 if a in arrows2]
-        common_weakness = [
-            a for a in grid1.get('weakness_arrows', [])
-            if a in grid2.get('weakness_arrows', [])
-        ]
+        # Shared arrows are the arrows of the combined masks
+        common_strength = list(self._STRENGTH_ARROWS.present(present1 & present2))
+        common_weakness = list(self._WEAKNESS_ARROWS.absent(present1 | present2))
         
         # Calculate compatibility score
-        compatibility_score = self._calculate_grid_compatibility(
-            matching_positions,
-            complementary_positions,
-            conflicting_positions,
-            common_strength,
-            common_weakness
-        )
+        compatibility_score = self._calculate_grid_compatibility(present1, present2)
         
         # Generate insights
         insights = self._generate_comparison_insights(
@@ -155,8 +140,6 @@ class LoShuGridService:
         
         # Generate recommendations
         recommendations = self._generate_comparison_recommendations(
-            grid1,
-            grid2,
             matching_positions,
             conflicting_positions
         )
@@ -179,44 +162,44 @@ class LoShuGridService:
             'recommendations': recommendations
         }
     
-    def _build_position_grid(self, grid_data: Dict[str, Any]) -> Dict[int, int]:
-        """Build position grid mapping number to count."""
-        position_grid = {}
-        grid = grid_data.get('grid', {})
-        
-        for num in range(1, 10):
-            pos_key = str(num)
-            if pos_key in grid:
-                position_grid[num] = grid[pos_key].get('count', 0)
-            else:
-                position_grid[num] = 0
-        
-        return position_grid
+    def rank_grid_compatibility(
+        self,
+        grid: LoShuBits,
+        others: Iterable[Tuple[Any, LoShuBits]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Score one grid against many others.
+        
+        Args:
+            grid: Grid to compare from
+            others: (key, grid) pairs, e.g. person ids and their grids
+            
+        Returns:
+            One entry per pair with the key, compatibility score and position
+            counts, best match first
+        """
+        present = grid.present
+        results = []
+        for key, other in others:
+            shared = present & other.present
+            results.append({
+                'key': key,
+                'compatibility_score': self._calculate_grid_compatibility(present, other.present),
+                'matching_positions': shared.bit_count(),
+                'complementary_positions': (present ^ other.present).bit_count(),
+                'conflicting_positions': 9 - (present | other.present).bit_count(),
+                'common_strength_arrows': list(self._STRENGTH_ARROWS.present(shared)),
+            })
+        results.sort(key=lambda result: result['compatibility_score'], reverse=True)
+        return results
     
-    def _calculate_strength_arrows(self, position_grid: Dict[int, int]) -> List[str]:
+    def _calculate_strength_arrows(self, bits: LoShuBits) -> List[str]:
         """Calculate strength arrows (numbers present in arrow pattern)."""
-        strength_arrows = []
-        
-        for arrow_name, positions in self.ARROW_PATTERNS['strength'].items():
-            if all(position_grid.get(pos, 0) > 0 for pos in positions):
-                strength_arrows.append(arrow_name)
-        
-        return strength_arrows
+        return list(self._STRENGTH_ARROWS.present(bits.present))
     
-    def _calculate_weakness_arrows(
-        self,
-        position_grid: Dict[int, int],
-        grid_data: Dict[str, Any]
-    ) -> List[str]:
+    def _calculate_weakness_arrows(self, bits: LoShuBits) -> List[str]:
         """Calculate weakness arrows (missing numbers in arrow pattern)."""
-        weakness_arrows = []
-        missing_numbers = set(grid_data.get('missing_numbers', []))
-        
-        for arrow_name, positions in self.ARROW_PATTERNS['weakness'].items():
-            if all(pos in missing_numbers for pos in positions):
-                weakness_arrows.append(arrow_name)
-        
-        return weakness_arrows
+        return list(self._WEAKNESS_ARROWS.absent(bits.present))
     
     def _interpret_arrows(
         self,
@@ -324,31 +307,24 @@ class LoShuGridService:
         
         return suggestions
     
-    def _calculate_grid_compatibility(
-        self,
-        matching: List[int],
-        complementary: List[int],
-        conflicting: List[int],
-        common_strength: List[str],
-        common_weakness: List[str]
-    ) -> int:
-        """Calculate compatibility score (0-100)."""
+    def _calculate_grid_compatibility(self, present1: int, present2: int) -> int:
+        """Calculate compatibility score (0-100) of two presence masks."""
         score = 0
         
         # Matching positions boost compatibility
-        score += len(matching) * 8
+        score += (present1 & present2).bit_count() * 8
         
         # Complementary positions are good
-        score += len(complementary) * 5
+        score += (present1 ^ present2).bit_count() * 5
         
         # Conflicting positions reduce compatibility
-        score -= len(conflicting) * 3
+        score -= (9 - (present1 | present2).bit_count()) * 3
         
         # Common strength arrows boost
-        score += len(common_strength) * 10
+        score += len(self._STRENGTH_ARROWS.present(present1 & present2)) * 10
         
         # Common weakness arrows reduce
-        score -= len(common_weakness) * 5
+        score -= len(self._WEAKNESS_ARROWS.absent(present1 | present2)) * 5
         
         return max(0, min(100, score))
     
@@ -381,8 +357,6 @@ class LoShuGridService:
     
     def _generate_comparison_recommendations(
         self,
-        grid1: Dict[str, Any],
-        grid2: Dict[str, Any],
         matching: List[int],
         conflicting: List[int]
     ) -> List[str]:
@@ -395,28 +369,30 @@ class LoShuGridService:
         if conflicting:
             recommendations.append('Focus on understanding and respecting each other\'s different approaches.')
         
-        # Check for complementary missing numbers
-        missing1 = set(grid1.get('missing_numbers', []))
-        missing2 = set(grid2.get('missing_numbers', []))
-        complementary_missing = missing1.intersection(missing2)
-        
-        if complementary_missing:
-            recommendations.append(f'Work together to develop areas represented by numbers: {", ".join(map(str, complementary_missing))}')
+        # Numbers missing from both grids
+        if conflicting:
+            recommendations.append(f'Work together to develop areas represented by numbers: {", ".join(map(str, conflicting))}')
         
         return recommendations
     
-    def calculate_personality_arrows(self, full_name: str, birth_date: date) -> Dict[str, Any]:
+    def calculate_personality_arrows(
+        self,
+        full_name: Optional[str] = None,
+        birth_date: Optional[date] = None,
+        chart: Optional[NumerologyChart] = None
+    ) -> Dict[str, Any]:
         """
         Calculate all personality arrows in the Lo Shu Grid.
         
         Args:
             full_name: Full name
             birth_date: Date of birth
+            chart: NumerologyChart to use instead of full_name and birth_date
             
         Returns:
             Dictionary with all arrow patterns detected
         """
-        enhanced_grid = self.calculate_enhanced_grid(full_name, birth_date)
+        enhanced_grid = self.calculate_enhanced_grid(full_name, birth_date, chart=chart)
         
         return {
             'strength_arrows': enhanced_grid.get('strength_arrows', []),
@@ -514,18 +490,24 @@ class LoShuGridService:
         
         return arrow_details
     
-    def calculate_grid_strength_score(self, full_name: str, birth_date: date) -> Dict[str, Any]:
+    def calculate_grid_strength_score(
+        self,
+        full_name: Optional[str] = None,
+        birth_date: Optional[date] = None,
+        chart: Optional[NumerologyChart] = None
+    ) -> Dict[str, Any]:
         """
         Calculate overall grid health/strength score.
         
         Args:
             full_name: Full name
             birth_date: Date of birth
+            chart: NumerologyChart to use instead of full_name and birth_date
             
         Returns:
             Dictionary with strength score and analysis
         """
-        enhanced_grid = self.calculate_enhanced_grid(full_name, birth_date)
+        enhanced_grid = self.calculate_enhanced_grid(full_name, birth_date, chart=chart)
         position_grid = enhanced_grid.get('position_grid', {})
         
         # Calculate score based on:
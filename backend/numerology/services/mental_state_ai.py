@@ -9,20 +9,12 @@ from numerology.models import (
 )
 from numerology.numerology import NumerologyCalculator
 from accounts.models import User
-import os
+from .llm_gateway import get_llm_gateway
 import json
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Try to import OpenAI, but handle gracefully if not available
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    logger.warning("OpenAI not available. AI features will be limited.")
-
 
 class MentalStateAIService:
     """Service for analyzing mental state using numerology and AI."""
@@ -36,12 +28,7 @@ class MentalStateAIService:
         """
         self.calculator = NumerologyCalculator(system=system)
         self.system = system
-        self.openai_client = None
-        
-        if OPENAI_AVAILABLE:
-            api_key = os.getenv('OPENAI_API_KEY')
-            if api_key:
-                self.openai_client = OpenAI(api_key=api_key)
+        self.llm_gateway = get_llm_gateway('openai')
     
     def track_emotional_state(
         self,
@@ -202,7 +189,7 @@ class MentalStateAIService:
             recommendations.extend(stress_recommendations)
         
         # AI-generated recommendations if OpenAI is available
-        if self.openai_client:
+        if self.llm_gateway.is_available():
             try:
                 ai_recommendations = self._generate_ai_recommendations(user, profile, analysis)
                 recommendations.extend(ai_recommendations)
@@ -531,7 +518,7 @@ class MentalStateAIService:
         analysis: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
         """Generate AI-powered recommendations using OpenAI."""
-        if not self.openai_client:
+        if not self.llm_gateway.is_available():
             return []
         
         try:
@@ -548,7 +535,8 @@ class MentalStateAIService:
             Provide recommendations in JSON format with: type, priority, title, description, and actions array.
             """
             
-            response = self.openai_client.chat.completions.create(
+            response = self.llm_gateway.chat_completion(
+                'mental_state_recommendations',
                 model="gpt-4",
                 messages=[
                     {"role": "system", "content": "You are a numerology and mental health expert."},
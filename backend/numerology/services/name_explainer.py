@@ -8,6 +8,7 @@ import time
 from typing import Dict, Optional, Any
 from pathlib import Path
 from .llm_service import get_llm_service
+from ..rag_ingestion import REFERENCE_FILTER, reference_query
 
 logger = logging.getLogger(__name__)
 
@@ -193,7 +194,13 @@ Please provide your explanation as a JSON object following the specified format.
                     prompt=prompt,
                     context=input_data,
                     max_tokens=500,
-                    temperature=0.7
+                    temperature=0.7,
+                    reference_query=reference_query(
+                        'name expression soul urge personality',
+                        [numbers.get(key, {}).get('reduced') for key in ('expression', 'soul_urge', 'personality')],
+                        system=system,
+                    ),
+                    reference_filter=REFERENCE_FILTER,
                 )
                 latency_ms = (time.time() - start_time) * 1000
                 
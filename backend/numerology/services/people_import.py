@@ -0,0 +1,306 @@
+"""
+Bulk import of people from CSV or JSON files.
+
+Rows are read from the file as a stream, validated like ``people_list_create``
+input, deduplicated by normalized name and birth date against the user's
+existing people and the rest of the file (so case, spacing and accent variants
+of one person are imported once) and written in chunks: one ``bulk_create`` of
+``Person`` rows and one of their ``PersonNumerologyProfile`` rows per chunk.
+Memory use depends on the chunk size, not on the size of the file.
+
+CSV files need a header row with ``name`` and ``birth_date`` columns and may
+have ``relationship`` and ``notes``. JSON files are either an array of objects
+with those keys or one object per line (JSON Lines).
+"""
+import csv
+import io
+import json
+import logging
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from ..chart import NumerologyChart
+from ..models import PeopleImport, Person, PersonNumerologyProfile
+from ..name_numerology import normalize_names
+from ..numerology import NumerologyCalculator, validate_birth_date, validate_name
+from ..serializers import PersonSerializer
+
+logger = logging.getLogger(__name__)
+
+IMPORT_CHUNK_SIZE = 500
+# Errors kept on the PeopleImport row; later ones are only counted
+MAX_REPORTED_ERRORS = 1000
+# Largest single JSON row accepted, bounding the read buffer
+MAX_JSON_ROW_CHARS = 64 * 1024
+READ_SIZE = 64 * 1024
+
+ROW_FIELDS = ('name', 'birth_date', 'relationship', 'notes')
+PROFILE_FIELDS = (
+    'life_path_number', 'destiny_number', 'soul_urge_number', 'personality_number', 'attitude_number',
+    'maturity_number', 'balance_number', 'personal_year_number', 'personal_month_number',
+)
+PROGRESS_FIELDS = ['status', 'processed_rows', 'created_count', 'duplicate_count', 'error_count', 'errors']
+
+_WHITESPACE = re.compile(r'\s*')
+
+
+class ImportFormatError(ValueError):
+    """The file as a whole cannot be parsed."""
+
+
+def detect_format(filename: str, content_type: Optional[str] = None) -> Optional[str]:
+    """Guess 'csv' or 'json' from an upload's name or content type."""
+    name = (filename or '').lower()
+    if name.endswith('.csv') or content_type == 'text/csv':
+        return 'csv'
+    if name.endswith(('.json', '.jsonl', '.ndjson')) or content_type in ('application/json', 'application/x-ndjson'):
+        return 'json'
+    return None
+
+
+def _text(stream) -> io.TextIOBase:
+    return io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+
+
+def iter_csv_rows(stream) -> Iterator[Dict[str, Any]]:
+    """Yield each CSV data row as a dict keyed by lowercased header."""
+    text = _text(stream)
+    try:
+        reader = csv.DictReader(text)
+        if not reader.fieldnames:
+            raise ImportFormatError('CSV file is empty')
+        headers = [(field or '').strip().lower() for field in reader.fieldnames]
+        missing = {'name', 'birth_date'} - set(headers)
+        if missing:
+            raise ImportFormatError(f"CSV header is missing: {', '.join(sorted(missing))}")
+        reader.fieldnames = headers
+        try:
+            yield from reader
+        except (csv.Error, UnicodeDecodeError) as e:
+            raise ImportFormatError(f'Invalid CSV: {str(e)}')
+    finally:
+        text.detach()
+
+
+class _JsonValues:
+    """Incremental decoder for consecutive JSON values in a text stream."""
+
+    def __init__(self, text):
+        self.text = text
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.position = 0
+        self.eof = False
+
+    def _fill(self):
+        try:
+            chunk = self.text.read(READ_SIZE)
+        except UnicodeDecodeError as e:
+            raise ImportFormatError(f'Invalid JSON: {str(e)}')
+        self.eof = not chunk
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or '' at the end of the stream."""
+        while True:
+            self.position = _WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer) or self.eof:
+                return self.buffer[self.position:self.position + 1]
+            self._fill()
+
+    def skip(self):
+        self.position += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    raise ImportFormatError(f'Invalid JSON: {e.msg} at character {e.pos}')
+                if len(self.buffer) - self.position > MAX_JSON_ROW_CHARS:
+                    raise ImportFormatError('JSON row is too large')
+                self._fill()
+                continue
+            # A value ending with the buffer (e.g. a number) may continue in the next read
+            if end == len(self.buffer) and not self.eof:
+                self._fill()
+                continue
+            self.position = end
+            return value
+
+
+def iter_json_rows(stream) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array, or each value of a JSON Lines file."""
+    text = _text(stream)
+    try:
+        values = _JsonValues(text)
+        if values.peek() != '[':
+            while values.peek():
+                yield values.value()
+            return
+
+        values.skip()
+        if values.peek() == ']':
+            values.skip()
+        else:
+            while True:
+                yield values.value()
+                separator = values.peek()
+                values.skip()
+                if separator == ']':
+                    break
+                if separator != ',':
+                    raise ImportFormatError('Invalid JSON: expected "," or "]" between array items')
+        if values.peek():
+            raise ImportFormatError('Invalid JSON: unexpected data after the array')
+    finally:
+        text.detach()
+
+
+def iter_rows(stream, file_format: str) -> Iterator[Any]:
+    if file_format == 'csv':
+        return iter_csv_rows(stream)
+    if file_format == 'json':
+        return iter_json_rows(stream)
+    raise ImportFormatError(f'Unsupported format: {file_format}')
+
+
+def validate_row(row: Any) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, List[str]]]]:
+    """
+    Validate one imported row.
+
+    Returns:
+        (validated Person fields, None) or (None, field errors)
+    """
+    if not isinstance(row, dict):
+        return None, {'row': ['Expected an object with name and birth_date.']}
+
+    data = {}
+    for field in ROW_FIELDS:
+        value = row.get(field)
+        if isinstance(value, str):
+            value = value.strip()
+        if value not in (None, ''):
+            data[field] = value
+
+    serializer = PersonSerializer(data=data)
+    if not serializer.is_valid():
+        return None, {field: [str(message) for message in messages] for field, messages in serializer.errors.items()}
+
+    validated = serializer.validated_data
+    if not validate_name(validated['name']):
+        return None, {'name': ['Name must contain at least one letter.']}
+    if not validate_birth_date(validated['birth_date']):
+        return None, {'birth_date': ['Birth date must be between 1900-01-01 and today.']}
+    return dict(validated), None
+
+
+def _profile_numbers(calculator: NumerologyCalculator, person: Person) -> Dict[str, int]:
+    chart = NumerologyChart(person.name, person.birth_date, calculator=calculator)
+    return {field: getattr(chart, field) for field in PROFILE_FIELDS}
+
+
+def _person_keys(people: List[Tuple[str, Any]]) -> List[Tuple[str, Any]]:
+    """(normalized name, birth date) per person; names with no Latin form are kept as entered."""
+    names = normalize_names(name for name, _ in people)
+    return [(normalized or name, birth_date) for normalized, (name, birth_date) in zip(names, people)]
+
+
+def _write_chunk(people_import: PeopleImport, chunk: List[Tuple[int, Dict[str, Any]]],
+                 calculator: NumerologyCalculator) -> None:
+    """Create the people of one chunk, skipping those the user already has."""
+    user = people_import.user
+    keys = _person_keys([(data['name'], data['birth_date']) for _, data in chunk])
+    for attempt in range(2):
+        existing = set(_person_keys(list(Person.objects.filter(
+            user=user,
+            birth_date__in={data['birth_date'] for _, data in chunk},
+        ).values_list('name', 'birth_date'))))
+
+        people, seen, duplicates = [], set(), 0
+        for (_, data), key in zip(chunk, keys):
+            if key in existing or key in seen:
+                duplicates += 1
+                continue
+            seen.add(key)
+            people.append(Person(user=user, **data))
+        profiles = [
+            PersonNumerologyProfile(
+                person=person, calculation_system=calculator.system, **_profile_numbers(calculator, person)
+            )
+            for person in people
+        ]
+
+        try:
+            with transaction.atomic():
+                Person.objects.bulk_create(people)
+                PersonNumerologyProfile.objects.bulk_create(profiles)
+        except IntegrityError:
+            # Someone added one of these people since the lookup; look again
+            if attempt:
+                raise
+            continue
+        people_import.created_count += len(people)
+        people_import.duplicate_count += duplicates
+        return
+
+
+def _record_error(people_import: PeopleImport, row_number: int, errors: Dict[str, List[str]]) -> None:
+    people_import.error_count += 1
+    if len(people_import.errors) < MAX_REPORTED_ERRORS:
+        people_import.errors.append({'row': row_number, 'errors': errors})
+
+
+def run_import(people_import: PeopleImport, stream, chunk_size: int = IMPORT_CHUNK_SIZE) -> PeopleImport:
+    """
+    Import every row of ``stream`` for ``people_import.user``.
+
+    Progress is saved on ``people_import`` after every chunk. Rows are
+    numbered from 1, not counting a CSV header.
+
+    Args:
+        people_import: Import record to update
+        stream: Binary file object with the uploaded file
+        chunk_size: Rows validated and written per chunk
+
+    Returns:
+        The updated import record
+    """
+    calculator = NumerologyCalculator()
+    people_import.status = 'processing'
+    people_import.save(update_fields=['status'])
+
+    chunk = []
+    try:
+        for row_number, row in enumerate(iter_rows(stream, people_import.file_format), start=1):
+            data, errors = validate_row(row)
+            if errors:
+                _record_error(people_import, row_number, errors)
+            else:
+                chunk.append((row_number, data))
+            people_import.processed_rows = row_number
+            if row_number % chunk_size == 0:
+                if chunk:
+                    _write_chunk(people_import, chunk, calculator)
+                    chunk = []
+                people_import.save(update_fields=PROGRESS_FIELDS)
+        if chunk:
+            _write_chunk(people_import, chunk, calculator)
+        people_import.status = 'completed'
+    except ImportFormatError as e:
+        people_import.status = 'failed'
+        people_import.error_message = str(e)
+    except Exception as e:
+        logger.error(f'People import {people_import.id} failed: {str(e)}', exc_info=True)
+        people_import.status = 'failed'
+        people_import.error_message = 'Import failed unexpectedly; rows before the failure were imported.'
+
+    people_import.completed_at = timezone.now()
+    people_import.save(update_fields=PROGRESS_FIELDS + ['error_message', 'completed_at'])
+    return people_import
@@ -8,6 +8,7 @@ import time
 from typing import Dict, Optional, Any
 from pathlib import Path
 from .llm_service import get_llm_service
+from ..rag_ingestion import REFERENCE_FILTER, reference_query
 
 logger = logging.getLogger(__name__)
 
@@ -123,7 +124,12 @@ Please provide your explanation as a JSON object following the specified format.
                     prompt=prompt,
                     context=input_data,
                     max_tokens=500,
-                    temperature=0.7
+                    temperature=0.7,
+                    reference_query=reference_query(
+                        'phone number vibration',
+                        [computed.get('core_number', {}).get('reduced'), computed.get('dominant_digit')],
+                    ),
+                    reference_filter=REFERENCE_FILTER,
                 )
                 latency_ms = (time.time() - start_time) * 1000
                 
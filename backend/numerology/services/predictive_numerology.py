@@ -4,6 +4,7 @@ Predictive Numerology service for 9-year cycles, life forecasting, and breakthro
 from typing import Dict, List, Any, Optional
 from datetime import date
 from ..numerology import NumerologyCalculator
+from ..chart import NumerologyChart, resolve_chart
 
 
 class PredictiveNumerologyService:
@@ -16,9 +17,10 @@ class PredictiveNumerologyService:
     
     def calculate_predictive_profile(
         self,
-        full_name: str,
-        birth_date: date,
-        forecast_years: int = 20
+        full_name: Optional[str] = None,
+        birth_date: Optional[date] = None,
+        forecast_years: int = 20,
+        chart: Optional[NumerologyChart] = None
     ) -> Dict[str, Any]:
         """
         Calculate comprehensive predictive numerology profile.
@@ -27,13 +29,17 @@ class PredictiveNumerologyService:
             full_name: Full name
             birth_date: Birth date
             forecast_years: Number of years to forecast (default 20)
+            chart: NumerologyChart to use instead of full_name and birth_date
         
         Returns:
             Predictive profile with cycles, forecasting, and breakthrough predictions
         """
+        chart = resolve_chart(chart, full_name, birth_date, self.calculator)
+        birth_date = chart.birth_date
+        
         # Calculate base numbers
-        life_path = self.calculator.calculate_life_path_number(birth_date)
-        destiny = self.calculator.calculate_destiny_number(full_name)
+        life_path = chart.life_path_number
+        destiny = chart.destiny_number
         
         # Calculate 9-year cycles
         nine_year_cycles = self._calculate_nine_year_cycles(birth_date, forecast_years)
@@ -539,9 +545,10 @@ class PredictiveNumerologyService:
     
     def generate_yearly_forecast(
         self,
-        birth_date: date,
+        birth_date: Optional[date],
         target_year: int,
-        full_name: str
+        full_name: Optional[str] = None,
+        chart: Optional[NumerologyChart] = None
     ) -> Dict[str, Any]:
         """
         Generate comprehensive yearly forecast for a specific year.
@@ -550,12 +557,15 @@ class PredictiveNumerologyService:
             birth_date: Birth date
             target_year: Year to forecast
             full_name: Full name
+            chart: NumerologyChart to use instead of full_name and birth_date
         
         Returns:
             Dictionary with comprehensive yearly forecast
         """
-        life_path = self.calculator.calculate_life_path_number(birth_date)
-        destiny = self.calculator.calculate_destiny_number(full_name)
+        chart = resolve_chart(chart, full_name, birth_date, self.calculator)
+        birth_date = chart.birth_date
+        life_path = chart.life_path_number
+        destiny = chart.destiny_number
         
         # Calculate personal year
         personal_year = self.calculator.calculate_personal_year_number(birth_date, target_year)
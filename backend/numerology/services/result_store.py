@@ -0,0 +1,228 @@
+"""
+Content-addressed store of computed name and phone numerology.
+
+The numbers and the LLM explanation for a name depend only on the
+normalized name, name type and system (for a phone number: the E.164
+number and method), not on who asked. They are stored once in
+``NumerologyResult`` under a digest of that normalized input and
+referenced from each user's ``NameReport`` / ``PhoneReport``.
+"""
+import hashlib
+import json
+import logging
+from typing import Any, Callable, Dict
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from utils.metrics import increment
+from utils.single_flight import single_flight
+from ..models import NumerologyResult
+from ..name_numerology import compute_name_numbers, normalize_name
+from ..phone_numerology import compute_phone_numerology
+from .name_explainer import generate_name_explanation
+from .phone_explainer import generate_phone_explanation
+
+logger = logging.getLogger(__name__)
+
+# Bump when computation or prompts change so old rows stop matching.
+NAME_ALGORITHM_VERSION = 1
+PHONE_ALGORITHM_VERSION = 1
+
+
+def input_digest(kind: str, version: int, inputs: Dict[str, Any]) -> str:
+    """Return the SHA-256 digest addressing a normalized input."""
+    payload = json.dumps({'kind': kind, 'version': version, 'inputs': inputs}, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _explanation_fields(explanation_result: Dict[str, Any]) -> Dict[str, Any]:
+    explanation = explanation_result.get('explanation')
+    return {
+        'explanation': explanation,
+        'explanation_error': explanation_result.get('error'),
+        'tokens_used': (explanation_result.get('tokens_used') or 0) if explanation else 0,
+    }
+
+
+def _get_or_create(
+    kind: str,
+    version: int,
+    inputs: Dict[str, Any],
+    compute: Callable[[], Dict],
+    explain: Callable[[Dict], Dict[str, Any]],
+    store: bool = True,
+    refresh: bool = False
+) -> NumerologyResult:
+    digest = input_digest(kind, version, inputs)
+    shared = NumerologyResult.objects.filter(digest=digest).first()
+
+    if shared is None:
+        # Concurrent first requests for this input, from any user, share one
+        # generation. Unstored results are kept apart from stored ones so a
+        # caller that saves a report always gets a saved row.
+        return single_flight(
+            f'numerology_result:{digest}:{store}',
+            lambda: _create(kind, digest, inputs, compute, explain, store),
+            operation=f'numerology_result_{kind}',
+        )
+
+    if refresh:
+        # Regenerate for the requesting user's report only; the shared row
+        # keeps the explanation every other report was given, unless it
+        # never had one.
+        increment('numerology_result_store.refresh', kind=kind)
+        shared.result = compute()
+        fields = _explanation_fields(explain(shared.result))
+        if store and shared.explanation is None:
+            NumerologyResult.objects.filter(pk=shared.pk).update(result=shared.result, **fields)
+        for field, value in fields.items():
+            setattr(shared, field, value)
+        return shared
+
+    increment('numerology_result_store.hit', kind=kind)
+    updates = {'hit_count': F('hit_count') + 1, 'last_used_at': timezone.now()}
+    if shared.explanation is None:
+        # The first explanation failed; retry it and share the outcome.
+        fields = _explanation_fields(explain(shared.result))
+        for field, value in fields.items():
+            setattr(shared, field, value)
+        updates.update(fields)
+    else:
+        increment('numerology_result_store.tokens_saved', shared.tokens_used, kind=kind)
+    if store:
+        NumerologyResult.objects.filter(pk=shared.pk).update(**updates)
+    return shared
+
+
+def _create(
+    kind: str,
+    digest: str,
+    inputs: Dict[str, Any],
+    compute: Callable[[], Dict],
+    explain: Callable[[Dict], Dict[str, Any]],
+    store: bool
+) -> NumerologyResult:
+    if store:
+        # A previous leader may have stored it since the caller looked.
+        existing = NumerologyResult.objects.filter(digest=digest).first()
+        if existing is not None:
+            return existing
+    increment('numerology_result_store.miss', kind=kind)
+    result = compute()
+    fields = _explanation_fields(explain(result))
+    shared = NumerologyResult(kind=kind, digest=digest, inputs=inputs, result=result, **fields)
+    if not store:
+        return shared
+    try:
+        with transaction.atomic():
+            shared.save()
+    except IntegrityError:
+        # Another worker stored the same input first; share its row.
+        shared = NumerologyResult.objects.get(digest=digest)
+    return shared
+
+
+def get_name_result(
+    user,
+    name: str,
+    name_type: str,
+    system: str,
+    keep_master: bool = True,
+    refresh: bool = False
+) -> NumerologyResult:
+    """
+    Return the shared computation and explanation for a name.
+
+    Args:
+        user: User requesting the report (only used when explaining a miss)
+        name: Name as entered
+        name_type: "birth", "current", or "nickname"
+        system: "pythagorean" or "chaldean"
+        keep_master: Whether master numbers are preserved
+        refresh: Recompute and re-explain for this request without changing the shared result
+
+    Returns:
+        NumerologyResult whose ``result`` is the compute_name_numbers output
+
+    Raises:
+        ValueError: If the name is empty or has no letters
+    """
+    inputs = {
+        'normalized_name': normalize_name(name, transliterate=True),
+        'name_type': name_type,
+        'system': system,
+        'keep_master': keep_master,
+    }
+    if not inputs['normalized_name']:
+        # Let the calculator raise its usual validation error.
+        compute_name_numbers(name=name, system=system, keep_master=keep_master)
+
+    def explain(numbers):
+        return generate_name_explanation(
+            user=user,
+            name=name,
+            name_type=name_type,
+            system=system,
+            numbers=numbers,
+            breakdown=numbers['breakdown'],
+            keep_master=keep_master,
+            report_type='saved'
+        )
+
+    return _get_or_create(
+        'name', NAME_ALGORITHM_VERSION, inputs,
+        compute=lambda: compute_name_numbers(name=name, system=system, keep_master=keep_master),
+        explain=explain,
+        refresh=refresh,
+    )
+
+
+def get_phone_result(
+    user,
+    phone_raw: str,
+    phone_e164: str,
+    method: str,
+    persist: bool = True,
+    refresh: bool = False
+) -> NumerologyResult:
+    """
+    Return the shared computation and explanation for a phone number.
+
+    When ``persist`` is False an existing result is reused but a new one is
+    not stored, so numbers the user did not ask to save stay out of the table.
+
+    Args:
+        user: User requesting the report (only used when explaining a miss)
+        phone_raw: Phone number as entered
+        phone_e164: Sanitized E.164 number
+        method: "core", "full", or "compatibility"
+        persist: Whether the report is being saved
+        refresh: Recompute and re-explain for this request without changing the shared result
+
+    Returns:
+        NumerologyResult whose ``result`` is the compute_phone_numerology output
+    """
+    inputs = {
+        'phone_e164': phone_e164,
+        'method': method,
+        'core_scope': 'national',
+        'keep_master': False,
+    }
+    return _get_or_create(
+        'phone', PHONE_ALGORITHM_VERSION, inputs,
+        compute=lambda: compute_phone_numerology(
+            phone_e164, method=method, core_scope='national', keep_master=False
+        ),
+        explain=lambda computed: generate_phone_explanation(
+            user=user,
+            phone_raw=phone_raw,
+            phone_e164=phone_e164,
+            method=method,
+            computed=computed,
+            persist=persist
+        ),
+        store=persist,
+        refresh=refresh,
+    )
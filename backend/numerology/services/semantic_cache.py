@@ -0,0 +1,299 @@
+"""
+Semantic cache for LLM-generated explanations.
+
+The numerology context behind an explanation is flattened into normalized
+features, embedded, and compared against previously generated explanations
+of the same type. When the best match is above the similarity threshold its
+content is reused instead of calling the LLM again.
+
+Embeddings are stored on ``Explanation.embedding`` together with the name of
+the embedder that produced them, and each worker keeps an in-memory matrix
+per explanation type that is topped up incrementally from the database.
+"""
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from utils.metrics import increment
+from .llm_gateway import get_llm_gateway
+from ..models import Explanation
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+HASHING_DIMENSIONS = 512
+
+# Free-text fields longer than this are embedded as word features.
+_MAX_SCALAR_TEXT = 40
+
+
+def _flatten(prefix: str, value: Any, features: List[str]) -> None:
+    if isinstance(value, dict):
+        for key in sorted(value):
+            _flatten(f"{prefix}.{key}" if prefix else str(key), value[key], features)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _flatten(prefix, item, features)
+    elif value is None:
+        return
+    elif isinstance(value, str):
+        text = ' '.join(value.lower().split())
+        if len(text) <= _MAX_SCALAR_TEXT:
+            features.append(f"{prefix}={text}")
+        else:
+            features.extend(f"{prefix}~{word.strip('.,!?;:')}" for word in text.split())
+    else:
+        features.append(f"{prefix}={value}")
+
+
+def context_features(explanation_type: str, data: Dict[str, Any], profile: Dict[str, Any]) -> List[str]:
+    """Normalize an explanation context into a list of string features."""
+    features = [f"type={explanation_type}"]
+    _flatten('data', data, features)
+    _flatten('profile', profile, features)
+    return features
+
+
+class HashingEmbedder:
+    """
+    Deterministic feature-hashing embedder.
+
+    Runs locally with no external calls, so identical contexts always map to
+    identical vectors. Used by default and in tests.
+    """
+
+    name = f'hashing-{HASHING_DIMENSIONS}'
+    dimensions = HASHING_DIMENSIONS
+
+    def embed(self, features: List[str]) -> np.ndarray:
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for feature in features:
+            digest = hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], 'little') % self.dimensions
+            sign = 1.0 if digest[4] & 1 else -1.0
+            vector[bucket] += sign
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+class OpenAIEmbedder:
+    """Embedder backed by the OpenAI embeddings API."""
+
+    model = 'text-embedding-3-small'
+    name = f'openai-{model}'
+
+    def __init__(self):
+        self._gateway = get_llm_gateway('openai')
+
+    def embed(self, features: List[str]) -> np.ndarray:
+        response = self._gateway.create_embedding(
+            'explanation_embedding', model=self.model, input=' '.join(features)
+        )
+        vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+def get_embedder():
+    """Return the embedder selected by ``EXPLANATION_EMBEDDING_BACKEND``."""
+    backend = getattr(settings, 'EXPLANATION_EMBEDDING_BACKEND', 'hashing')
+    if backend == 'openai':
+        return OpenAIEmbedder()
+    return HashingEmbedder()
+
+
+class ExplanationIndex:
+    """
+    In-memory vector index over stored explanations of one type.
+
+    New rows are pulled from the database on each search using the
+    ``(explanation_type, generated_at)`` index, so the matrix stays current
+    across workers without a full reload. Expired rows are dropped on
+    refresh, so the matrix only holds explanations that can still match.
+    """
+
+    def __init__(self, explanation_type: str, embedder_name: str, dimensions: int):
+        self.explanation_type = explanation_type
+        self.embedder_name = embedder_name
+        self.dimensions = dimensions
+        self._ids: List[str] = []
+        self._expires: List[Optional[datetime]] = []
+        self._matrix = np.zeros((0, dimensions), dtype=np.float32)
+        self._loaded_until: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    def _append(self, rows):
+        ids, expires, vectors = [], [], []
+        for explanation_id, embedding, expires_at in rows:
+            if not isinstance(embedding, dict) or embedding.get('model') != self.embedder_name:
+                continue
+            vector = embedding.get('vector') or []
+            if len(vector) != self.dimensions:
+                continue
+            ids.append(str(explanation_id))
+            expires.append(expires_at)
+            vectors.append(vector)
+        if vectors:
+            # Replaced rather than extended, so searches keep a consistent snapshot
+            self._ids = self._ids + ids
+            self._expires = self._expires + expires
+            self._matrix = np.vstack([self._matrix, np.asarray(vectors, dtype=np.float32)])
+
+    def _compact(self, now: datetime) -> None:
+        live = [i for i, expires_at in enumerate(self._expires) if expires_at is None or expires_at > now]
+        if len(live) == len(self._ids):
+            return
+        self._ids = [self._ids[i] for i in live]
+        self._expires = [self._expires[i] for i in live]
+        self._matrix = self._matrix[live]
+
+    def refresh(self) -> None:
+        with self._lock:
+            self._compact(timezone.now())
+            queryset = Explanation.objects.filter(
+                explanation_type=self.explanation_type,
+                is_cached=False,
+                embedding__isnull=False,
+            ).exclude(llm_provider='template')
+            if self._loaded_until:
+                queryset = queryset.filter(generated_at__gt=self._loaded_until)
+            queryset = queryset.filter(Q(expires_at__isnull=True) | Q(expires_at__gt=timezone.now()))
+            rows = list(queryset.order_by('generated_at').values_list(
+                'id', 'embedding', 'expires_at', 'generated_at'
+            ))
+            if rows:
+                self._loaded_until = rows[-1][3]
+                self._append(row[:3] for row in rows)
+
+    def search(self, vector: np.ndarray) -> Tuple[Optional[str], float]:
+        """Return ``(explanation_id, cosine_similarity)`` of the best live match."""
+        self.refresh()
+        with self._lock:
+            ids, expires, matrix = self._ids, self._expires, self._matrix
+        if not ids:
+            return None, 0.0
+        scores = matrix @ vector
+        now = timezone.now()
+        # Rows expiring since the last refresh are skipped until the next one compacts them
+        for index in np.argsort(-scores):
+            expires_at = expires[index]
+            if expires_at is None or expires_at > now:
+                return ids[index], float(scores[index])
+        return None, 0.0
+
+    def __len__(self):
+        return len(self._ids)
+
+
+_indexes: Dict[Tuple[str, str], ExplanationIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index(explanation_type: str, embedder) -> ExplanationIndex:
+    key = (explanation_type, embedder.name)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = ExplanationIndex(explanation_type, embedder.name, embedder.dimensions)
+            _indexes[key] = index
+        return index
+
+
+def reset_indexes() -> None:
+    """Drop all in-memory indexes (used by tests)."""
+    with _indexes_lock:
+        _indexes.clear()
+
+
+class SemanticExplanationCache:
+    """Look up and record explanations by context similarity."""
+
+    def __init__(self, embedder=None, threshold: Optional[float] = None):
+        self.embedder = embedder or get_embedder()
+        self.threshold = threshold if threshold is not None else getattr(
+            settings, 'EXPLANATION_SEMANTIC_CACHE_THRESHOLD', DEFAULT_SIMILARITY_THRESHOLD
+        )
+        self.enabled = getattr(settings, 'EXPLANATION_SEMANTIC_CACHE_ENABLED', True)
+
+    def embed(self, explanation_type: str, data: Dict[str, Any], profile: Dict[str, Any]) -> Optional[np.ndarray]:
+        if not self.enabled:
+            return None
+        try:
+            return self.embedder.embed(context_features(explanation_type, data, profile))
+        except Exception as e:
+            logger.warning(f"Failed to embed {explanation_type} explanation context: {str(e)}")
+            return None
+
+    def lookup(
+        self,
+        user,
+        explanation_type: str,
+        vector: Optional[np.ndarray],
+        cache_key: str,
+        context_data: Dict[str, Any],
+    ) -> Optional[Explanation]:
+        """
+        Return a copy of the closest stored explanation for ``user``.
+
+        The copy is stored as a cached explanation (no tokens used) that
+        points at its source. Returns None when no match clears the threshold.
+        """
+        if vector is None:
+            return None
+
+        index = get_index(explanation_type, self.embedder)
+        match_id, similarity = index.search(vector)
+        source = None
+        if match_id and similarity >= self.threshold:
+            source = Explanation.objects.filter(id=match_id).first()
+
+        if source is None:
+            increment('explanation_semantic_cache.miss', explanation_type=explanation_type)
+            return None
+
+        increment('explanation_semantic_cache.hit', explanation_type=explanation_type)
+        increment(
+            'explanation_semantic_cache.tokens_saved',
+            source.tokens_used or 0,
+            explanation_type=explanation_type,
+        )
+        logger.info(
+            f"Semantic cache hit for {explanation_type} explanation "
+            f"(similarity {similarity:.3f}, source {source.id})"
+        )
+        return Explanation.objects.create(
+            user=user,
+            explanation_type=explanation_type,
+            title=source.title,
+            content=source.content,
+            llm_provider=source.llm_provider,
+            llm_model=source.llm_model,
+            tokens_used=0,
+            cost=0,
+            context_data={
+                **context_data,
+                'semantic_cache': {'source_id': str(source.id), 'similarity': round(similarity, 4)},
+            },
+            is_cached=True,
+            cache_key=cache_key,
+            expires_at=source.expires_at,
+        )
+
+    def embedding_for(self, vector: Optional[np.ndarray], llm_provider: str) -> Optional[Dict[str, Any]]:
+        """
+        Value of ``Explanation.embedding`` for a freshly generated explanation.
+
+        It must be passed to the same ``create()`` as the explanation: indexes
+        load rows past their last ``generated_at``, so an embedding saved
+        later could be skipped for good.
+        """
+        if vector is None or llm_provider == 'template':
+            return None
+        return {'model': self.embedder.name, 'vector': vector.tolist()}
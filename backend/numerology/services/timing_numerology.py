@@ -1,11 +1,21 @@
 """
 Timing numerology service for optimal dates, danger dates, and event timing.
 """
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterable, Optional
 from datetime import date, timedelta
+import numpy as np
 from numerology.numerology import NumerologyCalculator
 from numerology.services.universal_cycles import UniversalCycleCalculator
 
+JOINT_STRATEGIES = ('maximin', 'weighted_mean')
+MAX_JOINT_PEOPLE = 50
+MAX_JOINT_DAYS = 732
+
+
+def _digital_root(values: np.ndarray) -> np.ndarray:
+    """Vectorized _reduce_to_single_digit(n, preserve_master=False) for n >= 1."""
+    return 1 + (values - 1) % 9
+
 
 class TimingNumerologyService:
     """Service for timing and mundane numerology."""
@@ -203,6 +213,181 @@ class TimingNumerologyService:
             'recommendations': best_dates['recommendations']
         }
     
+    def find_joint_dates(
+        self,
+        people: List[Dict[str, Any]],
+        event_type: str,
+        start_date: date,
+        end_date: date,
+        strategy: str = 'maximin',
+        allowed_weekdays: Optional[Iterable[int]] = None,
+        blackout_dates: Optional[Iterable[date]] = None,
+        limit: int = 10
+    ) -> Dict[str, Any]:
+        """
+        Find dates that suit several people at once.
+        
+        Builds a people x days matrix of the same scores _calculate_date_score
+        gives each person, then aggregates each day across people.
+        
+        Args:
+            people: List of dicts with birth_date, optional name and weight
+            event_type: Type of event (wedding, business_launch, meeting, ...)
+            start_date: Start of date range
+            end_date: End of date range
+            strategy: 'maximin' (best worst-off person, mean breaks ties)
+                or 'weighted_mean'
+            allowed_weekdays: Weekdays to consider (0=Monday); all if None
+            blackout_dates: Dates that must not be suggested
+            limit: Maximum number of dates to return
+            
+        Returns:
+            Ranked dates with per-person breakdowns
+            
+        Raises:
+            ValueError: If inputs are out of range
+        """
+        if strategy not in JOINT_STRATEGIES:
+            raise ValueError(f'strategy must be one of {", ".join(JOINT_STRATEGIES)}')
+        if not people or len(people) > MAX_JOINT_PEOPLE:
+            raise ValueError(f'Provide between 1 and {MAX_JOINT_PEOPLE} people')
+        if end_date < start_date or (end_date - start_date).days + 1 > MAX_JOINT_DAYS:
+            raise ValueError(f'Date range must be between 1 and {MAX_JOINT_DAYS} days')
+        
+        # Day axis, with hard constraints applied before scoring
+        days = np.arange(
+            np.datetime64(start_date, 'D'), np.datetime64(end_date, 'D') + 1
+        )
+        keep = np.ones(len(days), dtype=bool)
+        if allowed_weekdays is not None:
+            # 1970-01-01 was a Thursday (weekday 3)
+            weekdays = (days.astype('int64') + 3) % 7
+            keep &= np.isin(weekdays, list(allowed_weekdays))
+        if blackout_dates:
+            keep &= ~np.isin(days, np.array(list(blackout_dates), dtype='datetime64[D]'))
+        days = days[keep]
+        
+        weights = np.array([float(person.get('weight', 1)) for person in people])
+        if (weights < 0).any() or weights.sum() <= 0:
+            raise ValueError('Weights must be non-negative and not all zero')
+        
+        if len(days) == 0:
+            ranked = []
+        else:
+            matrix = self._joint_score_matrix(people, days, event_type)
+            mean = (matrix['score'] * weights[:, None]).sum(axis=0) / weights.sum()
+            if strategy == 'maximin':
+                primary = matrix['score'].min(axis=0).astype(float)
+            else:
+                primary = mean
+            # Best primary first, then mean, then earliest date
+            order = np.lexsort((np.arange(len(days)), -mean, -primary))[:limit]
+            ranked = [
+                self._joint_date_entry(people, days, matrix, primary, mean, index)
+                for index in order
+            ]
+        
+        return {
+            'event_type': event_type,
+            'strategy': strategy,
+            'date_range': {
+                'start': start_date.isoformat(),
+                'end': end_date.isoformat()
+            },
+            'people_count': len(people),
+            'candidate_days': int(len(days)),
+            'best_dates': ranked,
+            'recommendations': self._get_event_recommendations(event_type)
+        }
+    
+    def _joint_score_matrix(
+        self,
+        people: List[Dict[str, Any]],
+        days: np.ndarray,
+        event_type: str
+    ) -> Dict[str, np.ndarray]:
+        """Vectorized _calculate_date_score for every person and day."""
+        years = days.astype('datetime64[Y]').astype('int64') + 1970
+        months = days.astype('datetime64[M]').astype('int64') % 12 + 1
+        day_of_month = (days - days.astype('datetime64[M]')).astype('int64') + 1
+        
+        birth_dates = [person['birth_date'] for person in people]
+        birth_digits = np.array([
+            self.calculator._reduce_to_single_digit(birth.day, preserve_master=False) +
+            self.calculator._reduce_to_single_digit(birth.month, preserve_master=False)
+            for birth in birth_dates
+        ])[:, None]
+        
+        # Personal and universal cycles (all reduce without master numbers)
+        year_root = _digital_root(years)
+        personal_year = _digital_root(birth_digits + year_root)
+        personal_month = _digital_root(personal_year + _digital_root(months))
+        personal_day = _digital_root(personal_month + _digital_root(day_of_month))
+        universal_month = _digital_root(year_root + _digital_root(months))
+        universal_day = _digital_root(universal_month + _digital_root(day_of_month))
+        
+        # Score tables from the single-date helpers, indexed by cycle number
+        numbers = range(10)
+        day_table = np.array([self._get_personal_day_score(n, event_type) for n in numbers])
+        month_table = np.array([self._get_month_alignment(n, event_type) for n in numbers])
+        year_table = np.array([self._get_year_alignment(n, event_type) for n in numbers])
+        universal_table = np.array([self._get_universal_day_score(n, event_type) for n in numbers])
+        
+        alignment = 1 - (
+            np.abs(personal_day - personal_month) / 9.0 +
+            np.abs(personal_day - personal_year) / 9.0 +
+            np.abs(personal_day - universal_day) / 9.0
+        ) / 3
+        alignment = np.clip(alignment, 0, 1)
+        
+        score = (
+            day_table[personal_day] * 0.4 +
+            month_table[personal_month] * 0.25 +
+            year_table[personal_year] * 0.2 +
+            universal_table[universal_day] * 0.15
+        )
+        score = score + np.where(alignment >= 0.8, 10, np.where(alignment >= 0.6, 5, 0))
+        score = np.round(np.clip(score, 0, 100)).astype(int)
+        
+        return {
+            'score': score,
+            'personal_day': personal_day,
+            'personal_month': personal_month,
+            'personal_year': personal_year,
+            'universal_day': universal_day
+        }
+    
+    def _joint_date_entry(
+        self,
+        people: List[Dict[str, Any]],
+        days: np.ndarray,
+        matrix: Dict[str, np.ndarray],
+        primary: np.ndarray,
+        mean: np.ndarray,
+        index: int
+    ) -> Dict[str, Any]:
+        """Build the response entry for one ranked day."""
+        scores = matrix['score'][:, index]
+        breakdown = []
+        for i, person in enumerate(people):
+            score = int(scores[i])
+            breakdown.append({
+                'name': person.get('name'),
+                'score': score,
+                'level': 'excellent' if score >= 85 else 'good' if score >= 70 else 'moderate' if score >= 50 else 'poor',
+                'personal_day': int(matrix['personal_day'][i, index]),
+                'personal_month': int(matrix['personal_month'][i, index]),
+                'personal_year': int(matrix['personal_year'][i, index])
+            })
+        return {
+            'date': str(days[index]),
+            'score': round(float(primary[index]), 2),
+            'mean_score': round(float(mean[index]), 2),
+            'min_score': int(scores.min()),
+            'universal_day': int(matrix['universal_day'][index]),
+            'people': breakdown
+        }
+    
     def _calculate_date_score(
         self,
         user_birth_date: date,
@@ -230,11 +415,7 @@ class TimingNumerologyService:
         )
         
         # Calculate universal day
-        universal_day_data = self.universal_calculator.calculate_universal_day(
-            target_date.year,
-            target_date.month,
-            target_date.day
-        )
+        universal_day_data = self.universal_calculator.calculate_universal_day(target_date)
         universal_day = universal_day_data['universal_day_number']
         
         # Calculate base score from personal day
@@ -2,7 +2,7 @@
 Universal Cycles service for numerology.
 Calculates global year, month, and day numbers.
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import date, datetime
 from numerology.numerology import NumerologyCalculator
 
@@ -652,3 +652,7 @@ class UniversalCyclesService:
             trends.append('Some challenging cycles require preparation')
         
         return trends
+
+
+# Backwards-compatible name used by the services package and timing service.
+UniversalCycleCalculator = UniversalCyclesService
@@ -6,6 +6,7 @@ from typing import Dict, List, Any, Optional
 from datetime import date, datetime, timedelta
 from numerology.numerology import NumerologyCalculator
 from numerology.models import NumerologyProfile
+from numerology.chart import NumerologyChart, resolve_chart
 
 
 class VisualizationService:
@@ -17,8 +18,9 @@ class VisualizationService:
     def generate_numerology_wheel(
         self,
         profile: NumerologyProfile,
-        full_name: str,
-        birth_date: date
+        full_name: Optional[str] = None,
+        birth_date: Optional[date] = None,
+        chart: Optional[NumerologyChart] = None
     ) -> Dict[str, Any]:
         """
         Generate data for numerology wheel visualization.
@@ -28,12 +30,12 @@ class VisualizationService:
             profile: NumerologyProfile instance
             full_name: Full name
             birth_date: Date of birth
+            chart: NumerologyChart to use instead of full_name and birth_date
             
         Returns:
             Dictionary with wheel data including positions and connections
         """
-        # Get all numbers
-        numbers = self.calculator.calculate_all(full_name, birth_date)
+        chart = resolve_chart(chart, full_name, birth_date, self.calculator)
         
         # Calculate angles for each number on the wheel (360 degrees / 9 positions = 40 degrees each)
         # Numbers 1-9 are positioned around the circle
@@ -41,13 +43,13 @@ class VisualizationService:
         angle_step = 360 / 9
         
         number_types = {
-            'life_path': numbers.get('life_path_number'),
-            'destiny': numbers.get('destiny_number'),
-            'soul_urge': numbers.get('soul_urge_number'),
-            'personality': numbers.get('personality_number'),
-            'attitude': numbers.get('attitude_number'),
-            'maturity': numbers.get('maturity_number'),
-            'balance': numbers.get('balance_number'),
+            'life_path': chart.life_path_number,
+            'destiny': chart.destiny_number,
+            'soul_urge': chart.soul_urge_number,
+            'personality': chart.personality_number,
+            'attitude': chart.attitude_number,
+            'maturity': chart.maturity_number,
+            'balance': chart.balance_number,
         }
         
         # Group numbers by their value (1-9)
@@ -267,8 +269,9 @@ class VisualizationService:
     def create_heatmap_data(
         self,
         profile: NumerologyProfile,
-        full_name: str,
-        birth_date: date
+        full_name: Optional[str] = None,
+        birth_date: Optional[date] = None,
+        chart: Optional[NumerologyChart] = None
     ) -> Dict[str, Any]:
         """
         Generate heatmap data showing number strength/weakness.
@@ -277,21 +280,22 @@ class VisualizationService:
             profile: NumerologyProfile instance
             full_name: Full name
             birth_date: Date of birth
+            chart: NumerologyChart to use instead of full_name and birth_date
             
         Returns:
             Dictionary with heatmap data
         """
-        numbers = self.calculator.calculate_all(full_name, birth_date)
+        chart = resolve_chart(chart, full_name, birth_date, self.calculator)
         
         # Map numbers to 1-9 grid
         number_types = {
-            'Life Path': numbers.get('life_path_number'),
-            'Destiny': numbers.get('destiny_number'),
-            'Soul Urge': numbers.get('soul_urge_number'),
-            'Personality': numbers.get('personality_number'),
-            'Attitude': numbers.get('attitude_number'),
-            'Maturity': numbers.get('maturity_number'),
-            'Balance': numbers.get('balance_number'),
+            'Life Path': chart.life_path_number,
+            'Destiny': chart.destiny_number,
+            'Soul Urge': chart.soul_urge_number,
+            'Personality': chart.personality_number,
+            'Attitude': chart.attitude_number,
+            'Maturity': chart.maturity_number,
+            'Balance': chart.balance_number,
         }
         
         # Count frequency of each number (1-9)
@@ -352,8 +356,9 @@ class VisualizationService:
     def generate_3d_visualization_data(
         self,
         profile: NumerologyProfile,
-        full_name: str,
-        birth_date: date
+        full_name: Optional[str] = None,
+        birth_date: Optional[date] = None,
+        chart: Optional[NumerologyChart] = None
     ) -> Dict[str, Any]:
         """
         Generate 3D visualization data for number relationships.
@@ -362,20 +367,21 @@ class VisualizationService:
             profile: NumerologyProfile instance
             full_name: Full name
             birth_date: Date of birth
+            chart: NumerologyChart to use instead of full_name and birth_date
             
         Returns:
             Dictionary with 3D positions and connections
         """
-        numbers = self.calculator.calculate_all(full_name, birth_date)
+        chart = resolve_chart(chart, full_name, birth_date, self.calculator)
         
         number_types = {
-            'life_path': numbers.get('life_path_number'),
-            'destiny': numbers.get('destiny_number'),
-            'soul_urge': numbers.get('soul_urge_number'),
-            'personality': numbers.get('personality_number'),
-            'attitude': numbers.get('attitude_number'),
-            'maturity': numbers.get('maturity_number'),
-            'balance': numbers.get('balance_number'),
+            'life_path': chart.life_path_number,
+            'destiny': chart.destiny_number,
+            'soul_urge': chart.soul_urge_number,
+            'personality': chart.personality_number,
+            'attitude': chart.attitude_number,
+            'maturity': chart.maturity_number,
+            'balance': chart.balance_number,
         }
         
         # Create 3D positions in a sphere
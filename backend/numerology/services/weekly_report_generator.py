@@ -2,18 +2,38 @@
 Weekly report generator service for numerology insights.
 """
 import logging
+from collections import defaultdict
 from typing import Dict, Any, Optional, List
 from datetime import date, timedelta
+from django.db.models import F
 from django.utils import timezone
 from django.core.cache import cache
 
-from ..models import DailyReading, NumerologyProfile, PersonNumerologyProfile, RajYogDetection
+from ..models import DailyReading, NumerologyProfile, PersonNumerologyProfile, RajYogDetection, WeeklyReport
 from ..numerology import NumerologyCalculator
 from ..interpretations import get_interpretation
 from .explanation_generator import get_explanation_generator
 
 logger = logging.getLogger(__name__)
 
+PROFILE_FIELDS = [
+    'life_path_number',
+    'destiny_number',
+    'soul_urge_number',
+    'personality_number',
+    'personal_year_number',
+    'personal_month_number',
+]
+READING_FIELDS = [
+    'reading_date',
+    'lucky_number',
+    'lucky_color',
+    'activity_recommendation',
+    'affirmation',
+    'raj_yog_status',
+]
+RAJ_YOG_FIELDS = ['is_detected', 'yog_name', 'strength_score']
+
 
 class WeeklyReportGenerator:
     """Generate comprehensive weekly numerology reports."""
@@ -42,8 +62,6 @@ class WeeklyReportGenerator:
             Dictionary with weekly report data
         """
         week_end_date = week_start_date + timedelta(days=6)
-        week_number = week_start_date.isocalendar()[1]
-        year = week_start_date.year
         
         # Get numerology profile
         if not numerology_profile:
@@ -96,6 +114,56 @@ class WeeklyReportGenerator:
                 except UserProfile.DoesNotExist:
                     raise ValueError("User profile not found. Please complete your profile first.")
         
+        readings_by_date = {
+            reading['reading_date']: reading
+            for reading in DailyReading.objects.filter(
+                user=user,
+                reading_date__range=(week_start_date, week_end_date)
+            ).values(*READING_FIELDS)
+        }
+        
+        raj_yog_detection = None
+        try:
+            raj_yog_detection = RajYogDetection.objects.filter(
+                user=user,
+                person=person
+            ).values(*RAJ_YOG_FIELDS).first()
+        except Exception as e:
+            logger.warning(f"Error getting Raj Yog detection: {str(e)}")
+        
+        return self.build_weekly_report(
+            week_start_date,
+            birth_date,
+            numerology_profile,
+            readings_by_date,
+            raj_yog_detection
+        )
+    
+    def build_weekly_report(
+        self,
+        week_start_date: date,
+        birth_date: date,
+        numerology_profile: Dict,
+        readings_by_date: Dict[date, Dict],
+        raj_yog_detection: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Build weekly report data from pre-fetched inputs without querying.
+        
+        Args:
+            week_start_date: Start date of the week
+            birth_date: Birth date of the subject
+            numerology_profile: Numerology profile dict
+            readings_by_date: Daily reading values keyed by reading date
+            raj_yog_detection: Latest Raj Yog detection values, if any
+        
+        Returns:
+            Dictionary with weekly report data
+        """
+        week_end_date = week_start_date + timedelta(days=6)
+        week_number = week_start_date.isocalendar()[1]
+        year = week_start_date.year
+        
         # Calculate weekly number (average of personal day numbers for the week)
         personal_day_numbers = []
         daily_insights = []
@@ -107,33 +175,17 @@ class WeeklyReportGenerator:
             )
             personal_day_numbers.append(personal_day)
             
-            # Get daily reading if available
-            try:
-                daily_reading = DailyReading.objects.get(
-                    user=user,
-                    reading_date=current_date
-                )
-                daily_insights.append({
-                    'date': current_date.isoformat(),
-                    'day_name': current_date.strftime('%A'),
-                    'personal_day_number': personal_day,
-                    'lucky_number': daily_reading.lucky_number,
-                    'lucky_color': daily_reading.lucky_color,
-                    'activity': daily_reading.activity_recommendation,
-                    'affirmation': daily_reading.affirmation,
-                    'raj_yog_status': daily_reading.raj_yog_status,
-                })
-            except DailyReading.DoesNotExist:
-                daily_insights.append({
-                    'date': current_date.isoformat(),
-                    'day_name': current_date.strftime('%A'),
-                    'personal_day_number': personal_day,
-                    'lucky_number': None,
-                    'lucky_color': None,
-                    'activity': None,
-                    'affirmation': None,
-                    'raj_yog_status': None,
-                })
+            daily_reading = readings_by_date.get(current_date) or {}
+            daily_insights.append({
+                'date': current_date.isoformat(),
+                'day_name': current_date.strftime('%A'),
+                'personal_day_number': personal_day,
+                'lucky_number': daily_reading.get('lucky_number'),
+                'lucky_color': daily_reading.get('lucky_color'),
+                'activity': daily_reading.get('activity_recommendation'),
+                'affirmation': daily_reading.get('affirmation'),
+                'raj_yog_status': daily_reading.get('raj_yog_status'),
+            })
             
             current_date += timedelta(days=1)
         
@@ -145,19 +197,12 @@ class WeeklyReportGenerator:
         # Get Raj Yog status
         raj_yog_status = None
         raj_yog_insights = None
-        try:
-            detection = RajYogDetection.objects.filter(
-                user=user,
-                person=person
-            ).first()
-            if detection and detection.is_detected:
-                raj_yog_status = 'detected'
-                raj_yog_insights = (
-                    f"Your {detection.yog_name} (strength: {detection.strength_score}/100) "
-                    f"influences this week. Focus on activities aligned with your Raj Yog strengths."
-                )
-        except Exception as e:
-            logger.warning(f"Error getting Raj Yog detection: {str(e)}")
+        if raj_yog_detection and raj_yog_detection['is_detected']:
+            raj_yog_status = 'detected'
+            raj_yog_insights = (
+                f"Your {raj_yog_detection['yog_name']} (strength: {raj_yog_detection['strength_score']}/100) "
+                f"influences this week. Focus on activities aligned with your Raj Yog strengths."
+            )
         
         # Identify trends
         trends = self._identify_trends(daily_insights, numerology_profile)
@@ -211,6 +256,80 @@ class WeeklyReportGenerator:
             'raj_yog_insights': raj_yog_insights,
         }
     
+    def generate_weekly_reports_batch(self, user_ids: List, week_start_date: date) -> Dict[str, int]:
+        """
+        Generate and bulk insert weekly reports for a chunk of users.
+
+        Profiles, birth dates, the week's readings and Raj Yog detections are
+        loaded for the whole chunk with one query each, so the query count
+        does not grow with the number of users.
+
+        Args:
+            user_ids: IDs of the users in this chunk
+            week_start_date: Start date of the week
+
+        Returns:
+            Counts of created, skipped (already existing) and failed reports
+        """
+        week_end_date = week_start_date + timedelta(days=6)
+
+        existing = set(WeeklyReport.objects.filter(
+            user_id__in=user_ids,
+            person__isnull=True,
+            week_start_date=week_start_date
+        ).values_list('user_id', flat=True))
+
+        profiles = list(NumerologyProfile.objects.filter(
+            user_id__in=user_ids,
+            user__profile__date_of_birth__isnull=False
+        ).exclude(
+            user_id__in=existing
+        ).values('user_id', *PROFILE_FIELDS, birth_date=F('user__profile__date_of_birth')))
+        pending_ids = [profile['user_id'] for profile in profiles]
+
+        readings: Dict[Any, Dict[date, Dict]] = defaultdict(dict)
+        for reading in DailyReading.objects.filter(
+            user_id__in=pending_ids,
+            reading_date__range=(week_start_date, week_end_date)
+        ).values('user_id', *READING_FIELDS):
+            readings[reading['user_id']][reading['reading_date']] = reading
+
+        detections: Dict[Any, Dict] = {}
+        for detection in RajYogDetection.objects.filter(
+            user_id__in=pending_ids,
+            person__isnull=True
+        ).order_by('user_id', '-detected_at').values('user_id', *RAJ_YOG_FIELDS):
+            # Latest detection per user, matching the single-report lookup
+            detections.setdefault(detection['user_id'], detection)
+
+        reports = []
+        error_count = 0
+        for profile in profiles:
+            user_id = profile['user_id']
+            try:
+                report_data = self.build_weekly_report(
+                    week_start_date,
+                    profile['birth_date'],
+                    {field: profile[field] for field in PROFILE_FIELDS},
+                    readings.get(user_id, {}),
+                    detections.get(user_id)
+                )
+                reports.append(WeeklyReport(user_id=user_id, person=None, **report_data))
+            except Exception as e:
+                error_count += 1
+                logger.error(f'Error building weekly report for user {user_id}: {str(e)}')
+
+        WeeklyReport.objects.bulk_create(reports, batch_size=500, ignore_conflicts=True)
+        # Rows another run inserted first are skipped by the database; ids are
+        # generated here, so count only the ones that made it in
+        created = WeeklyReport.objects.filter(id__in=[report.id for report in reports]).count()
+
+        return {
+            'created': created,
+            'skipped': len(existing) + len(reports) - created,
+            'errors': error_count + len(user_ids) - len(existing) - len(profiles),
+        }
+
     def _identify_trends(self, daily_insights: List[Dict], numerology_profile: Dict) -> Dict[str, Any]:
         """Identify trends and patterns in the week."""
         # Count personal day numbers
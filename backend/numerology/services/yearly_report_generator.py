@@ -4,15 +4,19 @@ Yearly report generator service for numerology insights.
 import logging
 from typing import Dict, Any, Optional, List
 from datetime import date, timedelta
+from django.db.models import Count, F
 from django.utils import timezone
 
-from ..models import NumerologyProfile, PersonNumerologyProfile, RajYogDetection, WeeklyReport
+from ..models import NumerologyProfile, PersonNumerologyProfile, RajYogDetection, WeeklyReport, YearlyReport
 from ..numerology import NumerologyCalculator
 from ..interpretations import get_interpretation
 from .explanation_generator import get_explanation_generator
 
 logger = logging.getLogger(__name__)
 
+PROFILE_FIELDS = ['life_path_number', 'destiny_number', 'soul_urge_number', 'personality_number']
+RAJ_YOG_FIELDS = ['is_detected', 'yog_name', 'strength_score']
+
 
 class YearlyReportGenerator:
     """Generate comprehensive yearly numerology reports."""
@@ -107,18 +111,54 @@ class YearlyReportGenerator:
             if field not in numerology_profile or numerology_profile[field] is None:
                 raise ValueError(f"Numerology profile is incomplete. Missing field: {field}")
         
+        # Get Raj Yog patterns
+        try:
+            raj_yog_patterns = self._analyze_raj_yog_patterns(user, person, year)
+        except Exception as e:
+            logger.warning(f"Error analyzing Raj Yog patterns for user {user.id}, year {year}: {str(e)}, using empty list")
+            raj_yog_patterns = []
+        
+        return self.build_yearly_report(
+            year,
+            birth_date,
+            numerology_profile,
+            raj_yog_patterns,
+            subject=f"user {user.id}"
+        )
+    
+    def build_yearly_report(
+        self,
+        year: int,
+        birth_date: date,
+        numerology_profile: Dict,
+        raj_yog_patterns: List[Dict],
+        subject: str = "user"
+    ) -> Dict[str, Any]:
+        """
+        Build yearly report data from pre-fetched inputs without querying.
+        
+        Args:
+            year: Year to generate report for
+            birth_date: Birth date of the subject
+            numerology_profile: Numerology profile dict
+            raj_yog_patterns: Raj Yog patterns for the year
+            subject: Label used in log messages
+        
+        Returns:
+            Dictionary with yearly report data
+        """
         # Calculate personal year number
         try:
             personal_year = self.calculator.calculate_personal_year_number(birth_date, year)
         except Exception as e:
-            logger.error(f"Error calculating personal year number for user {user.id}, year {year}: {str(e)}")
+            logger.error(f"Error calculating personal year number for {subject}, year {year}: {str(e)}")
             raise ValueError(f"Failed to calculate personal year number: {str(e)}")
         
         # Determine cycle phase
         try:
             cycle_phase = self._determine_cycle_phase(year, birth_date)
         except Exception as e:
-            logger.warning(f"Error determining cycle phase for user {user.id}, year {year}: {str(e)}, using default")
+            logger.warning(f"Error determining cycle phase for {subject}, year {year}: {str(e)}, using default")
             cycle_phase = 'middle'  # Default fallback
         
         # Generate month-by-month overview
@@ -127,30 +167,23 @@ class YearlyReportGenerator:
                 birth_date, year, numerology_profile
             )
         except Exception as e:
-            logger.warning(f"Error generating month-by-month overview for user {user.id}, year {year}: {str(e)}, using empty dict")
+            logger.warning(f"Error generating month-by-month overview for {subject}, year {year}: {str(e)}, using empty dict")
             month_by_month = {}
         
         # Identify key dates
         try:
             key_dates = self._identify_key_dates(birth_date, year, personal_year)
         except Exception as e:
-            logger.warning(f"Error identifying key dates for user {user.id}, year {year}: {str(e)}, using empty list")
+            logger.warning(f"Error identifying key dates for {subject}, year {year}: {str(e)}, using empty list")
             key_dates = []
         
-        # Get Raj Yog patterns
-        try:
-            raj_yog_patterns = self._analyze_raj_yog_patterns(user, person, year)
-        except Exception as e:
-            logger.warning(f"Error analyzing Raj Yog patterns for user {user.id}, year {year}: {str(e)}, using empty list")
-            raj_yog_patterns = []
-        
         # Generate major themes
         try:
             major_themes = self._generate_major_themes(
                 personal_year, numerology_profile, cycle_phase
             )
         except Exception as e:
-            logger.warning(f"Error generating major themes for user {user.id}, year {year}: {str(e)}, using default")
+            logger.warning(f"Error generating major themes for {subject}, year {year}: {str(e)}, using default")
             major_themes = [f"Personal Year {personal_year}"]
         
         # Generate opportunities
@@ -159,7 +192,7 @@ class YearlyReportGenerator:
                 personal_year, numerology_profile, key_dates
             )
         except Exception as e:
-            logger.warning(f"Error generating opportunities for user {user.id}, year {year}: {str(e)}, using empty list")
+            logger.warning(f"Error generating opportunities for {subject}, year {year}: {str(e)}, using empty list")
             opportunities = []
         
         # Generate challenges
@@ -168,7 +201,7 @@ class YearlyReportGenerator:
                 personal_year, numerology_profile, cycle_phase
             )
         except Exception as e:
-            logger.warning(f"Error generating challenges for user {user.id}, year {year}: {str(e)}, using empty list")
+            logger.warning(f"Error generating challenges for {subject}, year {year}: {str(e)}, using empty list")
             challenges = []
         
         # Generate recommendations
@@ -177,7 +210,7 @@ class YearlyReportGenerator:
                 personal_year, numerology_profile, major_themes
             )
         except Exception as e:
-            logger.warning(f"Error generating recommendations for user {user.id}, year {year}: {str(e)}, using default")
+            logger.warning(f"Error generating recommendations for {subject}, year {year}: {str(e)}, using default")
             recommendations = [f"Embrace the energy of Personal Year {personal_year}"]
         
         # Generate annual overview
@@ -190,7 +223,7 @@ class YearlyReportGenerator:
                 challenges
             )
         except Exception as e:
-            logger.warning(f"Error generating annual overview for user {user.id}, year {year}: {str(e)}, using default")
+            logger.warning(f"Error generating annual overview for {subject}, year {year}: {str(e)}, using default")
             annual_overview = f"Personal Year {personal_year} brings unique energies and opportunities for growth and transformation."
         
         # Raj Yog insights
@@ -219,6 +252,78 @@ class YearlyReportGenerator:
             'raj_yog_insights': raj_yog_insights,
         }
     
+    def generate_yearly_reports_batch(self, user_ids: List, year: int) -> Dict[str, int]:
+        """
+        Generate and bulk insert yearly reports for a chunk of users.
+        
+        Profiles, birth dates, Raj Yog detections and active Raj Yog weeks are
+        loaded for the whole chunk with one query each.
+        
+        Args:
+            user_ids: IDs of the users in this chunk
+            year: Year to generate reports for
+        
+        Returns:
+            Counts of created, skipped (already existing) and failed reports
+        """
+        existing = set(YearlyReport.objects.filter(
+            user_id__in=user_ids,
+            person__isnull=True,
+            year=year
+        ).values_list('user_id', flat=True))
+        
+        profiles = list(NumerologyProfile.objects.filter(
+            user_id__in=user_ids,
+            user__profile__date_of_birth__isnull=False
+        ).exclude(
+            user_id__in=existing
+        ).values('user_id', *PROFILE_FIELDS, birth_date=F('user__profile__date_of_birth')))
+        pending_ids = [profile['user_id'] for profile in profiles]
+        
+        detections: Dict[Any, Dict] = {}
+        for detection in RajYogDetection.objects.filter(
+            user_id__in=pending_ids,
+            person__isnull=True
+        ).order_by('user_id', '-detected_at').values('user_id', *RAJ_YOG_FIELDS):
+            # Latest detection per user, matching the single-report lookup
+            detections.setdefault(detection['user_id'], detection)
+        
+        active_weeks = dict(WeeklyReport.objects.filter(
+            user_id__in=[user_id for user_id, d in detections.items() if d['is_detected']],
+            person__isnull=True,
+            week_start_date__gte=date(year, 1, 1),
+            week_start_date__lte=date(year, 12, 31),
+            raj_yog_status='detected'
+        ).order_by().values('user_id').annotate(count=Count('id')).values_list('user_id', 'count'))
+        
+        reports = []
+        error_count = 0
+        for profile in profiles:
+            user_id = profile['user_id']
+            try:
+                report_data = self.build_yearly_report(
+                    year,
+                    profile['birth_date'],
+                    {field: profile[field] for field in PROFILE_FIELDS},
+                    self._raj_yog_patterns(detections.get(user_id), active_weeks.get(user_id, 0)),
+                    subject=f"user {user_id}"
+                )
+                reports.append(YearlyReport(user_id=user_id, person=None, **report_data))
+            except Exception as e:
+                error_count += 1
+                logger.error(f'Error building yearly report for user {user_id}: {str(e)}')
+        
+        YearlyReport.objects.bulk_create(reports, batch_size=500, ignore_conflicts=True)
+        # Rows another run inserted first are skipped by the database; ids are
+        # generated here, so count only the ones that made it in
+        created = YearlyReport.objects.filter(id__in=[report.id for report in reports]).count()
+        
+        return {
+            'created': created,
+            'skipped': len(existing) + len(reports) - created,
+            'errors': error_count + len(user_ids) - len(existing) - len(profiles),
+        }
+    
     def _determine_cycle_phase(self, year: int, birth_date: date) -> str:
         """Determine if year is beginning, middle, or end of 9-year cycle."""
         # Personal year cycles are 1-9, repeating
@@ -305,37 +410,37 @@ class YearlyReportGenerator:
         year: int
     ) -> List[Dict]:
         """Analyze Raj Yog patterns throughout the year."""
-        patterns = []
-        
         try:
             detection = RajYogDetection.objects.filter(
                 user=user,
                 person=person
-            ).first()
+            ).values(*RAJ_YOG_FIELDS).first()
             
-            if detection and detection.is_detected:
+            active_weeks = 0
+            if detection and detection['is_detected']:
                 # Check weekly reports for Raj Yog activity
-                year_start = date(year, 1, 1)
-                year_end = date(year, 12, 31)
-                
-                weekly_reports = WeeklyReport.objects.filter(
+                active_weeks = WeeklyReport.objects.filter(
                     user=user,
                     person=person,
-                    week_start_date__gte=year_start,
-                    week_start_date__lte=year_end,
+                    week_start_date__gte=date(year, 1, 1),
+                    week_start_date__lte=date(year, 12, 31),
                     raj_yog_status='detected'
-                )
-                
-                patterns.append({
-                    'type': 'continuous',
-                    'description': f"{detection.yog_name} active throughout the year",
-                    'strength': detection.strength_score,
-                    'active_weeks': weekly_reports.count(),
-                })
+                ).count()
+            return self._raj_yog_patterns(detection, active_weeks)
         except Exception as e:
             logger.warning(f"Error analyzing Raj Yog patterns: {str(e)}")
-        
-        return patterns
+            return []
+    
+    def _raj_yog_patterns(self, detection: Optional[Dict], active_weeks: int) -> List[Dict]:
+        """Raj Yog patterns from a detection and its count of active weeks."""
+        if not detection or not detection['is_detected']:
+            return []
+        return [{
+            'type': 'continuous',
+            'description': f"{detection['yog_name']} active throughout the year",
+            'strength': detection['strength_score'],
+            'active_weeks': active_weeks,
+        }]
     
     def _generate_major_themes(
         self,
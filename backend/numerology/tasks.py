@@ -5,19 +5,23 @@ from celery import shared_task
 from django.utils import timezone
 from datetime import date
 from accounts.models import User, UserProfile
-from .models import DailyReading, NameReport, PhoneReport
+from .models import DailyReading, NameReport, PeopleImport, PhoneReport
 from .numerology import NumerologyCalculator
 from .reading_generator import DailyReadingGenerator
-from .name_numerology import compute_name_numbers
-from .services.name_explainer import generate_name_explanation
-from .phone_numerology import sanitize_and_validate_phone, compute_phone_numerology
-from .services.phone_explainer import generate_phone_explanation
+from .phone_numerology import sanitize_and_validate_phone
+from .services.people_import import run_import
+from .services.result_store import get_name_result, get_phone_result
 from utils.notifications import send_push_notification
+from utils.single_flight import single_flight
+import io
 import logging
 import time
 
 logger = logging.getLogger(__name__)
 
+# Users per scheduled report task; chunks run in parallel across workers.
+REPORT_BATCH_SIZE = 500
+
 
 @shared_task
 def generate_daily_readings():
@@ -150,65 +154,58 @@ def send_daily_reading_notifications():
     return result
 
 
+def _report_user_id_chunks():
+    """IDs of users eligible for scheduled reports, in chunks of REPORT_BATCH_SIZE."""
+    user_ids = [
+        str(user_id) for user_id in User.objects.filter(
+            is_active=True,
+            is_verified=True,
+            profile__date_of_birth__isnull=False
+        ).order_by('id').values_list('id', flat=True)
+    ]
+    return [user_ids[i:i + REPORT_BATCH_SIZE] for i in range(0, len(user_ids), REPORT_BATCH_SIZE)]
+
+
 @shared_task
 def generate_weekly_reports():
     """
     Generate weekly reports for all active users.
     Runs weekly on Sunday via Celery Beat.
+    
+    Users are split into chunks that are generated in parallel by
+    generate_weekly_reports_chunk on the Celery workers.
     """
     from datetime import date, timedelta
-    from .models import WeeklyReport
-    from .services.weekly_report_generator import get_weekly_report_generator
     
     # Get current week start (Sunday)
     today = date.today()
     days_since_sunday = today.weekday() + 1  # Monday=0, Sunday=6
     week_start_date = today - timedelta(days=days_since_sunday % 7)
     
-    generator = get_weekly_report_generator()
+    chunks = _report_user_id_chunks()
+    for chunk in chunks:
+        generate_weekly_reports_chunk.delay(chunk, week_start_date.isoformat())
     
-    # Get all active verified users with profiles
-    users = User.objects.filter(
-        is_active=True,
-        is_verified=True,
-        profile__date_of_birth__isnull=False
-    ).select_related('profile')
+    result = f'Queued weekly reports for {sum(len(c) for c in chunks)} users in {len(chunks)} chunks'
+    logger.info(result)
+    return result
+
+
+@shared_task
+def generate_weekly_reports_chunk(user_ids, week_start_date):
+    """
+    Generate weekly reports for one chunk of users.
     
-    created_count = 0
-    error_count = 0
+    Args:
+        user_ids: List of user UUIDs
+        week_start_date: ISO date of the week start
+    """
+    from .services.weekly_report_generator import get_weekly_report_generator
     
-    for user in users:
-        try:
-            # Check if report already exists for this week
-            if WeeklyReport.objects.filter(
-                user=user,
-                person=None,
-                week_start_date=week_start_date
-            ).exists():
-                continue
-            
-            # Generate weekly report
-            report_data = generator.generate_weekly_report(
-                user=user,
-                week_start_date=week_start_date,
-                person=None
-            )
-            
-            # Create weekly report
-            WeeklyReport.objects.create(
-                user=user,
-                person=None,
-                **report_data
-            )
-            
-            created_count += 1
-            logger.info(f'Created weekly report for user {user.id}')
-            
-        except Exception as e:
-            error_count += 1
-            logger.error(f'Error creating weekly report for user {user.id}: {str(e)}')
+    generator = get_weekly_report_generator()
+    counts = generator.generate_weekly_reports_batch(user_ids, date.fromisoformat(week_start_date))
     
-    result = f'Generated {created_count} weekly reports, {error_count} errors'
+    result = f"Generated {counts['created']} weekly reports, {counts['errors']} errors"
     logger.info(result)
     return result
 
@@ -218,56 +215,38 @@ def generate_yearly_reports():
     """
     Generate yearly reports for all active users.
     Runs annually on January 1st via Celery Beat.
+    
+    Users are split into chunks that are generated in parallel by
+    generate_yearly_reports_chunk on the Celery workers.
     """
     from datetime import date
-    from .models import YearlyReport
-    from .services.yearly_report_generator import get_yearly_report_generator
     
     current_year = date.today().year
-    generator = get_yearly_report_generator()
     
-    # Get all active verified users with profiles
-    users = User.objects.filter(
-        is_active=True,
-        is_verified=True,
-        profile__date_of_birth__isnull=False
-    ).select_related('profile')
+    chunks = _report_user_id_chunks()
+    for chunk in chunks:
+        generate_yearly_reports_chunk.delay(chunk, current_year)
     
-    created_count = 0
-    error_count = 0
+    result = f'Queued yearly reports for {sum(len(c) for c in chunks)} users in {len(chunks)} chunks'
+    logger.info(result)
+    return result
+
+
+@shared_task
+def generate_yearly_reports_chunk(user_ids, year):
+    """
+    Generate yearly reports for one chunk of users.
     
-    for user in users:
-        try:
-            # Check if report already exists for this year
-            if YearlyReport.objects.filter(
-                user=user,
-                person=None,
-                year=current_year
-            ).exists():
-                continue
-            
-            # Generate yearly report
-            report_data = generator.generate_yearly_report(
-                user=user,
-                year=current_year,
-                person=None
-            )
-            
-            # Create yearly report
-            YearlyReport.objects.create(
-                user=user,
-                person=None,
-                **report_data
-            )
-            
-            created_count += 1
-            logger.info(f'Created yearly report for user {user.id}')
-            
-        except Exception as e:
-            error_count += 1
-            logger.error(f'Error creating yearly report for user {user.id}: {str(e)}')
+    Args:
+        user_ids: List of user UUIDs
+        year: Year to generate reports for
+    """
+    from .services.yearly_report_generator import get_yearly_report_generator
+    
+    generator = get_yearly_report_generator()
+    counts = generator.generate_yearly_reports_batch(user_ids, year)
     
-    result = f'Generated {created_count} yearly reports, {error_count} errors'
+    result = f"Generated {counts['created']} yearly reports, {counts['errors']} errors"
     logger.info(result)
     return result
 
@@ -296,6 +275,16 @@ def generate_name_report(user_id, name, name_type, system, force_refresh=False):
         logger.error(f'User {user_id} not found')
         return {'error': 'User not found'}
     
+    # Concurrent identical requests share one computation and LLM call
+    return single_flight(
+        f'name_report:{user_id}:{name}:{name_type}:{system}:{force_refresh}',
+        lambda: _build_name_report(user, user_id, name, name_type, system, force_refresh, start_time),
+        operation='name_report',
+    )
+
+
+def _build_name_report(user, user_id, name, name_type, system, force_refresh, start_time):
+    """Compute, explain and persist a name report for generate_name_report."""
     try:
         # Check if report already exists (unless force_refresh)
         if not force_refresh:
@@ -310,59 +299,17 @@ def generate_name_report(user_id, name, name_type, system, force_refresh=False):
                 logger.info(f'Using existing report {existing.id} for user {user_id}')
                 return {'report_id': str(existing.id), 'status': 'existing'}
         
-        # Compute name numbers (pure deterministic logic)
+        # Numbers and explanation are shared by everyone asking for this name
         keep_master = True  # Can be made configurable per user
-        numbers_data = compute_name_numbers(
-            name=name,
-            system=system,
-            keep_master=keep_master
-        )
-        
-        # Build evidence object for LLM
-        evidence = {}
-        evidence_id = 1
-        
-        # Expression
-        evidence[f'E{evidence_id}'] = {
-            'type': 'expression',
-            'value': numbers_data['expression']['reduced'],
-            'raw_total': numbers_data['expression']['raw_total']
-        }
-        evidence_id += 1
-        
-        # Soul urge
-        evidence[f'E{evidence_id}'] = {
-            'type': 'soul_urge',
-            'value': numbers_data['soul_urge']['reduced'],
-            'raw_total': numbers_data['soul_urge']['raw_total']
-        }
-        evidence_id += 1
-        
-        # Personality
-        evidence[f'E{evidence_id}'] = {
-            'type': 'personality',
-            'value': numbers_data['personality']['reduced'],
-            'raw_total': numbers_data['personality']['raw_total']
-        }
-        evidence_id += 1
-        
-        # Name vibration
-        evidence[f'E{evidence_id}'] = {
-            'type': 'name_vibration',
-            'value': numbers_data['name_vibration']
-        }
-        
-        # Generate LLM explanation
-        explanation_result = generate_name_explanation(
-            user=user,
+        shared = get_name_result(
+            user,
             name=name,
             name_type=name_type,
             system=system,
-            numbers=numbers_data,
-            breakdown=numbers_data['breakdown'],
             keep_master=keep_master,
-            report_type='saved'
+            refresh=force_refresh
         )
+        numbers_data = shared.result
         
         # Create report
         report = NameReport.objects.create(
@@ -373,8 +320,9 @@ def generate_name_report(user_id, name, name_type, system, force_refresh=False):
             normalized_name=numbers_data['normalized_name'],
             numbers=numbers_data,
             breakdown=numbers_data['breakdown'],
-            explanation=explanation_result.get('explanation'),
-            explanation_error=explanation_result.get('error')
+            explanation=shared.explanation,
+            explanation_error=shared.explanation_error,
+            shared_result=shared
         )
         
         # Emit metrics (if you have a metrics system)
@@ -384,13 +332,6 @@ def generate_name_report(user_id, name, name_type, system, force_refresh=False):
             f'in {generation_time_ms:.2f}ms'
         )
         
-        # Log metrics
-        if explanation_result.get('latency_ms'):
-            logger.info(
-                f'LLM explanation latency: {explanation_result["latency_ms"]:.2f}ms, '
-                f'tokens: {explanation_result.get("tokens_used", 0)}'
-            )
-        
         return {
             'report_id': str(report.id),
             'status': 'completed',
@@ -439,6 +380,22 @@ def generate_phone_report(
         logger.error(f'User {user_id} not found')
         return {'error': 'User not found'}
     
+    # Concurrent identical requests share one computation and LLM call
+    return single_flight(
+        f'phone_report:{user_id}:{phone_number}:{country_hint}:{method}:'
+        f'{persist}:{force_refresh}:{convert_vanity}',
+        lambda: _build_phone_report(
+            user, user_id, phone_number, country_hint, method, persist, force_refresh, convert_vanity,
+            start_time
+        ),
+        operation='phone_report',
+    )
+
+
+def _build_phone_report(
+    user, user_id, phone_number, country_hint, method, persist, force_refresh, convert_vanity, start_time
+):
+    """Validate, compute, explain and optionally persist a phone report for generate_phone_report."""
     try:
         # Sanitize and validate phone number
         validation_result = sanitize_and_validate_phone(
@@ -465,23 +422,16 @@ def generate_phone_report(
                 logger.info(f'Using existing report {existing.id} for user {user_id}')
                 return {'report_id': str(existing.id), 'status': 'existing'}
         
-        # Compute numerology (pure deterministic logic)
-        computed = compute_phone_numerology(
-            phone_e164,
-            method=method,
-            core_scope='national',  # Default to national
-            keep_master=False
-        )
-        
-        # Generate LLM explanation
-        explanation_result = generate_phone_explanation(
-            user=user,
+        # Numbers and explanation are shared by everyone asking for this number
+        shared = get_phone_result(
+            user,
             phone_raw=phone_number,
             phone_e164=phone_e164,
             method=method,
-            computed=computed,
-            persist=persist
+            persist=persist,
+            refresh=force_refresh
         )
+        computed = shared.result
         
         # Create report if persist=True
         report = None
@@ -493,8 +443,9 @@ def generate_phone_report(
                 country=validation_result.get('country'),
                 method=method,
                 computed=computed,
-                explanation=explanation_result.get('explanation'),
-                explanation_error=explanation_result.get('error')
+                explanation=shared.explanation,
+                explanation_error=shared.explanation_error,
+                shared_result=shared
             )
             
             # Emit metrics
@@ -504,13 +455,6 @@ def generate_phone_report(
                 f'in {generation_time_ms:.2f}ms'
             )
             
-            # Log LLM metrics
-            if explanation_result.get('latency_ms'):
-                logger.info(
-                    f'LLM explanation latency: {explanation_result["latency_ms"]:.2f}ms, '
-                    f'tokens: {explanation_result.get("tokens_used", 0)}'
-                )
-            
             return {
                 'report_id': str(report.id),
                 'status': 'completed',
@@ -521,7 +465,7 @@ def generate_phone_report(
             return {
                 'status': 'computed',
                 'computed': computed,
-                'explanation': explanation_result.get('explanation'),
+                'explanation': shared.explanation,
                 'generation_time_ms': (time.time() - start_time) * 1000
             }
         
@@ -590,4 +534,43 @@ def generate_detailed_readings_for_profile(user_id):
             f'Error generating detailed readings for user {user_id}: {e}',
             exc_info=True
         )
-        return {'error': str(e)}
\ No newline at end of file
+        return {'error': str(e)}
+
+
+@shared_task
+def import_people_file(import_id):
+    """
+    Import people from a queued upload, saving progress on the PeopleImport.
+    
+    Args:
+        import_id: PeopleImport UUID
+        
+    Returns:
+        Dictionary with the import's final status and counts
+    """
+    try:
+        people_import = PeopleImport.objects.select_related('user').get(id=import_id)
+    except PeopleImport.DoesNotExist:
+        logger.error(f'People import {import_id} not found')
+        return {'error': 'Import not found'}
+    
+    if people_import.payload is None:
+        logger.error(f'People import {import_id} has no queued upload')
+        people_import.status = 'failed'
+        people_import.error_message = 'Uploaded file could not be read.'
+        people_import.completed_at = timezone.now()
+        people_import.save(update_fields=['status', 'error_message', 'completed_at'])
+    else:
+        try:
+            run_import(people_import, io.BytesIO(bytes(people_import.payload)))
+        finally:
+            people_import.payload = None
+            people_import.save(update_fields=['payload'])
+    
+    return {
+        'import_id': str(people_import.id),
+        'status': people_import.status,
+        'created': people_import.created_count,
+        'duplicates': people_import.duplicate_count,
+        'errors': people_import.error_count,
+    }
@@ -0,0 +1,150 @@
+"""
+Tests for the lazy per-request NumerologyChart.
+"""
+from datetime import date
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from numerology.chart import CACHED_FIELDS, CALCULATE_ALL_FIELDS, NumerologyChart, get_chart
+from numerology.numerology import NumerologyCalculator
+from numerology.services.health_numerology import HealthNumerologyService
+from numerology.services.lo_shu_service import LoShuGridService
+from numerology.services.predictive_numerology import PredictiveNumerologyService
+
+NAME = 'Ada Lovelace'
+BIRTH_DATE = date(1990, 5, 15)
+
+
+def _expected(calculator, full_name, birth_date):
+    life_path = calculator.calculate_life_path_number(birth_date)
+    destiny = calculator.calculate_destiny_number(full_name)
+    return {
+        'life_path_number': life_path,
+        'destiny_number': destiny,
+        'soul_urge_number': calculator.calculate_soul_urge_number(full_name),
+        'personality_number': calculator.calculate_personality_number(full_name),
+        'attitude_number': calculator.calculate_attitude_number(birth_date),
+        'birthday_number': calculator.calculate_birthday_number(birth_date),
+        'maturity_number': calculator.calculate_maturity_number(life_path, destiny),
+        'balance_number': calculator.calculate_balance_number(full_name),
+        'personal_year_number': calculator.calculate_personal_year_number(birth_date),
+        'personal_month_number': calculator.calculate_personal_month_number(birth_date),
+        'personal_day_number': calculator.calculate_personal_day_number(birth_date),
+        'hidden_passion_number': calculator.calculate_hidden_passion_number(full_name),
+        'subconscious_self_number': calculator.calculate_subconscious_self_number(full_name),
+        'karmic_debt_numbers': calculator.calculate_karmic_debt_numbers(birth_date, full_name),
+        'karmic_lessons': calculator.calculate_karmic_lessons(full_name),
+        'pinnacles': calculator.calculate_pinnacles(birth_date),
+        'challenges': calculator.calculate_challenges(birth_date),
+        'driver_number': calculator.calculate_driver_number(birth_date),
+        'conductor_number': calculator.calculate_conductor_number(birth_date),
+        'driver_conductor_compatibility': calculator.calculate_driver_conductor_compatibility(birth_date),
+    }
+
+
+class NumerologyChartTest(SimpleTestCase):
+    """Test cases for chart laziness, immutability and parity with calculate_all."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_as_dict_matches_individual_calculations(self):
+        """Every system produces the same numbers as the calculator methods, in calculate_all order."""
+        for system in ('pythagorean', 'chaldean'):
+            calculator = NumerologyCalculator(system)
+            for full_name, birth_date in ((NAME, BIRTH_DATE), ('John Smith', date(1985, 11, 29)),
+                                          ('Maria Garcia', date(2001, 2, 22))):
+                numbers = NumerologyChart(full_name, birth_date, system).as_dict()
+                self.assertEqual(tuple(numbers), CALCULATE_ALL_FIELDS)
+                self.assertEqual(numbers, _expected(calculator, full_name, birth_date))
+                self.assertEqual(calculator.calculate_all(full_name, birth_date), numbers)
+
+    def test_numbers_are_computed_once_on_first_access(self):
+        calculator = NumerologyCalculator()
+        chart = NumerologyChart(NAME, BIRTH_DATE, calculator=calculator)
+        with mock.patch.object(calculator, 'calculate_destiny_number', wraps=calculator.calculate_destiny_number) as destiny:
+            self.assertEqual(destiny.call_count, 0)
+            chart.destiny_number
+            chart.maturity_number
+            chart.destiny_number
+            self.assertEqual(destiny.call_count, 1)
+
+    def test_chart_is_immutable(self):
+        chart = NumerologyChart(NAME, BIRTH_DATE)
+        with self.assertRaises(AttributeError):
+            chart.full_name = 'Someone Else'
+        with self.assertRaises(AttributeError):
+            chart.life_path_number = 1
+        with self.assertRaises(AttributeError):
+            del chart.birth_date
+        self.assertFalse(hasattr(chart, '__dict__'))
+
+    def test_as_dict_copies_are_independent(self):
+        chart = NumerologyChart(NAME, BIRTH_DATE)
+        chart.as_dict()['pinnacles'].append(99)
+        self.assertEqual(chart.pinnacles, NumerologyCalculator().calculate_pinnacles(BIRTH_DATE))
+
+
+class GetChartTest(SimpleTestCase):
+    """Test cases for per-request memoization and cache seeding."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_chart_is_shared_within_a_request(self):
+        django_request = APIRequestFactory().get('/')
+        chart = get_chart(NAME, BIRTH_DATE, 'Pythagorean', request=Request(django_request))
+        self.assertIs(get_chart(NAME, BIRTH_DATE, 'pythagorean', request=django_request), chart)
+        self.assertIsNot(get_chart(NAME, BIRTH_DATE, 'chaldean', request=django_request), chart)
+        self.assertIsNot(get_chart(NAME, BIRTH_DATE, 'pythagorean', request=APIRequestFactory().get('/')), chart)
+
+    def test_date_independent_numbers_are_cached(self):
+        expected = get_chart(NAME, BIRTH_DATE).as_dict()
+        with mock.patch.object(NumerologyCalculator, 'calculate_destiny_number') as destiny:
+            chart = get_chart(NAME, BIRTH_DATE)
+            self.assertEqual(chart.destiny_number, expected['destiny_number'])
+            self.assertEqual(chart.as_dict(), expected)
+            destiny.assert_not_called()
+        self.assertTrue(set(CACHED_FIELDS) <= chart._values.keys())
+
+
+class ServiceChartTest(SimpleTestCase):
+    """Test cases for services reading a shared chart instead of raw arguments."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_services_give_the_same_results_with_a_chart(self):
+        chart = NumerologyChart(NAME, BIRTH_DATE)
+
+        health = HealthNumerologyService()
+        self.assertEqual(health.calculate_health_cycles(chart=chart), health.calculate_health_cycles(BIRTH_DATE, NAME))
+        self.assertEqual(
+            health.calculate_emotional_vulnerabilities(chart=chart),
+            health.calculate_emotional_vulnerabilities(BIRTH_DATE, NAME)
+        )
+        self.assertEqual(health.calculate_wellness_windows(chart=chart), health.calculate_wellness_windows(BIRTH_DATE, NAME))
+
+        lo_shu = LoShuGridService()
+        self.assertEqual(lo_shu.calculate_enhanced_grid(chart=chart), lo_shu.calculate_enhanced_grid(NAME, BIRTH_DATE))
+        self.assertEqual(
+            lo_shu.calculate_grid_strength_score(chart=chart), lo_shu.calculate_grid_strength_score(NAME, BIRTH_DATE)
+        )
+
+        predictive = PredictiveNumerologyService()
+        self.assertEqual(
+            predictive.generate_yearly_forecast(None, 2030, chart=chart),
+            predictive.generate_yearly_forecast(BIRTH_DATE, 2030, NAME)
+        )
+
+    def test_services_share_one_calculation(self):
+        calculator = NumerologyCalculator()
+        chart = NumerologyChart(NAME, BIRTH_DATE, calculator=calculator)
+        with mock.patch.object(calculator, 'calculate_soul_urge_number', wraps=calculator.calculate_soul_urge_number) as soul_urge:
+            HealthNumerologyService().calculate_emotional_vulnerabilities(chart=chart)
+            HealthNumerologyService().calculate_emotional_vulnerabilities(chart=chart)
+            self.assertEqual(soul_urge.call_count, 1)
@@ -0,0 +1,89 @@
+"""
+Tests for the precomputed birth-date feature table.
+"""
+import random
+import shutil
+import tempfile
+from datetime import date, timedelta
+
+from django.test import SimpleTestCase, override_settings
+
+from numerology import date_features
+from numerology.date_features import (
+    DAY_COUNT, FIRST_DATE, LAST_DATE, build_feature_table, get_birth_date_features, get_feature_table,
+)
+from numerology.numerology import NumerologyCalculator
+
+
+def _live(calculator, birth_date):
+    counts = calculator.calculate_lo_shu_digit_counts(birth_date)
+    return {
+        'life_path_number': calculator.calculate_life_path_number(birth_date),
+        'attitude_number': calculator.calculate_attitude_number(birth_date),
+        'birthday_number': calculator.calculate_birthday_number(birth_date),
+        'driver_number': calculator.calculate_driver_number(birth_date),
+        'conductor_number': calculator.calculate_conductor_number(birth_date),
+        'pinnacles': calculator.calculate_pinnacles(birth_date),
+        'challenges': calculator.calculate_challenges(birth_date),
+        'lo_shu_counts': counts,
+        'personality_arrows': calculator._detect_personality_arrows(counts),
+    }
+
+
+class BirthDateFeaturesTest(SimpleTestCase):
+    """Test cases for building, loading and falling back from the feature table."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.features_dir = tempfile.mkdtemp()
+        cls.path = build_feature_table(cls.features_dir)
+        cls.settings_override = override_settings(NUMEROLOGY_DATE_FEATURES_DIR=cls.features_dir)
+        cls.settings_override.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.settings_override.disable()
+        date_features._loaded.pop(str(cls.path), None)
+        shutil.rmtree(cls.features_dir, ignore_errors=True)
+        super().tearDownClass()
+
+    def setUp(self):
+        self.calculator = NumerologyCalculator()
+
+    def test_table_matches_live_calculation(self):
+        """Stored features equal the current calculator for edge and sampled dates."""
+        table = get_feature_table()
+        self.assertIsNotNone(table)
+        self.assertEqual(table.matrix.shape[1], DAY_COUNT)
+
+        rng = random.Random(42)
+        dates = [FIRST_DATE, LAST_DATE, date(2000, 2, 29), date(1999, 9, 29), date(1929, 11, 29)]
+        dates += [FIRST_DATE + timedelta(days=rng.randrange(DAY_COUNT)) for _ in range(3000)]
+        for birth_date in dates:
+            with self.subTest(birth_date=birth_date):
+                self.assertIsNotNone(table.row(birth_date))
+                self.assertEqual(get_birth_date_features(birth_date, self.calculator), _live(self.calculator, birth_date))
+
+    def test_out_of_range_and_missing_table_compute_live(self):
+        """Dates outside the table and an unbuilt table give the same results as live code."""
+        table = get_feature_table()
+        for birth_date in (date(1899, 12, 31), date(2101, 1, 1), date(1850, 6, 15)):
+            self.assertIsNone(table.row(birth_date))
+            self.assertEqual(get_birth_date_features(birth_date, self.calculator), _live(self.calculator, birth_date))
+
+        empty_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, empty_dir, ignore_errors=True)
+        with override_settings(NUMEROLOGY_DATE_FEATURES_DIR=empty_dir):
+            self.assertIsNone(get_feature_table())
+            birth_date = date(1990, 5, 15)
+            self.assertEqual(get_birth_date_features(birth_date, self.calculator), _live(self.calculator, birth_date))
+
+    def test_calculate_all_uses_table_without_changing_results(self):
+        """calculate_all returns the same date-derived numbers as the individual methods."""
+        birth_date = date(1987, 11, 22)
+        result = self.calculator.calculate_all('Jane Alice Doe', birth_date)
+        live = _live(self.calculator, birth_date)
+        for key in ('life_path_number', 'attitude_number', 'birthday_number', 'driver_number',
+                    'conductor_number', 'pinnacles', 'challenges'):
+            self.assertEqual(result[key], live[key])
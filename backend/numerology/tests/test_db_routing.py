@@ -0,0 +1,115 @@
+"""
+Tests for read-replica routing against two local databases.
+"""
+import os
+import shutil
+import tempfile
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.test import RequestFactory, TransactionTestCase
+
+from accounts.models import User
+from numerology.models import NumerologyResult
+from utils.db_routing import ReplicaRoutingMiddleware, pin_to_primary, primary_db, replica_db
+
+REPLICA = 'replica_1'
+
+
+def _result(digest):
+    return {'kind': 'name', 'digest': digest, 'inputs': {}, 'result': {}}
+
+
+def _digests():
+    return sorted(NumerologyResult.objects.values_list('digest', flat=True))
+
+
+class ReplicaRoutingTest(TransactionTestCase):
+    """Test cases for routing reads between a primary and a replica with different contents."""
+
+    databases = {DEFAULT_DB_ALIAS, REPLICA}
+
+    @classmethod
+    def setUpClass(cls):
+        cls.replica_dir = tempfile.mkdtemp()
+        connections.settings[REPLICA] = connections.configure_settings({
+            DEFAULT_DB_ALIAS: dict(connections.settings[DEFAULT_DB_ALIAS]),
+            REPLICA: {'ENGINE': 'django.db.backends.sqlite3', 'NAME': os.path.join(cls.replica_dir, 'replica.sqlite3')},
+        })[REPLICA]
+        with connections[REPLICA].schema_editor() as editor:
+            editor.create_model(NumerologyResult)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        connections[REPLICA].close()
+        del connections[REPLICA]
+        del connections.settings[REPLICA]
+        shutil.rmtree(cls.replica_dir, ignore_errors=True)
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(email='reader@example.com', full_name='Reader')
+        NumerologyResult.objects.create(**_result('primary'))
+        # flush skips the replica, where the router allows no migrations
+        with connections[REPLICA].cursor() as cursor:
+            cursor.execute(f'DELETE FROM {NumerologyResult._meta.db_table}')
+        NumerologyResult.objects.using(REPLICA).create(**_result('replica'))
+        self.factory = RequestFactory()
+
+    def _handle(self, method, view, user=None):
+        request = getattr(self.factory, method)('/api/v1/numerology/')
+        request.user = user or self.user
+        return ReplicaRoutingMiddleware(view)(request)
+
+    def test_outside_requests_reads_use_primary(self):
+        self.assertEqual(_digests(), ['primary'])
+
+    def test_safe_request_reads_from_replica(self):
+        self.assertEqual(self._handle('get', lambda request: _digests()), ['replica'])
+
+    def test_anonymous_and_unsafe_requests_use_primary(self):
+        self.assertEqual(self._handle('get', lambda request: _digests(), user=AnonymousUser()), ['primary'])
+        self.assertEqual(self._handle('post', lambda request: _digests()), ['primary'])
+
+    def test_write_pins_user_to_primary(self):
+        def write_then_read(request):
+            before = _digests()
+            NumerologyResult.objects.create(**_result('written'))
+            return before, _digests()
+
+        self.assertEqual(self._handle('get', write_then_read), (['replica'], ['primary', 'written']))
+        self.assertEqual(self._handle('get', lambda request: _digests()), ['primary', 'written'])
+
+        other = User.objects.create(email='other@example.com', full_name='Other')
+        self.assertEqual(self._handle('get', lambda request: _digests(), user=other), ['replica'])
+
+        cache.clear()  # sticky window over
+        self.assertEqual(self._handle('get', lambda request: _digests()), ['replica'])
+
+    def test_pin_is_per_user(self):
+        pin_to_primary(self.user.pk)
+        self.assertEqual(self._handle('get', lambda request: _digests()), ['primary'])
+
+    def test_primary_db_decorator(self):
+        @primary_db()
+        def fresh(request):
+            return _digests()
+
+        self.assertEqual(self._handle('get', fresh), ['primary'])
+
+    def test_replica_db_outside_requests(self):
+        with replica_db():
+            self.assertEqual(_digests(), ['replica'])
+            with primary_db():
+                self.assertEqual(_digests(), ['primary'])
+        self.assertEqual(_digests(), ['primary'])
+
+    def test_reads_in_transaction_use_primary(self):
+        def read_in_transaction(request):
+            with transaction.atomic():
+                return _digests()
+
+        self.assertEqual(self._handle('get', read_in_transaction), ['primary'])
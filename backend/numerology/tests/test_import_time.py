@@ -0,0 +1,75 @@
+"""
+Eager imports on web and worker cold starts.
+
+Each scenario runs in a fresh interpreter under ``python -X importtime``;
+the report lists every module imported and the time spent importing it.
+"""
+import os
+import re
+import subprocess
+import sys
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+# Libraries only a few endpoints or tasks use, imported where they are used
+LAZY_MODULES = ('reportlab', 'firebase_admin', 'openai', 'anthropic')
+
+SCENARIOS = {
+    # Every numerology view, as loaded by the URLconf
+    'web': (
+        "import django; django.setup()\n"
+        "import numerology.views as views\n"
+        "[getattr(views, name) for name in views.__all__]\n"
+    ),
+    # What `celery -A numerai worker` imports before taking tasks
+    'worker': (
+        "from numerai.celery import app\n"
+        "app.loader.import_default_modules()\n"
+    ),
+}
+
+_IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+\d+ \|\s*(\S+)$')
+
+
+def measure_imports(code):
+    """
+    Run ``code`` in a new interpreter with ``-X importtime``.
+
+    Returns:
+        (total import time in ms, set of imported module names)
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    env.setdefault('DJANGO_SETTINGS_MODULE', settings.SETTINGS_MODULE)
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, timeout=120,
+    )
+    if completed.returncode != 0:
+        raise AssertionError(f'Import scenario failed:\n{completed.stderr[-4000:]}')
+
+    total_us, modules = 0, set()
+    for line in completed.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            total_us += int(match.group(1))
+            modules.add(match.group(2))
+    return total_us / 1000, modules
+
+
+class ImportTimeBudgetTest(SimpleTestCase):
+    """Test cases for cold-start imports of web and worker processes."""
+
+    def _check(self, scenario):
+        _, modules = measure_imports(SCENARIOS[scenario])
+        eager = sorted({name.split('.')[0] for name in modules} & set(LAZY_MODULES))
+        self.assertEqual(eager, [], f'{scenario} imports {eager} at startup')
+        return modules
+
+    def test_web_cold_start(self):
+        self._check('web')
+
+    def test_worker_cold_start(self):
+        modules = self._check('worker')
+        self.assertFalse(any(name.startswith('numerology.views') for name in modules),
+                         'worker imports numerology views')
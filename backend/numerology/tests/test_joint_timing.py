@@ -0,0 +1,108 @@
+"""
+Tests for joint date optimization across several people.
+"""
+import random
+from datetime import date, timedelta
+
+import pytest
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.models import User
+from numerology.models import Person
+from numerology.services.timing_numerology import TimingNumerologyService
+from numerology.views import find_joint_dates
+
+
+def _people(count, seed=3):
+    rng = random.Random(seed)
+    return [
+        {'name': f'Person {i}', 'birth_date': date(1950, 1, 1) + timedelta(days=rng.randint(0, 20000))}
+        for i in range(count)
+    ]
+
+
+def test_matrix_matches_single_date_scores():
+    """Per-person breakdowns equal _calculate_date_score for that person and day."""
+    service = TimingNumerologyService()
+    people = _people(4)
+
+    result = service.find_joint_dates(people, 'wedding', date(2026, 1, 1), date(2026, 12, 31), limit=366)
+
+    assert len(result['best_dates']) == 365
+    for entry in result['best_dates'][:60]:
+        day = date.fromisoformat(entry['date'])
+        for person, breakdown in zip(people, entry['people']):
+            single = service._calculate_date_score(person['birth_date'], day, 'wedding')
+            assert breakdown['score'] == single['score']
+            assert breakdown['personal_day'] == single['personal_day']
+            assert entry['universal_day'] == single['universal_day']
+        assert entry['score'] == entry['min_score']
+
+
+def test_strategies_and_constraints():
+    """Weighted mean follows the weights; weekday and blackout constraints are hard."""
+    service = TimingNumerologyService()
+    people = _people(3)
+    people[0]['weight'] = 5
+
+    result = service.find_joint_dates(
+        people, 'meeting', date(2026, 1, 1), date(2026, 3, 31),
+        strategy='weighted_mean', allowed_weekdays=[5, 6], blackout_dates=[date(2026, 1, 3)],
+    )
+
+    assert result['candidate_days'] == 25
+    for entry in result['best_dates']:
+        day = date.fromisoformat(entry['date'])
+        assert day.weekday() in (5, 6)
+        assert day != date(2026, 1, 3)
+        scores = [p['score'] for p in entry['people']]
+        assert entry['score'] == round((5 * scores[0] + scores[1] + scores[2]) / 7, 2)
+    ranked = [entry['score'] for entry in result['best_dates']]
+    assert ranked == sorted(ranked, reverse=True)
+
+    with pytest.raises(ValueError):
+        service.find_joint_dates(people, 'meeting', date(2026, 1, 1), date(2026, 1, 31), strategy='median')
+
+
+class FindJointDatesViewTest(TestCase):
+    """Test cases for the joint dates endpoint."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.factory = APIRequestFactory()
+        self.user = User.objects.create(
+            email='planner@example.com', full_name='Planner', subscription_plan='premium'
+        )
+        self.partner = Person.objects.create(user=self.user, name='Sam', birth_date=date(1990, 4, 12))
+
+    def _post(self, data, user=None):
+        request = self.factory.post('/api/v1/numerology/timing/joint-dates/', data, format='json')
+        force_authenticate(request, user=user or self.user)
+        return find_joint_dates(request)
+
+    def test_mixes_saved_people_and_birth_dates(self):
+        """Saved people are resolved by id and named in the breakdown."""
+        response = self._post({
+            'people': [{'person_id': str(self.partner.id)}, {'name': 'Alex', 'birth_date': '1988-09-30'}],
+            'event_type': 'wedding',
+            'start_date': '2026-06-01',
+            'end_date': '2026-06-30',
+            'limit': 3,
+        })
+
+        assert response.status_code == 200
+        assert len(response.data['best_dates']) == 3
+        assert [p['name'] for p in response.data['best_dates'][0]['people']] == ['Sam', 'Alex']
+
+    def test_rejects_bad_input_and_free_plan(self):
+        """Unknown strategies are a client error; free users are refused."""
+        response = self._post({
+            'people': [{'birth_date': '1988-09-30'}], 'event_type': 'wedding',
+            'start_date': '2026-06-01', 'end_date': '2026-06-30', 'strategy': 'median',
+        })
+        assert response.status_code == 400
+
+        free_user = User.objects.create(email='free@example.com', full_name='Free')
+        response = self._post({'people': []}, user=free_user)
+        assert response.status_code == 403
@@ -0,0 +1,212 @@
+"""
+Unit tests for the shared LLM gateway against a local fake provider.
+"""
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from accounts.models import User
+from numerology.ai_reading_generator import generate_detailed_reading
+from numerology.models import DetailedReading, NumerologyProfile
+from numerology.services import llm_gateway
+from numerology.services.explanation_generator import ExplanationGenerator
+from numerology.services.llm_gateway import CircuitOpenError, LLMUnavailableError, get_llm_gateway
+from utils.metrics import get_metric
+
+
+class FakeProviderHandler(BaseHTTPRequestHandler):
+    """Replies with the next scripted (status, delay) pair, then succeeds."""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.server.requests += 1
+        status, delay = self.server.script.pop(0) if self.server.script else (200, 0)
+        time.sleep(delay)
+        if status == 200:
+            body = {
+                'id': 'chatcmpl-test', 'object': 'chat.completion', 'created': 0, 'model': 'gpt-4',
+                'choices': [{
+                    'index': 0, 'finish_reason': 'stop',
+                    'message': {'role': 'assistant', 'content': 'Seven seeks truth.'},
+                }],
+                'usage': {'prompt_tokens': 30, 'completion_tokens': 12, 'total_tokens': 42},
+            }
+        else:
+            body = {'error': {'message': 'scripted failure', 'type': 'server_error'}}
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@override_settings(
+    LLM_MAX_RETRIES=2, LLM_RETRY_BACKOFF=0, LLM_REQUEST_TIMEOUT=0.5,
+    LLM_CIRCUIT_FAILURE_THRESHOLD=3, LLM_CIRCUIT_RESET_TIMEOUT=60,
+    LLM_MAX_CONCURRENCY=2, LLM_QUEUE_TIMEOUT=0.05,
+)
+class LLMGatewayTest(TestCase):
+    """Test cases for retries, circuit breaking, limits and metrics."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), FakeProviderHandler)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        """Set up test fixtures."""
+        cache.clear()
+        self.server.script = []
+        self.server.requests = 0
+        patcher = mock.patch.dict(os.environ, {
+            'OPENAI_API_KEY': 'test-key',
+            'OPENAI_BASE_URL': f'http://127.0.0.1:{self.server.server_port}/v1',
+        })
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        llm_gateway.reset_gateways()
+        self.addCleanup(llm_gateway.reset_gateways)
+        self.gateway = get_llm_gateway('openai')
+
+    def _chat(self):
+        return self.gateway.chat_completion(
+            'test', model='gpt-4', messages=[{'role': 'user', 'content': 'Life path 7?'}]
+        )
+
+    def test_retries_rate_limits_and_server_errors(self):
+        """429 and 5xx responses are retried and the call records latency and tokens."""
+        self.server.script = [(429, 0), (503, 0)]
+
+        response = self._chat()
+
+        self.assertEqual(response.choices[0].message.content, 'Seven seeks truth.')
+        self.assertEqual(self.server.requests, 3)
+        self.assertEqual(get_metric('llm.calls', provider='openai', operation='test'), 1)
+        self.assertEqual(get_metric('llm.tokens', provider='openai', operation='test'), 42)
+        self.assertEqual(get_metric('llm.latency_ms.count', provider='openai', operation='test'), 1)
+        self.assertEqual(
+            get_metric('llm.errors', provider='openai', operation='test', error='RateLimitError'), 1
+        )
+
+    def test_client_errors_are_not_retried(self):
+        """A 400 is the caller's fault: no retry and no strike against the provider."""
+        self.server.script = [(400, 0)]
+        with self.assertRaises(Exception):
+            self._chat()
+        self.assertEqual(self.server.requests, 1)
+        self.assertFalse(self.gateway.breaker.is_open)
+
+    def test_timeouts_open_circuit_and_fail_fast(self):
+        """A slow provider trips the breaker; later calls fail without contacting it."""
+        self.server.script = [(200, 1)] * 3
+
+        with self.assertRaises(Exception):
+            self._chat()
+        self.assertTrue(self.gateway.breaker.is_open)
+        self.assertFalse(self.gateway.is_available())
+
+        requests = self.server.requests
+        with self.assertRaises(CircuitOpenError):
+            self._chat()
+        self.assertEqual(self.server.requests, requests)
+        self.assertEqual(get_metric('llm.circuit_opened', provider='openai'), 1)
+
+    def test_half_open_probe_closes_circuit(self):
+        """After the reset timeout one probe call is allowed and success closes the circuit."""
+        self.gateway.breaker.reset_timeout = 0
+        for _ in range(3):
+            self.gateway.breaker.record_failure()
+
+        self._chat()
+
+        self.assertFalse(self.gateway.breaker.is_open)
+        self.assertEqual(self.server.requests, 1)
+
+    def test_abandoned_stream_probe_reopens_circuit(self):
+        """A probe stream the consumer closes mid-way releases the probe instead of wedging the circuit."""
+        closed = []
+
+        class Stream:
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                return mock.Mock(usage=None)
+
+            async def close(self):
+                closed.append(True)
+
+        client = mock.Mock()
+        client.chat.completions.create = mock.AsyncMock(return_value=Stream())
+        self.gateway.get_async_client = mock.Mock(return_value=client)
+        breaker = self.gateway.breaker
+        breaker.reset_timeout = 0
+        for _ in range(3):
+            breaker.record_failure()
+
+        async def read_one_chunk():
+            stream = self.gateway.astream_chat_completion('test', model='gpt-4', messages=[])
+            await stream.__anext__()
+            self.assertTrue(breaker.is_open)  # probe in flight
+            await stream.aclose()
+
+        async_to_sync(read_one_chunk)()
+
+        self.assertEqual(closed, [True])
+        self.assertFalse(breaker._probing)
+        # The abandoned probe counts as a failure; after the reset timeout a new probe may run
+        self.assertTrue(breaker.allow())
+        breaker.record_success()
+        self.assertFalse(breaker.is_open)
+
+    def test_saturated_gateway_rejects_after_queue_timeout(self):
+        """Callers give up when every concurrency slot stays busy."""
+        self.gateway._semaphore.acquire()
+        self.gateway._semaphore.acquire()
+        self.addCleanup(self.gateway._semaphore.release)
+        self.addCleanup(self.gateway._semaphore.release)
+
+        with self.assertRaises(LLMUnavailableError):
+            self._chat()
+        self.assertEqual(self.server.requests, 0)
+        self.assertEqual(get_metric('llm.saturated', provider='openai', operation='test'), 1)
+
+    def test_open_circuit_falls_back_to_templates(self):
+        """Explanations and detailed readings use template content while the circuit is open."""
+        user = User.objects.create(email='gateway@example.com', full_name='Gateway User')
+        profile, _ = NumerologyProfile.objects.update_or_create(user=user, defaults={
+            'life_path_number': 7, 'destiny_number': 3, 'soul_urge_number': 5,
+            'personality_number': 1, 'attitude_number': 2, 'maturity_number': 1,
+            'balance_number': 4, 'personal_year_number': 9, 'personal_month_number': 6,
+        })
+        for _ in range(3):
+            self.gateway.breaker.record_failure()
+
+        explanation = ExplanationGenerator(llm_provider='openai').generate_weekly_explanation(
+            user, {'weekly_number': 5, 'main_theme': 'Change'}, {'life_path_number': 7}
+        )
+        reading = generate_detailed_reading(user, 'life_path', 7, profile)
+
+        self.assertEqual(explanation.llm_provider, 'template')
+        self.assertIsInstance(reading, DetailedReading)
+        self.assertFalse(reading.generated_by_ai)
+        self.assertEqual(self.server.requests, 0)
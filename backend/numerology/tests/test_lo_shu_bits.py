@@ -0,0 +1,189 @@
+"""
+Tests for bit-packed Lo Shu grids and batch grid comparison.
+"""
+import random
+import uuid
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.models import User
+from numerology.lo_shu_kernel import FULL_MASK, ArrowTable, LoShuBits, digit_mask, mask_digits
+from numerology.models import NumerologyProfile, Person
+from numerology.numerology import NumerologyCalculator
+from numerology.services.lo_shu_service import LoShuGridService
+from numerology.views import compare_lo_shu_grids
+
+
+def _random_dates(count, seed=11):
+    rng = random.Random(seed)
+    return [date(1900, 1, 1) + timedelta(days=rng.randrange(73000)) for _ in range(count)]
+
+
+def _arrows_by_loop(arrows, number_counts):
+    found = []
+    for name, numbers in arrows.items():
+        if all(number_counts.get(n, 0) > 0 for n in numbers):
+            found.append((name, True))
+        elif all(number_counts.get(n, 0) == 0 for n in numbers):
+            found.append((name, False))
+    return found
+
+
+class LoShuBitsTest(SimpleTestCase):
+    """Test cases for packing grids and testing arrows against masks."""
+
+    def setUp(self):
+        self.calculator = NumerologyCalculator()
+
+    def test_packing_matches_digit_counts(self):
+        for birth_date in _random_dates(500):
+            counts = self.calculator.calculate_lo_shu_digit_counts(birth_date)
+            bits = LoShuBits.from_birth_date(birth_date)
+            self.assertEqual(bits, LoShuBits.from_counts(counts))
+            self.assertEqual(bits.as_dict(), {d: counts.get(d, 0) for d in range(1, 10)})
+            self.assertEqual(mask_digits(bits.present), tuple(sorted(counts)))
+
+    def test_from_grid_accepts_stored_json(self):
+        grid = self.calculator.calculate_lo_shu_grid('Ada Lovelace', date(1815, 12, 10))
+        bits = LoShuBits.from_grid(grid)
+
+        stored = dict(grid, number_frequency={str(k): v for k, v in grid['number_frequency'].items()})
+        self.assertEqual(LoShuBits.from_grid(stored), bits)
+        without_frequency = {'grid': grid['grid']}
+        self.assertEqual(LoShuBits.from_grid(without_frequency), bits)
+        self.assertEqual(list(mask_digits(bits.missing)), grid['missing_numbers'])
+
+    def test_arrow_table_matches_loop(self):
+        arrows = {name: arrow['numbers'] for name, arrow in NumerologyCalculator.PERSONALITY_ARROWS.items()}
+        table = ArrowTable(arrows)
+        for present in range(FULL_MASK + 1):
+            counts = {d: 1 for d in mask_digits(present)}
+            self.assertEqual(list(table.formed(present)), _arrows_by_loop(arrows, counts))
+        self.assertEqual(table.masks['mental_plane'], digit_mask([2, 4, 9]))
+
+    def test_calculator_arrows_unchanged(self):
+        for birth_date in _random_dates(200):
+            counts = self.calculator.calculate_lo_shu_digit_counts(birth_date)
+            arrows = self.calculator._detect_personality_arrows(counts)
+            expected = [
+                self.calculator._personality_arrow(name, present)
+                for name, present in _arrows_by_loop(
+                    {name: arrow['numbers'] for name, arrow in NumerologyCalculator.PERSONALITY_ARROWS.items()},
+                    counts,
+                )
+            ]
+            self.assertEqual(arrows, expected)
+
+
+class LoShuComparisonTest(SimpleTestCase):
+    """Test cases for comparing grids with mask operations."""
+
+    def setUp(self):
+        self.service = LoShuGridService()
+
+    def test_enhanced_grid_uses_digit_counts(self):
+        # 1+2+3 present, so the action arrow forms; 4, 5 and 6 are all missing
+        grid = self.service.calculate_enhanced_grid('Test Person', date(2012, 3, 1))
+        self.assertEqual(grid['position_grid'], {1: 2, 2: 2, 3: 1, 4: 0, 5: 0, 6: 0, 7: 0, 8: 0, 9: 0})
+        self.assertIn('action_arrow', grid['strength_arrows'])
+        self.assertIn('missing_emotional', grid['weakness_arrows'])
+
+    def test_compare_grids_classifies_positions(self):
+        grid1 = self.service.calculate_enhanced_grid('One', date(2012, 3, 1))
+        grid2 = self.service.calculate_enhanced_grid('Two', date(1987, 4, 15))
+        comparison = self.service.compare_grids(grid1, grid2, 'One', 'Two')
+
+        digits1 = set(mask_digits(LoShuBits.from_grid(grid1).present))
+        digits2 = set(mask_digits(LoShuBits.from_grid(grid2).present))
+        positions = comparison['position_comparison']
+        self.assertEqual(positions['matching'], sorted(digits1 & digits2))
+        self.assertEqual(positions['complementary'], sorted(digits1 ^ digits2))
+        self.assertEqual(positions['conflicting'], sorted(set(range(1, 10)) - digits1 - digits2))
+        self.assertEqual(comparison['common_strength_arrows'],
+                         [a for a in grid1['strength_arrows'] if a in grid2['strength_arrows']])
+
+    def test_ranking_agrees_with_pairwise_comparison(self):
+        base_date = date(1990, 7, 24)
+        base = self.service.calculate_enhanced_grid('Base', base_date)
+        dates = _random_dates(300)
+        ranking = self.service.rank_grid_compatibility(
+            LoShuBits.from_birth_date(base_date),
+            [(i, LoShuBits.from_birth_date(d)) for i, d in enumerate(dates)],
+        )
+
+        self.assertEqual(len(ranking), 300)
+        scores = [result['compatibility_score'] for result in ranking]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        for result in ranking[:25]:
+            other = self.service.calculate_enhanced_grid('Other', dates[result['key']])
+            comparison = self.service.compare_grids(base, other, 'Base', 'Other')
+            self.assertEqual(result['compatibility_score'], comparison['compatibility_score'])
+            self.assertEqual(result['matching_positions'], comparison['matching_positions'])
+            self.assertEqual(result['conflicting_positions'], comparison['conflicting_positions'])
+
+
+@patch('numerology.subscription_utils.can_access_feature', return_value=True)
+class CompareLoShuGridsViewTest(TestCase):
+    """Test cases for comparing one grid against many people."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.factory = APIRequestFactory()
+        self.user = User.objects.create(email='grids@example.com', full_name='Grid Owner', subscription_plan='premium')
+        self.grid = NumerologyCalculator().calculate_lo_shu_grid('Grid Owner', date(1990, 7, 24))
+        NumerologyProfile.objects.update_or_create(user=self.user, defaults={
+            'life_path_number': 5, 'destiny_number': 3, 'soul_urge_number': 5,
+            'personality_number': 1, 'attitude_number': 2, 'maturity_number': 1,
+            'balance_number': 4, 'personal_year_number': 9, 'personal_month_number': 6,
+            'lo_shu_grid': self.grid,
+        })
+        self.people = Person.objects.bulk_create([
+            Person(user=self.user, name=f'Person {i}', birth_date=birth_date)
+            for i, birth_date in enumerate(_random_dates(200))
+        ])
+
+    def _post(self, data):
+        request = self.factory.post('/api/v1/numerology/lo-shu-grid/compare/', data, format='json')
+        force_authenticate(request, user=self.user)
+        return compare_lo_shu_grids(request)
+
+    def test_ranks_people_against_stored_grid(self, _):
+        missing = uuid.uuid4()
+        with self.assertNumQueries(2):
+            response = self._post({'person_ids': [str(p.id) for p in self.people] + [str(missing)]})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['person1_name'], 'Grid Owner')
+        self.assertEqual(response.data['not_found_count'], 1)
+        results = response.data['results']
+        self.assertEqual(len(results), 200)
+        scores = [result['compatibility_score'] for result in results]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+        service = LoShuGridService()
+        by_id = {str(p.id): p for p in self.people}
+        top = results[0]
+        person = by_id[top['person_id']]
+        self.assertEqual(top['person_name'], person.name)
+        expected = service.compare_grids(
+            self.grid, service.calculate_enhanced_grid(person.name, person.birth_date), 'a', 'b'
+        )
+        self.assertEqual(top['compatibility_score'], expected['compatibility_score'])
+
+    def test_person_as_base(self, _):
+        base = self.people[0]
+        response = self._post({'person1_id': str(base.id), 'person_ids': [str(p.id) for p in self.people[1:4]]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['person1_name'], base.name)
+        self.assertEqual(len(response.data['results']), 3)
+
+    def test_rejects_invalid_requests(self, _):
+        self.assertEqual(self._post({'person_ids': []}).status_code, 400)
+        self.assertEqual(self._post({'person_ids': ['not-a-uuid']}).status_code, 400)
+        self.assertEqual(self._post({'person_ids': [str(uuid.uuid4())] * 501}).status_code, 400)
+        self.assertEqual(
+            self._post({'person1_id': str(uuid.uuid4()), 'person_ids': [str(self.people[0].id)]}).status_code, 404
+        )
@@ -0,0 +1,93 @@
+"""
+Tests for the single-pass name analysis kernel.
+"""
+import collections
+import random
+
+import pytest
+
+from numerology.name_kernel import get_letter_table
+from numerology.name_numerology import PYTHAGOREAN_MAP, compute_name_numbers
+from numerology.numerology import NumerologyCalculator
+
+SYSTEMS = ['pythagorean', 'chaldean', 'vedic']
+
+
+def _corpus(count, seed=11):
+    rng = random.Random(seed)
+    alphabet = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ' * 3 + "éÅßøñ-'. ı"
+    return [
+        ' '.join(
+            ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 12)))
+            for _ in range(rng.randint(1, 5))
+        )
+        for _ in range(count)
+    ]
+
+
+class _ScanningReference:
+    """The per-number name scans the kernel replaces."""
+
+    def __init__(self, calculator):
+        self.calc = calculator
+
+    def sum_name(self, name, vowels_only=False, consonants_only=False):
+        total = 0
+        for char in name.upper():
+            if not char.isalpha():
+                continue
+            is_vowel = char in self.calc.VOWELS
+            if (vowels_only and not is_vowel) or (consonants_only and is_vowel):
+                continue
+            total += self.calc._get_letter_value(char)
+        return total
+
+    def counts(self, name):
+        counts = collections.defaultdict(int)
+        for char in name.upper():
+            if char.isalpha() and self.calc._get_letter_value(char) > 0:
+                counts[self.calc._get_letter_value(char)] += 1
+        return counts
+
+    def numbers(self, name):
+        counts = self.counts(name)
+        initials = ''.join(word[0] for word in name.strip().split() if word)
+        return {
+            'total': self.sum_name(name),
+            'vowels': self.sum_name(name, vowels_only=True),
+            'consonants': self.sum_name(name, consonants_only=True),
+            'initials': self.sum_name(initials),
+            'lessons': [i for i in range(1, 10) if i not in counts],
+            'counts': dict(counts),
+        }
+
+
+@pytest.mark.parametrize('system', SYSTEMS)
+def test_profile_matches_per_number_scans(system):
+    """Every name-derived sum and count equals the character-by-character result."""
+    calculator = NumerologyCalculator(system)
+    reference = _ScanningReference(calculator)
+
+    for name in _corpus(2000) + ['', '   ', 'Ærøskøbing', 'Straße', "O'Brien-Smith"]:
+        profile = calculator.analyze_name(name)
+        expected = reference.numbers(name)
+        assert profile.total == expected['total'] == calculator._sum_name(name)
+        assert profile.vowel_total == expected['vowels']
+        assert profile.consonant_total == expected['consonants']
+        assert profile.initials_total == expected['initials']
+        assert calculator.calculate_karmic_lessons(name) == expected['lessons']
+        assert {v: c for v, c in enumerate(profile.value_counts) if c} == expected['counts']
+
+
+def test_compute_name_numbers_breakdown():
+    """The shared kernel yields the same breakdown and totals as per-letter lookups."""
+    result = compute_name_numbers('Mary Ann Smith', 'pythagorean')
+    letters = 'maryannsmith'
+    assert [entry['letter'] for entry in result['breakdown']] == list(letters)
+    assert [entry['value'] for entry in result['breakdown']] == [PYTHAGOREAN_MAP[c] for c in letters]
+    assert result['soul_urge']['letters'] == ['a', 'a', 'i']
+    assert result['expression']['raw_total'] == sum(PYTHAGOREAN_MAP[c] for c in letters)
+    assert result['soul_urge']['raw_total'] + result['personality']['raw_total'] == result['expression']['raw_total']
+    assert [w['raw_total'] for w in result['word_totals']] == [
+        sum(PYTHAGOREAN_MAP[c] for c in word) for word in ('mary', 'ann', 'smith')
+    ]
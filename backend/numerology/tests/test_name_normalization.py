@@ -1,8 +1,50 @@
 """
 Unit tests for name normalization and transliteration.
 """
+import random
+import re
+import unicodedata
+
 import pytest
-from numerology.name_numerology import normalize_name
+from numerology.name_normalizer import NameNormalizer
+from numerology.name_numerology import TRANSLITERATION_MAP, normalize_name, normalize_names
+
+SCRIPTS = [
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ',
+    'éèáàíóúâêîôûçăğşöüñśłÉÅßøÆ',
+    'абвгдежзийклмнопрстуфхцчшщъыьэюяАБВ',
+    'अआइईउऊएऐओऔकखगघचछजझटठडढणतथदधनपफबभमयरलवशषसह्ािीुू',
+    'ابتثجحخدذرزسشصضطظعغفقكلمنهوي',
+]
+
+
+def _reference(name, rules, transliterate=True):
+    """The regex and per-character implementation NameNormalizer replaces."""
+    if not name:
+        return ""
+    name = ' '.join(name.split())
+    name = re.sub(r"[''-]", ' ', name)
+    name = re.sub(r'[^\w\s]', '', name)
+    name = unicodedata.normalize('NFKD', name)
+    name = ''.join(char for char in name if not unicodedata.combining(char))
+    name = name.lower()
+    if transliterate and rules:
+        name = ''.join(rules.get(char, char) for char in name)
+    name = re.sub(r'[^a-z\s]', '', name)
+    return ' '.join(name.split())
+
+
+def _mixed_script_corpus(count, seed=7):
+    rng = random.Random(seed)
+    punctuation = "'-.,0 \t’"
+
+    def word():
+        letters = rng.choice(SCRIPTS)
+        return ''.join(
+            rng.choice(punctuation if rng.random() < 0.05 else letters) for _ in range(rng.randint(2, 10))
+        )
+
+    return [' '.join(word() for _ in range(rng.randint(1, 4))) for _ in range(count)]
 
 
 def test_strip_whitespace():
@@ -67,3 +109,37 @@ def test_non_latin_characters():
     assert "123" not in result
     assert result == "john"
 
+
+
+@pytest.mark.parametrize('transliterate', [True, False])
+def test_matches_reference_on_mixed_scripts(transliterate):
+    """The compiled engine gives the same result as the original step-by-step pipeline."""
+    for name in _mixed_script_corpus(5000) + ['İstanbul', 'Ǆemal', 'ﬁona', 'Ａｎｎａ', 'Σίσυφος', '']:
+        assert normalize_name(name, transliterate=transliterate) == _reference(
+            name, TRANSLITERATION_MAP, transliterate
+        )
+
+
+def test_multi_character_rules_take_longest_match():
+    """Multi-character rules are applied in one pass, longest first."""
+    rules = {'ш': 'sh', 'шч': 'shch', 'ч': 'ch', 'кс': 'x', 'к': 'k', 'а': 'a', 'с': 's'}
+    normalizer = NameNormalizer(rules)
+    assert normalizer.normalize('Шчаша Ксаш-ч') == 'shchasha xash ch'
+    assert normalizer.normalize('Émilie-Rose') == 'emilie rose'
+    assert normalizer.normalize('каска аксака') == 'kaska axaka'
+
+
+def test_cache_is_bounded():
+    normalizer = NameNormalizer(TRANSLITERATION_MAP, cache_size=4)
+    for name in ['Ann', 'Bob', 'Cy', 'Dee', 'Eve', 'Ann']:
+        normalizer.normalize(name)
+    info = normalizer.normalize.cache_info()
+    assert info.maxsize == 4
+    assert info.currsize == 4
+    assert info.hits == 0
+
+
+def test_normalize_names_batch():
+    names = ['  José  ', 'Шура', 'O\'Connor', 'José', '']
+    assert normalize_names(names) == [normalize_name(name) for name in names]
+    assert normalize_names(iter(['Mary-Jane']), transliterate=False) == ['mary jane']
@@ -0,0 +1,167 @@
+"""
+Tests for bulk people import.
+"""
+import io
+import json
+from datetime import date
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.models import User
+from numerology.models import PeopleImport, Person, PersonNumerologyProfile
+from numerology.numerology import NumerologyCalculator
+from numerology.services.people_import import PROFILE_FIELDS, iter_json_rows, run_import
+from numerology.tasks import import_people_file
+from numerology.views import import_people, people_import_status
+
+CSV_TEXT = (
+    "Name,Birth_Date,Relationship,Notes\n"
+    "Ada Lovelace,1915-12-10,friend,\n"
+    "Alan Turing,1912-06-23,colleague,Codebreaker\n"
+    "  Ada Lovelace ,1915-12-10,friend,duplicate in file\n"
+    "Grace Hopper,1906-12-09,client,\n"
+    "12345,1990-01-01,,\n"
+    "Katherine Johnson,not-a-date,,\n"
+)
+
+
+class RunImportTest(TestCase):
+    """Test cases for streaming, validating and writing imported rows."""
+
+    def setUp(self):
+        self.user = User.objects.create(email='consultant@example.com', full_name='Consultant')
+        Person.objects.create(user=self.user, name='Alan Turing', birth_date=date(1912, 6, 23))
+
+    def _run(self, content, file_format, chunk_size=500):
+        people_import = PeopleImport.objects.create(user=self.user, file_format=file_format)
+        return run_import(people_import, io.BytesIO(content.encode('utf-8')), chunk_size=chunk_size)
+
+    def test_csv_import_dedupes_and_reports_row_errors(self):
+        result = self._run(CSV_TEXT, 'csv', chunk_size=2)
+
+        self.assertEqual(result.status, 'completed')
+        self.assertEqual(result.processed_rows, 6)
+        self.assertEqual(result.created_count, 1)
+        self.assertEqual(result.duplicate_count, 2)
+        self.assertEqual(result.error_count, 3)
+        self.assertEqual([error['row'] for error in result.errors], [4, 5, 6])
+        self.assertIn('relationship', result.errors[0]['errors'])
+        self.assertIn('name', result.errors[1]['errors'])
+        self.assertIn('birth_date', result.errors[2]['errors'])
+        self.assertEqual(
+            sorted(Person.objects.filter(user=self.user).values_list('name', flat=True)),
+            ['Ada Lovelace', 'Alan Turing']
+        )
+
+    def test_name_variants_are_duplicates(self):
+        result = self._run(
+            "name,birth_date\n"
+            "ALAN  TURING,1912-06-23\n"
+            "José Martí,1953-01-28\n"
+            "jose marti,1953-01-28\n"
+            "Jose Marti,1900-01-28\n",
+            'csv',
+        )
+
+        self.assertEqual(result.created_count, 2)
+        self.assertEqual(result.duplicate_count, 2)
+        self.assertEqual(
+            sorted(Person.objects.filter(user=self.user).values_list('name', 'birth_date')),
+            [('Alan Turing', date(1912, 6, 23)), ('Jose Marti', date(1900, 1, 28)),
+             ('José Martí', date(1953, 1, 28))]
+        )
+
+    def test_profiles_match_calculator(self):
+        self._run('[{"name": "Grace Hopper", "birth_date": "1906-12-09", "relationship": "friend"}]', 'json')
+
+        profile = PersonNumerologyProfile.objects.get(person__name='Grace Hopper')
+        numbers = NumerologyCalculator().calculate_all('Grace Hopper', date(1906, 12, 9))
+        self.assertEqual({field: getattr(profile, field) for field in PROFILE_FIELDS},
+                         {field: numbers[field] for field in PROFILE_FIELDS})
+        self.assertEqual(profile.calculation_system, 'pythagorean')
+
+    def test_json_lines_and_progress(self):
+        rows = [{'name': f'Client {chr(65 + i % 26)}{chr(65 + i // 26)}', 'birth_date': '1980-01-01'} for i in range(25)]
+        with mock.patch.object(PeopleImport, 'save', autospec=True, side_effect=PeopleImport.save) as save:
+            result = self._run('\n'.join(json.dumps(row) for row in rows), 'json', chunk_size=10)
+
+        self.assertEqual(result.created_count, 25)
+        self.assertEqual(PersonNumerologyProfile.objects.filter(person__user=self.user).count(), 25)
+        # creation, processing, two full chunks, completion
+        self.assertEqual(save.call_count, 5)
+
+    def test_invalid_json_fails_import(self):
+        result = self._run('[{"name": "Ada Lovelace", "birth_date": "1915-12-10"} {"name": ', 'json')
+        self.assertEqual(result.status, 'failed')
+        self.assertIn('Invalid JSON', result.error_message)
+        self.assertIsNotNone(result.completed_at)
+
+    def test_csv_without_required_columns_fails_import(self):
+        result = self._run('full_name,dob\nAda,1915-12-10\n', 'csv')
+        self.assertEqual(result.status, 'failed')
+        self.assertIn('birth_date', result.error_message)
+
+    def test_json_reader_handles_values_across_reads(self):
+        rows = [{'name': 'x' * 1000, 'birth_date': '2000-01-01', 'n': i} for i in range(200)]
+        with mock.patch('numerology.services.people_import.READ_SIZE', 7):
+            parsed = list(iter_json_rows(io.BytesIO(json.dumps(rows, indent=1).encode('utf-8'))))
+        self.assertEqual(parsed, rows)
+        self.assertEqual(list(iter_json_rows(io.BytesIO(b' [ ] '))), [])
+
+
+class ImportPeopleViewTest(TestCase):
+    """Test cases for the people import endpoints."""
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.user = User.objects.create(email='importer@example.com', full_name='Importer')
+
+    def _post(self, upload, **data):
+        request = self.factory.post('/api/v1/people/import/', {'file': upload, **data}, format='multipart')
+        force_authenticate(request, user=self.user)
+        return import_people(request)
+
+    def test_small_file_is_imported_in_request(self):
+        response = self._post(SimpleUploadedFile('clients.csv', CSV_TEXT.encode('utf-8'), content_type='text/csv'))
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['status'], 'completed')
+        self.assertEqual(response.data['created_count'], 2)
+        self.assertEqual(Person.objects.filter(user=self.user).count(), 2)
+
+    def test_unknown_format_is_rejected(self):
+        response = self._post(SimpleUploadedFile('clients.xlsx', b'data'))
+        self.assertEqual(response.status_code, 400)
+
+    def test_large_file_is_queued_and_processed_by_task(self):
+        upload_bytes = json.dumps([
+            {'name': 'Ada Lovelace', 'birth_date': '1915-12-10'},
+            {'name': 'Grace Hopper', 'birth_date': '1906-12-09'},
+        ]).encode('utf-8')
+        upload = SimpleUploadedFile('clients.json', upload_bytes)
+        with override_settings(PEOPLE_IMPORT_SYNC_MAX_BYTES=10), \
+                mock.patch('numerology.views.people.import_people_file.delay') as delay:
+            response = self._post(upload)
+            self.assertEqual(response.status_code, 202)
+            self.assertEqual(response.data['status'], 'queued')
+            delay.assert_called_once_with(response.data['id'])
+            # The worker reads the upload from the database, not the web container's disk
+            self.assertEqual(bytes(PeopleImport.objects.get(id=response.data['id']).payload), upload_bytes)
+
+            result = import_people_file(response.data['id'])
+
+        self.assertEqual(result['status'], 'completed')
+        self.assertEqual(result['created'], 2)
+        people_import = PeopleImport.objects.get(id=response.data['id'])
+        self.assertIsNone(people_import.payload)
+
+        request = self.factory.get('/')
+        force_authenticate(request, user=self.user)
+        self.assertEqual(people_import_status(request, import_id=people_import.id).data['created_count'], 2)
+
+        other = User.objects.create(email='other@example.com', full_name='Other')
+        force_authenticate(request, user=other)
+        self.assertEqual(people_import_status(request, import_id=people_import.id).status_code, 404)
@@ -0,0 +1,120 @@
+"""
+Tests for bulk phone candidate ranking.
+"""
+import random
+
+import pytest
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.models import User
+from numerology.models import NumerologyProfile
+from numerology.phone_numerology import compute_compatibility_score, compute_phone_numerology
+from numerology.phone_ranking import (
+    expand_candidate_range,
+    rank_phone_candidates,
+    sanitize_candidates,
+)
+from numerology.views import rank_phone_numbers
+
+OWNER = '+14155552671'
+
+
+def _random_candidates(count, seed=7):
+    rng = random.Random(seed)
+    prefixes = ['+1', '+44', '+91', '+7', '+353', '0049']
+    return [
+        rng.choice(prefixes) + ''.join(rng.choice('0123456789') for _ in range(rng.randint(5, 12)))
+        for _ in range(count)
+    ]
+
+
+def test_scores_match_single_number_calculations():
+    """Vectorized scores equal compute_phone_numerology / compute_compatibility_score."""
+    candidates = _random_candidates(2000)
+    ranking = rank_phone_candidates(candidates, owner_e164=OWNER, preferred_numbers=[7], top_k=2000)
+
+    assert ranking['valid_candidates'] == len(ranking['results'])
+    for row in ranking['results']:
+        single = compute_phone_numerology(row['phone_e164'], core_scope='national')
+        compatibility = compute_compatibility_score(row['phone_e164'], OWNER)
+        assert row['raw_total'] == single['core_number']['raw_total']
+        assert row['core_number'] == single['core_number']['reduced']
+        assert row['dominant_digit'] == single['dominant_digit']
+        assert row['compatibility_score'] == compatibility['compatibility_score']
+
+    scores = [row['score'] for row in ranking['results']]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_sanitization_matches_single_validation():
+    """Fast-path and fallback sanitization agree with sanitize_and_validate_phone."""
+    result = sanitize_candidates([
+        '+1 (415) 555-2671', '0014155552671', '+1-800-FLOWERS', '4155552671', '+123', '',
+    ])
+
+    assert result['valid'] == ['+14155552671']
+    assert [item['phone'] for item in result['invalid']] == ['+1-800-FLOWERS', '4155552671', '+123', '']
+    assert result['invalid'][2]['reason'] == 'Phone number too short (minimum 6 digits)'
+
+
+def test_ranks_ten_thousand_candidates():
+    """A 10k-number range ranks down to the requested top k."""
+    candidates = expand_candidate_range('+1415555', '0000', '9999')
+    ranking = rank_phone_candidates(candidates, owner_e164=OWNER, preferred_numbers=[5], top_k=10)
+
+    assert ranking['valid_candidates'] == 10000
+    assert len(ranking['results']) == 10
+
+
+def test_expand_candidate_range_validation():
+    """Ranges are zero-padded and bounded."""
+    assert expand_candidate_range('+4420', '098', '101') == ['+4420098', '+4420099', '+4420100', '+4420101']
+    with pytest.raises(ValueError):
+        expand_candidate_range('+4420', '10', '099')
+    with pytest.raises(ValueError):
+        expand_candidate_range('+4420', '00000', '99999')
+
+
+class RankPhoneNumbersViewTest(TestCase):
+    """Test cases for the phone ranking endpoint."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.factory = APIRequestFactory()
+        self.user = User.objects.create(
+            email='ranker@example.com', full_name='Ranker', subscription_plan='premium'
+        )
+        NumerologyProfile.objects.update_or_create(user=self.user, defaults={
+            'life_path_number': 5, 'destiny_number': 3, 'soul_urge_number': 5,
+            'personality_number': 1, 'attitude_number': 2, 'maturity_number': 1,
+            'balance_number': 4, 'personal_year_number': 9, 'personal_month_number': 6,
+        })
+
+    def _post(self, data, user=None):
+        request = self.factory.post('/api/v1/phone-numerology/rank/', data, format='json')
+        force_authenticate(request, user=user or self.user)
+        return rank_phone_numbers(request)
+
+    def test_ranks_prefix_range_with_profile_defaults(self):
+        """Life path is the default preferred number and top_k limits results."""
+        response = self._post({
+            'prefix': '+1415555', 'range_start': '2600', 'range_end': '2699',
+            'owner_phone': OWNER, 'top_k': 5,
+        })
+
+        assert response.status_code == 200
+        assert response.data['valid_candidates'] == 100
+        assert response.data['preferred_numbers'] == [5]
+        assert response.data['owner_phone_e164'] == OWNER
+        assert len(response.data['results']) == 5
+        assert response.data['results'][0]['core_number'] == 5
+
+    def test_rejects_mixed_inputs_and_free_plan(self):
+        """Candidates and a range are exclusive; free users are refused."""
+        response = self._post({'candidates': [OWNER], 'prefix': '+1', 'range_start': '0', 'range_end': '9'})
+        assert response.status_code == 400
+
+        free_user = User.objects.create(email='free@example.com', full_name='Free')
+        response = self._post({'candidates': [OWNER]}, user=free_user)
+        assert response.status_code == 403
@@ -0,0 +1,116 @@
+"""
+Unit tests for the encyclopedia retrieval index.
+"""
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from numerology import rag_ingestion
+from numerology.rag_ingestion import (
+    ENCYCLOPEDIA_PATH,
+    REFERENCE_FILTER,
+    chunk_encyclopedia,
+    get_vector_index,
+    ingest_numerology_data,
+    reference_query,
+)
+
+
+class RagIngestionTest(SimpleTestCase):
+    """Test cases for chunking, ingestion and search."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        self.index_dir = self.tmp / 'index'
+        self.source = self.tmp / 'encyclopedia.json'
+        shutil.copy(ENCYCLOPEDIA_PATH, self.source)
+
+    def _load_source(self):
+        return json.loads(self.source.read_text())
+
+    def test_chunks_are_paragraph_level_with_metadata(self):
+        """Each digit interpretation and numbering system becomes its own chunk."""
+        chunks = chunk_encyclopedia(self._load_source())
+        paths = [chunk['metadata']['path'] for chunk in chunks]
+
+        self.assertIn('interpretations.digits.7', paths)
+        self.assertIn('systems.chaldean', paths)
+        self.assertTrue(all(len(chunk['text']) <= rag_ingestion.CHUNK_SIZE + 100 for chunk in chunks))
+
+        chaldean = next(c for c in chunks if c['metadata']['path'] == 'systems.chaldean')
+        self.assertEqual(chaldean['metadata']['section'], 'systems')
+        self.assertEqual(chaldean['metadata']['system'], 'chaldean')
+        self.assertEqual(len({chunk['id'] for chunk in chunks}), len(chunks))
+
+    def test_search_returns_relevant_chunks_and_applies_filters(self):
+        """Cosine top-k search ranks the matching section first and honours metadata filters."""
+        ingest_numerology_data(self.source, self.index_dir)
+        index = get_vector_index(self.index_dir)
+
+        hits = index.search('master numbers reduce', top_k=3)
+        self.assertEqual(hits[0]['metadata']['path'], 'algorithms.reduce')
+        self.assertGreaterEqual(hits[0]['score'], hits[-1]['score'])
+
+        hits = index.search('letter mapping', top_k=1, filter={'system': 'chaldean'})
+        self.assertEqual(hits[0]['metadata']['path'], 'systems.chaldean')
+
+        hits = index.search('life path', top_k=5, filter={'section': {'$in': ['examples']}})
+        self.assertTrue(hits)
+        self.assertTrue(all(hit['metadata']['section'] == 'examples' for hit in hits))
+
+        self.assertEqual(index.search('life path', filter={'section': 'missing'}), [])
+
+    def test_vectors_are_memory_mapped_read_only(self):
+        """Workers share the matrix through a read-only memory map."""
+        ingest_numerology_data(self.source, self.index_dir)
+        index = get_vector_index(self.index_dir)
+        self.assertIsInstance(index.vectors, rag_ingestion.np.memmap)
+        self.assertFalse(index.vectors.flags.writeable)
+
+    def test_reingestion_only_embeds_changed_chunks(self):
+        """Unchanged sources are skipped and edits only embed the changed paragraphs."""
+        first = ingest_numerology_data(self.source, self.index_dir)
+        self.assertEqual(first['reused'], 0)
+        self.assertEqual(ingest_numerology_data(self.source, self.index_dir)['unchanged'], True)
+
+        data = self._load_source()
+        data['interpretations']['digits']['7']['short'] = 'Introspection, analysis and quiet wisdom.'
+        self.source.write_text(json.dumps(data))
+
+        with mock.patch.object(
+            rag_ingestion, 'embed_text_batch', wraps=rag_ingestion.embed_text_batch
+        ) as embed:
+            second = ingest_numerology_data(self.source, self.index_dir)
+        self.assertEqual(second['added'], 1)
+        self.assertEqual(second['removed'], 1)
+        self.assertEqual(len(embed.call_args.args[0]), 1)
+
+        # Readers switch to the new version on their next lookup.
+        index = get_vector_index(self.index_dir)
+        self.assertEqual(index.path.name, second['version'])
+        hits = index.search('quiet wisdom introspection', top_k=1)
+        self.assertEqual(hits[0]['metadata']['path'], 'interpretations.digits.7')
+
+    def test_missing_index_returns_no_context(self):
+        """Retrieval degrades to no context before the first ingestion."""
+        with self.settings(NUMEROLOGY_RAG_INDEX_DIR=str(self.index_dir)):
+            self.assertEqual(rag_ingestion.retrieve('life path'), [])
+            self.assertEqual(rag_ingestion.retrieve_context('life path'), '')
+
+    def test_reference_query_finds_number_interpretations(self):
+        """Explanation prompts retrieve the interpretation of the numbers they describe."""
+        query = reference_query('name expression soul urge', [7, 7, None, ''], system='chaldean')
+        self.assertEqual(query, 'name expression soul urge chaldean number 7')
+
+        ingest_numerology_data(self.source, self.index_dir)
+        with self.settings(NUMEROLOGY_RAG_INDEX_DIR=str(self.index_dir)):
+            hits = rag_ingestion.retrieve(reference_query('personal year cycle', [7]), filter=REFERENCE_FILTER)
+        paths = [hit['metadata']['path'] for hit in hits]
+        self.assertIn('interpretations.digits.7', paths)
+        self.assertTrue(all(hit['metadata']['section'] != 'examples' for hit in hits))
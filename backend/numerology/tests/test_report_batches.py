@@ -0,0 +1,163 @@
+"""
+Unit tests for set-based weekly and yearly report generation.
+"""
+import json
+from datetime import date, timedelta
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import User, UserProfile
+from numerology import tasks
+from numerology.models import DailyReading, NumerologyProfile, RajYogDetection, WeeklyReport, YearlyReport
+from numerology.services.weekly_report_generator import WeeklyReportGenerator
+from numerology.services.yearly_report_generator import YearlyReportGenerator
+
+WEEK_START = date(2024, 3, 10)
+
+
+def as_stored(value):
+    """Mimic a JSONField round-trip (dict keys become strings)."""
+    if isinstance(value, (dict, list)):
+        return json.loads(json.dumps(value))
+    return value
+
+
+class ReportBatchTest(TestCase):
+    """Test cases for chunked report generation."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.weekly = WeeklyReportGenerator()
+        self.yearly = YearlyReportGenerator()
+
+    def _make_users(self, count, offset=0):
+        users = []
+        for index in range(offset, offset + count):
+            user = User.objects.create(
+                email=f'batch{index}@example.com', full_name=f'Batch User {index}', is_verified=True
+            )
+            UserProfile.objects.update_or_create(
+                user=user, defaults={'date_of_birth': date(1990, 1 + index % 12, 1 + index % 28)}
+            )
+            NumerologyProfile.objects.update_or_create(user=user, defaults={
+                'life_path_number': 1 + index % 9, 'destiny_number': 8, 'soul_urge_number': 5,
+                'personality_number': 3, 'attitude_number': 2, 'maturity_number': 1,
+                'balance_number': 4, 'personal_year_number': 9, 'personal_month_number': 6,
+            })
+            DailyReading.objects.create(
+                user=user, reading_date=WEEK_START + timedelta(days=1), personal_day_number=4,
+                lucky_number=4, lucky_color='Blue', auspicious_time='9 AM',
+                activity_recommendation='Plan', warning='Rushing', affirmation='I build',
+                actionable_tip='List goals', raj_yog_status='detected',
+            )
+            RajYogDetection.objects.create(
+                user=user, is_detected=True, yog_name='Leadership Raj Yog', strength_score=80
+            )
+            users.append(user)
+        return users
+
+    def _count_batch_queries(self, method, users, arg):
+        with CaptureQueriesContext(connection) as queries:
+            method([str(u.id) for u in users], arg)
+        return len(queries)
+
+    def test_weekly_batch_matches_single_report(self):
+        """Batch output is identical to the per-user generator."""
+        user = self._make_users(1)[0]
+        expected = self.weekly.generate_weekly_report(user, WEEK_START)
+
+        counts = self.weekly.generate_weekly_reports_batch([str(user.id)], WEEK_START)
+        self.assertEqual(counts, {'created': 1, 'skipped': 0, 'errors': 0})
+
+        report = WeeklyReport.objects.get(user=user, week_start_date=WEEK_START)
+        for field, value in expected.items():
+            self.assertEqual(getattr(report, field), as_stored(value), field)
+        self.assertEqual(report.daily_insights[1]['lucky_color'], 'Blue')
+        self.assertEqual(report.raj_yog_status, 'detected')
+
+    def test_yearly_batch_matches_single_report(self):
+        """Batch output is identical to the per-user generator."""
+        user = self._make_users(1)[0]
+        WeeklyReport.objects.create(
+            user=user, week_start_date=date(2024, 1, 7), week_end_date=date(2024, 1, 13),
+            week_number=1, year=2024, weekly_number=5, personal_year_number=9,
+            personal_month_number=6, main_theme='Change', weekly_summary='', raj_yog_status='detected',
+        )
+        expected = self.yearly.generate_yearly_report(user, 2024)
+
+        counts = self.yearly.generate_yearly_reports_batch([str(user.id)], 2024)
+        self.assertEqual(counts['created'], 1)
+
+        report = YearlyReport.objects.get(user=user, year=2024)
+        self.assertEqual(report.raj_yog_patterns[0]['active_weeks'], 1)
+        for field, value in expected.items():
+            self.assertEqual(getattr(report, field), as_stored(value), field)
+
+    def test_batch_query_count_does_not_grow_with_users(self):
+        """A chunk costs a fixed number of queries regardless of its size."""
+        small = self._count_batch_queries(self.weekly.generate_weekly_reports_batch, self._make_users(2), WEEK_START)
+        large = self._count_batch_queries(
+            self.weekly.generate_weekly_reports_batch, self._make_users(8, offset=2), WEEK_START
+        )
+        self.assertEqual(small, large)
+
+        small = self._count_batch_queries(
+            self.yearly.generate_yearly_reports_batch, User.objects.order_by('email')[:2], 2024
+        )
+        large = self._count_batch_queries(
+            self.yearly.generate_yearly_reports_batch, User.objects.order_by('email')[2:], 2024
+        )
+        self.assertEqual(small, large)
+
+    def test_existing_and_incomplete_users_are_not_duplicated(self):
+        """Re-running skips existing reports; users without profiles count as errors."""
+        users = self._make_users(2)
+        NumerologyProfile.objects.filter(user=users[1]).delete()
+        user_ids = [str(u.id) for u in users]
+
+        first = self.weekly.generate_weekly_reports_batch(user_ids, WEEK_START)
+        second = self.weekly.generate_weekly_reports_batch(user_ids, WEEK_START)
+
+        self.assertEqual(first, {'created': 1, 'skipped': 0, 'errors': 1})
+        self.assertEqual(second, {'created': 0, 'skipped': 1, 'errors': 1})
+        self.assertEqual(WeeklyReport.objects.count(), 1)
+
+    def test_concurrent_run_does_not_duplicate_or_overcount(self):
+        """Rows another run inserts mid-batch are skipped and not counted as created."""
+        users = self._make_users(3)
+        user_ids = [str(u.id) for u in users]
+
+        for model, run, period in (
+            (WeeklyReport, self.weekly.generate_weekly_reports_batch, WEEK_START),
+            (YearlyReport, self.yearly.generate_yearly_reports_batch, 2024),
+        ):
+            bulk_create = model.objects.bulk_create
+            raced = []
+
+            def race(reports, **kwargs):
+                if not raced:
+                    # A redelivered chunk inserts the first user's report in the meantime
+                    raced.append(True)
+                    run(user_ids[:1], period)
+                return bulk_create(reports, **kwargs)
+
+            with mock.patch.object(model.objects, 'bulk_create', side_effect=race):
+                counts = run(user_ids, period)
+            self.assertEqual(counts, {'created': 2, 'skipped': 1, 'errors': 0})
+            self.assertEqual(model.objects.filter(user=users[0], person__isnull=True).count(), 1)
+
+    def test_scheduled_tasks_dispatch_chunks(self):
+        """The beat tasks fan out one chunk task per REPORT_BATCH_SIZE users."""
+        self._make_users(5)
+        with mock.patch.object(tasks, 'REPORT_BATCH_SIZE', 2), \
+                mock.patch.object(tasks.generate_weekly_reports_chunk, 'delay') as weekly_delay, \
+                mock.patch.object(tasks.generate_yearly_reports_chunk, 'delay') as yearly_delay:
+            tasks.generate_weekly_reports()
+            tasks.generate_yearly_reports()
+
+        self.assertEqual([len(call.args[0]) for call in weekly_delay.call_args_list], [2, 2, 1])
+        self.assertEqual(yearly_delay.call_count, 3)
+        self.assertEqual(yearly_delay.call_args.args[1], date.today().year)
@@ -0,0 +1,128 @@
+"""
+Unit tests for the shared name and phone result store.
+"""
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from accounts.models import User
+from numerology import tasks
+from numerology.models import NameReport, NumerologyResult, PhoneReport
+from numerology.services import result_store
+from utils.metrics import get_metric
+from utils.single_flight import single_flight
+
+EXPLANATION = {
+    'explanation': {
+        'short_summary': 'A seeker of truth.',
+        'long_explanation': 'Expression 7 favours study.',
+        'action_points': ['Read', 'Reflect', 'Rest'],
+        'confidence_notes': 'Deterministic numbers.',
+    },
+    'tokens_used': 300,
+}
+
+
+class ResultStoreTest(TestCase):
+    """Test cases for content-addressed report sharing."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        cache.clear()
+        self.alice = User.objects.create(email='alice@example.com', full_name='Alice')
+        self.bob = User.objects.create(email='bob@example.com', full_name='Bob')
+
+    def test_same_normalized_name_shares_one_explanation(self):
+        """Users asking for the same name reuse one computation and LLM call."""
+        with mock.patch(
+            'numerology.services.result_store.generate_name_explanation', return_value=EXPLANATION
+        ) as explain:
+            first = tasks.generate_name_report(str(self.alice.id), 'Ada Lovelace', 'birth', 'pythagorean')
+            second = tasks.generate_name_report(str(self.bob.id), '  ada  LOVELACE ', 'birth', 'pythagorean')
+
+        self.assertEqual(explain.call_count, 1)
+        alice_report = NameReport.objects.get(id=first['report_id'])
+        bob_report = NameReport.objects.get(id=second['report_id'])
+        self.assertEqual(alice_report.shared_result_id, bob_report.shared_result_id)
+        self.assertEqual(bob_report.user, self.bob)
+        self.assertEqual(bob_report.name, '  ada  LOVELACE ')
+        self.assertEqual(bob_report.explanation, EXPLANATION['explanation'])
+        self.assertEqual(bob_report.numbers, alice_report.numbers)
+
+        self.assertEqual(NumerologyResult.objects.get().hit_count, 1)
+        self.assertEqual(get_metric('numerology_result_store.hit', kind='name'), 1)
+        self.assertEqual(get_metric('numerology_result_store.miss', kind='name'), 1)
+        self.assertEqual(get_metric('numerology_result_store.tokens_saved', kind='name'), 300)
+
+    def test_first_requests_coalesce_across_users(self):
+        """Misses for the same input share one single-flight key whoever asks."""
+        with mock.patch(
+            'numerology.services.result_store.generate_name_explanation', return_value=EXPLANATION
+        ), mock.patch.object(result_store, 'single_flight', wraps=single_flight) as flight:
+            result_store.get_name_result(self.alice, 'Ada Lovelace', 'birth', 'pythagorean')
+            NumerologyResult.objects.all().delete()
+            result_store.get_name_result(self.bob, 'ada lovelace', 'birth', 'pythagorean')
+
+        keys = [call.args[0] for call in flight.call_args_list]
+        self.assertEqual(len(keys), 2)
+        self.assertEqual(keys[0], keys[1])
+        self.assertTrue(keys[0].startswith('numerology_result:'))
+
+    def test_refresh_does_not_change_other_reports(self):
+        """A forced refresh re-explains for that user only."""
+        refreshed = dict(EXPLANATION, explanation=dict(EXPLANATION['explanation'], short_summary='Refreshed.'))
+        with mock.patch(
+            'numerology.services.result_store.generate_name_explanation', side_effect=[EXPLANATION, refreshed]
+        ):
+            tasks.generate_name_report(str(self.alice.id), 'Ada Lovelace', 'birth', 'pythagorean')
+            second = tasks.generate_name_report(
+                str(self.bob.id), 'Ada Lovelace', 'birth', 'pythagorean', force_refresh=True
+            )
+
+        self.assertEqual(NameReport.objects.get(id=second['report_id']).explanation['short_summary'], 'Refreshed.')
+        self.assertEqual(NumerologyResult.objects.get().explanation, EXPLANATION['explanation'])
+
+    def test_different_inputs_are_not_shared(self):
+        """Name type and system are part of the digest."""
+        with mock.patch(
+            'numerology.services.result_store.generate_name_explanation', return_value=EXPLANATION
+        ) as explain:
+            tasks.generate_name_report(str(self.alice.id), 'Ada Lovelace', 'birth', 'pythagorean')
+            tasks.generate_name_report(str(self.bob.id), 'Ada Lovelace', 'birth', 'chaldean')
+            tasks.generate_name_report(str(self.bob.id), 'Ada Lovelace', 'current', 'pythagorean')
+
+        self.assertEqual(explain.call_count, 3)
+        self.assertEqual(NumerologyResult.objects.count(), 3)
+
+    def test_failed_explanation_is_retried_on_next_request(self):
+        """A stored LLM failure is not shared; the next request re-explains and fixes the row."""
+        failure = {'error': 'LLM service not available', 'explanation': None}
+        with mock.patch(
+            'numerology.services.result_store.generate_name_explanation', side_effect=[failure, EXPLANATION]
+        ):
+            tasks.generate_name_report(str(self.alice.id), 'Ada Lovelace', 'birth', 'pythagorean')
+            second = tasks.generate_name_report(str(self.bob.id), 'Ada Lovelace', 'birth', 'pythagorean')
+
+        shared = NumerologyResult.objects.get()
+        self.assertEqual(shared.explanation, EXPLANATION['explanation'])
+        self.assertEqual(shared.tokens_used, 300)
+        self.assertIsNone(NameReport.objects.get(id=second['report_id']).explanation_error)
+
+    def test_phone_results_are_shared_only_when_persisted(self):
+        """Unsaved lookups reuse stored results but never add phone numbers to the store."""
+        with mock.patch(
+            'numerology.services.result_store.generate_phone_explanation', return_value=EXPLANATION
+        ) as explain:
+            preview = tasks.generate_phone_report(str(self.alice.id), '+1 (415) 555-2671', persist=False)
+            self.assertEqual(NumerologyResult.objects.count(), 0)
+
+            tasks.generate_phone_report(str(self.alice.id), '+1 (415) 555-2671')
+            saved = tasks.generate_phone_report(str(self.bob.id), '+14155552671')
+
+        self.assertEqual(preview['status'], 'computed')
+        self.assertEqual(explain.call_count, 2)
+        report = PhoneReport.objects.get(id=saved['report_id'])
+        self.assertEqual(report.shared_result.inputs['phone_e164'], '+14155552671')
+        self.assertEqual(report.explanation, EXPLANATION['explanation'])
+        self.assertEqual(get_metric('numerology_result_store.hit', kind='phone'), 1)
@@ -0,0 +1,148 @@
+"""
+Unit tests for the semantic explanation cache.
+"""
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from accounts.models import User
+from numerology.models import Explanation
+from numerology.services import semantic_cache
+from numerology.services.explanation_generator import ExplanationGenerator
+from utils.metrics import get_metric
+
+
+def make_daily_reading(**overrides):
+    reading = {
+        'personal_day_number': 5,
+        'lucky_color': 'Green',
+        'activity_recommendation': 'Try something new and embrace change today.',
+        'affirmation': 'I welcome change with curiosity.',
+        'warning': 'Avoid impulsive decisions.',
+        'reading_date': '2024-03-10',
+    }
+    reading.update(overrides)
+    return reading
+
+
+def make_profile(**overrides):
+    profile = {
+        'life_path_number': 7, 'destiny_number': 3, 'soul_urge_number': 5,
+        'personality_number': 1, 'attitude_number': 2, 'maturity_number': 1,
+        'balance_number': 4, 'personal_year_number': 9, 'personal_month_number': 6,
+    }
+    profile.update(overrides)
+    return profile
+
+
+class SemanticExplanationCacheTest(TestCase):
+    """Test cases for reusing explanations across similar contexts."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        cache.clear()
+        semantic_cache.reset_indexes()
+        self.addCleanup(semantic_cache.reset_indexes)
+        self.first_user = User.objects.create(email='first@example.com', full_name='First User')
+        self.second_user = User.objects.create(email='second@example.com', full_name='Second User')
+
+        self.llm = mock.Mock()
+        self.llm.is_available.return_value = True
+        self.llm.generate_explanation.return_value = {
+            'content': 'Day 5 invites movement for a reflective Life Path 7.',
+            'tokens_used': 320,
+            'cost': 0.01,
+            'model': 'gpt-4',
+            'provider': 'openai',
+        }
+        patcher = mock.patch(
+            'numerology.services.explanation_generator.get_llm_service', return_value=self.llm
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.generator = ExplanationGenerator()
+
+    def test_hashing_embedder_is_deterministic(self):
+        """Identical contexts produce identical unit vectors."""
+        embedder = semantic_cache.HashingEmbedder()
+        features = semantic_cache.context_features('daily', make_daily_reading(), make_profile())
+        first = embedder.embed(features)
+        self.assertEqual(first.tolist(), embedder.embed(features).tolist())
+        self.assertAlmostEqual(float(first @ first), 1.0, places=5)
+
+    def test_near_identical_context_reuses_explanation(self):
+        """A second user with a near-identical context gets the stored reply without an LLM call."""
+        original = self.generator.generate_daily_explanation(
+            self.first_user, make_daily_reading(), make_profile()
+        )
+        self.assertEqual(original.embedding['model'], semantic_cache.HashingEmbedder.name)
+
+        # Only the reading date differs, so the exact cache key misses.
+        reused = self.generator.generate_daily_explanation(
+            self.second_user, make_daily_reading(reading_date='2024-03-19'), make_profile()
+        )
+
+        self.assertEqual(self.llm.generate_explanation.call_count, 1)
+        self.assertNotEqual(reused.id, original.id)
+        self.assertEqual(reused.user, self.second_user)
+        self.assertEqual(reused.content, original.content)
+        self.assertTrue(reused.is_cached)
+        self.assertEqual(reused.tokens_used, 0)
+        self.assertEqual(reused.context_data['semantic_cache']['source_id'], str(original.id))
+        self.assertEqual(get_metric('explanation_semantic_cache.hit', explanation_type='daily'), 1)
+        self.assertEqual(get_metric('explanation_semantic_cache.tokens_saved', explanation_type='daily'), 320)
+
+    def test_different_context_calls_llm(self):
+        """A different personal day number falls below the threshold."""
+        self.generator.generate_daily_explanation(
+            self.first_user, make_daily_reading(), make_profile()
+        )
+        self.generator.generate_daily_explanation(
+            self.second_user,
+            make_daily_reading(
+                personal_day_number=8,
+                lucky_color='Gold',
+                activity_recommendation='Focus on finances and long-term goals.',
+                affirmation='I build lasting abundance.',
+            ),
+            make_profile(life_path_number=4),
+        )
+
+        self.assertEqual(self.llm.generate_explanation.call_count, 2)
+        self.assertEqual(Explanation.objects.filter(is_cached=True).count(), 0)
+        self.assertEqual(get_metric('explanation_semantic_cache.miss', explanation_type='daily'), 2)
+
+    def test_other_explanation_types_are_not_reused(self):
+        """Matches are only searched within the same explanation type."""
+        self.generator.generate_weekly_explanation(
+            self.first_user, {'weekly_number': 5, 'main_theme': 'Change'}, make_profile()
+        )
+        self.generator.generate_yearly_explanation(
+            self.second_user, {'personal_year_number': 5, 'main_theme': 'Change'}, make_profile()
+        )
+        self.assertEqual(self.llm.generate_explanation.call_count, 2)
+
+    def test_template_explanations_are_not_indexed(self):
+        """Fallback templates are cheap and never served to other users."""
+        self.llm.is_available.return_value = False
+        explanation = self.generator.generate_daily_explanation(
+            self.first_user, make_daily_reading(), make_profile()
+        )
+        self.assertIsNone(explanation.embedding)
+
+    def test_expired_rows_are_compacted(self):
+        """Expired explanations leave the in-memory index on the next refresh."""
+        self.generator.generate_daily_explanation(self.first_user, make_daily_reading(), make_profile())
+        index = semantic_cache.get_index('daily', self.generator.semantic_cache.embedder)
+        index.refresh()
+        self.assertEqual(len(index), 1)
+
+        # Daily explanations expire after a day
+        later = timezone.now() + timedelta(days=2)
+        with mock.patch('numerology.services.semantic_cache.timezone.now', return_value=later):
+            index.refresh()
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index._matrix.shape, (0, index.dimensions))
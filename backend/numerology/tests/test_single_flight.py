@@ -0,0 +1,101 @@
+"""
+Unit tests for single-flight coalescing of LLM generation.
+"""
+import threading
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+
+from accounts.models import User
+from numerology import tasks
+from utils import single_flight as sf
+from utils.metrics import get_metric
+
+
+class SingleFlightTest(SimpleTestCase):
+    """Test cases for the cache-lease single-flight helper."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        cache.clear()
+
+    def test_concurrent_callers_share_one_computation(self):
+        """Only the lease holder computes; everyone else receives its result."""
+        calls = []
+        release = threading.Event()
+
+        def compute():
+            calls.append(1)
+            release.wait(5)
+            return {'content': 'shared'}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(
+                sf.single_flight('key', compute, operation='test', poll_interval=0.01)
+            ))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'content': 'shared'}] * 8)
+        self.assertEqual(get_metric('single_flight.leader', operation='test'), 1)
+        self.assertEqual(get_metric('single_flight.coalesced', operation='test'), 7)
+        self.assertIsNone(cache.get(sf._lease_key('key')))
+
+    def test_expired_lease_is_taken_over(self):
+        """A waiter takes over once an abandoned lease expires."""
+        cache.add(sf._lease_key('key'), 'crashed-worker', 1)
+
+        result = sf.single_flight('key', lambda: 'recovered', operation='test', poll_interval=0.05)
+
+        self.assertEqual(result, 'recovered')
+        self.assertEqual(get_metric('single_flight.takeover', operation='test'), 1)
+
+    def test_failed_leader_releases_lease(self):
+        """Errors propagate to the leader and the next caller computes afresh."""
+        with self.assertRaises(RuntimeError):
+            sf.single_flight('key', mock.Mock(side_effect=RuntimeError('LLM down')), operation='test')
+
+        self.assertEqual(sf.single_flight('key', lambda: 'retry', operation='test'), 'retry')
+
+    def test_waiter_computes_after_timeout(self):
+        """A stuck leader never blocks callers beyond wait_timeout."""
+        cache.add(sf._lease_key('key'), 'stuck-worker', 60)
+
+        result = sf.single_flight(
+            'key', lambda: 'own', operation='test', wait_timeout=0.1, poll_interval=0.01
+        )
+
+        self.assertEqual(result, 'own')
+        self.assertEqual(get_metric('single_flight.timeout', operation='test'), 1)
+
+
+class ReportSingleFlightTest(TestCase):
+    """Test cases for coalescing report tasks."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        cache.clear()
+        self.user = User.objects.create(email='flight@example.com', full_name='Flight User')
+
+    def test_name_report_waits_for_in_flight_generation(self):
+        """A duplicate request returns the in-flight report instead of calling the LLM again."""
+        key = f'name_report:{self.user.id}:Ada Lovelace:birth:pythagorean:False'
+        cache.add(sf._lease_key(key), 'leader', 60)
+        cache.set(sf._result_key(key, 'leader'), {'report_id': 'r1', 'status': 'completed'}, 60)
+
+        with mock.patch('numerology.services.result_store.generate_name_explanation') as explain:
+            result = tasks.generate_name_report(str(self.user.id), 'Ada Lovelace', 'birth', 'pythagorean')
+
+        self.assertEqual(result, {'report_id': 'r1', 'status': 'completed'})
+        explain.assert_not_called()
+        self.assertEqual(get_metric('single_flight.coalesced', operation='name_report'), 1)
@@ -0,0 +1,96 @@
+"""
+Tests for Celery queue routing and queue-latency metrics.
+"""
+import time
+from datetime import datetime, timedelta, timezone
+
+from celery.app.task import Context
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from ai_chat.tasks import summarize_conversation
+from consultations.tasks import send_consultation_reminders
+from numerai.celery import app
+from numerology import tasks
+from utils import metrics
+from utils.task_metrics import PUBLISHED_AT_HEADER, queue_latency_ms, record_queue_latency
+
+
+def _queue(task):
+    return app.amqp.router.route({}, task.name)['queue'].name
+
+
+class TaskRoutingTest(SimpleTestCase):
+    """Test cases for routing tasks to queues by workload class."""
+
+    def test_tasks_route_by_workload(self):
+        self.assertEqual(_queue(send_consultation_reminders), 'priority')
+        for task in (tasks.generate_daily_readings, tasks.generate_weekly_reports_chunk,
+                     tasks.generate_yearly_reports_chunk, tasks.import_people_file):
+            self.assertEqual(_queue(task), 'batch', task.name)
+        for task in (tasks.generate_name_report, tasks.generate_phone_report,
+                     tasks.generate_detailed_readings_for_profile, summarize_conversation):
+            self.assertEqual(_queue(task), 'llm', task.name)
+        self.assertEqual(_queue(tasks.send_daily_reading_notifications), 'notifications')
+        self.assertEqual(app.amqp.router.route({}, 'accounts.tasks.cleanup_expired_otps')['queue'].name, 'default')
+
+    def test_routes_use_declared_queues(self):
+        declared = {queue.name for queue in app.conf.task_queues}
+        self.assertIn(app.conf.task_default_queue, declared)
+        self.assertLessEqual({route['queue'] for route in settings.CELERY_TASK_ROUTES.values()}, declared)
+
+    def test_acks_follow_queue(self):
+        self.assertTrue(tasks.import_people_file.acks_late)
+        self.assertTrue(tasks.generate_name_report.acks_late)
+        self.assertFalse(tasks.send_daily_reading_notifications.acks_late)
+        self.assertFalse(send_consultation_reminders.acks_late)
+
+    def test_published_message_is_routed_and_stamped(self):
+        before = time.time()
+        with app.connection_for_write('memory://') as connection:
+            tasks.generate_phone_report.apply_async(('user', '+14155550100'), connection=connection, ignore_result=True)
+            queue = connection.SimpleQueue('llm')
+            try:
+                message = queue.get(timeout=1)
+            finally:
+                queue.close()
+
+        self.assertEqual(message.headers['task'], tasks.generate_phone_report.name)
+        self.assertGreaterEqual(message.headers[PUBLISHED_AT_HEADER], before)
+
+
+class QueueLatencyTest(SimpleTestCase):
+    """Test cases for the queue-latency metric."""
+
+    def setUp(self):
+        cache.clear()
+
+    def _run_prerun(self, task, **request):
+        task.push_request(**request)
+        try:
+            record_queue_latency(task=task)
+        finally:
+            task.pop_request()
+
+    def test_latency_recorded_per_queue_and_task(self):
+        task = tasks.import_people_file
+        self._run_prerun(task, published_at=time.time() - 2, delivery_info={'routing_key': 'batch'})
+
+        tags = {'queue': 'batch', 'task': task.name}
+        self.assertEqual(metrics.get_metric('celery.queue_latency_ms.count', **tags), 1)
+        self.assertAlmostEqual(metrics.get_metric('celery.queue_latency_ms.sum', **tags), 2000, delta=500)
+
+    def test_eager_tasks_are_not_measured(self):
+        task = tasks.import_people_file
+        self._run_prerun(task, delivery_info={'routing_key': 'batch'})
+        self.assertEqual(metrics.get_metric('celery.queue_latency_ms.count', queue='batch', task=task.name), 0)
+
+    def test_countdown_measured_from_eta(self):
+        now = time.time()
+        eta = datetime.fromtimestamp(now - 1, tz=timezone.utc)
+        request = Context(published_at=now - 61, eta=eta.isoformat())
+        self.assertAlmostEqual(queue_latency_ms(request, now=now), 1000, delta=1)
+
+        future = (datetime.fromtimestamp(now, tz=timezone.utc) + timedelta(seconds=5)).isoformat()
+        self.assertEqual(queue_latency_ms(Context(published_at=now, eta=future), now=now), 0)
@@ -29,6 +29,8 @@ urlpatterns = [
     
     # Multi-person numerology endpoints
     path('people/', views.people_list_create, name='people-list-create'),
+    path('people/import/', views.import_people, name='people-import'),
+    path('people/import/<uuid:import_id>/', views.people_import_status, name='people-import-status'),
     path('people/<uuid:person_id>/', views.person_detail, name='person-detail'),
     path('people/<uuid:person_id>/calculate/', views.calculate_person_numerology, name='calculate-person-numerology'),
     path('people/<uuid:person_id>/profile/', views.get_person_numerology_profile, name='person-numerology-profile'),
@@ -78,6 +80,7 @@ urlpatterns = [
     path('phone-numerology/<uuid:user_id>/<uuid:report_id>/', views.get_phone_report, name='get-phone-report'),
     path('phone-numerology/<uuid:user_id>/latest/', views.get_latest_phone_report, name='get-latest-phone-report'),
     path('phone-numerology/compatibility/', views.check_phone_compatibility, name='check-phone-compatibility'),
+    path('phone-numerology/rank/', views.rank_phone_numbers, name='rank-phone-numbers'),
     
     # Enhanced Cycles endpoints
     path('numerology/essence-cycles/', views.get_essence_cycles, name='essence-cycles'),
@@ -119,6 +122,7 @@ urlpatterns = [
     path('numerology/timing/best-dates/', views.find_best_dates, name='find-best-dates'),
     path('numerology/timing/danger-dates/', views.find_danger_dates, name='find-danger-dates'),
     path('numerology/timing/optimize/', views.optimize_event_timing, name='optimize-event-timing'),
+    path('numerology/timing/joint-dates/', views.find_joint_dates, name='find-joint-dates'),
     path('numerology/timing/global-influences/', views.analyze_global_influences, name='global-influences'),
     path('numerology/timing/compatibility/', views.calculate_timing_compatibility, name='timing-compatibility'),
     
@@ -0,0 +1,124 @@
+"""
+API views for NumerAI numerology application.
+
+Views are split into per-domain modules that import only the services and
+libraries their own endpoints use. Every view is still available as
+``numerology.views.<name>``; its module is imported on first access, so
+code that needs one view (a test, a task, a management command) does not
+load the rest.
+"""
+import importlib
+
+# View names by the module defining them
+_MODULE_VIEWS = {
+    'core': (
+        'calculate_numerology_profile', 'get_numerology_profile', 'get_birth_chart', 'get_life_path_analysis',
+        'health_check',
+    ),
+    'lo_shu': (
+        'get_lo_shu_grid', 'compare_lo_shu_grids', 'get_lo_shu_arrows', 'get_lo_shu_remedies',
+        'get_lo_shu_visualization',
+    ),
+    'readings': (
+        'get_daily_reading', 'get_reading_history',
+    ),
+    'cycles': (
+        'get_pinnacles_detailed', 'get_pinnacles_timeline', 'get_challenge_remedies', 'get_essence_cycles',
+        'get_cycle_timeline', 'get_universal_cycles', 'get_personal_hour', 'get_cycle_transitions',
+        'get_cycle_alerts', 'calculate_cycle_compatibility',
+    ),
+    'compatibility': (
+        'check_compatibility', 'detailed_compatibility_breakdown', 'relationship_timeline_predictions',
+        'conflict_resolution_guidance', 'communication_style_analysis', 'get_compatibility_history',
+    ),
+    'remedies': (
+        'get_personalized_remedies', 'track_remedy', 'get_remedy_tracking_data',
+        'submit_remedy_effectiveness', 'get_remedy_effectiveness', 'get_remedy_combinations',
+        'create_remedy_reminder', 'get_remedy_reminders', 'delete_remedy_reminder',
+    ),
+    'reports': (
+        'export_birth_chart_pdf', 'get_full_numerology_report', 'export_full_numerology_report_pdf',
+        'get_weekly_report', 'get_yearly_report',
+    ),
+    'people': (
+        'people_list_create', 'import_people', 'people_import_status', 'person_detail',
+        'calculate_person_numerology', 'get_person_numerology_profile',
+    ),
+    'raj_yog': (
+        'get_raj_yog_detection', 'generate_raj_yog_explanation', 'get_explanation',
+    ),
+    'names': (
+        'generate_name_numerology', 'get_name_report', 'get_latest_name_report', 'preview_name_numerology',
+        'analyze_name_correction',
+    ),
+    'phone': (
+        'generate_phone_numerology', 'preview_phone_numerology', 'get_phone_report',
+        'get_latest_phone_report', 'check_phone_compatibility', 'rank_phone_numbers',
+    ),
+    'assets': (
+        'calculate_vehicle_numerology', 'calculate_property_numerology', 'calculate_business_numerology',
+        'optimize_business_name', 'calculate_launch_dates', 'analyze_business_cycles',
+        'calculate_financial_timing', 'analyze_team_compatibility', 'calculate_phone_numerology_asset',
+    ),
+    'relationships': (
+        'calculate_enhanced_compatibility', 'compare_multiple_partners', 'calculate_marriage_harmony_cycles',
+    ),
+    'timing': (
+        'find_best_dates', 'find_danger_dates', 'optimize_event_timing', 'find_joint_dates',
+        'analyze_global_influences', 'calculate_timing_compatibility',
+    ),
+    'health': (
+        'calculate_health_cycles', 'calculate_medical_timing', 'calculate_emotional_vulnerabilities',
+        'get_health_analysis', 'get_health_risk_periods', 'analyze_health_compatibility',
+        'get_health_numerology',
+    ),
+    'generational': (
+        'generational_family_analysis', 'get_generational_family_analysis', 'generational_karmic_contract',
+        'get_karmic_contracts', 'get_generational_patterns', 'get_family_compatibility_matrix',
+    ),
+    'feng_shui': (
+        'feng_shui_analyze', 'get_feng_shui_analysis', 'feng_shui_optimize_space', 'get_energy_flow',
+        'get_room_numerology', 'check_direction_compatibility',
+    ),
+    'mental_state': (
+        'mental_state_track', 'get_mental_state_history', 'mental_state_analyze', 'get_stress_patterns',
+        'get_wellbeing_recommendations', 'get_mood_predictions', 'get_emotional_compatibility',
+    ),
+    'spiritual': (
+        'get_spiritual_numerology', 'get_soul_contracts', 'get_karmic_timeline', 'get_rebirth_cycles',
+        'get_divine_gifts', 'get_meditation_timing',
+    ),
+    'predictive': (
+        'get_predictive_numerology', 'get_9_year_cycle', 'get_breakthrough_years', 'get_crisis_years',
+        'get_opportunity_periods', 'get_life_milestones', 'get_yearly_forecast',
+    ),
+    'analysis': (
+        'get_chaldean_analysis', 'get_detailed_lo_shu_grid', 'get_zodiac_numerology',
+        'get_enhanced_attitude_number', 'get_complete_core_numbers',
+    ),
+    'visualization': (
+        'get_numerology_wheel', 'get_numerology_timeline', 'get_numerology_comparison_charts',
+        'get_numerology_heatmap', 'get_3d_numerology_visualization',
+    ),
+    'dashboard': (
+        'get_dashboard_insights', 'get_dashboard_quick_actions', 'get_dashboard_activity',
+        'get_dashboard_recommendations',
+    ),
+}
+
+_VIEW_MODULES = {name: module for module, names in _MODULE_VIEWS.items() for name in names}
+
+__all__ = sorted(_VIEW_MODULES)
+
+
+def __getattr__(name):
+    module = _VIEW_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    view = getattr(importlib.import_module(f'{__name__}.{module}'), name)
+    globals()[name] = view
+    return view
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_VIEW_MODULES))
@@ -0,0 +1,468 @@
+"""
+API views for Chaldean, detailed Lo Shu, zodiac and core number analysis endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from django.utils import timezone
+from ..models import NumerologyProfile
+from ..numerology import NumerologyCalculator
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_chaldean_analysis(request):
+    """
+    Get Chaldean numerology analysis including Driver, Conductor, and Birthday numbers.
+    
+    This endpoint provides DivineAPI-style Chaldean numerology insights:
+    - Driver Number (Psychic Number): Your inner self and how you see yourself
+    - Conductor Number: How others perceive you and your life's direction
+    - Birthday Number: Your inherent talents and abilities
+    - Driver-Conductor Compatibility: Harmony analysis between inner and outer self
+    """
+    # #region agent log
+    import json
+    import os
+    log_data = {
+        'location': 'backend/numerology/views.py:4465',
+        'message': 'get_chaldean_analysis called',
+        'data': {'user_id': str(request.user.id) if request.user.is_authenticated else 'anonymous', 'path': request.path},
+        'timestamp': int(timezone.now().timestamp() * 1000),
+        'sessionId': 'debug-session',
+        'runId': 'run1',
+        'hypothesisId': 'B'
+    }
+    try:
+        with open('/Users/burhanahmed/Desktop/NumerAI/.cursor/debug.log', 'a') as f:
+            f.write(json.dumps(log_data) + '\n')
+    except: pass
+    # #endregion
+    from ..interpretations import (
+        get_driver_interpretation, 
+        get_conductor_interpretation, 
+        get_birthday_interpretation
+    )
+    
+    user = request.user
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        
+        # Get birth date
+        if not hasattr(user, 'profile') or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Birth date is required for Chaldean analysis.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        birth_date = user.profile.date_of_birth
+        
+        # Calculate Chaldean numbers
+        calculator = NumerologyCalculator(profile.calculation_system)
+        
+        driver_number = calculator.calculate_driver_number(birth_date)
+        conductor_number = calculator.calculate_conductor_number(birth_date)
+        birthday_number = calculator.calculate_birthday_number(birth_date)
+        driver_conductor_compatibility = calculator.calculate_driver_conductor_compatibility(birth_date)
+        
+        # Get interpretations
+        driver_interpretation = get_driver_interpretation(driver_number)
+        conductor_interpretation = get_conductor_interpretation(conductor_number)
+        birthday_interpretation = get_birthday_interpretation(birthday_number)
+        
+        # Update profile with new numbers if not already set
+        updated = False
+        if profile.driver_number != driver_number:
+            profile.driver_number = driver_number
+            updated = True
+        if profile.conductor_number != conductor_number:
+            profile.conductor_number = conductor_number
+            updated = True
+        if profile.birthday_number != birthday_number:
+            profile.birthday_number = birthday_number
+            updated = True
+        
+        if updated:
+            profile.save()
+        
+        response_data = {
+            'driver_number': {
+                'number': driver_number,
+                'interpretation': driver_interpretation
+            },
+            'conductor_number': {
+                'number': conductor_number,
+                'interpretation': conductor_interpretation
+            },
+            'birthday_number': {
+                'number': birthday_number,
+                'interpretation': birthday_interpretation
+            },
+            'driver_conductor_compatibility': driver_conductor_compatibility,
+            'calculation_system': profile.calculation_system,
+            'birth_date': birth_date.isoformat()
+        }
+        
+        return Response(response_data, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Numerology profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_detailed_lo_shu_grid(request):
+    """
+    Get enhanced Lo Shu Grid with personality arrows, missing/repeating number analysis.
+    
+    This endpoint provides DivineAPI-style Lo Shu Grid analysis:
+    - 3x3 Grid visualization data
+    - Missing numbers with karmic lessons
+    - Repeating numbers with strength/overemphasis analysis
+    - Personality Arrows (8 directional patterns)
+    - Detailed interpretations for each aspect
+    """
+    # #region agent log
+    import json
+    import os
+    log_data = {
+        'location': 'backend/numerology/views.py:4550',
+        'message': 'get_detailed_lo_shu_grid called',
+        'data': {'user_id': str(request.user.id) if request.user.is_authenticated else 'anonymous', 'path': request.path},
+        'timestamp': int(timezone.now().timestamp() * 1000),
+        'sessionId': 'debug-session',
+        'runId': 'run1',
+        'hypothesisId': 'C'
+    }
+    try:
+        with open('/Users/burhanahmed/Desktop/NumerAI/.cursor/debug.log', 'a') as f:
+            f.write(json.dumps(log_data) + '\n')
+    except: pass
+    # #endregion
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    # Check subscription access for enhanced features
+    has_premium = can_access_feature(user, 'numerology_lo_shu_visualization')
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        
+        # Get user info
+        user_full_name = None
+        if hasattr(user, 'full_name') and user.full_name:
+            user_full_name = user.full_name
+        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        if not user_full_name or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Full name and birth date are required for Lo Shu Grid calculation.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        birth_date = user.profile.date_of_birth
+        
+        # Calculate enhanced Lo Shu Grid
+        calculator = NumerologyCalculator(profile.calculation_system)
+        lo_shu_data = calculator.calculate_lo_shu_grid(user_full_name, birth_date)
+        
+        # Save personality arrows to profile
+        if lo_shu_data.get('personality_arrows'):
+            profile.personality_arrows = lo_shu_data['personality_arrows']
+            profile.lo_shu_grid = {
+                'grid': lo_shu_data.get('grid', {}),
+                'missing_numbers': lo_shu_data.get('missing_numbers', []),
+                'strong_numbers': lo_shu_data.get('strong_numbers', []),
+                'repeating_numbers': lo_shu_data.get('repeating_numbers', []),
+                'number_frequency': lo_shu_data.get('number_frequency', {}),
+                'interpretation': lo_shu_data.get('interpretation', '')
+            }
+            profile.save()
+        
+        # Build response
+        response_data = {
+            'grid': lo_shu_data.get('grid', {}),
+            'number_frequency': lo_shu_data.get('number_frequency', {}),
+            'missing_numbers': lo_shu_data.get('missing_numbers', []),
+            'strong_numbers': lo_shu_data.get('strong_numbers', []),
+            'repeating_numbers': lo_shu_data.get('repeating_numbers', []),
+            'interpretation': lo_shu_data.get('interpretation', ''),
+            'has_premium_access': has_premium
+        }
+        
+        # Add premium features if user has access
+        if has_premium:
+            response_data['missing_number_details'] = lo_shu_data.get('missing_number_details', [])
+            response_data['repeating_number_details'] = lo_shu_data.get('repeating_number_details', [])
+            response_data['personality_arrows'] = lo_shu_data.get('personality_arrows', [])
+        else:
+            # Provide limited preview for non-premium users
+            response_data['missing_number_details'] = lo_shu_data.get('missing_number_details', [])[:2]
+            response_data['repeating_number_details'] = lo_shu_data.get('repeating_number_details', [])[:1]
+            response_data['personality_arrows'] = lo_shu_data.get('personality_arrows', [])[:2]
+            response_data['premium_preview'] = True
+            response_data['upgrade_message'] = 'Upgrade to Premium to see all personality arrows and detailed interpretations.'
+        
+        return Response(response_data, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Numerology profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_zodiac_numerology(request):
+    """
+    Get zodiac-numerology integration with planetary associations.
+    
+    This endpoint provides DivineAPI-style zodiac-numerology insights:
+    - Zodiac sign based on birth date
+    - Ruling planet for life path number
+    - Birth day planet association
+    - Zodiac-numerology compatibility analysis
+    - Lucky elements (day, color, gemstone)
+    - Planetary periods based on numerology cycles
+    """
+    # #region agent log
+    import json
+    import os
+    log_data = {
+        'location': 'backend/numerology/views.py:4636',
+        'message': 'get_zodiac_numerology called',
+        'data': {'user_id': str(request.user.id) if request.user.is_authenticated else 'anonymous', 'path': request.path},
+        'timestamp': int(timezone.now().timestamp() * 1000),
+        'sessionId': 'debug-session',
+        'runId': 'run1',
+        'hypothesisId': 'D'
+    }
+    try:
+        with open('/Users/burhanahmed/Desktop/NumerAI/.cursor/debug.log', 'a') as f:
+            f.write(json.dumps(log_data) + '\n')
+    except: pass
+    # #endregion
+    from ..services.zodiac_numerology import ZodiacNumerologyService
+    
+    user = request.user
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        
+        # Get birth date
+        if not hasattr(user, 'profile') or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Birth date is required for zodiac-numerology analysis.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        birth_date = user.profile.date_of_birth
+        
+        # Initialize service
+        service = ZodiacNumerologyService(system=profile.calculation_system)
+        
+        # Get full zodiac-numerology profile
+        zodiac_profile = service.get_full_zodiac_numerology_profile(
+            birth_date=birth_date,
+            life_path_number=profile.life_path_number,
+            driver_number=profile.driver_number,
+            conductor_number=profile.conductor_number
+        )
+        
+        # Get planetary periods
+        planetary_periods = service.get_planetary_periods(birth_date)
+        
+        # Save zodiac data to profile
+        profile.zodiac_planet_data = zodiac_profile
+        profile.save()
+        
+        response_data = {
+            **zodiac_profile,
+            'planetary_periods': planetary_periods,
+            'life_path_number': profile.life_path_number,
+            'calculation_system': profile.calculation_system
+        }
+        
+        return Response(response_data, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Numerology profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_enhanced_attitude_number(request):
+    """
+    Get enhanced Attitude Number analysis with detailed interpretation.
+    
+    The Attitude Number reveals your default approach to life and 
+    how you initially come across to others.
+    """
+    from ..interpretations import get_attitude_interpretation
+    
+    user = request.user
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        
+        # Get birth date
+        if not hasattr(user, 'profile') or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Birth date is required for attitude number analysis.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        birth_date = user.profile.date_of_birth
+        
+        # Calculate attitude number
+        calculator = NumerologyCalculator(profile.calculation_system)
+        attitude_number = calculator.calculate_attitude_number(birth_date)
+        
+        # Get enhanced interpretation
+        interpretation = get_attitude_interpretation(attitude_number)
+        
+        response_data = {
+            'attitude_number': attitude_number,
+            'interpretation': interpretation,
+            'birth_month': birth_date.month,
+            'birth_day': birth_date.day,
+            'calculation': f"{birth_date.month} + {birth_date.day} = {birth_date.month + birth_date.day} → {attitude_number}"
+        }
+        
+        return Response(response_data, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Numerology profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_complete_core_numbers(request):
+    """
+    Get all core numbers with DivineAPI-style comprehensive interpretations.
+    
+    This endpoint provides a complete numerology profile including:
+    - Life Path, Destiny, Soul Urge, Personality (standard)
+    - Attitude, Birthday, Maturity, Balance (enhanced)
+    - Driver, Conductor (Chaldean)
+    - All with detailed interpretations
+    """
+    from ..interpretations import (
+        get_interpretation,
+        get_birthday_interpretation,
+        get_driver_interpretation,
+        get_conductor_interpretation,
+        get_attitude_interpretation
+    )
+    
+    user = request.user
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        
+        # Get birth date
+        if not hasattr(user, 'profile') or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Birth date is required for complete core numbers.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        birth_date = user.profile.date_of_birth
+        
+        # Get user name
+        user_full_name = None
+        if hasattr(user, 'full_name') and user.full_name:
+            user_full_name = user.full_name
+        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        # Calculate all numbers
+        calculator = NumerologyCalculator(profile.calculation_system)
+        
+        # Ensure all numbers are calculated
+        if not profile.driver_number:
+            profile.driver_number = calculator.calculate_driver_number(birth_date)
+        if not profile.conductor_number:
+            profile.conductor_number = calculator.calculate_conductor_number(birth_date)
+        if not profile.birthday_number:
+            profile.birthday_number = calculator.calculate_birthday_number(birth_date)
+        profile.save()
+        
+        # Build comprehensive response
+        core_numbers = {
+            'life_path': {
+                'number': profile.life_path_number,
+                'interpretation': get_interpretation(profile.life_path_number) if profile.life_path_number in [1,2,3,4,5,6,7,8,9,11,22,33] else None
+            },
+            'destiny': {
+                'number': profile.destiny_number,
+                'interpretation': get_interpretation(profile.destiny_number) if profile.destiny_number in [1,2,3,4,5,6,7,8,9,11,22,33] else None
+            },
+            'soul_urge': {
+                'number': profile.soul_urge_number,
+                'interpretation': get_interpretation(profile.soul_urge_number) if profile.soul_urge_number in [1,2,3,4,5,6,7,8,9,11,22,33] else None
+            },
+            'personality': {
+                'number': profile.personality_number,
+                'interpretation': get_interpretation(profile.personality_number) if profile.personality_number in [1,2,3,4,5,6,7,8,9,11,22,33] else None
+            },
+            'attitude': {
+                'number': profile.attitude_number,
+                'interpretation': get_attitude_interpretation(profile.attitude_number)
+            },
+            'birthday': {
+                'number': profile.birthday_number,
+                'interpretation': get_birthday_interpretation(profile.birthday_number)
+            },
+            'maturity': {
+                'number': profile.maturity_number,
+                'interpretation': get_interpretation(profile.maturity_number) if profile.maturity_number in [1,2,3,4,5,6,7,8,9,11,22,33] else None
+            },
+            'balance': {
+                'number': profile.balance_number,
+                'interpretation': get_interpretation(profile.balance_number) if profile.balance_number in [1,2,3,4,5,6,7,8,9,11,22,33] else None
+            },
+            'driver': {
+                'number': profile.driver_number,
+                'interpretation': get_driver_interpretation(profile.driver_number)
+            },
+            'conductor': {
+                'number': profile.conductor_number,
+                'interpretation': get_conductor_interpretation(profile.conductor_number)
+            }
+        }
+        
+        # Add personal cycles
+        personal_cycles = {
+            'personal_year': profile.personal_year_number,
+            'personal_month': profile.personal_month_number,
+        }
+        
+        response_data = {
+            'user_name': user_full_name,
+            'birth_date': birth_date.isoformat(),
+            'calculation_system': profile.calculation_system,
+            'core_numbers': core_numbers,
+            'personal_cycles': personal_cycles,
+            'enhanced_numbers': {
+                'karmic_debt': profile.karmic_debt_number,
+                'hidden_passion': profile.hidden_passion_number,
+                'subconscious_self': profile.subconscious_self_number
+            }
+        }
+        
+        return Response(response_data, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Numerology profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,425 @@
+"""
+API views for asset numerology endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from datetime import datetime
+from ..models import NumerologyProfile
+from ..services.asset_numerology import AssetNumerologyService
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def calculate_vehicle_numerology(request):
+    """Calculate numerology for a vehicle."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_vehicle'):
+        return Response({
+            'error': 'Vehicle numerology is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_vehicle'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    license_plate = request.data.get('license_plate')
+    if not license_plate:
+        return Response({
+            'error': 'License plate is required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        service = AssetNumerologyService()
+        user_profile = getattr(user, 'numerology_profile', None)
+        
+        owner_life_path = None
+        if user_profile:
+            owner_life_path = user_profile.life_path_number
+        
+        owner_dob = None
+        if hasattr(user, 'profile') and user.profile.date_of_birth:
+            owner_dob = user.profile.date_of_birth
+        
+        result = service.calculate_vehicle_numerology(
+            license_plate,
+            owner_dob,
+            owner_life_path
+        )
+        
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error calculating vehicle numerology: {str(e)}")
+        return Response({
+            'error': f'Failed to calculate vehicle numerology: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def calculate_property_numerology(request):
+    """Calculate numerology for a property."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_property'):
+        return Response({
+            'error': 'Property numerology is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_property'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    house_number = request.data.get('house_number')
+    if not house_number:
+        return Response({
+            'error': 'House number is required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        service = AssetNumerologyService()
+        user_profile = getattr(user, 'numerology_profile', None)
+        
+        owner_life_path = None
+        if user_profile:
+            owner_life_path = user_profile.life_path_number
+        
+        owner_dob = None
+        if hasattr(user, 'profile') and user.profile.date_of_birth:
+            owner_dob = user.profile.date_of_birth
+        
+        floor_number = request.data.get('floor_number')
+        if floor_number:
+            floor_number = int(floor_number)
+        
+        result = service.calculate_property_numerology(
+            str(house_number),
+            floor_number,
+            owner_dob,
+            owner_life_path
+        )
+        
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error calculating property numerology: {str(e)}")
+        return Response({
+            'error': f'Failed to calculate property numerology: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def calculate_business_numerology(request):
+    """Calculate numerology for a business."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_business'):
+        return Response({
+            'error': 'Business numerology is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_business'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    business_name = request.data.get('business_name')
+    if not business_name:
+        return Response({
+            'error': 'Business name is required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        service = AssetNumerologyService()
+        
+        registration_number = request.data.get('registration_number')
+        launch_date_str = request.data.get('launch_date')
+        
+        launch_date = None
+        if launch_date_str:
+            launch_date = datetime.strptime(launch_date_str, '%Y-%m-%d').date()
+        
+        owner_dob = None
+        if hasattr(user, 'profile') and user.profile.date_of_birth:
+            owner_dob = user.profile.date_of_birth
+        
+        result = service.calculate_business_numerology(
+            business_name,
+            registration_number,
+            launch_date,
+            owner_dob
+        )
+        
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error calculating business numerology: {str(e)}")
+        return Response({
+            'error': f'Failed to calculate business numerology: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def optimize_business_name(request):
+    """Optimize business name for better numerology."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_business'):
+        return Response({
+            'error': 'Business numerology is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_business'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    current_name = request.data.get('current_name')
+    target_vibration = request.data.get('target_vibration')
+    business_type = request.data.get('business_type')
+    
+    if not current_name:
+        return Response({
+            'error': 'current_name is required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        service = AssetNumerologyService(profile.calculation_system)
+        result = service.optimize_business_name(
+            current_name,
+            target_vibration,
+            business_type
+        )
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error optimizing business name: {str(e)}")
+        return Response({
+            'error': f'Failed to optimize business name: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def calculate_launch_dates(request):
+    """Calculate optimal launch dates for business."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_business'):
+        return Response({
+            'error': 'Business numerology is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_business'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    owner_birth_date_str = request.data.get('owner_birth_date')
+    business_name = request.data.get('business_name')
+    start_date_str = request.data.get('start_date')
+    end_date_str = request.data.get('end_date')
+    business_type = request.data.get('business_type')
+    
+    if not all([owner_birth_date_str, business_name, start_date_str, end_date_str]):
+        return Response({
+            'error': 'owner_birth_date, business_name, start_date, and end_date are required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        owner_birth_date = datetime.strptime(owner_birth_date_str, '%Y-%m-%d').date()
+        start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
+        end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
+        
+        profile = NumerologyProfile.objects.get(user=user)
+        service = AssetNumerologyService(profile.calculation_system)
+        result = service.calculate_launch_date(
+            owner_birth_date,
+            business_name,
+            start_date,
+            end_date,
+            business_type
+        )
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error calculating launch dates: {str(e)}")
+        return Response({
+            'error': f'Failed to calculate launch dates: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def analyze_business_cycles(request):
+    """Analyze business cycles."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_business'):
+        return Response({
+            'error': 'Business numerology is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_business'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    launch_date_str = request.data.get('launch_date')
+    years_ahead = request.data.get('years_ahead', 10)
+    
+    if not launch_date_str:
+        return Response({
+            'error': 'launch_date is required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        launch_date = datetime.strptime(launch_date_str, '%Y-%m-%d').date()
+        
+        profile = NumerologyProfile.objects.get(user=user)
+        service = AssetNumerologyService(profile.calculation_system)
+        result = service.analyze_business_cycles(launch_date, int(years_ahead))
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error analyzing business cycles: {str(e)}")
+        return Response({
+            'error': f'Failed to analyze business cycles: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def calculate_financial_timing(request):
+    """Calculate optimal financial timing."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_business'):
+        return Response({
+            'error': 'Business numerology is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_business'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    owner_birth_date_str = request.data.get('owner_birth_date')
+    business_name = request.data.get('business_name')
+    start_date_str = request.data.get('start_date')
+    end_date_str = request.data.get('end_date')
+    
+    if not all([owner_birth_date_str, business_name, start_date_str, end_date_str]):
+        return Response({
+            'error': 'owner_birth_date, business_name, start_date, and end_date are required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        owner_birth_date = datetime.strptime(owner_birth_date_str, '%Y-%m-%d').date()
+        start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
+        end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
+        
+        profile = NumerologyProfile.objects.get(user=user)
+        service = AssetNumerologyService(profile.calculation_system)
+        result = service.calculate_financial_timing(
+            owner_birth_date,
+            business_name,
+            start_date,
+            end_date
+        )
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error calculating financial timing: {str(e)}")
+        return Response({
+            'error': f'Failed to calculate financial timing: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def analyze_team_compatibility(request):
+    """Analyze team numerology compatibility."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_business'):
+        return Response({
+            'error': 'Business numerology is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_business'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    business_name = request.data.get('business_name')
+    team_members = request.data.get('team_members', [])
+    
+    if not business_name or not team_members:
+        return Response({
+            'error': 'business_name and team_members are required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        # Convert team members data
+        processed_members = []
+        for member in team_members:
+            birth_date_str = member.get('birth_date')
+            if birth_date_str:
+                birth_date = datetime.strptime(birth_date_str, '%Y-%m-%d').date()
+                processed_members.append({
+                    'name': member.get('name', ''),
+                    'birth_date': birth_date
+                })
+        
+        profile = NumerologyProfile.objects.get(user=user)
+        service = AssetNumerologyService(profile.calculation_system)
+        result = service.analyze_team_compatibility(business_name, processed_members)
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error analyzing team compatibility: {str(e)}")
+        return Response({
+            'error': f'Failed to analyze team compatibility: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def calculate_phone_numerology_asset(request):
+    """Calculate numerology for a phone number (asset version)."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_phone'):
+        return Response({
+            'error': 'Phone numerology is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_phone'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    phone_number = request.data.get('phone_number')
+    if not phone_number:
+        return Response({
+            'error': 'Phone number is required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        service = AssetNumerologyService()
+        user_profile = getattr(user, 'numerology_profile', None)
+        
+        owner_life_path = None
+        if user_profile:
+            owner_life_path = user_profile.life_path_number
+        
+        owner_dob = None
+        if hasattr(user, 'profile') and user.profile.date_of_birth:
+            owner_dob = user.profile.date_of_birth
+        
+        result = service.calculate_phone_numerology(
+            phone_number,
+            owner_dob,
+            owner_life_path
+        )
+        
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error calculating phone numerology: {str(e)}")
+        return Response({
+            'error': f'Failed to calculate phone numerology: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
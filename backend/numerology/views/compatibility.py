@@ -0,0 +1,348 @@
+"""
+API views for compatibility endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from datetime import datetime
+from ..models import NumerologyProfile, CompatibilityCheck
+from ..serializers import CompatibilityCheckSerializer
+from ..numerology import NumerologyCalculator, validate_birth_date
+from ..compatibility import CompatibilityAnalyzer
+from utils.activity_logger import log_user_activity
+from utils.pagination import KeysetPagination
+import traceback
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def check_compatibility(request):
+    """Check compatibility between user and another person."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    # Check subscription access
+    if not can_access_feature(user, 'compatibility_insights'):
+        return Response({
+            'error': 'Compatibility Analysis is available for Premium plan and above. Please upgrade your subscription.',
+            'required_tier': 'premium',
+            'feature': 'compatibility_insights'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    partner_name = request.data.get('partner_name')
+    partner_birth_date_str = request.data.get('partner_birth_date')
+    
+    # Validate input
+    if not partner_name or not partner_birth_date_str:
+        return Response({
+            'error': 'Partner name and birth date are required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        partner_birth_date = datetime.strptime(partner_birth_date_str, '%Y-%m-%d').date()
+    except ValueError:
+        return Response({
+            'error': 'Invalid date format. Use YYYY-MM-DD'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    # Validate birth dates
+    if not validate_birth_date(partner_birth_date):
+        return Response({
+            'error': 'Invalid partner birth date'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        # Get user's numerology profile
+        user_profile = NumerologyProfile.objects.get(user=user)
+        
+        # Calculate partner's numerology profile
+        calculator = NumerologyCalculator()
+        partner_numbers = calculator.calculate_all(partner_name, partner_birth_date)
+        
+        # Get user's full name - try multiple sources
+        user_full_name = None
+        if hasattr(user, 'full_name') and user.full_name:
+            user_full_name = user.full_name
+        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        # Validate that user has a full name
+        if not user_full_name:
+            return Response({
+                'error': 'User full name is required. Please update your profile.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Validate that user has a birth date
+        user_birth_date = None
+        if hasattr(user, 'profile') and hasattr(user.profile, 'date_of_birth') and user.profile.date_of_birth:
+            user_birth_date = user.profile.date_of_birth
+        # Fallback to user profile's date_of_birth if it exists
+        elif hasattr(user_profile, 'user') and hasattr(user_profile.user, 'profile') and hasattr(user_profile.user.profile, 'date_of_birth') and user_profile.user.profile.date_of_birth:
+            user_birth_date = user_profile.user.profile.date_of_birth
+        else:
+            return Response({
+                'error': 'User birth date is required. Please update your profile.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Ensure user_birth_date is a date object, not datetime
+        if hasattr(user_birth_date, 'date') and callable(getattr(user_birth_date, 'date', None)):
+            user_birth_date = user_birth_date.date()
+        
+        # Analyze compatibility
+        analyzer = CompatibilityAnalyzer()
+        compatibility_result = analyzer.analyze_compatibility(
+            user_full_name,
+            user_birth_date,
+            partner_name,
+            partner_birth_date
+        )
+        
+        # Save compatibility check
+        compatibility_check = CompatibilityCheck.objects.create(
+            user=user,
+            partner_name=partner_name,
+            partner_birth_date=partner_birth_date,
+            relationship_type=request.data.get('relationship_type', 'romantic'),
+            compatibility_score=compatibility_result['compatibility_score'],
+            strengths=compatibility_result['strengths'],
+            challenges=compatibility_result['challenges'],
+            advice=compatibility_result['advice']
+        )
+        
+        # Log activity
+        log_user_activity(user, 'compatibility_checked', {
+            'partner_name': partner_name,
+            'relationship_type': request.data.get('relationship_type', 'romantic'),
+            'score': compatibility_result['compatibility_score']
+        })
+        
+        serializer = CompatibilityCheckSerializer(compatibility_check)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Please calculate your numerology profile first.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    except AttributeError as e:
+        # Handle case where user profile attributes are missing
+        return Response({
+            'error': f'Missing required user profile information: {str(e)}. Please update your profile.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        # Log the full traceback for debugging
+        error_details = traceback.format_exc()
+        print(f"Compatibility check error: {str(e)}")
+        print(f"Traceback: {error_details}")
+        
+        return Response({
+            'error': f'Compatibility check failed: {str(e)}',
+            'details': error_details
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def detailed_compatibility_breakdown(request):
+    """Get detailed number-by-number compatibility breakdown."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_compatibility'):
+        return Response({
+            'error': 'Enhanced compatibility is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_compatibility'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    user_full_name = request.data.get('user_full_name')
+    user_birth_date_str = request.data.get('user_birth_date')
+    partner_full_name = request.data.get('partner_full_name')
+    partner_birth_date_str = request.data.get('partner_birth_date')
+    
+    if not all([user_full_name, user_birth_date_str, partner_full_name, partner_birth_date_str]):
+        return Response({
+            'error': 'user_full_name, user_birth_date, partner_full_name, and partner_birth_date are required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        user_birth_date = datetime.strptime(user_birth_date_str, '%Y-%m-%d').date()
+        partner_birth_date = datetime.strptime(partner_birth_date_str, '%Y-%m-%d').date()
+        
+        profile = NumerologyProfile.objects.get(user=user)
+        calculator = NumerologyCalculator(profile.calculation_system)
+        
+        user_numbers = calculator.calculate_all(user_full_name, user_birth_date)
+        partner_numbers = calculator.calculate_all(partner_full_name, partner_birth_date)
+        
+        analyzer = CompatibilityAnalyzer()
+        result = analyzer.detailed_compatibility_breakdown(user_numbers, partner_numbers)
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error in detailed compatibility breakdown: {str(e)}")
+        return Response({
+            'error': f'Failed to generate detailed breakdown: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def relationship_timeline_predictions(request):
+    """Get relationship timeline predictions."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_compatibility'):
+        return Response({
+            'error': 'Timeline predictions are available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_compatibility'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    user_full_name = request.data.get('user_full_name')
+    user_birth_date_str = request.data.get('user_birth_date')
+    partner_full_name = request.data.get('partner_full_name')
+    partner_birth_date_str = request.data.get('partner_birth_date')
+    relationship_start_date_str = request.data.get('relationship_start_date')
+    years_ahead = int(request.data.get('years_ahead', 10))
+    
+    if not all([user_full_name, user_birth_date_str, partner_full_name, partner_birth_date_str, relationship_start_date_str]):
+        return Response({
+            'error': 'user_full_name, user_birth_date, partner_full_name, partner_birth_date, and relationship_start_date are required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        user_birth_date = datetime.strptime(user_birth_date_str, '%Y-%m-%d').date()
+        partner_birth_date = datetime.strptime(partner_birth_date_str, '%Y-%m-%d').date()
+        relationship_start_date = datetime.strptime(relationship_start_date_str, '%Y-%m-%d').date()
+        
+        profile = NumerologyProfile.objects.get(user=user)
+        calculator = NumerologyCalculator(profile.calculation_system)
+        
+        user_numbers = calculator.calculate_all(user_full_name, user_birth_date)
+        user_numbers['birth_date'] = user_birth_date
+        partner_numbers = calculator.calculate_all(partner_full_name, partner_birth_date)
+        partner_numbers['birth_date'] = partner_birth_date
+        
+        analyzer = CompatibilityAnalyzer()
+        result = analyzer.relationship_timeline_predictions(
+            user_numbers, partner_numbers, relationship_start_date, years_ahead
+        )
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error in timeline predictions: {str(e)}")
+        return Response({
+            'error': f'Failed to generate timeline predictions: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def conflict_resolution_guidance(request):
+    """Get conflict resolution guidance."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_compatibility'):
+        return Response({
+            'error': 'Conflict resolution guidance is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_compatibility'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    user_full_name = request.data.get('user_full_name')
+    user_birth_date_str = request.data.get('user_birth_date')
+    partner_full_name = request.data.get('partner_full_name')
+    partner_birth_date_str = request.data.get('partner_birth_date')
+    conflict_type = request.data.get('conflict_type')
+    
+    if not all([user_full_name, user_birth_date_str, partner_full_name, partner_birth_date_str]):
+        return Response({
+            'error': 'user_full_name, user_birth_date, partner_full_name, and partner_birth_date are required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        user_birth_date = datetime.strptime(user_birth_date_str, '%Y-%m-%d').date()
+        partner_birth_date = datetime.strptime(partner_birth_date_str, '%Y-%m-%d').date()
+        
+        profile = NumerologyProfile.objects.get(user=user)
+        calculator = NumerologyCalculator(profile.calculation_system)
+        
+        user_numbers = calculator.calculate_all(user_full_name, user_birth_date)
+        partner_numbers = calculator.calculate_all(partner_full_name, partner_birth_date)
+        
+        analyzer = CompatibilityAnalyzer()
+        result = analyzer.conflict_resolution_guidance(user_numbers, partner_numbers, conflict_type)
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error in conflict resolution guidance: {str(e)}")
+        return Response({
+            'error': f'Failed to generate conflict resolution guidance: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def communication_style_analysis(request):
+    """Analyze communication styles."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_compatibility'):
+        return Response({
+            'error': 'Communication analysis is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_compatibility'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    user_full_name = request.data.get('user_full_name')
+    user_birth_date_str = request.data.get('user_birth_date')
+    partner_full_name = request.data.get('partner_full_name')
+    partner_birth_date_str = request.data.get('partner_birth_date')
+    
+    if not all([user_full_name, user_birth_date_str, partner_full_name, partner_birth_date_str]):
+        return Response({
+            'error': 'user_full_name, user_birth_date, partner_full_name, and partner_birth_date are required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        user_birth_date = datetime.strptime(user_birth_date_str, '%Y-%m-%d').date()
+        partner_birth_date = datetime.strptime(partner_birth_date_str, '%Y-%m-%d').date()
+        
+        profile = NumerologyProfile.objects.get(user=user)
+        calculator = NumerologyCalculator(profile.calculation_system)
+        
+        user_numbers = calculator.calculate_all(user_full_name, user_birth_date)
+        partner_numbers = calculator.calculate_all(partner_full_name, partner_birth_date)
+        
+        analyzer = CompatibilityAnalyzer()
+        result = analyzer.communication_style_analysis(user_numbers, partner_numbers)
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error in communication style analysis: {str(e)}")
+        return Response({
+            'error': f'Failed to analyze communication styles: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_compatibility_history(request):
+    """Get compatibility check history, newest first, with keyset pagination."""
+    user = request.user
+    
+    checks = CompatibilityCheck.objects.filter(user=user)
+    
+    paginator = KeysetPagination('created_at')
+    page = paginator.paginate_queryset(checks, request)
+    serializer = CompatibilityCheckSerializer(page, many=True)
+    return paginator.get_paginated_response(serializer.data)
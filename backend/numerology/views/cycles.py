@@ -0,0 +1,393 @@
+"""
+API views for pinnacle, essence, universal and personal cycle endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from datetime import date, datetime
+from ..models import NumerologyProfile
+from ..services.universal_cycles import UniversalCyclesService
+from ..services.personal_cycles import PersonalCyclesService
+from ..services.pinnacles_service import PinnaclesService
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_pinnacles_detailed(request):
+    """Get detailed pinnacle analysis with age ranges and interpretations."""
+    user = request.user
+    
+    if not user.profile.date_of_birth:
+        return Response({
+            'error': 'Birth date is required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        service = PinnaclesService(profile.calculation_system)
+        
+        pinnacle_ages = service.calculate_pinnacle_ages(user.profile.date_of_birth)
+        transitions = service.analyze_pinnacle_transitions(user.profile.date_of_birth)
+        
+        # Get interpretations for each pinnacle
+        pinnacle_details = []
+        for pinnacle in pinnacle_ages['pinnacles']:
+            interpretation = service.get_pinnacle_interpretation(
+                pinnacle['number'],
+                pinnacle['pinnacle']
+            )
+            pinnacle_details.append({
+                **pinnacle,
+                **interpretation
+            })
+        
+        return Response({
+            'pinnacle_ages': pinnacle_ages,
+            'pinnacle_details': pinnacle_details,
+            'transitions': transitions,
+            'challenges': service.calculator.calculate_challenges(user.profile.date_of_birth)
+        }, status=status.HTTP_200_OK)
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f'Error getting pinnacles: {str(e)}')
+        return Response({
+            'error': f'Failed to get pinnacles: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_pinnacles_timeline(request):
+    """Get pinnacle timeline visualization data."""
+    user = request.user
+    
+    if not user.profile.date_of_birth:
+        return Response({
+            'error': 'Birth date is required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        service = PinnaclesService(profile.calculation_system)
+        
+        pinnacle_ages = service.calculate_pinnacle_ages(user.profile.date_of_birth)
+        transitions = service.analyze_pinnacle_transitions(user.profile.date_of_birth)
+        
+        # Calculate actual dates for timeline
+        today = date.today()
+        birth_date = user.profile.date_of_birth
+        from datetime import timedelta
+        
+        timeline_events = []
+        for pinnacle in pinnacle_ages['pinnacles']:
+            start_date = birth_date + timedelta(days=pinnacle['start_age'] * 365)
+            if pinnacle['end_age']:
+                end_date = birth_date + timedelta(days=pinnacle['end_age'] * 365)
+            else:
+                end_date = None
+            
+            interpretation = service.get_pinnacle_interpretation(
+                pinnacle['number'],
+                pinnacle['pinnacle']
+            )
+            
+            timeline_events.append({
+                'pinnacle': pinnacle['pinnacle'],
+                'number': pinnacle['number'],
+                'start_age': pinnacle['start_age'],
+                'end_age': pinnacle['end_age'],
+                'start_date': start_date.isoformat(),
+                'end_date': end_date.isoformat() if end_date else None,
+                'title': interpretation['title'],
+                'is_current': pinnacle_ages['current_pinnacle'] == pinnacle['pinnacle']
+            })
+        
+        return Response({
+            'timeline': timeline_events,
+            'current_pinnacle': pinnacle_ages['current_pinnacle'],
+            'current_age': pinnacle_ages['current_age'],
+            'transitions': transitions['transitions']
+        }, status=status.HTTP_200_OK)
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f'Error getting pinnacles timeline: {str(e)}')
+        return Response({
+            'error': f'Failed to get timeline: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_challenge_remedies(request):
+    """Get remedies for challenges."""
+    user = request.user
+    
+    if not user.profile.date_of_birth:
+        return Response({
+            'error': 'Birth date is required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        service = PinnaclesService(profile.calculation_system)
+        
+        challenges = service.calculator.calculate_challenges(user.profile.date_of_birth)
+        
+        challenge_details = []
+        for i, challenge_num in enumerate(challenges, 1):
+            remedy = service.get_challenge_remedies(challenge_num)
+            challenge_details.append({
+                'challenge': i,
+                'number': challenge_num,
+                **remedy
+            })
+        
+        return Response({
+            'challenges': challenge_details
+        }, status=status.HTTP_200_OK)
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f'Error getting challenge remedies: {str(e)}')
+        return Response({
+            'error': f'Failed to get remedies: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_essence_cycles(request):
+    """Get essence cycles for user."""
+    try:
+        user = request.user
+        if not user.date_of_birth:
+            return Response({
+                'error': 'Date of birth required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        from ..services.essence_cycles import EssenceCycleCalculator
+        calculator = EssenceCycleCalculator()
+        
+        essence_cycles = calculator.calculate_essence_cycles(
+            user.full_name,
+            user.date_of_birth
+        )
+        
+        return Response(essence_cycles)
+    except Exception as e:
+        logger.error(f"Error calculating essence cycles: {str(e)}")
+        return Response({
+            'error': f'Failed to calculate essence cycles: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_cycle_timeline(request):
+    """Get complete cycle timeline visualization."""
+    try:
+        user = request.user
+        if not user.date_of_birth:
+            return Response({
+                'error': 'Date of birth required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        start_year = int(request.query_params.get('start_year', date.today().year))
+        end_year = int(request.query_params.get('end_year', start_year + 9))
+        
+        from ..services.cycle_visualization import CycleVisualizationService
+        service = CycleVisualizationService()
+        
+        timeline = service.generate_cycle_timeline(
+            user.full_name,
+            user.date_of_birth,
+            start_year,
+            end_year
+        )
+        
+        return Response(timeline)
+    except Exception as e:
+        logger.error(f"Error generating cycle timeline: {str(e)}")
+        return Response({
+            'error': f'Failed to generate timeline: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_universal_cycles(request):
+    """Get universal year, month, and day cycles."""
+    try:
+        service = UniversalCyclesService()
+        
+        year = int(request.query_params.get('year', date.today().year))
+        month = int(request.query_params.get('month', date.today().month))
+        target_date_str = request.query_params.get('date')
+        
+        if target_date_str:
+            target_date = datetime.strptime(target_date_str, '%Y-%m-%d').date()
+        else:
+            target_date = date.today()
+        
+        universal_year = service.calculate_universal_year(year)
+        universal_month = service.calculate_universal_month(year, month)
+        universal_day = service.calculate_universal_day(target_date)
+        
+        return Response({
+            'universal_year': universal_year,
+            'universal_month': universal_month,
+            'universal_day': universal_day
+        })
+    except Exception as e:
+        logger.error(f"Error calculating universal cycles: {str(e)}")
+        return Response({
+            'error': f'Failed to calculate universal cycles: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_personal_hour(request):
+    """Get personal hour number for current or specified time."""
+    user = request.user
+    
+    if not user.profile.date_of_birth:
+        return Response({
+            'error': 'Birth date is required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        service = UniversalCyclesService()
+        
+        target_datetime_str = request.query_params.get('datetime')
+        if target_datetime_str:
+            target_datetime = datetime.fromisoformat(target_datetime_str.replace('Z', '+00:00'))
+        else:
+            target_datetime = datetime.now()
+        
+        personal_hour = service.calculate_personal_hour(user.profile.date_of_birth, target_datetime)
+        
+        return Response(personal_hour, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f'Error calculating personal hour: {str(e)}')
+        return Response({
+            'error': f'Failed to calculate personal hour: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_cycle_transitions(request):
+    """Get cycle transition dates and analysis."""
+    user = request.user
+    
+    if not user.profile.date_of_birth:
+        return Response({
+            'error': 'Birth date is required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        service = PersonalCyclesService()
+        
+        start_date_str = request.query_params.get('start_date')
+        end_date_str = request.query_params.get('end_date')
+        
+        start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date() if start_date_str else date.today()
+        end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date() if end_date_str else None
+        
+        transitions = service.calculate_cycle_transitions(
+            user.profile.date_of_birth,
+            start_date,
+            end_date
+        )
+        
+        return Response(transitions, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f'Error getting cycle transitions: {str(e)}')
+        return Response({
+            'error': f'Failed to get cycle transitions: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_cycle_alerts(request):
+    """Get important cycle dates and alerts."""
+    user = request.user
+    
+    if not user.profile.date_of_birth:
+        return Response({
+            'error': 'Birth date is required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        service = PersonalCyclesService()
+        
+        days_ahead = int(request.query_params.get('days_ahead', 30))
+        
+        alerts = service.get_cycle_alerts(user.profile.date_of_birth, days_ahead)
+        
+        return Response(alerts, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f'Error getting cycle alerts: {str(e)}')
+        return Response({
+            'error': f'Failed to get cycle alerts: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def calculate_cycle_compatibility(request):
+    """Calculate cycle compatibility between two profiles."""
+    try:
+        from ..services.cycle_visualization import CycleVisualizationService
+        service = CycleVisualizationService()
+        
+        profile_1_name = request.data.get('profile_1_name')
+        profile_1_dob = request.data.get('profile_1_dob')
+        profile_2_name = request.data.get('profile_2_name')
+        profile_2_dob = request.data.get('profile_2_dob')
+        target_year = int(request.data.get('target_year', date.today().year))
+        
+        if not all([profile_1_name, profile_1_dob, profile_2_name, profile_2_dob]):
+            return Response({
+                'error': 'All profile fields required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Parse dates
+        dob1 = datetime.strptime(profile_1_dob, '%Y-%m-%d').date()
+        dob2 = datetime.strptime(profile_2_dob, '%Y-%m-%d').date()
+        
+        compatibility = service.calculate_cycle_compatibility(
+            {'name': profile_1_name, 'birth_date': dob1},
+            {'name': profile_2_name, 'birth_date': dob2},
+            target_year
+        )
+        
+        return Response(compatibility)
+    except Exception as e:
+        logger.error(f"Error calculating cycle compatibility: {str(e)}")
+        return Response({
+            'error': f'Failed to calculate cycle compatibility: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
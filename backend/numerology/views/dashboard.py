@@ -0,0 +1,123 @@
+"""
+API views for dashboard endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from ..models import NumerologyProfile
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_dashboard_insights(request):
+    """Get personalized insights for dashboard."""
+    user = request.user
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        
+        from ..services.dashboard_service import DashboardService
+        service = DashboardService()
+        insights = service.get_personalized_insights(user, profile)
+        
+        return Response({
+            'insights': insights,
+            'count': len(insights)
+        }, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f'Error getting dashboard insights: {str(e)}')
+        return Response({
+            'error': 'Failed to get insights.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_dashboard_quick_actions(request):
+    """Get quick actions for dashboard."""
+    user = request.user
+    
+    context = request.query_params.get('context')
+    
+    try:
+        from ..services.dashboard_service import DashboardService
+        service = DashboardService()
+        actions = service.get_quick_actions(user, context)
+        
+        return Response({
+            'actions': actions,
+            'count': len(actions)
+        }, status=status.HTTP_200_OK)
+    
+    except Exception as e:
+        logger.error(f'Error getting quick actions: {str(e)}')
+        return Response({
+            'error': 'Failed to get quick actions.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_dashboard_activity(request):
+    """Get recent activity feed for dashboard."""
+    user = request.user
+    
+    limit = int(request.query_params.get('limit', 10))
+    activity_types = request.query_params.getlist('types')
+    
+    try:
+        from ..services.dashboard_service import DashboardService
+        service = DashboardService()
+        activities = service.get_recent_activity(user, limit, activity_types if activity_types else None)
+        
+        return Response({
+            'activities': activities,
+            'count': len(activities)
+        }, status=status.HTTP_200_OK)
+    
+    except Exception as e:
+        logger.error(f'Error getting activity feed: {str(e)}')
+        return Response({
+            'error': 'Failed to get activity feed.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_dashboard_recommendations(request):
+    """Get personalized recommendations for dashboard."""
+    user = request.user
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        
+        from ..services.dashboard_service import DashboardService
+        service = DashboardService()
+        recommendations = service.get_recommendations(user, profile)
+        
+        return Response({
+            'recommendations': recommendations,
+            'count': len(recommendations)
+        }, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f'Error getting recommendations: {str(e)}')
+        return Response({
+            'error': 'Failed to get recommendations.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
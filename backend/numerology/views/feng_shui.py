@@ -0,0 +1,368 @@
+"""
+API views for Feng Shui × numerology hybrid endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from ..models import NumerologyProfile
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def feng_shui_analyze(request):
+    """Analyze property using Feng Shui × Numerology."""
+    from feature_flags.services import FeatureFlagService
+    from ..models import FengShuiAnalysis
+    from ..services.feng_shui_hybrid import FengShuiHybridService
+    
+    user = request.user
+    
+    if not FeatureFlagService.can_access(user, 'numerology_feng_shui'):
+        return Response({
+            'error': 'Feng Shui Hybrid feature is not available'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        house_number = request.data.get('house_number')
+        property_address = request.data.get('property_address', '')
+        
+        if not house_number:
+            return Response({
+                'error': 'House number is required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Get user's numerology profile
+        try:
+            profile = NumerologyProfile.objects.get(user=user)
+        except NumerologyProfile.DoesNotExist:
+            return Response({
+                'error': 'Please calculate your numerology profile first'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Analyze
+        analyzer = FengShuiHybridService()
+        house_analysis = analyzer.analyze_house_vibration(house_number, profile)
+        
+        # Combine with numerology
+        hybrid_result = analyzer.combine_feng_shui_numerology(
+            house_analysis,
+            {'life_path_number': profile.life_path_number}
+        )
+        
+        # Save analysis
+        analysis = FengShuiAnalysis.objects.create(
+            user=user,
+            property_address=property_address,
+            house_number=house_number,
+            feng_shui_data={},
+            numerology_vibration=house_analysis['vibration_number'],
+            hybrid_score=hybrid_result['hybrid_score'],
+            recommendations=hybrid_result.get('recommendations', [])
+        )
+        
+        return Response({
+            'success': True,
+            'analysis': {
+                'house_vibration': house_analysis,
+                'hybrid_analysis': hybrid_result
+            },
+            'analysis_id': str(analysis.id)
+        }, status=status.HTTP_201_CREATED)
+        
+    except Exception as e:
+        logger.error(f"Error in Feng Shui analysis: {str(e)}")
+        return Response({
+            'error': f'Failed to analyze property: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_feng_shui_analysis(request, analysis_id):
+    """Get Feng Shui analysis by ID."""
+    from feature_flags.services import FeatureFlagService
+    from ..models import FengShuiAnalysis
+    
+    user = request.user
+    
+    if not FeatureFlagService.can_access(user, 'numerology_feng_shui'):
+        return Response({
+            'error': 'Feng Shui Hybrid feature is not available'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        analysis = FengShuiAnalysis.objects.get(id=analysis_id, user=user)
+        
+        return Response({
+            'success': True,
+            'analysis': {
+                'id': str(analysis.id),
+                'property_address': analysis.property_address,
+                'house_number': analysis.house_number,
+                'numerology_vibration': analysis.numerology_vibration,
+                'hybrid_score': analysis.hybrid_score,
+                'recommendations': analysis.recommendations,
+                'calculated_at': analysis.calculated_at.isoformat()
+            }
+        })
+    except FengShuiAnalysis.DoesNotExist:
+        return Response({
+            'error': 'Analysis not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f"Error getting Feng Shui analysis: {str(e)}")
+        return Response({
+            'error': f'Failed to get analysis: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def feng_shui_optimize_space(request):
+    """Get space optimization recommendations."""
+    from feature_flags.services import FeatureFlagService
+    from ..models import FengShuiAnalysis, SpaceOptimization
+    from ..services.feng_shui_hybrid import FengShuiHybridService
+    
+    user = request.user
+    
+    if not FeatureFlagService.can_access(user, 'numerology_space_optimization'):
+        return Response({
+            'error': 'Space Optimization feature is not available'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        analysis_id = request.data.get('analysis_id')
+        room_data = request.data.get('room_data', {})
+        
+        if not analysis_id:
+            return Response({
+                'error': 'Analysis ID is required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        analysis = FengShuiAnalysis.objects.get(id=analysis_id, user=user)
+        
+        try:
+            profile = NumerologyProfile.objects.get(user=user)
+        except NumerologyProfile.DoesNotExist:
+            return Response({
+                'error': 'Please calculate your numerology profile first'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        analyzer = FengShuiHybridService()
+        optimization = analyzer.optimize_space_layout(room_data, profile)
+        
+        # Save optimization
+        space_opt = SpaceOptimization.objects.create(
+            analysis=analysis,
+            room_name=room_data.get('room_name', 'Unknown'),
+            room_number=room_data.get('room_number'),
+            direction=room_data.get('direction'),
+            color_recommendations=optimization.get('color_recommendations', []),
+            number_combinations=optimization.get('number_combinations', []),
+            energy_flow_score=optimization.get('energy_flow_score'),
+            layout_suggestions=optimization.get('layout_suggestions', [])
+        )
+        
+        return Response({
+            'success': True,
+            'optimization': optimization,
+            'optimization_id': str(space_opt.id)
+        }, status=status.HTTP_201_CREATED)
+        
+    except FengShuiAnalysis.DoesNotExist:
+        return Response({
+            'error': 'Analysis not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f"Error optimizing space: {str(e)}")
+        return Response({
+            'error': f'Failed to optimize space: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_energy_flow(request):
+    """Get energy flow analysis for property."""
+    from feature_flags.services import FeatureFlagService
+    from ..services.feng_shui_hybrid import FengShuiHybridService
+    
+    user = request.user
+    
+    if not FeatureFlagService.can_access(user, 'numerology_feng_shui'):
+        return Response({
+            'error': 'Feng Shui Hybrid feature is not available'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        analysis_id = request.query_params.get('analysis_id')
+        if not analysis_id:
+            return Response({
+                'error': 'analysis_id is required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        from ..models import FengShuiAnalysis
+        analysis = FengShuiAnalysis.objects.get(id=analysis_id, user=user)
+        
+        try:
+            numerology_profile = NumerologyProfile.objects.get(user=user)
+        except NumerologyProfile.DoesNotExist:
+            return Response({
+                'error': 'Numerology profile not found. Please calculate your profile first.'
+            }, status=status.HTTP_404_NOT_FOUND)
+        
+        service = FengShuiHybridService()
+        
+        # Get property layout from analysis or request
+        property_layout = {
+            'rooms': [],
+            'main_entrance': {}
+        }
+        
+        energy_flow = service.analyze_energy_flow(property_layout, numerology_profile)
+        
+        return Response({
+            'success': True,
+            'energy_flow': energy_flow
+        })
+    
+    except FengShuiAnalysis.DoesNotExist:
+        return Response({
+            'error': 'Feng Shui analysis not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f"Error getting energy flow: {str(e)}")
+        return Response({
+            'error': f'Failed to get energy flow: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET', 'POST'])
+@permission_classes([IsAuthenticated])
+def get_room_numerology(request):
+    """Get room numerology analysis."""
+    from feature_flags.services import FeatureFlagService
+    from ..models import RoomNumerology, FengShuiAnalysis
+    from ..services.feng_shui_hybrid import FengShuiHybridService
+    
+    user = request.user
+    
+    if not FeatureFlagService.can_access(user, 'numerology_feng_shui'):
+        return Response({
+            'error': 'Feng Shui Hybrid feature is not available'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        analysis_id = request.query_params.get('analysis_id') or request.data.get('analysis_id')
+        if not analysis_id:
+            return Response({
+                'error': 'analysis_id is required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        analysis = FengShuiAnalysis.objects.get(id=analysis_id, user=user)
+        
+        try:
+            numerology_profile = NumerologyProfile.objects.get(user=user)
+        except NumerologyProfile.DoesNotExist:
+            return Response({
+                'error': 'Numerology profile not found.'
+            }, status=status.HTTP_404_NOT_FOUND)
+        
+        service = FengShuiHybridService()
+        
+        # Get room data from request or existing optimization
+        room_data = request.data.get('room_data', {})
+        if not room_data:
+            # Get from existing space optimization if available
+            space_opt = analysis.space_optimizations.first()
+            if space_opt:
+                room_data = {
+                    'room_name': space_opt.room_name,
+                    'room_number': space_opt.room_number,
+                    'direction': space_opt.direction
+                }
+        
+        room_analysis = service.optimize_space_layout(room_data, numerology_profile)
+        
+        # Save to database
+        room_num, created = RoomNumerology.objects.update_or_create(
+            analysis=analysis,
+            room_name=room_data.get('room_name', 'Unknown'),
+            defaults={
+                'room_number': room_data.get('room_number'),
+                'direction': room_data.get('direction'),
+                'room_vibration': room_analysis.get('room_vibration'),
+                'direction_compatibility': room_analysis.get('direction_compatibility', {}),
+                'color_recommendations': room_analysis.get('color_recommendations', []),
+                'number_recommendations': room_analysis.get('number_combinations', []),
+                'layout_recommendations': room_analysis.get('layout_suggestions', [])
+            }
+        )
+        
+        return Response({
+            'success': True,
+            'room_numerology': room_analysis
+        })
+    
+    except FengShuiAnalysis.DoesNotExist:
+        return Response({
+            'error': 'Feng Shui analysis not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f"Error getting room numerology: {str(e)}")
+        return Response({
+            'error': f'Failed to get room numerology: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def check_direction_compatibility(request):
+    """Check direction compatibility with numerology."""
+    from feature_flags.services import FeatureFlagService
+    from ..services.feng_shui_hybrid import FengShuiHybridService
+    
+    user = request.user
+    
+    if not FeatureFlagService.can_access(user, 'numerology_feng_shui'):
+        return Response({
+            'error': 'Feng Shui Hybrid feature is not available'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        direction = request.data.get('direction')
+        if not direction:
+            return Response({
+                'error': 'direction is required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            numerology_profile = NumerologyProfile.objects.get(user=user)
+        except NumerologyProfile.DoesNotExist:
+            return Response({
+                'error': 'Numerology profile not found.'
+            }, status=status.HTTP_404_NOT_FOUND)
+        
+        service = FengShuiHybridService()
+        compatibility = service.check_direction_compatibility(direction, numerology_profile)
+        
+        return Response({
+            'success': True,
+            'compatibility': compatibility
+        })
+    
+    except Exception as e:
+        logger.error(f"Error checking direction compatibility: {str(e)}")
+        return Response({
+            'error': f'Failed to check compatibility: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
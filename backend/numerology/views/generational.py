@@ -0,0 +1,326 @@
+"""
+API views for generational numerology endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from ..models import Person
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def generational_family_analysis(request):
+    """Analyze family generational numerology."""
+    from feature_flags.services import FeatureFlagService
+    from ..models import GenerationalAnalysis
+    from ..services.generational import GenerationalAnalyzer
+    
+    user = request.user
+    
+    # Check feature flag
+    if not FeatureFlagService.can_access(user, 'numerology_generational'):
+        return Response({
+            'error': 'Generational Numerology feature is not available for your subscription tier'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        person_ids = request.data.get('person_ids', [])
+        if not person_ids:
+            return Response({
+                'error': 'At least one person ID is required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Get family members
+        family_members = Person.objects.filter(
+            id__in=person_ids,
+            user=user,
+            is_active=True
+        )
+        
+        if not family_members.exists():
+            return Response({
+                'error': 'No valid family members found'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Analyze
+        analyzer = GenerationalAnalyzer()
+        analysis_result = analyzer.calculate_family_generational_number(list(family_members))
+        
+        # Generate family unit hash
+        family_unit_hash = GenerationalAnalyzer.generate_family_unit_hash(
+            [str(p.id) for p in family_members]
+        )
+        
+        # Save or update analysis
+        analysis, created = GenerationalAnalysis.objects.update_or_create(
+            user=user,
+            family_unit_hash=family_unit_hash,
+            defaults={
+                'generational_number': analysis_result['generational_number'],
+                'analysis_data': analysis_result
+            }
+        )
+        
+        return Response({
+            'success': True,
+            'analysis': analysis_result,
+            'analysis_id': str(analysis.id),
+            'created': created
+        }, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
+        
+    except Exception as e:
+        logger.error(f"Error in generational family analysis: {str(e)}")
+        return Response({
+            'error': f'Failed to analyze family: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_generational_family_analysis(request):
+    """Get existing family generational analysis."""
+    from feature_flags.services import FeatureFlagService
+    from ..models import GenerationalAnalysis
+    
+    user = request.user
+    
+    if not FeatureFlagService.can_access(user, 'numerology_generational'):
+        return Response({
+            'error': 'Generational Numerology feature is not available'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        analyses = GenerationalAnalysis.objects.filter(user=user).order_by('-calculated_at')
+        
+        results = []
+        for analysis in analyses:
+            results.append({
+                'id': str(analysis.id),
+                'generational_number': analysis.generational_number,
+                'analysis_data': analysis.analysis_data,
+                'calculated_at': analysis.calculated_at.isoformat()
+            })
+        
+        return Response({
+            'success': True,
+            'analyses': results
+        })
+    except Exception as e:
+        logger.error(f"Error getting generational analysis: {str(e)}")
+        return Response({
+            'error': f'Failed to get analysis: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def generational_karmic_contract(request):
+    """Analyze parent-child karmic contract."""
+    from feature_flags.services import FeatureFlagService
+    from ..models import KarmicContract
+    from ..services.generational import GenerationalAnalyzer
+    
+    user = request.user
+    
+    if not FeatureFlagService.can_access(user, 'numerology_generational'):
+        return Response({
+            'error': 'Generational Numerology feature is not available'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        parent_id = request.data.get('parent_id')
+        child_id = request.data.get('child_id')
+        
+        if not parent_id or not child_id:
+            return Response({
+                'error': 'Both parent_id and child_id are required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Get persons
+        parent = Person.objects.get(id=parent_id, user=user, is_active=True)
+        child = Person.objects.get(id=child_id, user=user, is_active=True)
+        
+        # Analyze
+        analyzer = GenerationalAnalyzer()
+        contract_result = analyzer.analyze_parent_child_karmic_contract(parent, child)
+        
+        # Save contract
+        contract, created = KarmicContract.objects.update_or_create(
+            user=user,
+            parent_person=parent,
+            child_person=child,
+            defaults={
+                'contract_type': contract_result.get('contract_type'),
+                'karmic_lessons': contract_result.get('karmic_lessons', []),
+                'compatibility_score': contract_result.get('compatibility_score'),
+                'analysis_data': contract_result
+            }
+        )
+        
+        return Response({
+            'success': True,
+            'contract': contract_result,
+            'contract_id': str(contract.id),
+            'created': created
+        }, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
+        
+    except Person.DoesNotExist:
+        return Response({
+            'error': 'Parent or child not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f"Error analyzing karmic contract: {str(e)}")
+        return Response({
+            'error': f'Failed to analyze contract: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_karmic_contracts(request):
+    """Get all karmic contracts for user."""
+    from feature_flags.services import FeatureFlagService
+    from ..models import KarmicContract
+    
+    user = request.user
+    
+    if not FeatureFlagService.can_access(user, 'numerology_generational'):
+        return Response({
+            'error': 'Generational Numerology feature is not available'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        contracts = KarmicContract.objects.filter(user=user).order_by('-calculated_at')
+        
+        results = []
+        for contract in contracts:
+            results.append({
+                'id': str(contract.id),
+                'parent': {
+                    'id': str(contract.parent_person.id),
+                    'name': contract.parent_person.name
+                },
+                'child': {
+                    'id': str(contract.child_person.id),
+                    'name': contract.child_person.name
+                },
+                'contract_type': contract.contract_type,
+                'compatibility_score': contract.compatibility_score,
+                'karmic_lessons': contract.karmic_lessons,
+                'analysis_data': contract.analysis_data,
+                'calculated_at': contract.calculated_at.isoformat()
+            })
+        
+        return Response({
+            'success': True,
+            'contracts': results
+        })
+    except Exception as e:
+        logger.error(f"Error getting karmic contracts: {str(e)}")
+        return Response({
+            'error': f'Failed to get contracts: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_generational_patterns(request):
+    """Get generational patterns for family."""
+    from feature_flags.services import FeatureFlagService
+    from ..services.generational import GenerationalAnalyzer
+    
+    user = request.user
+    
+    if not FeatureFlagService.can_access(user, 'numerology_generational'):
+        return Response({
+            'error': 'Generational Numerology feature is not available'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        person_ids = request.query_params.getlist('person_ids')
+        
+        if not person_ids:
+            # Get all family members
+            family_members = Person.objects.filter(
+                user=user,
+                is_active=True,
+                relationship__in=['parent', 'child', 'sibling', 'spouse']
+            )
+        else:
+            family_members = Person.objects.filter(
+                id__in=person_ids,
+                user=user,
+                is_active=True
+            )
+        
+        if not family_members.exists():
+            return Response({
+                'error': 'No family members found'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        analyzer = GenerationalAnalyzer()
+        patterns = analyzer.identify_generational_patterns(list(family_members))
+        
+        return Response({
+            'success': True,
+            'patterns': patterns
+        })
+    except Exception as e:
+        logger.error(f"Error identifying generational patterns: {str(e)}")
+        return Response({
+            'error': f'Failed to identify patterns: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_family_compatibility_matrix(request):
+    """Get family compatibility matrix."""
+    from feature_flags.services import FeatureFlagService
+    from ..services.generational import GenerationalAnalyzer
+    
+    user = request.user
+    
+    if not FeatureFlagService.can_access(user, 'numerology_generational'):
+        return Response({
+            'error': 'Generational Numerology feature is not available'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        person_ids = request.query_params.getlist('person_ids')
+        
+        if not person_ids:
+            family_members = Person.objects.filter(user=user, is_active=True)
+        else:
+            family_members = Person.objects.filter(
+                id__in=person_ids,
+                user=user,
+                is_active=True
+            )
+        
+        if not family_members.exists():
+            return Response({
+                'error': 'No family members found'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        analyzer = GenerationalAnalyzer()
+        matrix = analyzer.generate_family_compatibility_matrix(list(family_members))
+        
+        return Response({
+            'success': True,
+            'matrix': matrix
+        })
+    except Exception as e:
+        logger.error(f"Error generating compatibility matrix: {str(e)}")
+        return Response({
+            'error': f'Failed to generate matrix: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
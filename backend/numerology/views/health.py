@@ -0,0 +1,423 @@
+"""
+API views for health numerology endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from datetime import datetime
+from ..models import NumerologyProfile, HealthNumerologyProfile
+from ..serializers import HealthNumerologyProfileSerializer
+from ..chart import get_chart
+from ..services.health_numerology import HealthNumerologyService
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def calculate_health_cycles(request):
+    """Calculate health cycles and risk periods."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_health'):
+        return Response({
+            'error': 'Health numerology is available for Elite plan and above.',
+            'required_tier': 'elite',
+            'feature': 'numerology_health'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    birth_date_str = request.data.get('birth_date')
+    full_name = request.data.get('full_name')
+    start_year = request.data.get('start_year')
+    end_year = request.data.get('end_year')
+    
+    if not birth_date_str or not full_name:
+        # Try to get from user profile
+        if hasattr(user, 'profile') and user.profile.date_of_birth:
+            birth_date_str = user.profile.date_of_birth.isoformat()
+        if hasattr(user, 'full_name') and user.full_name:
+            full_name = user.full_name
+        
+        if not birth_date_str or not full_name:
+            return Response({
+                'error': 'birth_date and full_name are required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        birth_date = datetime.strptime(birth_date_str, '%Y-%m-%d').date()
+        
+        if start_year:
+            start_year = int(start_year)
+        if end_year:
+            end_year = int(end_year)
+        
+        service = HealthNumerologyService()
+        result = service.calculate_health_cycles(
+            birth_date,
+            full_name,
+            start_year,
+            end_year
+        )
+        
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error calculating health cycles: {str(e)}")
+        return Response({
+            'error': f'Failed to calculate health cycles: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def calculate_medical_timing(request):
+    """Calculate optimal timing for medical procedures."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_medical_timing'):
+        return Response({
+            'error': 'Medical timing is available for Elite plan and above.',
+            'required_tier': 'elite',
+            'feature': 'numerology_medical_timing'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    birth_date_str = request.data.get('birth_date')
+    procedure_type = request.data.get('procedure_type')
+    start_date_str = request.data.get('start_date')
+    end_date_str = request.data.get('end_date')
+    
+    if not all([birth_date_str, procedure_type, start_date_str, end_date_str]):
+        return Response({
+            'error': 'birth_date, procedure_type, start_date, and end_date are required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        birth_date = datetime.strptime(birth_date_str, '%Y-%m-%d').date()
+        start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
+        end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
+        
+        service = HealthNumerologyService()
+        result = service.calculate_medical_timing(
+            birth_date,
+            procedure_type,
+            start_date,
+            end_date
+        )
+        
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error calculating medical timing: {str(e)}")
+        return Response({
+            'error': f'Failed to calculate medical timing: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def calculate_emotional_vulnerabilities(request):
+    """Calculate emotional vulnerabilities."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_health'):
+        return Response({
+            'error': 'Emotional vulnerability analysis is available for Elite plan and above.',
+            'required_tier': 'elite',
+            'feature': 'numerology_health'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    birth_date_str = request.data.get('birth_date')
+    full_name = request.data.get('full_name')
+    
+    if not birth_date_str or not full_name:
+        # Try to get from user profile
+        if hasattr(user, 'profile') and user.profile.date_of_birth:
+            birth_date_str = user.profile.date_of_birth.isoformat()
+        if hasattr(user, 'full_name') and user.full_name:
+            full_name = user.full_name
+        
+        if not birth_date_str or not full_name:
+            return Response({
+                'error': 'birth_date and full_name are required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        birth_date = datetime.strptime(birth_date_str, '%Y-%m-%d').date()
+        
+        service = HealthNumerologyService()
+        result = service.calculate_emotional_vulnerabilities(
+            birth_date,
+            full_name
+        )
+        
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error calculating emotional vulnerabilities: {str(e)}")
+        return Response({
+            'error': f'Failed to calculate emotional vulnerabilities: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_health_analysis(request):
+    """Get comprehensive health numerology analysis."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    if not can_access_feature(user, 'numerology_health'):
+        return Response({
+            'error': 'Health Numerology is available for Elite plan subscribers.',
+            'required_tier': 'elite',
+            'feature': 'numerology_health'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        
+        user_full_name = None
+        if hasattr(user, 'full_name') and user.full_name:
+            user_full_name = user.full_name
+        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        if not user_full_name or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Full name and birth date are required.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        service = HealthNumerologyService(profile.calculation_system)
+        chart = get_chart(user_full_name, user.profile.date_of_birth, profile.calculation_system, request=request)
+        health_cycles = service.calculate_health_cycles(chart=chart)
+        risk_cycles = service.identify_health_risk_cycles(chart=chart)
+        wellness_windows = service.calculate_wellness_windows(chart=chart)
+        emotional_vulnerabilities = service.calculate_emotional_vulnerabilities(chart=chart)
+        
+        return Response({
+            'health_numbers': {
+                'health_number': health_cycles['health_number'],
+                'vitality_number': health_cycles['vitality_number'],
+                'stress_number': health_cycles['stress_number']
+            },
+            'health_cycles': health_cycles,
+            'risk_cycles': risk_cycles,
+            'wellness_windows': wellness_windows,
+            'emotional_vulnerabilities': emotional_vulnerabilities,
+            'overall_assessment': {
+                'health_trend': health_cycles['overall_health_trend'],
+                'current_risk_level': risk_cycles['total_risk_periods'],
+                'next_wellness_window': wellness_windows.get('next_wellness_window')
+            }
+        }, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f'Error getting health analysis: {str(e)}')
+        return Response({
+            'error': f'Failed to get health analysis: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_health_risk_periods(request):
+    """Get health risk periods analysis."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    if not can_access_feature(user, 'numerology_health'):
+        return Response({
+            'error': 'Health Numerology is available for Elite plan subscribers.',
+            'required_tier': 'elite',
+            'feature': 'numerology_health'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        
+        user_full_name = None
+        if hasattr(user, 'full_name') and user.full_name:
+            user_full_name = user.full_name
+        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        if not user_full_name or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Full name and birth date are required.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        years_ahead = int(request.query_params.get('years_ahead', 10))
+        
+        service = HealthNumerologyService(profile.calculation_system)
+        risk_cycles = service.identify_health_risk_cycles(
+            user.profile.date_of_birth,
+            user_full_name,
+            years_ahead
+        )
+        
+        return Response(risk_cycles, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f'Error getting health risk periods: {str(e)}')
+        return Response({
+            'error': f'Failed to get risk periods: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def analyze_health_compatibility(request):
+    """Analyze health compatibility between two people."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    if not can_access_feature(user, 'numerology_health'):
+        return Response({
+            'error': 'Health Numerology is available for Elite plan subscribers.',
+            'required_tier': 'elite',
+            'feature': 'numerology_health'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    person2_id = request.data.get('person2_id')
+    person2_name = request.data.get('person2_name')
+    person2_birth_date_str = request.data.get('person2_birth_date')
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        
+        user_full_name = None
+        if hasattr(user, 'full_name') and user.full_name:
+            user_full_name = user.full_name
+        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        if not user_full_name or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Your full name and birth date are required.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Get person 2 data
+        if person2_id:
+            from ..models import Person
+            person2 = Person.objects.get(id=person2_id, user=user, is_active=True)
+            person2_name = person2.name
+            person2_birth_date = person2.birth_date
+        elif person2_name and person2_birth_date_str:
+            person2_birth_date = datetime.strptime(person2_birth_date_str, '%Y-%m-%d').date()
+        else:
+            return Response({
+                'error': 'Either person2_id or both person2_name and person2_birth_date are required.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        service = HealthNumerologyService(profile.calculation_system)
+        compatibility = service.analyze_health_compatibility(
+            user.profile.date_of_birth,
+            user_full_name,
+            person2_birth_date,
+            person2_name
+        )
+        
+        return Response(compatibility, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f'Error analyzing health compatibility: {str(e)}')
+        return Response({
+            'error': f'Failed to analyze compatibility: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET', 'POST'])
+@permission_classes([IsAuthenticated])
+def get_health_numerology(request):
+    """Get or calculate Health Numerology profile for user."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    # Check subscription access
+    if not can_access_feature(user, 'numerology_health'):
+        return Response({
+            'error': 'Health Numerology is available for Elite plan subscribers.',
+            'required_tier': 'elite',
+            'feature': 'numerology_health'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        # Get user info
+        user_full_name = None
+        if hasattr(user, 'full_name') and user.full_name:
+            user_full_name = user.full_name
+        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        if not user_full_name or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Full name and birth date are required for Health Numerology calculation.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Get or create profile
+        profile, created = HealthNumerologyProfile.objects.get_or_create(
+            user=user,
+            defaults={}
+        )
+        
+        # Get numerology profile for calculation system
+        numerology_profile = NumerologyProfile.objects.get(user=user)
+        system = numerology_profile.calculation_system
+        
+        # Calculate health profile
+        service = HealthNumerologyService(system=system)
+        health_data = service.calculate_health_profile(
+            user_full_name,
+            user.profile.date_of_birth
+        )
+        
+        # Update profile
+        profile.stress_number = health_data['stress_number']
+        profile.vitality_number = health_data['vitality_number']
+        profile.health_cycle_number = health_data['health_cycle_number']
+        profile.health_cycles = health_data['health_cycles']
+        profile.current_cycle = health_data['current_cycle']
+        profile.medical_timing = health_data['medical_timing']
+        profile.health_windows = health_data['health_windows']
+        profile.risk_periods = health_data['risk_periods']
+        profile.save()
+        
+        # Serialize response
+        serializer = HealthNumerologyProfileSerializer(profile)
+        response_data = serializer.data
+        response_data['interpretation'] = health_data['interpretation']
+        
+        return Response(response_data, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Numerology profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except HealthNumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Health Numerology profile not found.'
+        }, status=status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,444 @@
+"""
+API views for Lo Shu grid endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from ..models import NumerologyProfile, Person, PersonNumerologyProfile
+from ..numerology import NumerologyCalculator
+from ..chart import get_chart
+from ..services.lo_shu_service import LoShuGridService
+from ..lo_shu_kernel import LoShuBits
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# Most people one batch comparison may score
+MAX_COMPARE_PEOPLE = 500
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_lo_shu_grid(request):
+    """Get Lo Shu Grid for user with enhanced visualization."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    # Check subscription access
+    if not can_access_feature(user, 'lo_shu_grid'):
+        return Response({
+            'error': 'Lo Shu Grid is available for Basic plan and above. Please upgrade your subscription.',
+            'required_tier': 'basic',
+            'feature': 'lo_shu_grid'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        
+        # Get user info
+        user_full_name = None
+        if hasattr(user, 'full_name') and user.full_name:
+            user_full_name = user.full_name
+        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        if not user_full_name or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Full name and birth date are required for Lo Shu Grid calculation.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Check if enhanced visualization is requested
+        enhanced = request.query_params.get('enhanced', 'false').lower() == 'true'
+        
+        if enhanced:
+            # Use enhanced service with arrows
+            if not can_access_feature(user, 'numerology_lo_shu_visualization'):
+                return Response({
+                    'error': 'Enhanced Lo Shu Grid visualization is available for Premium plan and above.',
+                    'required_tier': 'premium',
+                    'feature': 'numerology_lo_shu_visualization'
+                }, status=status.HTTP_403_FORBIDDEN)
+            
+            service = LoShuGridService(profile.calculation_system)
+            lo_shu_grid = service.calculate_enhanced_grid(user_full_name, user.profile.date_of_birth)
+        else:
+            # Use basic calculation
+            calculator = NumerologyCalculator(profile.calculation_system)
+            lo_shu_grid = calculator.calculate_lo_shu_grid(user_full_name, user.profile.date_of_birth)
+        
+        # Save to profile (store basic version)
+        if not profile.lo_shu_grid:
+            profile.lo_shu_grid = {
+                'grid': lo_shu_grid.get('grid', {}),
+                'missing_numbers': lo_shu_grid.get('missing_numbers', []),
+                'strong_numbers': lo_shu_grid.get('strong_numbers', []),
+                'number_frequency': lo_shu_grid.get('number_frequency', {}),
+                'interpretation': lo_shu_grid.get('interpretation', '')
+            }
+            profile.save()
+        
+        return Response(lo_shu_grid, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def compare_lo_shu_grids(request):
+    """
+    Compare Lo Shu Grids between two people.
+    
+    With ``person_ids``, scores ``person1_id`` (default 'self') against each
+    of those people in one call instead, best match first.
+    """
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    # Check subscription access
+    if not can_access_feature(user, 'numerology_lo_shu_visualization'):
+        return Response({
+            'error': 'Grid comparison is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_lo_shu_visualization'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    if 'person_ids' in request.data:
+        return _rank_lo_shu_grids(request)
+    
+    person1_id = request.data.get('person1_id')
+    person2_id = request.data.get('person2_id')
+    
+    if not person1_id or not person2_id:
+        return Response({
+            'error': 'Both person1_id and person2_id are required.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        # Get person 1 (can be user or a Person)
+        if person1_id == 'self':
+            profile1 = NumerologyProfile.objects.get(user=user)
+            person1_name = user.full_name or user.email
+        else:
+            person1 = Person.objects.get(id=person1_id, user=user, is_active=True)
+            profile1 = PersonNumerologyProfile.objects.get(person=person1)
+            person1_name = person1.name
+        
+        # Get person 2
+        if person2_id == 'self':
+            profile2 = NumerologyProfile.objects.get(user=user)
+            person2_name = user.full_name or user.email
+        else:
+            person2 = Person.objects.get(id=person2_id, user=user, is_active=True)
+            profile2 = PersonNumerologyProfile.objects.get(person=person2)
+            person2_name = person2.name
+        
+        # Get grid data
+        grid1_data = profile1.lo_shu_grid if hasattr(profile1, 'lo_shu_grid') and profile1.lo_shu_grid else None
+        grid2_data = profile2.lo_shu_grid if hasattr(profile2, 'lo_shu_grid') and profile2.lo_shu_grid else None
+        
+        # Calculate grids if not stored
+        service = LoShuGridService(profile1.calculation_system)
+        
+        if not grid1_data:
+            # Need to calculate grid1
+            if person1_id == 'self':
+                user_full_name = user.full_name or (user.profile.full_name if hasattr(user, 'profile') else None)
+                user_birth_date = user.profile.date_of_birth if hasattr(user, 'profile') else None
+            else:
+                user_full_name = person1.name
+                user_birth_date = person1.birth_date
+            
+            if not user_full_name or not user_birth_date:
+                return Response({
+                    'error': 'Person 1 name and birth date are required.'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            grid1_data = service.calculate_enhanced_grid(user_full_name, user_birth_date)
+        
+        if not grid2_data:
+            # Need to calculate grid2
+            if person2_id == 'self':
+                user_full_name = user.full_name or (user.profile.full_name if hasattr(user, 'profile') else None)
+                user_birth_date = user.profile.date_of_birth if hasattr(user, 'profile') else None
+            else:
+                user_full_name = person2.name
+                user_birth_date = person2.birth_date
+            
+            if not user_full_name or not user_birth_date:
+                return Response({
+                    'error': 'Person 2 name and birth date are required.'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            grid2_data = service.calculate_enhanced_grid(user_full_name, user_birth_date)
+        
+        # Compare grids
+        comparison = service.compare_grids(
+            grid1_data,
+            grid2_data,
+            person1_name,
+            person2_name
+        )
+        
+        return Response(comparison, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'One or both profiles not found. Please calculate profiles first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Person.DoesNotExist:
+        return Response({
+            'error': 'One or both persons not found.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except PersonNumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'One or both person profiles not found. Please calculate profiles first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f'Error comparing Lo Shu grids: {str(e)}')
+        return Response({
+            'error': 'Failed to compare grids.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+def _rank_lo_shu_grids(request):
+    """Score one grid against the grids of many of the user's people."""
+    user = request.user
+    person1_id = request.data.get('person1_id') or 'self'
+    person_ids = request.data.get('person_ids')
+    
+    if not isinstance(person_ids, list) or not person_ids:
+        return Response({
+            'error': 'person_ids must be a non-empty list.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    if len(person_ids) > MAX_COMPARE_PEOPLE:
+        return Response({
+            'error': f'At most {MAX_COMPARE_PEOPLE} people can be compared at once.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        person_ids = {uuid.UUID(str(person_id)) for person_id in person_ids}
+        if person1_id != 'self':
+            person1_id = uuid.UUID(str(person1_id))
+    except ValueError:
+        return Response({
+            'error': 'Invalid person id.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        if person1_id == 'self':
+            profile = NumerologyProfile.objects.filter(user=user).only('lo_shu_grid').first()
+            if profile and profile.lo_shu_grid:
+                grid = LoShuBits.from_grid(profile.lo_shu_grid)
+            elif hasattr(user, 'profile') and user.profile.date_of_birth:
+                grid = LoShuBits.from_birth_date(user.profile.date_of_birth)
+            else:
+                return Response({
+                    'error': 'Profile not found. Please calculate your profile first.'
+                }, status=status.HTTP_404_NOT_FOUND)
+            person1_name = user.full_name or user.email
+        else:
+            person1 = Person.objects.get(id=person1_id, user=user, is_active=True)
+            grid = LoShuBits.from_birth_date(person1.birth_date)
+            person1_name = person1.name
+        
+        # The grid depends only on the birth date, so no profiles are loaded
+        people = Person.objects.filter(
+            user=user, id__in=person_ids, is_active=True
+        ).values_list('id', 'name', 'birth_date')
+        names = {}
+        others = []
+        for person_id, name, birth_date in people:
+            names[person_id] = name
+            others.append((person_id, LoShuBits.from_birth_date(birth_date)))
+        
+        results = LoShuGridService().rank_grid_compatibility(grid, others)
+        for result in results:
+            person_id = result.pop('key')
+            result['person_id'] = str(person_id)
+            result['person_name'] = names[person_id]
+        
+        return Response({
+            'person1_name': person1_name,
+            'results': results,
+            'not_found_count': len(person_ids - names.keys()),
+        }, status=status.HTTP_200_OK)
+    
+    except Person.DoesNotExist:
+        return Response({
+            'error': 'Person not found.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f'Error ranking Lo Shu grids: {str(e)}')
+        return Response({
+            'error': 'Failed to compare grids.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_lo_shu_arrows(request):
+    """Get personality arrows analysis for Lo Shu Grid."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    if not can_access_feature(user, 'numerology_lo_shu_visualization'):
+        return Response({
+            'error': 'Arrow analysis is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_lo_shu_visualization'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        
+        user_full_name = None
+        if hasattr(user, 'full_name') and user.full_name:
+            user_full_name = user.full_name
+        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        if not user_full_name or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Full name and birth date are required.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        service = LoShuGridService(profile.calculation_system)
+        arrows = service.calculate_personality_arrows(user_full_name, user.profile.date_of_birth)
+        
+        return Response(arrows, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f'Error getting Lo Shu arrows: {str(e)}')
+        return Response({
+            'error': 'Failed to calculate arrows.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_lo_shu_remedies(request):
+    """Get remedy suggestions for missing numbers in Lo Shu Grid."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    if not can_access_feature(user, 'lo_shu_grid'):
+        return Response({
+            'error': 'Remedy suggestions are available for Basic plan and above.',
+            'required_tier': 'basic',
+            'feature': 'lo_shu_grid'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        
+        user_full_name = None
+        if hasattr(user, 'full_name') and user.full_name:
+            user_full_name = user.full_name
+        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        if not user_full_name or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Full name and birth date are required.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        service = LoShuGridService(profile.calculation_system)
+        enhanced_grid = service.calculate_enhanced_grid(user_full_name, user.profile.date_of_birth)
+        
+        remedies = {
+            'remedy_suggestions': enhanced_grid.get('remedy_suggestions', []),
+            'missing_numbers': enhanced_grid.get('missing_numbers', []),
+            'missing_number_details': enhanced_grid.get('missing_number_details', []),
+            'weakness_arrows': enhanced_grid.get('weakness_arrows', [])
+        }
+        
+        return Response(remedies, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f'Error getting Lo Shu remedies: {str(e)}')
+        return Response({
+            'error': 'Failed to get remedies.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_lo_shu_visualization(request):
+    """Get visualization data for Lo Shu Grid."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    if not can_access_feature(user, 'numerology_lo_shu_visualization'):
+        return Response({
+            'error': 'Visualization data is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_lo_shu_visualization'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        
+        user_full_name = None
+        if hasattr(user, 'full_name') and user.full_name:
+            user_full_name = user.full_name
+        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        if not user_full_name or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Full name and birth date are required.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        service = LoShuGridService(profile.calculation_system)
+        chart = get_chart(user_full_name, user.profile.date_of_birth, profile.calculation_system, request=request)
+        enhanced_grid = service.calculate_enhanced_grid(chart=chart)
+        strength_score = service.calculate_grid_strength_score(chart=chart)
+        
+        visualization_data = {
+            'grid': enhanced_grid.get('grid', {}),
+            'position_grid': enhanced_grid.get('position_grid', {}),
+            'strength_arrows': enhanced_grid.get('strength_arrows', []),
+            'weakness_arrows': enhanced_grid.get('weakness_arrows', []),
+            'arrow_details': service._get_arrow_details(
+                enhanced_grid.get('strength_arrows', []),
+                enhanced_grid.get('weakness_arrows', [])
+            ),
+            'strength_score': strength_score,
+            'personality_signature': enhanced_grid.get('personality_signature', {}),
+            'missing_numbers': enhanced_grid.get('missing_numbers', []),
+            'strong_numbers': enhanced_grid.get('strong_numbers', []),
+            'repeating_numbers': enhanced_grid.get('repeating_numbers', [])
+        }
+        
+        return Response(visualization_data, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f'Error getting Lo Shu visualization: {str(e)}')
+        return Response({
+            'error': 'Failed to get visualization data.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
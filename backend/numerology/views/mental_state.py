@@ -0,0 +1,353 @@
+"""
+API views for mental state AI × numerology endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from datetime import timedelta, date, datetime
+from ..models import NumerologyProfile
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def mental_state_track(request):
+    """Track emotional state."""
+    from feature_flags.services import FeatureFlagService
+    from ..services.mental_state_ai import MentalStateAIService
+    
+    user = request.user
+    
+    if not FeatureFlagService.can_access(user, 'numerology_mental_state'):
+        return Response({
+            'error': 'Mental State AI feature is not available'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        date_str = request.data.get('date')
+        if date_str:
+            track_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+        else:
+            track_date = date.today()
+        
+        state_data = {
+            'emotional_state': request.data.get('emotional_state', 'neutral'),
+            'stress_level': int(request.data.get('stress_level', 50)),
+            'mood_score': int(request.data.get('mood_score', 50)),
+            'notes': request.data.get('notes', '')
+        }
+        
+        analyzer = MentalStateAIService()
+        tracking = analyzer.track_emotional_state(user, track_date, state_data)
+        
+        return Response({
+            'success': True,
+            'tracking': {
+                'id': str(tracking.id),
+                'date': tracking.date.isoformat(),
+                'emotional_state': tracking.emotional_state,
+                'stress_level': tracking.stress_level,
+                'mood_score': tracking.mood_score,
+                'numerology_cycle': tracking.numerology_cycle
+            }
+        }, status=status.HTTP_201_CREATED)
+        
+    except Exception as e:
+        logger.error(f"Error tracking mental state: {str(e)}")
+        return Response({
+            'error': f'Failed to track mental state: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_mental_state_history(request):
+    """Get mental state tracking history."""
+    from feature_flags.services import FeatureFlagService
+    from ..models import MentalStateTracking
+    
+    user = request.user
+    
+    if not FeatureFlagService.can_access(user, 'numerology_mental_state'):
+        return Response({
+            'error': 'Mental State AI feature is not available'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        start_date = request.query_params.get('start_date')
+        end_date = request.query_params.get('end_date')
+        
+        trackings = MentalStateTracking.objects.filter(user=user)
+        
+        if start_date:
+            trackings = trackings.filter(date__gte=start_date)
+        if end_date:
+            trackings = trackings.filter(date__lte=end_date)
+        
+        trackings = trackings.order_by('-date')[:100]  # Limit to 100 most recent
+        
+        results = []
+        for tracking in trackings:
+            results.append({
+                'id': str(tracking.id),
+                'date': tracking.date.isoformat(),
+                'emotional_state': tracking.emotional_state,
+                'stress_level': tracking.stress_level,
+                'mood_score': tracking.mood_score,
+                'numerology_cycle': tracking.numerology_cycle,
+                'notes': tracking.notes
+            })
+        
+        return Response({
+            'success': True,
+            'trackings': results
+        })
+    except Exception as e:
+        logger.error(f"Error getting mental state history: {str(e)}")
+        return Response({
+            'error': f'Failed to get history: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def mental_state_analyze(request):
+    """Generate mental state analysis."""
+    from feature_flags.services import FeatureFlagService
+    from ..models import MentalStateAnalysis
+    from ..services.mental_state_ai import MentalStateAIService
+    
+    user = request.user
+    
+    if not FeatureFlagService.can_access(user, 'numerology_mental_state'):
+        return Response({
+            'error': 'Mental State AI feature is not available'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        period_start_str = request.data.get('period_start')
+        period_end_str = request.data.get('period_end')
+        
+        if not period_start_str or not period_end_str:
+            # Default to last 30 days
+            period_end = date.today()
+            period_start = period_end - timedelta(days=30)
+        else:
+            period_start = datetime.strptime(period_start_str, '%Y-%m-%d').date()
+            period_end = datetime.strptime(period_end_str, '%Y-%m-%d').date()
+        
+        analyzer = MentalStateAIService()
+        
+        # Identify stress patterns
+        stress_patterns = analyzer.identify_stress_patterns(user, period_start, period_end)
+        
+        # Generate recommendations
+        try:
+            profile = NumerologyProfile.objects.get(user=user)
+        except NumerologyProfile.DoesNotExist:
+            return Response({
+                'error': 'Please calculate your numerology profile first'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        recommendations = analyzer.generate_wellbeing_recommendations(user, stress_patterns)
+        
+        # Predict mood cycles
+        mood_predictions = analyzer.predict_mood_cycles(user, profile)
+        
+        # Save analysis
+        analysis = MentalStateAnalysis.objects.create(
+            user=user,
+            period_start=period_start,
+            period_end=period_end,
+            stress_patterns=stress_patterns,
+            wellbeing_recommendations=recommendations,
+            mood_predictions=mood_predictions
+        )
+        
+        return Response({
+            'success': True,
+            'analysis': {
+                'id': str(analysis.id),
+                'period_start': period_start.isoformat(),
+                'period_end': period_end.isoformat(),
+                'stress_patterns': stress_patterns,
+                'wellbeing_recommendations': recommendations,
+                'mood_predictions': mood_predictions
+            }
+        }, status=status.HTTP_201_CREATED)
+        
+    except Exception as e:
+        logger.error(f"Error analyzing mental state: {str(e)}")
+        return Response({
+            'error': f'Failed to analyze mental state: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_stress_patterns(request):
+    """Get stress patterns."""
+    from feature_flags.services import FeatureFlagService
+    from ..services.mental_state_ai import MentalStateAIService
+    
+    user = request.user
+    
+    if not FeatureFlagService.can_access(user, 'numerology_mental_state'):
+        return Response({
+            'error': 'Mental State AI feature is not available'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        period_start_str = request.query_params.get('period_start')
+        period_end_str = request.query_params.get('period_end')
+        
+        if not period_start_str or not period_end_str:
+            period_end = date.today()
+            period_start = period_end - timedelta(days=30)
+        else:
+            period_start = datetime.strptime(period_start_str, '%Y-%m-%d').date()
+            period_end = datetime.strptime(period_end_str, '%Y-%m-%d').date()
+        
+        analyzer = MentalStateAIService()
+        patterns = analyzer.identify_stress_patterns(user, period_start, period_end)
+        
+        return Response({
+            'success': True,
+            'patterns': patterns
+        })
+    except Exception as e:
+        logger.error(f"Error getting stress patterns: {str(e)}")
+        return Response({
+            'error': f'Failed to get patterns: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_wellbeing_recommendations(request):
+    """Get wellbeing recommendations."""
+    from feature_flags.services import FeatureFlagService
+    from ..services.mental_state_ai import MentalStateAIService
+    
+    user = request.user
+    
+    if not FeatureFlagService.can_access(user, 'numerology_mental_state'):
+        return Response({
+            'error': 'Mental State AI feature is not available'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        try:
+            profile = NumerologyProfile.objects.get(user=user)
+        except NumerologyProfile.DoesNotExist:
+            return Response({
+                'error': 'Please calculate your numerology profile first'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Get recent stress patterns
+        period_end = date.today()
+        period_start = period_end - timedelta(days=30)
+        
+        analyzer = MentalStateAIService()
+        stress_patterns = analyzer.identify_stress_patterns(user, period_start, period_end)
+        
+        recommendations = analyzer.generate_wellbeing_recommendations(user, stress_patterns)
+        
+        return Response({
+            'success': True,
+            'recommendations': recommendations
+        })
+    except Exception as e:
+        logger.error(f"Error getting recommendations: {str(e)}")
+        return Response({
+            'error': f'Failed to get recommendations: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_mood_predictions(request):
+    """Get mood cycle predictions."""
+    from feature_flags.services import FeatureFlagService
+    from ..services.mental_state_ai import MentalStateAIService
+    
+    user = request.user
+    
+    if not FeatureFlagService.can_access(user, 'numerology_mental_state'):
+        return Response({
+            'error': 'Mental State AI feature is not available'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        try:
+            profile = NumerologyProfile.objects.get(user=user)
+        except NumerologyProfile.DoesNotExist:
+            return Response({
+                'error': 'Please calculate your numerology profile first'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        analyzer = MentalStateAIService()
+        predictions = analyzer.predict_mood_cycles(user, profile)
+        
+        return Response({
+            'success': True,
+            'predictions': predictions
+        })
+    except Exception as e:
+        logger.error(f"Error getting mood predictions: {str(e)}")
+        return Response({
+            'error': f'Failed to get predictions: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def get_emotional_compatibility(request):
+    """Analyze emotional compatibility between two people."""
+    from feature_flags.services import FeatureFlagService
+    from ..services.mental_state_ai import MentalStateAIService
+    
+    user = request.user
+    
+    if not FeatureFlagService.can_access(user, 'numerology_mental_state'):
+        return Response({
+            'error': 'Mental State AI feature is not available'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        person2_id = request.data.get('person2_id')
+        if not person2_id:
+            return Response({
+                'error': 'person2_id is required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        from ..models import Person
+        person2 = Person.objects.get(id=person2_id)
+        person2_user = person2.user
+        
+        service = MentalStateAIService()
+        compatibility = service.analyze_emotional_compatibility(user, person2_user)
+        
+        return Response({
+            'success': True,
+            'compatibility': compatibility
+        })
+    
+    except Person.DoesNotExist:
+        return Response({
+            'error': 'Person not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f"Error analyzing emotional compatibility: {str(e)}")
+        return Response({
+            'error': f'Failed to analyze compatibility: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,254 @@
+"""
+API views for name numerology and name correction endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from ..models import NumerologyProfile, NameReport, NameCorrection
+from ..serializers import (
+    NameNumerologyGenerateSerializer, NameReportSerializer, NameCorrectionSerializer,
+    NameCorrectionRequestSerializer
+)
+from ..name_numerology import compute_name_numbers
+from ..tasks import generate_name_report
+from ..services.name_correction import NameCorrectionService
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def generate_name_numerology(request):
+    """
+    Generate name numerology report.
+    Returns job_id and queues the task.
+    """
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    # Check subscription access
+    if not can_access_feature(user, 'name_numerology'):
+        return Response({
+            'error': 'Name Numerology is available for Basic plan and above. Please upgrade your subscription.',
+            'required_tier': 'basic',
+            'feature': 'name_numerology'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    serializer = NameNumerologyGenerateSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
+    name = serializer.validated_data['name']
+    name_type = serializer.validated_data['name_type']
+    system = serializer.validated_data['system']
+    force_refresh = serializer.validated_data.get('force_refresh', False)
+    
+    # Validate name is not empty
+    if not name or not name.strip():
+        return Response({
+            'error': 'Name cannot be empty'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        # Queue the task
+        task = generate_name_report.delay(
+            user_id=str(user.id),
+            name=name,
+            name_type=name_type,
+            system=system,
+            force_refresh=force_refresh
+        )
+        
+        return Response({
+            'job_id': task.id,
+            'status': 'queued'
+        }, status=status.HTTP_202_ACCEPTED)
+        
+    except Exception as e:
+        return Response({
+            'error': f'Failed to queue task: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_name_report(request, user_id, report_id):
+    """
+    Get a specific name numerology report by ID.
+    """
+    user = request.user
+    
+    # Verify user owns the report
+    if str(user.id) != str(user_id):
+        return Response({
+            'error': 'Unauthorized'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        report = NameReport.objects.get(id=report_id, user=user)
+        serializer = NameReportSerializer(report)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+    except NameReport.DoesNotExist:
+        return Response({
+            'error': 'Report not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_latest_name_report(request, user_id):
+    """
+    Get the latest name numerology report for a user.
+    Optionally filter by name_type and system via query params.
+    """
+    user = request.user
+    
+    # Verify user owns the request
+    if str(user.id) != str(user_id):
+        return Response({
+            'error': 'Unauthorized'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    # Get query params
+    name_type = request.query_params.get('name_type')
+    system = request.query_params.get('system')
+    
+    # Build query
+    reports = NameReport.objects.filter(user=user)
+    
+    if name_type:
+        reports = reports.filter(name_type=name_type)
+    if system:
+        reports = reports.filter(system=system)
+    
+    # Get latest
+    report = reports.order_by('-computed_at').first()
+    
+    if not report:
+        return Response({
+            'error': 'No report found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    
+    serializer = NameReportSerializer(report)
+    return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def preview_name_numerology(request):
+    """
+    Preview name numerology results without persisting.
+    Returns computed numbers and breakdown for immediate UI feedback.
+    """
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    # Check subscription access
+    if not can_access_feature(user, 'name_numerology'):
+        return Response({
+            'error': 'Name Numerology is available for Basic plan and above. Please upgrade your subscription.',
+            'required_tier': 'basic',
+            'feature': 'name_numerology'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    serializer = NameNumerologyGenerateSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
+    name = serializer.validated_data['name']
+    system = serializer.validated_data['system']
+    transliterate = serializer.validated_data.get('transliterate', True)
+    
+    # Validate name is not empty
+    if not name or not name.strip():
+        return Response({
+            'error': 'Name cannot be empty'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        # Compute numbers (pure deterministic logic, no persistence)
+        keep_master = True
+        numbers_data = compute_name_numbers(
+            name=name,
+            system=system,
+            keep_master=keep_master
+        )
+        
+        return Response({
+            'normalized_name': numbers_data['normalized_name'],
+            'numbers': numbers_data,
+            'breakdown': numbers_data['breakdown'],
+            'word_totals': numbers_data['word_totals']
+        }, status=status.HTTP_200_OK)
+        
+    except ValueError as e:
+        return Response({
+            'error': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'error': f'Calculation failed: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def analyze_name_correction(request):
+    """Analyze name and provide correction suggestions."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    # Check subscription access
+    if not can_access_feature(user, 'numerology_name_correction'):
+        return Response({
+            'error': 'Name Correction is available for Elite plan subscribers.',
+            'required_tier': 'elite',
+            'feature': 'numerology_name_correction'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    serializer = NameCorrectionRequestSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
+    name = serializer.validated_data['name']
+    name_type = serializer.validated_data.get('name_type', 'current')
+    target_number = serializer.validated_data.get('target_number')
+    cultural_context = serializer.validated_data.get('cultural_context', 'western')
+    
+    try:
+        # Get numerology profile for calculation system
+        numerology_profile = NumerologyProfile.objects.get(user=user)
+        system = numerology_profile.calculation_system
+        
+        # Analyze name
+        service = NameCorrectionService(system=system)
+        analysis = service.analyze_name(name, target_number, cultural_context)
+        
+        # Save analysis
+        name_correction = NameCorrection.objects.create(
+            user=user,
+            original_name=name,
+            name_type=name_type,
+            current_expression=analysis['current_expression'],
+            target_expression=target_number,
+            cultural_context=cultural_context,
+            suggestions=analysis['suggestions'],
+            phonetic_analysis=analysis['phonetic_analysis'],
+            cultural_analysis=analysis['cultural_analysis'],
+            recommendations=analysis['recommendations']
+        )
+        
+        # Serialize response
+        response_serializer = NameCorrectionSerializer(name_correction)
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Numerology profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
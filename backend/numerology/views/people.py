@@ -0,0 +1,247 @@
+"""
+API views for people (multi-person numerology) endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from django.utils import timezone
+from django.conf import settings
+from ..models import Person, PersonNumerologyProfile, PeopleImport
+from ..serializers import PersonSerializer, PersonNumerologyProfileSerializer, PeopleImportSerializer
+from ..numerology import NumerologyCalculator, validate_name, validate_birth_date
+from ..tasks import import_people_file
+from ..services.people_import import detect_format, run_import
+from utils.activity_logger import log_user_activity
+from utils.db_routing import primary_db
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['GET', 'POST'])
+@permission_classes([IsAuthenticated])
+def people_list_create(request):
+    """List all people or create a new person."""
+    if request.method == 'GET':
+        people = Person.objects.filter(user=request.user, is_active=True)
+        serializer = PersonSerializer(people, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+    
+    elif request.method == 'POST':
+        serializer = PersonSerializer(data=request.data)
+        if serializer.is_valid():
+            person = serializer.save(user=request.user)
+            
+            # Log activity
+            log_user_activity(request.user, 'person_added', {'person_id': str(person.id), 'name': person.name})
+            
+            # Automatically calculate numerology profile if name and birth_date are provided
+            if person.name and person.birth_date:
+                try:
+                    # Validate name and birth date
+                    if validate_name(person.name) and validate_birth_date(person.birth_date):
+                        # Calculate all numbers
+                        calculator = NumerologyCalculator()
+                        numbers = calculator.calculate_all(person.name, person.birth_date)
+                        
+                        # Create or update numerology profile
+                        PersonNumerologyProfile.objects.update_or_create(
+                            person=person,
+                            defaults={
+                                'life_path_number': numbers['life_path_number'],
+                                'destiny_number': numbers['destiny_number'],
+                                'soul_urge_number': numbers['soul_urge_number'],
+                                'personality_number': numbers['personality_number'],
+                                'attitude_number': numbers['attitude_number'],
+                                'maturity_number': numbers['maturity_number'],
+                                'balance_number': numbers['balance_number'],
+                                'personal_year_number': numbers['personal_year_number'],
+                                'personal_month_number': numbers['personal_month_number'],
+                                'calculation_system': 'pythagorean'
+                            }
+                        )
+                        logger.info(f'Auto-calculated numerology profile for person {person.id}')
+                except Exception as e:
+                    logger.error(f'Failed to auto-calculate numerology for person {person.id}: {str(e)}', exc_info=True)
+                    # Don't fail person creation if calculation fails - user can calculate manually later
+            
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def import_people(request):
+    """
+    Import people from an uploaded CSV or JSON file (multipart field ``file``).
+    
+    Small files are imported in the request and the finished import is
+    returned; larger ones are queued and can be polled via people_import_status.
+    """
+    upload = request.FILES.get('file')
+    if upload is None:
+        return Response({
+            'error': 'A CSV or JSON file is required.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    file_format = request.data.get('format') or detect_format(upload.name, upload.content_type)
+    if file_format not in ('csv', 'json'):
+        return Response({
+            'error': 'Unsupported file format. Upload a .csv or .json file.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    if upload.size > settings.PEOPLE_IMPORT_MAX_BYTES:
+        return Response({
+            'error': f'File is too large. The limit is {settings.PEOPLE_IMPORT_MAX_BYTES // (1024 * 1024)} MB.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    people_import = PeopleImport.objects.create(user=request.user, file_format=file_format)
+    log_user_activity(request.user, 'people_import_started', {'import_id': str(people_import.id)})
+    
+    if upload.size <= settings.PEOPLE_IMPORT_SYNC_MAX_BYTES:
+        run_import(people_import, upload)
+        serializer = PeopleImportSerializer(people_import)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+    
+    people_import.payload = upload.read()
+    people_import.save(update_fields=['payload'])
+    try:
+        import_people_file.delay(str(people_import.id))
+    except Exception as e:
+        logger.error(f'Failed to queue people import {people_import.id}: {str(e)}')
+        people_import.payload = None
+        people_import.status = 'failed'
+        people_import.error_message = 'Import could not be queued. Please try again.'
+        people_import.completed_at = timezone.now()
+        people_import.save()
+        return Response({
+            'error': 'Failed to queue import'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
+    serializer = PeopleImportSerializer(people_import)
+    return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+@primary_db()
+def people_import_status(request, import_id):
+    """Get progress and per-row errors of a people import."""
+    try:
+        people_import = PeopleImport.objects.defer('payload').get(id=import_id, user=request.user)
+    except PeopleImport.DoesNotExist:
+        return Response({'error': 'Import not found'}, status=status.HTTP_404_NOT_FOUND)
+    
+    serializer = PeopleImportSerializer(people_import)
+    return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+
+@api_view(['GET', 'PUT', 'DELETE'])
+@permission_classes([IsAuthenticated])
+def person_detail(request, person_id):
+    """Get, update, or delete a specific person."""
+    try:
+        person = Person.objects.get(id=person_id, user=request.user)
+    except Person.DoesNotExist:
+        return Response({'error': 'Person not found'}, status=status.HTTP_404_NOT_FOUND)
+    
+    if request.method == 'GET':
+        serializer = PersonSerializer(person)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+    
+    elif request.method == 'PUT':
+        serializer = PersonSerializer(person, data=request.data, partial=True)
+        if serializer.is_valid():
+            serializer.save()
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
+    elif request.method == 'DELETE':
+        person.is_active = False
+        person.save()
+        return Response({'message': 'Person deleted successfully'}, status=status.HTTP_204_NO_CONTENT)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def calculate_person_numerology(request, person_id):
+    """Calculate numerology profile for a specific person."""
+    try:
+        person = Person.objects.get(id=person_id, user=request.user)
+    except Person.DoesNotExist:
+        return Response({'error': 'Person not found'}, status=status.HTTP_404_NOT_FOUND)
+    
+    # Validate input
+    if not person.name:
+        return Response({
+            'error': 'Person name is required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    if not person.birth_date:
+        return Response({
+            'error': 'Person birth date is required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    # Validate birth date
+    if not validate_birth_date(person.birth_date):
+        return Response({
+            'error': 'Invalid birth date'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        # Calculate all numbers
+        calculator = NumerologyCalculator()
+        numbers = calculator.calculate_all(person.name, person.birth_date)
+        
+        # Update or create profile
+        profile, created = PersonNumerologyProfile.objects.update_or_create(
+            person=person,
+            defaults={
+                'life_path_number': numbers['life_path_number'],
+                'destiny_number': numbers['destiny_number'],
+                'soul_urge_number': numbers['soul_urge_number'],
+                'personality_number': numbers['personality_number'],
+                'attitude_number': numbers['attitude_number'],
+                'maturity_number': numbers['maturity_number'],
+                'balance_number': numbers['balance_number'],
+                'personal_year_number': numbers['personal_year_number'],
+                'personal_month_number': numbers['personal_month_number'],
+                'calculation_system': 'pythagorean'
+            }
+        )
+        
+        serializer = PersonNumerologyProfileSerializer(profile)
+        return Response({
+            'message': 'Profile calculated successfully',
+            'profile': serializer.data
+        }, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
+    
+    except Exception as e:
+        return Response({
+            'error': f'Calculation failed: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_person_numerology_profile(request, person_id):
+    """Get numerology profile for a specific person."""
+    try:
+        person = Person.objects.get(id=person_id, user=request.user)
+        profile = PersonNumerologyProfile.objects.get(person=person)
+        serializer = PersonNumerologyProfileSerializer(profile)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+    except Person.DoesNotExist:
+        return Response({'error': 'Person not found'}, status=status.HTTP_404_NOT_FOUND)
+    except PersonNumerologyProfile.DoesNotExist:
+        # Return a more informative response when profile doesn't exist yet
+        return Response({
+            'error': 'Numerology profile not found for this person',
+            'message': 'Please calculate the numerology profile for this person first'
+        }, status=status.HTTP_404_NOT_FOUND)
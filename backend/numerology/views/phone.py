@@ -0,0 +1,362 @@
+"""
+API views for phone numerology endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from ..models import NumerologyProfile, PhoneReport
+from ..serializers import PhoneNumerologyGenerateSerializer, PhoneReportSerializer, PhoneCandidateRankingSerializer
+from ..tasks import generate_phone_report
+from ..phone_numerology import sanitize_and_validate_phone, compute_phone_numerology, compute_compatibility_score
+from ..phone_ranking import rank_phone_candidates
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def generate_phone_numerology(request):
+    """
+    Generate phone numerology report.
+    Returns job_id and queues the task.
+    """
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    # Check subscription access
+    if not can_access_feature(user, 'phone_numerology'):
+        return Response({
+            'error': 'Phone Numerology is available for Premium plan and above. Please upgrade your subscription.',
+            'required_tier': 'premium',
+            'feature': 'phone_numerology'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    serializer = PhoneNumerologyGenerateSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
+    phone_number = serializer.validated_data['phone_number']
+    country_hint = serializer.validated_data.get('country_hint')
+    method = serializer.validated_data.get('method', 'core')
+    persist = serializer.validated_data.get('persist', True)
+    force_refresh = serializer.validated_data.get('force_refresh', False)
+    convert_vanity = serializer.validated_data.get('convert_vanity', False)
+    
+    # Validate phone number is not empty
+    if not phone_number or not phone_number.strip():
+        return Response({
+            'error': 'Phone number cannot be empty'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        # Queue the task
+        task = generate_phone_report.delay(
+            user_id=str(user.id),
+            phone_number=phone_number,
+            country_hint=country_hint,
+            method=method,
+            persist=persist,
+            force_refresh=force_refresh,
+            convert_vanity=convert_vanity
+        )
+        
+        return Response({
+            'job_id': task.id,
+            'status': 'queued'
+        }, status=status.HTTP_202_ACCEPTED)
+        
+    except Exception as e:
+        return Response({
+            'error': f'Failed to queue task: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def preview_phone_numerology(request):
+    """
+    Preview phone numerology results without persisting.
+    Returns computed numbers and breakdown for immediate UI feedback.
+    """
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    # Check subscription access
+    if not can_access_feature(user, 'phone_numerology'):
+        return Response({
+            'error': 'Phone Numerology is available for Premium plan and above. Please upgrade your subscription.',
+            'required_tier': 'premium',
+            'feature': 'phone_numerology'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    serializer = PhoneNumerologyGenerateSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
+    phone_number = serializer.validated_data['phone_number']
+    country_hint = serializer.validated_data.get('country_hint')
+    method = serializer.validated_data.get('method', 'core')
+    convert_vanity = serializer.validated_data.get('convert_vanity', False)
+    
+    # Validate phone number is not empty
+    if not phone_number or not phone_number.strip():
+        return Response({
+            'error': 'Phone number cannot be empty'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        # Sanitize and validate
+        validation_result = sanitize_and_validate_phone(
+            phone_number,
+            country_hint=country_hint,
+            convert_vanity=convert_vanity
+        )
+        
+        if not validation_result['valid']:
+            return Response({
+                'error': validation_result['reason']
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Compute numerology (pure deterministic logic, no persistence)
+        computed = compute_phone_numerology(
+            validation_result['e164'],
+            method=method,
+            core_scope='national',  # Default to national
+            keep_master=False
+        )
+        
+        return Response({
+            'phone_e164': validation_result['e164'],
+            'phone_display': PhoneReport.mask_phone(validation_result['e164']),
+            'country': validation_result['country'],
+            'computed': computed
+        }, status=status.HTTP_200_OK)
+        
+    except ValueError as e:
+        return Response({
+            'error': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'error': f'Calculation failed: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_phone_report(request, user_id, report_id):
+    """
+    Get a specific phone numerology report by ID.
+    """
+    user = request.user
+    
+    # Verify user owns the report
+    if str(user.id) != str(user_id):
+        return Response({
+            'error': 'Unauthorized'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        report = PhoneReport.objects.get(id=report_id, user=user)
+        serializer = PhoneReportSerializer(report)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+    except PhoneReport.DoesNotExist:
+        return Response({
+            'error': 'Report not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_latest_phone_report(request, user_id):
+    """
+    Get the latest phone numerology report for a user.
+    Optionally filter by method via query params.
+    """
+    user = request.user
+    
+    # Verify user owns the request
+    if str(user.id) != str(user_id):
+        return Response({
+            'error': 'Unauthorized'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    # Get query params
+    method = request.query_params.get('method')
+    
+    # Build query
+    reports = PhoneReport.objects.filter(user=user)
+    
+    if method:
+        reports = reports.filter(method=method)
+    
+    # Get latest
+    report = reports.order_by('-computed_at').first()
+    
+    if not report:
+        return Response({
+            'error': 'No report found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    
+    serializer = PhoneReportSerializer(report)
+    return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def check_phone_compatibility(request):
+    """
+    Check compatibility between two phone numbers.
+    Accepts two phone numbers or user_ids.
+    """
+    user = request.user
+    
+    phone1 = request.data.get('phone1')
+    phone2 = request.data.get('phone2')
+    user_id1 = request.data.get('user_id1')
+    user_id2 = request.data.get('user_id2')
+    country_hint = request.data.get('country_hint')
+    convert_vanity = request.data.get('convert_vanity', False)
+    
+    # Get phone numbers from user_ids if provided
+    if user_id1:
+        try:
+            latest_report1 = PhoneReport.objects.filter(
+                user_id=user_id1
+            ).order_by('-computed_at').first()
+            if not latest_report1:
+                return Response({
+                    'error': f'No phone report found for user {user_id1}'
+                }, status=status.HTTP_404_NOT_FOUND)
+            phone1 = latest_report1.phone_e164
+        except Exception as e:
+            return Response({
+                'error': f'Error fetching phone for user {user_id1}: {str(e)}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+    
+    if user_id2:
+        try:
+            latest_report2 = PhoneReport.objects.filter(
+                user_id=user_id2
+            ).order_by('-computed_at').first()
+            if not latest_report2:
+                return Response({
+                    'error': f'No phone report found for user {user_id2}'
+                }, status=status.HTTP_404_NOT_FOUND)
+            phone2 = latest_report2.phone_e164
+        except Exception as e:
+            return Response({
+                'error': f'Error fetching phone for user {user_id2}: {str(e)}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+    
+    if not phone1 or not phone2:
+        return Response({
+            'error': 'Both phone numbers are required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        # Validate both phone numbers
+        validation1 = sanitize_and_validate_phone(phone1, country_hint=country_hint, convert_vanity=convert_vanity)
+        validation2 = sanitize_and_validate_phone(phone2, country_hint=country_hint, convert_vanity=convert_vanity)
+        
+        if not validation1['valid']:
+            return Response({
+                'error': f'Invalid phone number 1: {validation1["reason"]}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        if not validation2['valid']:
+            return Response({
+                'error': f'Invalid phone number 2: {validation2["reason"]}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Compute compatibility
+        compatibility = compute_compatibility_score(
+            validation1['e164'],
+            validation2['e164'],
+            core_scope='national',
+            keep_master=False
+        )
+        
+        return Response(compatibility, status=status.HTTP_200_OK)
+        
+    except Exception as e:
+        return Response({
+            'error': f'Compatibility check failed: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def rank_phone_numbers(request):
+    """
+    Rank candidate phone numbers for the current user.
+    Accepts a list of candidates or a prefix with a numeric suffix range and
+    returns the top_k by compatibility with the owner's number, core number
+    match with preferred numbers (default: life path) and repeated digits.
+    """
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    if not can_access_feature(user, 'phone_numerology'):
+        return Response({
+            'error': 'Phone Numerology is available for Premium plan and above. Please upgrade your subscription.',
+            'required_tier': 'premium',
+            'feature': 'phone_numerology'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    serializer = PhoneCandidateRankingSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
+    data = serializer.validated_data
+    country_hint = data.get('country_hint')
+    convert_vanity = data['convert_vanity']
+    
+    # Owner number: explicit, else the user's latest phone report
+    owner_e164 = None
+    owner_phone = data.get('owner_phone')
+    if owner_phone:
+        validation = sanitize_and_validate_phone(owner_phone, country_hint=country_hint, convert_vanity=convert_vanity)
+        if not validation['valid']:
+            return Response({
+                'error': f'Invalid owner phone number: {validation["reason"]}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        owner_e164 = validation['e164']
+    else:
+        latest_report = PhoneReport.objects.filter(user=user).order_by('-computed_at').first()
+        if latest_report:
+            owner_e164 = latest_report.phone_e164
+    
+    preferred_numbers = data.get('preferred_numbers')
+    if preferred_numbers is None:
+        profile = NumerologyProfile.objects.filter(user=user).only('life_path_number').first()
+        preferred_numbers = [profile.life_path_number] if profile and profile.life_path_number else []
+    
+    try:
+        ranking = rank_phone_candidates(
+            data['candidates'],
+            owner_e164=owner_e164,
+            preferred_numbers=preferred_numbers,
+            top_k=data['top_k'],
+            country_hint=country_hint,
+            convert_vanity=convert_vanity
+        )
+    except Exception as e:
+        logger.error(f"Phone ranking failed: {str(e)}")
+        return Response({
+            'error': f'Phone ranking failed: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
+    ranking['owner_phone_e164'] = owner_e164
+    ranking['preferred_numbers'] = preferred_numbers
+    return Response(ranking, status=status.HTTP_200_OK)
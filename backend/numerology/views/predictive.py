@@ -0,0 +1,463 @@
+"""
+API views for predictive numerology endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from datetime import date
+from ..models import NumerologyProfile, PredictiveCycle
+from ..services.predictive_numerology import PredictiveNumerologyService
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['GET', 'POST'])
+@permission_classes([IsAuthenticated])
+def get_predictive_numerology(request):
+    """Get or calculate Predictive Numerology profile for user."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    # Check subscription access
+    if not can_access_feature(user, 'numerology_predictive'):
+        return Response({
+            'error': 'Predictive Numerology is available for Elite plan subscribers.',
+            'required_tier': 'elite',
+            'feature': 'numerology_predictive'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        # Get user info
+        user_full_name = None
+        if hasattr(user, 'full_name') and user.full_name:
+            user_full_name = user.full_name
+        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        if not user_full_name or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Full name and birth date are required for Predictive Numerology calculation.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Get forecast years from request
+        forecast_years = int(request.query_params.get('forecast_years', 20))
+        forecast_years = min(max(forecast_years, 5), 30)  # Limit between 5 and 30 years
+        
+        # Get numerology profile for calculation system
+        numerology_profile = NumerologyProfile.objects.get(user=user)
+        system = numerology_profile.calculation_system
+        
+        # Calculate predictive profile
+        service = PredictiveNumerologyService(system=system)
+        predictive_data = service.calculate_predictive_profile(
+            user_full_name,
+            user.profile.date_of_birth,
+            forecast_years
+        )
+        
+        # Save cycles to database
+        PredictiveCycle.objects.filter(user=user).delete()  # Clear old cycles
+        
+        for cycle in predictive_data['nine_year_cycles']:
+            PredictiveCycle.objects.create(
+                user=user,
+                cycle_type='nine_year',
+                year=cycle['start_year'],
+                cycle_data=cycle
+            )
+        
+        for breakthrough in predictive_data['breakthrough_years']:
+            PredictiveCycle.objects.create(
+                user=user,
+                cycle_type='breakthrough',
+                year=breakthrough['year'],
+                cycle_data=breakthrough
+            )
+        
+        for crisis in predictive_data['crisis_years']:
+            PredictiveCycle.objects.create(
+                user=user,
+                cycle_type='crisis',
+                year=crisis['year'],
+                cycle_data=crisis
+            )
+        
+        for opportunity in predictive_data['opportunity_periods']:
+            PredictiveCycle.objects.create(
+                user=user,
+                cycle_type='opportunity',
+                year=opportunity['year'],
+                cycle_data=opportunity
+            )
+        
+        return Response(predictive_data, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Numerology profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_9_year_cycle(request):
+    """Get 9-year cycle forecast."""
+    from ..subscription_utils import can_access_feature
+    from ..models import PredictiveCycle
+    
+    user = request.user
+    
+    if not can_access_feature(user, 'numerology_predictive'):
+        return Response({
+            'error': 'Predictive Numerology is available for Elite plan subscribers.',
+            'required_tier': 'elite',
+            'feature': 'numerology_predictive'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        if not user.profile.date_of_birth:
+            return Response({
+                'error': 'Birth date is required.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        numerology_profile = NumerologyProfile.objects.get(user=user)
+        system = numerology_profile.calculation_system
+        
+        forecast_years = int(request.query_params.get('forecast_years', 20))
+        forecast_years = min(max(forecast_years, 5), 30)
+        
+        service = PredictiveNumerologyService(system=system)
+        cycles = service._calculate_nine_year_cycles(user.profile.date_of_birth, forecast_years)
+        
+        return Response({
+            'success': True,
+            'cycles': cycles
+        })
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Numerology profile not found.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f"Error getting 9-year cycle: {str(e)}")
+        return Response({
+            'error': f'Failed to get 9-year cycle: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_breakthrough_years(request):
+    """Get breakthrough year predictions."""
+    from ..subscription_utils import can_access_feature
+    from ..models import BreakthroughYear
+    
+    user = request.user
+    
+    if not can_access_feature(user, 'numerology_predictive'):
+        return Response({
+            'error': 'Predictive Numerology is available for Elite plan subscribers.',
+            'required_tier': 'elite',
+            'feature': 'numerology_predictive'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        if not user.profile.date_of_birth:
+            return Response({
+                'error': 'Birth date is required.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        numerology_profile = NumerologyProfile.objects.get(user=user)
+        system = numerology_profile.calculation_system
+        life_path = numerology_profile.life_path_number
+        
+        forecast_years = int(request.query_params.get('forecast_years', 20))
+        forecast_years = min(max(forecast_years, 5), 30)
+        
+        service = PredictiveNumerologyService(system=system)
+        breakthroughs = service._identify_breakthrough_years(
+            user.profile.date_of_birth,
+            life_path,
+            forecast_years
+        )
+        
+        # Save to database
+        BreakthroughYear.objects.filter(user=user).delete()
+        for breakthrough in breakthroughs:
+            BreakthroughYear.objects.create(
+                user=user,
+                year=breakthrough['year'],
+                personal_year=breakthrough['personal_year'],
+                breakthrough_type=breakthrough['breakthrough_type'],
+                description=breakthrough['description'],
+                preparation=breakthrough['preparation'],
+                confidence_score=breakthrough.get('confidence_score', 75)
+            )
+        
+        return Response({
+            'success': True,
+            'breakthrough_years': breakthroughs
+        })
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Numerology profile not found.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f"Error getting breakthrough years: {str(e)}")
+        return Response({
+            'error': f'Failed to get breakthrough years: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_crisis_years(request):
+    """Get crisis year predictions."""
+    from ..subscription_utils import can_access_feature
+    from ..models import CrisisYear
+    
+    user = request.user
+    
+    if not can_access_feature(user, 'numerology_predictive'):
+        return Response({
+            'error': 'Predictive Numerology is available for Elite plan subscribers.',
+            'required_tier': 'elite',
+            'feature': 'numerology_predictive'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        if not user.profile.date_of_birth:
+            return Response({
+                'error': 'Birth date is required.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        numerology_profile = NumerologyProfile.objects.get(user=user)
+        system = numerology_profile.calculation_system
+        life_path = numerology_profile.life_path_number
+        
+        forecast_years = int(request.query_params.get('forecast_years', 20))
+        forecast_years = min(max(forecast_years, 5), 30)
+        
+        service = PredictiveNumerologyService(system=system)
+        crises = service._identify_crisis_years(
+            user.profile.date_of_birth,
+            life_path,
+            forecast_years
+        )
+        
+        # Save to database
+        CrisisYear.objects.filter(user=user).delete()
+        for crisis in crises:
+            CrisisYear.objects.create(
+                user=user,
+                year=crisis['year'],
+                personal_year=crisis['personal_year'],
+                crisis_type=crisis['crisis_type'],
+                description=crisis['description'],
+                guidance=crisis['guidance'],
+                severity_level=crisis.get('severity_level', 'medium'),
+                preparation_steps=crisis.get('preparation_steps', [])
+            )
+        
+        return Response({
+            'success': True,
+            'crisis_years': crises
+        })
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Numerology profile not found.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f"Error getting crisis years: {str(e)}")
+        return Response({
+            'error': f'Failed to get crisis years: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_opportunity_periods(request):
+    """Get opportunity period predictions."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    if not can_access_feature(user, 'numerology_predictive'):
+        return Response({
+            'error': 'Predictive Numerology is available for Elite plan subscribers.',
+            'required_tier': 'elite',
+            'feature': 'numerology_predictive'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        if not user.profile.date_of_birth:
+            return Response({
+                'error': 'Birth date is required.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        numerology_profile = NumerologyProfile.objects.get(user=user)
+        system = numerology_profile.calculation_system
+        life_path = numerology_profile.life_path_number
+        
+        forecast_years = int(request.query_params.get('forecast_years', 20))
+        forecast_years = min(max(forecast_years, 5), 30)
+        
+        service = PredictiveNumerologyService(system=system)
+        opportunities = service._identify_opportunity_periods(
+            user.profile.date_of_birth,
+            life_path,
+            forecast_years
+        )
+        
+        return Response({
+            'success': True,
+            'opportunity_periods': opportunities
+        })
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Numerology profile not found.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f"Error getting opportunity periods: {str(e)}")
+        return Response({
+            'error': f'Failed to get opportunity periods: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_life_milestones(request):
+    """Get life milestone predictions."""
+    from ..subscription_utils import can_access_feature
+    from ..models import LifeMilestone
+    
+    user = request.user
+    
+    if not can_access_feature(user, 'numerology_predictive'):
+        return Response({
+            'error': 'Predictive Numerology is available for Elite plan subscribers.',
+            'required_tier': 'elite',
+            'feature': 'numerology_predictive'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        user_full_name = None
+        if hasattr(user, 'full_name') and user.full_name:
+            user_full_name = user.full_name
+        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        if not user_full_name or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Full name and birth date are required.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        numerology_profile = NumerologyProfile.objects.get(user=user)
+        system = numerology_profile.calculation_system
+        
+        forecast_years = int(request.query_params.get('forecast_years', 50))
+        forecast_years = min(max(forecast_years, 20), 100)
+        
+        service = PredictiveNumerologyService(system=system)
+        milestones = service.forecast_life_milestones(
+            user.profile.date_of_birth,
+            numerology_profile.life_path_number,
+            numerology_profile.destiny_number,
+            forecast_years
+        )
+        
+        # Save to database
+        LifeMilestone.objects.filter(user=user).delete()
+        for milestone in milestones:
+            LifeMilestone.objects.create(
+                user=user,
+                year=milestone['year'],
+                age=milestone['age'],
+                milestone_type=milestone['milestone_type'],
+                significance=milestone['significance'],
+                life_path_number=milestone.get('life_path_number'),
+                destiny_number=milestone.get('destiny_number')
+            )
+        
+        return Response({
+            'success': True,
+            'milestones': milestones
+        })
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Numerology profile not found.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f"Error getting life milestones: {str(e)}")
+        return Response({
+            'error': f'Failed to get life milestones: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_yearly_forecast(request):
+    """Get comprehensive yearly forecast for a specific year."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    if not can_access_feature(user, 'numerology_predictive'):
+        return Response({
+            'error': 'Predictive Numerology is available for Elite plan subscribers.',
+            'required_tier': 'elite',
+            'feature': 'numerology_predictive'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        user_full_name = None
+        if hasattr(user, 'full_name') and user.full_name:
+            user_full_name = user.full_name
+        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        if not user_full_name or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Full name and birth date are required.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        numerology_profile = NumerologyProfile.objects.get(user=user)
+        system = numerology_profile.calculation_system
+        
+        # Get target year from query params or use current year
+        target_year = int(request.query_params.get('year', date.today().year))
+        
+        service = PredictiveNumerologyService(system=system)
+        forecast = service.generate_yearly_forecast(
+            user.profile.date_of_birth,
+            target_year,
+            user_full_name
+        )
+        
+        return Response({
+            'success': True,
+            'forecast': forecast
+        })
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Numerology profile not found.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f"Error getting yearly forecast: {str(e)}")
+        return Response({
+            'error': f'Failed to get yearly forecast: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
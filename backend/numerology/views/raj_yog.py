@@ -0,0 +1,178 @@
+"""
+API views for Raj Yog detection and explanation endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from ..models import NumerologyProfile, Person, PersonNumerologyProfile, RajYogDetection, Explanation
+from ..serializers import RajYogDetectionSerializer, ExplanationSerializer
+from ..numerology import NumerologyCalculator
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_raj_yog_detection(request, person_id=None):
+    """
+    Get Raj Yog detection for user or specific person.
+    
+    If person_id is provided, detects Raj Yog for that person.
+    Otherwise, detects for the authenticated user.
+    """
+    user = request.user
+    
+    try:
+        # Get numerology profile
+        if person_id:
+            person = Person.objects.get(id=person_id, user=user)
+            try:
+                profile = PersonNumerologyProfile.objects.get(person=person)
+            except PersonNumerologyProfile.DoesNotExist:
+                return Response({
+                    'error': 'Numerology profile not found. Please calculate profile first.'
+                }, status=status.HTTP_404_NOT_FOUND)
+            
+            life_path = profile.life_path_number
+            destiny = profile.destiny_number
+            soul_urge = profile.soul_urge_number
+            personality = profile.personality_number
+            calculation_system = profile.calculation_system
+            person_obj = person
+        else:
+            try:
+                profile = NumerologyProfile.objects.get(user=user)
+            except NumerologyProfile.DoesNotExist:
+                return Response({
+                    'error': 'Numerology profile not found. Please calculate profile first.'
+                }, status=status.HTTP_404_NOT_FOUND)
+            
+            life_path = profile.life_path_number
+            destiny = profile.destiny_number
+            soul_urge = profile.soul_urge_number
+            personality = profile.personality_number
+            calculation_system = profile.calculation_system
+            person_obj = None
+        
+        # Detect Raj Yog
+        calculator = NumerologyCalculator(system=calculation_system)
+        raj_yog_data = calculator.detect_raj_yog(
+            life_path=life_path,
+            destiny=destiny,
+            soul_urge=soul_urge,
+            personality=personality
+        )
+        
+        # Get or create Raj Yog detection record
+        detection, created = RajYogDetection.objects.update_or_create(
+            user=user,
+            person=person_obj,
+            defaults={
+                'is_detected': raj_yog_data['is_detected'],
+                'yog_type': raj_yog_data.get('yog_type'),
+                'yog_name': raj_yog_data.get('yog_name'),
+                'strength_score': raj_yog_data.get('strength_score', 0),
+                'contributing_numbers': raj_yog_data.get('contributing_numbers', {}),
+                'detected_combinations': raj_yog_data.get('detected_combinations', []),
+                'calculation_system': calculation_system
+            }
+        )
+        
+        serializer = RajYogDetectionSerializer(detection)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+        
+    except Person.DoesNotExist:
+        return Response({'error': 'Person not found'}, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        return Response({
+            'error': 'Error detecting Raj Yog',
+            'message': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def generate_raj_yog_explanation(request, person_id=None):
+    """
+    Generate LLM explanation for Raj Yog detection.
+    
+    If person_id is provided, generates explanation for that person.
+    Otherwise, generates for the authenticated user.
+    """
+    user = request.user
+    
+    try:
+        from ..services.explanation_generator import get_explanation_generator
+        
+        # Get Raj Yog detection
+        if person_id:
+            person = Person.objects.get(id=person_id, user=user)
+            detection = RajYogDetection.objects.filter(user=user, person=person).first()
+            if not detection:
+                return Response({
+                    'error': 'Raj Yog detection not found. Please detect Raj Yog first.'
+                }, status=status.HTTP_404_NOT_FOUND)
+            
+            profile = PersonNumerologyProfile.objects.get(person=person)
+            numerology_profile = {
+                'life_path_number': profile.life_path_number,
+                'destiny_number': profile.destiny_number,
+                'soul_urge_number': profile.soul_urge_number,
+                'personality_number': profile.personality_number
+            }
+        else:
+            detection = RajYogDetection.objects.filter(user=user, person=None).first()
+            if not detection:
+                return Response({
+                    'error': 'Raj Yog detection not found. Please detect Raj Yog first.'
+                }, status=status.HTTP_404_NOT_FOUND)
+            
+            profile = NumerologyProfile.objects.get(user=user)
+            numerology_profile = {
+                'life_path_number': profile.life_path_number,
+                'destiny_number': profile.destiny_number,
+                'soul_urge_number': profile.soul_urge_number,
+                'personality_number': profile.personality_number
+            }
+        
+        # Prepare Raj Yog data
+        raj_yog_data = {
+            'is_detected': detection.is_detected,
+            'yog_type': detection.yog_type,
+            'yog_name': detection.yog_name,
+            'strength_score': detection.strength_score,
+            'detected_combinations': detection.detected_combinations,
+            'contributing_numbers': detection.contributing_numbers
+        }
+        
+        # Generate explanation
+        generator = get_explanation_generator()
+        explanation = generator.generate_raj_yog_explanation(
+            user=user,
+            raj_yog_data=raj_yog_data,
+            numerology_profile=numerology_profile
+        )
+        
+        serializer = ExplanationSerializer(explanation)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        
+    except Person.DoesNotExist:
+        return Response({'error': 'Person not found'}, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        return Response({
+            'error': 'Error generating explanation',
+            'message': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_explanation(request, explanation_id):
+    """Get a specific explanation by ID."""
+    try:
+        explanation = Explanation.objects.get(id=explanation_id, user=request.user)
+        serializer = ExplanationSerializer(explanation)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+    except Explanation.DoesNotExist:
+        return Response({'error': 'Explanation not found'}, status=status.HTTP_404_NOT_FOUND)
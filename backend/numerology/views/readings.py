@@ -0,0 +1,170 @@
+"""
+API views for daily reading endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from datetime import date
+from ..models import NumerologyProfile, DailyReading
+from ..serializers import DailyReadingSerializer
+from ..numerology import NumerologyCalculator
+from ..reading_generator import DailyReadingGenerator
+from ..cache import NumerologyCache
+from utils.pagination import KeysetPagination
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_daily_reading(request):
+    """Get daily numerology reading for user."""
+    user = request.user
+    reading_date_str = request.query_params.get('date')
+    
+    # Parse date or use today
+    if reading_date_str:
+        try:
+            # Import datetime module correctly
+            from datetime import datetime as dt
+            reading_date = dt.strptime(reading_date_str, '%Y-%m-%d').date()
+        except ValueError:
+            return Response({
+                'error': 'Invalid date format. Use YYYY-MM-DD'
+            }, status=status.HTTP_400_BAD_REQUEST)
+    else:
+        reading_date = date.today()
+    
+    # Check cache first
+    cached_reading = NumerologyCache.get_daily_reading(str(user.id), str(reading_date))
+    if cached_reading:
+        return Response(cached_reading, status=status.HTTP_200_OK)
+    
+    try:
+        # Get or create daily reading
+        try:
+            reading = DailyReading.objects.get(user=user, reading_date=reading_date)
+        except DailyReading.DoesNotExist:
+            # Validate user has profile with birth date
+            if not user.profile.date_of_birth:
+                return Response({
+                    'error': 'Please complete your profile with birth date first'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            # Calculate personal day number
+            try:
+                calculator = NumerologyCalculator()
+                personal_day_number = calculator.calculate_personal_day_number(
+                    user.profile.date_of_birth,
+                    reading_date
+                )
+            except Exception as e:
+                return Response({
+                    'error': f'Failed to calculate personal day number: {str(e)}'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            # Get user's numerology profile for personalization
+            try:
+                numerology_profile = NumerologyProfile.objects.get(user=user)
+                user_profile = {
+                    'life_path_number': numerology_profile.life_path_number,
+                    'destiny_number': numerology_profile.destiny_number,
+                    'soul_urge_number': numerology_profile.soul_urge_number,
+                    'personality_number': numerology_profile.personality_number,
+                    'personal_year_number': numerology_profile.personal_year_number,
+                }
+                
+                # Generate personalized reading
+                try:
+                    generator = DailyReadingGenerator()
+                    reading_content = generator.generate_personalized_reading(personal_day_number, user_profile)
+                except Exception as e:
+                    return Response({
+                        'error': f'Failed to generate personalized reading: {str(e)}'
+                    }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            except NumerologyProfile.DoesNotExist:
+                # Fall back to basic reading if no numerology profile
+                try:
+                    generator = DailyReadingGenerator()
+                    reading_content = generator.generate_reading(personal_day_number)
+                except Exception as e:
+                    return Response({
+                        'error': f'Failed to generate basic reading: {str(e)}'
+                    }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            
+            # Create the reading in database
+            try:
+                reading = DailyReading.objects.create(
+                    user=user,
+                    reading_date=reading_date,
+                    personal_day_number=personal_day_number,
+                    lucky_number=reading_content['lucky_number'],
+                    lucky_color=reading_content['lucky_color'],
+                    auspicious_time=reading_content['auspicious_time'],
+                    activity_recommendation=reading_content['activity_recommendation'],
+                    warning=reading_content['warning'],
+                    affirmation=reading_content['affirmation'],
+                    actionable_tip=reading_content['actionable_tip']
+                )
+            except Exception as e:
+                return Response({
+                    'error': f'Failed to save reading to database: {str(e)}'
+                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+                
+    except Exception as e:
+        return Response({
+            'error': f'Unexpected error occurred: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
+    # Check if enhanced reading is requested
+    enhanced = request.query_params.get('enhanced', 'false').lower() == 'true'
+    
+    # Serialize and return the reading
+    try:
+        serializer = DailyReadingSerializer(reading)
+        reading_data = dict(serializer.data) if not isinstance(serializer.data, dict) else serializer.data
+        
+        if enhanced:
+            # Generate enhanced reading with detailed interpretation
+            try:
+                generator = DailyReadingGenerator()
+                enhanced_content = generator.generate_reading(reading.personal_day_number)
+                reading_data.update({
+                    'detailed_interpretation': enhanced_content.get('detailed_interpretation', ''),
+                    'color_therapy': enhanced_content.get('color_therapy', {}),
+                    'crystals': enhanced_content.get('crystals', {}),
+                    'meditation': enhanced_content.get('meditation', {}),
+                })
+            except Exception as e:
+                logger.error(f'Error generating enhanced reading: {str(e)}')
+                # Continue with regular reading if enhancement fails
+        
+        # Cache the result
+        try:
+            NumerologyCache.set_daily_reading(str(user.id), str(reading_date), reading_data)
+        except Exception:
+            # Don't fail if caching fails
+            pass
+            
+        return Response(reading_data, status=status.HTTP_200_OK)
+    except Exception as e:
+        return Response({
+            'error': f'Failed to serialize reading: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_reading_history(request):
+    """Get reading history, newest first, with keyset pagination."""
+    user = request.user
+    
+    readings = DailyReading.objects.filter(user=user)
+    
+    paginator = KeysetPagination('reading_date')
+    page = paginator.paginate_queryset(readings, request)
+    serializer = DailyReadingSerializer(page, many=True)
+    return paginator.get_paginated_response(serializer.data)
@@ -0,0 +1,133 @@
+"""
+API views for relationship numerology endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from datetime import datetime
+from ..services.relationship_numerology import RelationshipNumerologyService
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def calculate_enhanced_compatibility(request):
+    """Calculate enhanced relationship compatibility."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_relationships'):
+        return Response({
+            'error': 'Enhanced relationship numerology is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_relationships'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    profile_1_data = request.data.get('profile_1')
+    profile_2_data = request.data.get('profile_2')
+    relationship_type = request.data.get('relationship_type', 'romantic')
+    
+    if not profile_1_data or not profile_2_data:
+        return Response({
+            'error': 'Both profile_1 and profile_2 are required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        service = RelationshipNumerologyService()
+        result = service.calculate_enhanced_compatibility(
+            profile_1_data,
+            profile_2_data,
+            relationship_type
+        )
+        
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error calculating enhanced compatibility: {str(e)}")
+        return Response({
+            'error': f'Failed to calculate compatibility: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def compare_multiple_partners(request):
+    """Compare user with multiple partners."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_multi_partner'):
+        return Response({
+            'error': 'Multi-partner comparison is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_multi_partner'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    user_profile_data = request.data.get('user_profile')
+    partner_profiles = request.data.get('partner_profiles', [])
+    
+    if not user_profile_data or not partner_profiles:
+        return Response({
+            'error': 'user_profile and partner_profiles are required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        service = RelationshipNumerologyService()
+        result = service.compare_multiple_partners(
+            user_profile_data,
+            partner_profiles
+        )
+        
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error comparing partners: {str(e)}")
+        return Response({
+            'error': f'Failed to compare partners: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def calculate_marriage_harmony_cycles(request):
+    """Calculate marriage harmony cycles."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_marriage_harmony'):
+        return Response({
+            'error': 'Marriage harmony cycles are available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_marriage_harmony'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    profile_1_data = request.data.get('profile_1')
+    profile_2_data = request.data.get('profile_2')
+    marriage_date_str = request.data.get('marriage_date')
+    
+    if not profile_1_data or not profile_2_data:
+        return Response({
+            'error': 'Both profile_1 and profile_2 are required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    marriage_date = None
+    if marriage_date_str:
+        marriage_date = datetime.strptime(marriage_date_str, '%Y-%m-%d').date()
+    
+    try:
+        service = RelationshipNumerologyService()
+        result = service.calculate_marriage_harmony_cycles(
+            profile_1_data,
+            profile_2_data,
+            marriage_date
+        )
+        
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error calculating marriage harmony: {str(e)}")
+        return Response({
+            'error': f'Failed to calculate marriage harmony: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
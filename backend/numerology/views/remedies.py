@@ -0,0 +1,564 @@
+"""
+API views for remedy endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from datetime import timedelta, date, datetime
+from ..models import NumerologyProfile, Remedy, RemedyTracking
+from ..serializers import RemedySerializer, RemedyTrackingSerializer
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_personalized_remedies(request):
+    """Get personalized remedies based on user's numerology profile."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    # Check subscription access
+    if not can_access_feature(user, 'rectification_suggestions'):
+        return Response({
+            'error': 'Personalized Remedies are available for Premium plan and above. Please upgrade your subscription.',
+            'required_tier': 'premium',
+            'feature': 'rectification_suggestions'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Please calculate your numerology profile first.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    # Check if remedies already exist
+    existing_remedies = Remedy.objects.filter(user=user, is_active=True)
+    if existing_remedies.exists():
+        serializer = RemedySerializer(existing_remedies, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+    
+    try:
+        # Generate new remedies based on numerology profile
+        remedies = []
+        
+        # Gemstone remedy
+        gemstone_remedies = {
+            1: {"title": "Ruby for Leadership", "description": "Enhances leadership qualities and confidence", "recommendation": "Wear as a ring on the right hand on Sunday"},
+            2: {"title": "Pearl for Harmony", "description": "Promotes peace and emotional balance", "recommendation": "Wear as a pendant on Monday"},
+            3: {"title": "Yellow Sapphire for Creativity", "description": "Boosts creativity and communication", "recommendation": "Wear as a ring on Thursday"},
+            4: {"title": "Emerald for Stability", "description": "Brings stability and growth", "recommendation": "Wear as a pendant on Wednesday"},
+            5: {"title": "Peridot for Freedom", "description": "Enhances adaptability and freedom", "recommendation": "Wear as a ring on Wednesday"},
+            6: {"title": "Pink Tourmaline for Love", "description": "Attracts love and harmony", "recommendation": "Wear as a pendant on Friday"},
+            7: {"title": "Amethyst for Wisdom", "description": "Enhances intuition and wisdom", "recommendation": "Wear as a ring on Saturday"},
+            8: {"title": "Diamond for Power", "description": "Brings success and abundance", "recommendation": "Wear as a ring on Saturday"},
+            9: {"title": "Bloodstone for Compassion", "description": "Enhances compassion and healing", "recommendation": "Wear as a pendant on Tuesday"},
+            11: {"title": "White Sapphire for Illumination", "description": "Enhances spiritual insight", "recommendation": "Wear as a ring on Sunday"},
+            22: {"title": "Blue Sapphire for Mastery", "description": "Enhances leadership and vision", "recommendation": "Wear as a pendant on Saturday"},
+            33: {"title": "Clear Quartz for Teaching", "description": "Enhances healing and teaching abilities", "recommendation": "Wear as a pendant on Sunday"}
+        }
+        
+        if profile.life_path_number in gemstone_remedies:
+            gemstone_data = gemstone_remedies[profile.life_path_number]
+            remedy = Remedy.objects.create(
+                user=user,
+                remedy_type='gemstone',
+                title=gemstone_data['title'],
+                description=gemstone_data['description'],
+                recommendation=gemstone_data['recommendation']
+            )
+            remedies.append(remedy)
+        
+        # Color remedy
+        color_remedies = {
+            1: {"title": "Red for Energy", "description": "Boosts energy and vitality", "recommendation": "Incorporate red in clothing or home decor on Sundays"},
+            2: {"title": "Silver for Harmony", "description": "Promotes peace and balance", "recommendation": "Incorporate silver in clothing or accessories on Mondays"},
+            3: {"title": "Yellow for Creativity", "description": "Enhances creativity and joy", "recommendation": "Incorporate yellow in clothing or home decor on Thursdays"},
+            4: {"title": "Green for Growth", "description": "Brings stability and growth", "recommendation": "Incorporate green in clothing or home decor on Wednesdays"},
+            5: {"title": "Orange for Freedom", "description": "Enhances adaptability and change", "recommendation": "Incorporate orange in clothing or home decor on Wednesdays"},
+            6: {"title": "Pink for Love", "description": "Attracts love and harmony", "recommendation": "Incorporate pink in clothing or home decor on Fridays"},
+            7: {"title": "Purple for Wisdom", "description": "Enhances intuition and spirituality", "recommendation": "Incorporate purple in clothing or home decor on Saturdays"},
+            8: {"title": "White for Power", "description": "Brings success and clarity", "recommendation": "Incorporate white in clothing or home decor on Saturdays"},
+            9: {"title": "Blue for Compassion", "description": "Enhances compassion and healing", "recommendation": "Incorporate blue in clothing or home decor on Tuesdays"},
+            11: {"title": "White for Illumination", "description": "Enhances spiritual insight", "recommendation": "Incorporate white in clothing or home decor on Sundays"},
+            22: {"title": "Blue for Mastery", "description": "Enhances leadership and vision", "recommendation": "Incorporate blue in clothing or home decor on Saturdays"},
+            33: {"title": "Clear for Teaching", "description": "Enhances healing and teaching abilities", "recommendation": "Incorporate clear/white in clothing or home decor on Sundays"}
+        }
+        
+        if profile.life_path_number in color_remedies:
+            color_data = color_remedies[profile.life_path_number]
+            remedy = Remedy.objects.create(
+                user=user,
+                remedy_type='color',
+                title=color_data['title'],
+                description=color_data['description'],
+                recommendation=color_data['recommendation']
+            )
+            remedies.append(remedy)
+        
+        # Ritual remedy
+        ritual_remedies = {
+            1: {"title": "Morning Affirmations", "description": "Boost confidence and set intentions", "recommendation": "Practice 10 minutes of affirmations each morning"},
+            2: {"title": "Meditation for Peace", "description": "Promote inner harmony", "recommendation": "Practice 15 minutes of meditation daily"},
+            3: {"title": "Creative Expression", "description": "Enhance self-expression", "recommendation": "Engage in creative activities for 30 minutes daily"},
+            4: {"title": "Grounding Exercises", "description": "Build stability", "recommendation": "Practice grounding exercises like walking barefoot for 10 minutes"},
+            5: {"title": "Adventure Time", "description": "Embrace change and freedom", "recommendation": "Try something new once a week"},
+            6: {"title": "Heart Opening", "description": "Cultivate love and compassion", "recommendation": "Practice heart-opening yoga poses 3 times a week"},
+            7: {"title": "Study Time", "description": "Enhance wisdom and knowledge", "recommendation": "Dedicate 30 minutes daily to learning"},
+            8: {"title": "Goal Setting", "description": "Focus on success and abundance", "recommendation": "Review and set goals weekly"},
+            9: {"title": "Service to Others", "description": "Express compassion", "recommendation": "Perform one act of service weekly"},
+            11: {"title": "Spiritual Practice", "description": "Enhance spiritual connection", "recommendation": "Practice spiritual activities daily"},
+            22: {"title": "Vision Planning", "description": "Work on big dreams", "recommendation": "Dedicate time monthly to vision planning"},
+            33: {"title": "Healing Practice", "description": "Develop healing abilities", "recommendation": "Practice healing techniques weekly"}
+        }
+        
+        if profile.life_path_number in ritual_remedies:
+            ritual_data = ritual_remedies[profile.life_path_number]
+            remedy = Remedy.objects.create(
+                user=user,
+                remedy_type='ritual',
+                title=ritual_data['title'],
+                description=ritual_data['description'],
+                recommendation=ritual_data['recommendation']
+            )
+            remedies.append(remedy)
+        
+        # Add personalized remedies based on other numerology numbers
+        # Mantra remedy based on Soul Urge Number
+        soul_urge_mantras = {
+            1: {"title": "Mantra for Leadership", "description": "Enhance your leadership qualities", "recommendation": "Chant 'Om Hum' 108 times on Sundays for confidence"},
+            2: {"title": "Mantra for Harmony", "description": "Promote peace and balance", "recommendation": "Chant 'Om Shantih' 108 times on Mondays for harmony"},
+            3: {"title": "Mantra for Creativity", "description": "Boost creativity and communication", "recommendation": "Chant 'Om Aim' 108 times on Thursdays for creativity"},
+            4: {"title": "Mantra for Stability", "description": "Bring stability and focus", "recommendation": "Chant 'Om Hrim' 108 times on Wednesdays for stability"},
+            5: {"title": "Mantra for Freedom", "description": "Enhance adaptability and change", "recommendation": "Chant 'Om Pim' 108 times on Wednesdays for freedom"},
+            6: {"title": "Mantra for Love", "description": "Attract love and harmony", "recommendation": "Chant 'Om Shrim' 108 times on Fridays for love"},
+            7: {"title": "Mantra for Wisdom", "description": "Enhance intuition and wisdom", "recommendation": "Chant 'Om Aum' 108 times on Saturdays for wisdom"},
+            8: {"title": "Mantra for Power", "description": "Bring success and abundance", "recommendation": "Chant 'Om Mahalakshmiyei Swaha' 108 times on Saturdays for abundance"},
+            9: {"title": "Mantra for Compassion", "description": "Enhance compassion and healing", "recommendation": "Chant 'Om Mani Padme Hum' 108 times on Tuesdays for compassion"},
+            11: {"title": "Mantra for Illumination", "description": "Enhance spiritual insight", "recommendation": "Chant 'Om Namah Shivaya' 108 times on Sundays for spiritual growth"},
+            22: {"title": "Mantra for Mastery", "description": "Enhance leadership and vision", "recommendation": "Chant 'Om Gam Ganapataye Namaha' 108 times on Saturdays for removing obstacles"},
+            33: {"title": "Mantra for Teaching", "description": "Enhance healing and teaching abilities", "recommendation": "Chant 'Om Tare Tuttare Ture Soha' 108 times on Sundays for compassion"}
+        }
+        
+        if profile.soul_urge_number in soul_urge_mantras:
+            mantra_data = soul_urge_mantras[profile.soul_urge_number]
+            remedy = Remedy.objects.create(
+                user=user,
+                remedy_type='mantra',
+                title=mantra_data['title'],
+                description=mantra_data['description'],
+                recommendation=mantra_data['recommendation']
+            )
+            remedies.append(remedy)
+        
+        # Dietary remedy based on Personality Number
+        personality_diet = {
+            1: {"title": "Foods for Energy", "description": "Boost energy and vitality", "recommendation": "Include protein-rich foods like eggs, nuts, and lean meats. Eat spicy foods for energy."},
+            2: {"title": "Foods for Harmony", "description": "Promote peace and balance", "recommendation": "Focus on dairy products, fruits, and温和 foods. Avoid overly spicy or acidic foods."},
+            3: {"title": "Foods for Creativity", "description": "Enhance creativity and joy", "recommendation": "Include colorful fruits and vegetables. Add natural sweeteners like honey for joy."},
+            4: {"title": "Foods for Stability", "description": "Bring stability and grounding", "recommendation": "Focus on root vegetables, grains, and hearty foods. Eat regular, balanced meals."},
+            5: {"title": "Foods for Freedom", "description": "Enhance adaptability and change", "recommendation": "Include variety in your diet. Try new foods and cuisines regularly."},
+            6: {"title": "Foods for Love", "description": "Attract love and harmony", "recommendation": "Include heart-healthy foods like berries, dark chocolate, and leafy greens."},
+            7: {"title": "Foods for Wisdom", "description": "Enhance intuition and spirituality", "recommendation": "Focus on light, pure foods. Include fish, nuts, and fresh herbs."},
+            8: {"title": "Foods for Power", "description": "Bring success and abundance", "recommendation": "Include foods that support energy and focus like green tea, dark chocolate, and whole grains."},
+            9: {"title": "Foods for Compassion", "description": "Enhance compassion and healing", "recommendation": "Focus on plant-based foods and cleansing foods like lemon water and green tea."},
+            11: {"title": "Foods for Illumination", "description": "Enhance spiritual insight", "recommendation": "Include foods that enhance mental clarity like blueberries, walnuts, and turmeric."},
+            22: {"title": "Foods for Mastery", "description": "Enhance leadership and vision", "recommendation": "Focus on foods that support brain function like salmon, avocados, and leafy greens."},
+            33: {"title": "Foods for Teaching", "description": "Enhance healing and teaching abilities", "recommendation": "Include anti-inflammatory foods like ginger, turmeric, and leafy greens."}
+        }
+        
+        if profile.personality_number in personality_diet:
+            diet_data = personality_diet[profile.personality_number]
+            remedy = Remedy.objects.create(
+                user=user,
+                remedy_type='dietary',
+                title=diet_data['title'],
+                description=diet_data['description'],
+                recommendation=diet_data['recommendation']
+            )
+            remedies.append(remedy)
+        
+        # Exercise remedy based on Personal Year Number
+        personal_year_exercise = {
+            1: {"title": "Exercise for New Beginnings", "description": "Boost energy for new initiatives", "recommendation": "Try high-energy activities like running, martial arts, or competitive sports."},
+            2: {"title": "Exercise for Partnership", "description": "Promote cooperation and balance", "recommendation": "Participate in partner activities like dancing, tennis, or yoga classes."},
+            3: {"title": "Exercise for Expression", "description": "Enhance creativity and communication", "recommendation": "Try expressive activities like dance, aerobics, or group fitness classes."},
+            4: {"title": "Exercise for Stability", "description": "Build structure and discipline", "recommendation": "Focus on structured activities like weight training, hiking, or regular gym routines."},
+            5: {"title": "Exercise for Change", "description": "Embrace freedom and adventure", "recommendation": "Try varied activities like cycling, swimming, or outdoor adventures."},
+            6: {"title": "Exercise for Harmony", "description": "Cultivate love and service", "recommendation": "Practice activities that connect you with others like group sports or community walks."},
+            7: {"title": "Exercise for Wisdom", "description": "Enhance introspection and knowledge", "recommendation": "Focus on mindful activities like yoga, tai chi, or meditation walks."},
+            8: {"title": "Exercise for Achievement", "description": "Focus on success and power", "recommendation": "Engage in goal-oriented activities like personal training or competitive sports."},
+            9: {"title": "Exercise for Completion", "description": "Express compassion and service", "recommendation": "Participate in activities that serve others like charity runs or community sports."}
+        }
+        
+        if profile.personal_year_number in personal_year_exercise:
+            exercise_data = personal_year_exercise[profile.personal_year_number]
+            remedy = Remedy.objects.create(
+                user=user,
+                remedy_type='exercise',
+                title=exercise_data['title'],
+                description=exercise_data['description'],
+                recommendation=exercise_data['recommendation']
+            )
+            remedies.append(remedy)
+        
+        serializer = RemedySerializer(remedies, many=True)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+    
+    except Exception as e:
+        return Response({
+            'error': f'Failed to generate remedies: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def track_remedy(request, remedy_id):
+    """Track remedy practice."""
+    user = request.user
+    date_str = request.data.get('date')
+    is_completed = request.data.get('is_completed', False)
+    notes = request.data.get('notes', '')
+    
+    # Parse date
+    if date_str:
+        try:
+            track_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+        except ValueError:
+            return Response({
+                'error': 'Invalid date format. Use YYYY-MM-DD'
+            }, status=status.HTTP_400_BAD_REQUEST)
+    else:
+        track_date = date.today()
+    
+    try:
+        # Get remedy
+        remedy = Remedy.objects.get(id=remedy_id, user=user)
+        
+        # Create or update tracking
+        tracking, created = RemedyTracking.objects.update_or_create(
+            user=user,
+            remedy=remedy,
+            date=track_date,
+            defaults={
+                'is_completed': is_completed,
+                'notes': notes
+            }
+        )
+        
+        serializer = RemedyTrackingSerializer(tracking)
+        return Response(serializer.data, status=status.HTTP_200_OK if not created else status.HTTP_201_CREATED)
+    
+    except Remedy.DoesNotExist:
+        return Response({
+            'error': 'Remedy not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        return Response({
+            'error': f'Failed to track remedy: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_remedy_tracking_data(request, remedy_id):
+    """Get tracking data for a specific remedy."""
+    user = request.user
+    
+    try:
+        remedy = Remedy.objects.get(id=remedy_id, user=user)
+    except Remedy.DoesNotExist:
+        return Response({
+            'error': 'Remedy not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    
+    # Get date range from query params
+    start_date_str = request.query_params.get('start_date')
+    end_date_str = request.query_params.get('end_date')
+    
+    if start_date_str and end_date_str:
+        try:
+            start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
+            end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
+        except ValueError:
+            return Response({
+                'error': 'Invalid date format. Use YYYY-MM-DD'
+            }, status=status.HTTP_400_BAD_REQUEST)
+    else:
+        # Default to last 30 days
+        end_date = date.today()
+        start_date = end_date - timedelta(days=30)
+    
+    try:
+        from ..services.remedies_service import RemediesService
+        service = RemediesService()
+        progress_data = service.track_remedy_progress(user, remedy, start_date, end_date)
+        
+        return Response(progress_data, status=status.HTTP_200_OK)
+    
+    except Exception as e:
+        logger.error(f'Error getting remedy tracking data: {str(e)}')
+        return Response({
+            'error': 'Failed to get tracking data.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def submit_remedy_effectiveness(request, remedy_id):
+    """Submit effectiveness data for a remedy."""
+    user = request.user
+    
+    effectiveness_rating = request.data.get('effectiveness_rating')
+    mood_before = request.data.get('mood_before')
+    mood_after = request.data.get('mood_after')
+    date_str = request.data.get('date')
+    
+    if not date_str:
+        track_date = date.today()
+    else:
+        try:
+            track_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+        except ValueError:
+            return Response({
+                'error': 'Invalid date format. Use YYYY-MM-DD'
+            }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        remedy = Remedy.objects.get(id=remedy_id, user=user)
+    except Remedy.DoesNotExist:
+        return Response({
+            'error': 'Remedy not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    
+    try:
+        # Update or create tracking
+        tracking, created = RemedyTracking.objects.update_or_create(
+            user=user,
+            remedy=remedy,
+            date=track_date,
+            defaults={
+                'effectiveness_rating': effectiveness_rating,
+                'mood_before': mood_before,
+                'mood_after': mood_after,
+                'is_completed': True
+            }
+        )
+        
+        serializer = RemedyTrackingSerializer(tracking)
+        return Response(serializer.data, status=status.HTTP_200_OK if not created else status.HTTP_201_CREATED)
+    
+    except Exception as e:
+        logger.error(f'Error submitting effectiveness: {str(e)}')
+        return Response({
+            'error': 'Failed to submit effectiveness data.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_remedy_effectiveness(request):
+    """Get effectiveness analysis for all remedies or a specific remedy."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    # Check subscription access
+    if not can_access_feature(user, 'rectification_suggestions'):
+        return Response({
+            'error': 'Remedy effectiveness analysis is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'rectification_suggestions'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    remedy_id = request.query_params.get('remedy_id')
+    period_days = int(request.query_params.get('period_days', 30))
+    
+    try:
+        from ..services.remedies_service import RemediesService
+        service = RemediesService()
+        
+        if remedy_id:
+            remedy = Remedy.objects.get(id=remedy_id, user=user)
+            effectiveness = service.analyze_remedy_effectiveness(user, remedy, period_days)
+            return Response(effectiveness, status=status.HTTP_200_OK)
+        else:
+            # Get effectiveness for all active remedies
+            remedies = Remedy.objects.filter(user=user, is_active=True)
+            effectiveness_list = []
+            
+            for remedy in remedies:
+                try:
+                    eff = service.analyze_remedy_effectiveness(user, remedy, period_days)
+                    effectiveness_list.append(eff)
+                except Exception as e:
+                    logger.error(f'Error analyzing remedy {remedy.id}: {str(e)}')
+                    continue
+            
+            return Response({
+                'remedies': effectiveness_list,
+                'count': len(effectiveness_list)
+            }, status=status.HTTP_200_OK)
+    
+    except Remedy.DoesNotExist:
+        return Response({
+            'error': 'Remedy not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f'Error getting effectiveness: {str(e)}')
+        return Response({
+            'error': 'Failed to get effectiveness analysis.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_remedy_combinations(request):
+    """Get suggested remedy combinations."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    # Check subscription access
+    if not can_access_feature(user, 'rectification_suggestions'):
+        return Response({
+            'error': 'Remedy combinations are available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'rectification_suggestions'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    remedy_id = request.query_params.get('remedy_id')
+    
+    if not remedy_id:
+        return Response({
+            'error': 'remedy_id is required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        remedy = Remedy.objects.get(id=remedy_id, user=user)
+        
+        from ..services.remedies_service import RemediesService
+        service = RemediesService()
+        combinations = service.get_remedy_combinations(user, remedy)
+        
+        return Response({
+            'combinations': combinations,
+            'count': len(combinations)
+        }, status=status.HTTP_200_OK)
+    
+    except Remedy.DoesNotExist:
+        return Response({
+            'error': 'Remedy not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f'Error getting combinations: {str(e)}')
+        return Response({
+            'error': 'Failed to get remedy combinations.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def create_remedy_reminder(request):
+    """Create a reminder for remedy practice."""
+    user = request.user
+    
+    remedy_id = request.data.get('remedy_id')
+    frequency = request.data.get('frequency', 'daily')
+    reminder_time_str = request.data.get('reminder_time')
+    
+    if not remedy_id or not reminder_time_str:
+        return Response({
+            'error': 'remedy_id and reminder_time are required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        remedy = Remedy.objects.get(id=remedy_id, user=user)
+    except Remedy.DoesNotExist:
+        return Response({
+            'error': 'Remedy not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    
+    try:
+        from datetime import time as time_class
+        reminder_time = datetime.strptime(reminder_time_str, '%H:%M:%S').time()
+    except ValueError:
+        try:
+            reminder_time = datetime.strptime(reminder_time_str, '%H:%M').time()
+        except ValueError:
+            return Response({
+                'error': 'Invalid time format. Use HH:MM:SS or HH:MM'
+            }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        from ..services.remedies_service import RemediesService
+        service = RemediesService()
+        reminder_data = service.schedule_remedy_reminders(user, remedy, frequency, reminder_time)
+        
+        return Response(reminder_data, status=status.HTTP_201_CREATED)
+    
+    except Exception as e:
+        logger.error(f'Error creating reminder: {str(e)}')
+        return Response({
+            'error': 'Failed to create reminder.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_remedy_reminders(request):
+    """Get user's remedy reminders."""
+    user = request.user
+    
+    from ..models import RemedyReminder
+    reminders = RemedyReminder.objects.filter(user=user, is_active=True).order_by('next_send_at')
+    
+    reminders_data = []
+    for reminder in reminders:
+        reminders_data.append({
+            'id': str(reminder.id),
+            'remedy_id': str(reminder.remedy.id),
+            'remedy_title': reminder.remedy.title,
+            'frequency': reminder.frequency,
+            'reminder_time': reminder.reminder_time.strftime('%H:%M:%S'),
+            'next_send_at': reminder.next_send_at.isoformat() if reminder.next_send_at else None,
+            'is_active': reminder.is_active
+        })
+    
+    return Response({
+        'reminders': reminders_data,
+        'count': len(reminders_data)
+    }, status=status.HTTP_200_OK)
+
+
+
+@api_view(['DELETE'])
+@permission_classes([IsAuthenticated])
+def delete_remedy_reminder(request, reminder_id):
+    """Delete a remedy reminder."""
+    user = request.user
+    
+    from ..models import RemedyReminder
+    try:
+        reminder = RemedyReminder.objects.get(id=reminder_id, user=user)
+        reminder.delete()
+        
+        return Response({
+            'message': 'Reminder deleted successfully'
+        }, status=status.HTTP_200_OK)
+    
+    except RemedyReminder.DoesNotExist:
+        return Response({
+            'error': 'Reminder not found'
+        }, status=status.HTTP_404_NOT_FOUND)
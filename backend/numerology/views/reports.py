@@ -0,0 +1,873 @@
+"""
+API views for full, weekly and yearly report and PDF export endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from django.utils import timezone
+from django.http import HttpResponse
+from django.conf import settings
+from datetime import timedelta, date
+from ..models import (
+    NumerologyProfile, Person, PersonNumerologyProfile, RajYogDetection, NameReport, WeeklyReport,
+    YearlyReport, PhoneReport
+)
+from ..serializers import WeeklyReportSerializer, YearlyReportSerializer
+from ..interpretations import get_interpretation
+import traceback
+from io import BytesIO
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def export_birth_chart_pdf(request):
+    """Export birth chart as PDF."""
+    # reportlab is only needed here, so web and worker processes start without it
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib import colors
+    from reportlab.platypus import Table, TableStyle
+    user = request.user
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    
+    # Get user's full name safely
+    user_full_name = "User"
+    if hasattr(user, 'full_name') and user.full_name:
+        user_full_name = user.full_name
+    elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+        user_full_name = user.profile.full_name
+    
+    # Create PDF
+    response = HttpResponse(content_type='application/pdf')
+    response['Content-Disposition'] = f'attachment; filename="birth_chart_{user_full_name.replace(" ", "_")}.pdf"'
+    
+    # Create PDF document
+    buffer = BytesIO()
+    p = canvas.Canvas(buffer, pagesize=letter)
+    width, height = letter
+    
+    # Title
+    p.setFont("Helvetica-Bold", 24)
+    p.drawString(50, height - 50, f"Numerology Birth Chart for {user_full_name}")
+    
+    # User info
+    p.setFont("Helvetica", 12)
+    if hasattr(user, 'profile') and hasattr(user.profile, 'date_of_birth'):
+        p.drawString(50, height - 80, f"Date of Birth: {user.profile.date_of_birth}")
+    p.drawString(50, height - 100, f"Calculation Date: {profile.calculated_at.strftime('%Y-%m-%d')}")
+    
+    # Numbers table
+    data = [
+        ['Number Type', 'Value', 'Category'],
+        ['Life Path', str(profile.life_path_number), 'Life'],
+        ['Destiny', str(profile.destiny_number), 'Life'],
+        ['Soul Urge', str(profile.soul_urge_number), 'Life'],
+        ['Personality', str(profile.personality_number), 'Compatibility'],
+        ['Attitude', str(profile.attitude_number), 'Compatibility'],
+        ['Maturity', str(profile.maturity_number), 'Challenge'],
+        ['Balance', str(profile.balance_number), 'Challenge'],
+        ['Personal Year', str(profile.personal_year_number), 'Timing'],
+        ['Personal Month', str(profile.personal_month_number), 'Timing'],
+    ]
+    
+    table = Table(data)
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 14),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ]))
+    
+    table.wrapOn(p, width, height)
+    table.drawOn(p, 50, height - 300)
+    
+    # Footer
+    p.setFont("Helvetica", 10)
+    p.drawString(50, 50, "Generated by NumerAI - Your Personal Numerology Guide")
+    
+    p.showPage()
+    p.save()
+    
+    # Get the value of the BytesIO buffer and write it to the response
+    pdf = buffer.getvalue()
+    buffer.close()
+    response.write(pdf)
+    return response
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_full_numerology_report(request):
+    """Get comprehensive full numerology report combining birth date, name, and phone numerology."""
+    from ..subscription_utils import get_user_subscription_tier, get_available_features, can_access_feature
+    from ..remedy_generator import generate_rectification_suggestions
+    from ..serializers import FullNumerologyReportSerializer
+    
+    user = request.user
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Please calculate your numerology profile first.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        # Get subscription tier and available features
+        subscription_tier = get_user_subscription_tier(user)
+        available_features = get_available_features(user)
+        
+        # Get user's full name safely
+        user_full_name = user.full_name if hasattr(user, 'full_name') and user.full_name else "User"
+        if user_full_name == "User" and hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        # Get user birth date safely
+        user_birth_date = None
+        if hasattr(user, 'profile') and hasattr(user.profile, 'date_of_birth'):
+            user_birth_date = user.profile.date_of_birth
+        
+        # Birth date numerology (always available)
+        birth_date_interpretations = {}
+        number_fields = [
+            'life_path_number', 'destiny_number', 'soul_urge_number', 'personality_number',
+            'attitude_number', 'maturity_number', 'balance_number',
+            'personal_year_number', 'personal_month_number'
+        ]
+        
+        for field in number_fields:
+            number_value = getattr(profile, field)
+            try:
+                birth_date_interpretations[field] = get_interpretation(number_value)
+            except ValueError:
+                birth_date_interpretations[field] = None
+        
+        # Name numerology (subscription-gated)
+        name_report = None
+        if can_access_feature(user, 'name_numerology'):
+            name_report = NameReport.objects.filter(user=user).order_by('-computed_at').first()
+        
+        # Phone numerology (subscription-gated)
+        phone_report = None
+        if can_access_feature(user, 'phone_numerology'):
+            phone_report = PhoneReport.objects.filter(user=user).order_by('-computed_at').first()
+        
+        # Lo Shu Grid (subscription-gated)
+        lo_shu_grid = None
+        if can_access_feature(user, 'lo_shu_grid') and profile.lo_shu_grid:
+            lo_shu_grid = profile.lo_shu_grid
+        
+        # Rectification suggestions (subscription-gated)
+        rectification_suggestions = []
+        if can_access_feature(user, 'rectification_suggestions'):
+            rectification_suggestions = generate_rectification_suggestions(
+                profile=profile,
+                name_report=name_report,
+                phone_report=phone_report,
+                subscription_tier=subscription_tier
+            )
+        
+        # Detailed analysis (subscription-gated) - Include AI-generated readings
+        detailed_analysis = None
+        if can_access_feature(user, 'detailed_analysis'):
+            from ..models import DetailedReading
+            from ..ai_reading_generator import generate_detailed_reading
+            from ..tasks import generate_detailed_readings_for_profile
+            import logging
+            
+            logger = logging.getLogger(__name__)
+            
+            # Try to get existing AI-generated readings
+            detailed_readings = {}
+            core_numbers = {
+                'life_path': profile.life_path_number,
+                'destiny': profile.destiny_number,
+                'soul_urge': profile.soul_urge_number,
+                'personality': profile.personality_number,
+            }
+            
+            # Add optional numbers if they exist
+            if profile.attitude_number:
+                core_numbers['attitude'] = profile.attitude_number
+            if profile.maturity_number:
+                core_numbers['maturity'] = profile.maturity_number
+            if profile.balance_number:
+                core_numbers['balance'] = profile.balance_number
+            
+            missing_readings = []
+            for reading_type, number_value in core_numbers.items():
+                if not number_value:
+                    continue
+                    
+                try:
+                    reading = DetailedReading.objects.get(
+                        user=user,
+                        reading_type=reading_type,
+                        number=number_value
+                    )
+                    detailed_readings[reading_type] = {
+                        'detailed_interpretation': reading.detailed_interpretation,
+                        'career_insights': reading.career_insights,
+                        'relationship_insights': reading.relationship_insights,
+                        'life_purpose': reading.life_purpose,
+                        'challenges_and_growth': reading.challenges_and_growth,
+                        'personalized_advice': reading.personalized_advice,
+                        'generated_at': reading.generated_at.isoformat() if reading.generated_at else None,
+                        'ai_generated': True,
+                    }
+                except DetailedReading.DoesNotExist:
+                    missing_readings.append((reading_type, number_value))
+                    # Fallback to basic interpretation if AI reading not available
+                    basic_interp = birth_date_interpretations.get(f'{reading_type}_number', {})
+                    if isinstance(basic_interp, dict):
+                        detailed_readings[reading_type] = {
+                            'detailed_interpretation': basic_interp.get('description', '') if basic_interp else '',
+                            'career_insights': ', '.join(basic_interp.get('career', [])) if isinstance(basic_interp.get('career'), list) else (basic_interp.get('career', '') if basic_interp else ''),
+                            'relationship_insights': basic_interp.get('relationships', '') if basic_interp else '',
+                            'life_purpose': basic_interp.get('life_purpose', '') if basic_interp else '',
+                            'challenges_and_growth': ', '.join(basic_interp.get('challenges', [])) if isinstance(basic_interp.get('challenges'), list) else (basic_interp.get('challenges', '') if basic_interp else ''),
+                            'personalized_advice': basic_interp.get('advice', '') if basic_interp else '',
+                            'generated_at': None,
+                            'ai_generated': False,
+                            'note': 'AI-generated reading not available. Using basic interpretation.',
+                        }
+                    else:
+                        detailed_readings[reading_type] = {
+                            'detailed_interpretation': '',
+                            'career_insights': '',
+                            'relationship_insights': '',
+                            'life_purpose': '',
+                            'challenges_and_growth': '',
+                            'personalized_advice': '',
+                            'generated_at': None,
+                            'ai_generated': False,
+                            'note': 'AI-generated reading not available.',
+                        }
+            
+            # Trigger async generation for missing readings (non-blocking)
+            if missing_readings:
+                try:
+                    generate_detailed_readings_for_profile.delay(str(user.id))
+                    logger.info(f'Queued AI reading generation for {len(missing_readings)} missing readings for user {user.id}')
+                except Exception as e:
+                    logger.warning(f'Failed to queue AI reading generation: {str(e)}')
+            
+            detailed_analysis = detailed_readings
+        
+        # Compatibility insights (subscription-gated)
+        compatibility_insights = []
+        if can_access_feature(user, 'compatibility_insights'):
+            if hasattr(user, 'compatibility_checks'):
+                recent_checks = user.compatibility_checks.order_by('-created_at')[:5]
+                for check in recent_checks:
+                    compatibility_insights.append({
+                        'partner_name': check.partner_name,
+                        'compatibility_score': check.compatibility_score,
+                        'relationship_type': check.relationship_type,
+                        'strengths': check.strengths,
+                        'challenges': check.challenges,
+                        'advice': check.advice,
+                    })
+        
+        # Raj Yog analysis (elite only)
+        raj_yog_analysis = None
+        if can_access_feature(user, 'raj_yog_analysis'):
+            try:
+                raj_yog = RajYogDetection.objects.filter(user=user).order_by('-detected_at').first()
+                if raj_yog:
+                    raj_yog_analysis = {
+                        'is_detected': raj_yog.is_detected,
+                        'yog_type': raj_yog.yog_type,
+                        'yog_name': raj_yog.yog_name,
+                        'strength_score': raj_yog.strength_score,
+                        'contributing_numbers': raj_yog.contributing_numbers,
+                        'detected_combinations': raj_yog.detected_combinations,
+                    }
+            except Exception:
+                pass
+        
+        # Yearly forecast (elite only)
+        yearly_forecast = None
+        if can_access_feature(user, 'yearly_forecast'):
+            try:
+                from datetime import date
+                current_year = date.today().year
+                yearly_report = YearlyReport.objects.filter(user=user, year=current_year).first()
+                if yearly_report:
+                    yearly_forecast = {
+                        'year': yearly_report.year,
+                        'personal_year_number': yearly_report.personal_year_number,
+                        'annual_overview': yearly_report.annual_overview,
+                        'major_themes': yearly_report.major_themes,
+                        'opportunities': yearly_report.opportunities,
+                        'challenges': yearly_report.challenges,
+                    }
+            except Exception:
+                pass
+        
+        # Expert recommendations (elite only)
+        expert_recommendations = []
+        if can_access_feature(user, 'expert_recommendations'):
+            # This would typically come from expert consultations or AI analysis
+            # For now, provide general recommendations based on profile
+            if profile.karmic_debt_number:
+                expert_recommendations.append({
+                    'type': 'karmic_debt',
+                    'title': f'Address Karmic Debt {profile.karmic_debt_number}',
+                    'description': 'Consider consulting with a numerology expert to understand and work through your karmic debt.',
+                })
+            if profile.life_path_number in [11, 22, 33]:
+                expert_recommendations.append({
+                    'type': 'master_number',
+                    'title': f'Master Number Guidance',
+                    'description': 'Master numbers require special understanding. Consider expert consultation for deeper insights.',
+                })
+        
+        # Pinnacle Cycles (premium feature - part of detailed analysis)
+        pinnacle_cycles = None
+        if can_access_feature(user, 'detailed_analysis') and user_birth_date:
+            from ..numerology import NumerologyCalculator
+            from ..interpretations import get_interpretation
+            
+            calculator = NumerologyCalculator()
+            pinnacle_numbers = calculator.calculate_pinnacles(user_birth_date)
+            challenge_numbers = calculator.calculate_challenges(user_birth_date)
+            
+            # Calculate age ranges for pinnacle cycles
+            # Standard formula: P1: 0 to (36 - life_path), P2: (36 - life_path) to (36 - life_path) + 9, etc.
+            life_path = profile.life_path_number
+            if life_path in [11, 22, 33]:
+                # Master numbers use reduced value for age calculation
+                life_path_reduced = calculator._reduce_to_single_digit(life_path, False)
+            else:
+                life_path_reduced = life_path
+            
+            p1_start = 0
+            p1_end = max(27, 36 - life_path_reduced)
+            p2_start = p1_end
+            p2_end = p1_end + 9
+            p3_start = p2_end
+            p3_end = p2_end + 9
+            p4_start = p3_end
+            
+            pinnacle_cycles = []
+            for i, pinnacle_num in enumerate(pinnacle_numbers, 1):
+                challenge_num = challenge_numbers[i-1] if i-1 < len(challenge_numbers) else None
+                
+                if i == 1:
+                    age_range = f"Birth to {p1_end}"
+                elif i == 2:
+                    age_range = f"{p2_start} to {p2_end}"
+                elif i == 3:
+                    age_range = f"{p3_start} to {p3_end}"
+                else:
+                    age_range = f"{p4_start} onwards"
+                
+                try:
+                    pinnacle_interp = get_interpretation(pinnacle_num)
+                    challenge_interp = get_interpretation(challenge_num) if challenge_num else None
+                except ValueError:
+                    pinnacle_interp = None
+                    challenge_interp = None
+                
+                pinnacle_cycles.append({
+                    'cycle_number': i,
+                    'pinnacle_number': pinnacle_num,
+                    'age_range': age_range,
+                    'start_age': p1_start if i == 1 else (p2_start if i == 2 else (p3_start if i == 3 else p4_start)),
+                    'end_age': p1_end if i == 1 else (p2_end if i == 2 else (p3_end if i == 3 else None)),
+                    'theme': pinnacle_interp.get('title', '') if pinnacle_interp else '',
+                    'description': pinnacle_interp.get('description', '') if pinnacle_interp else '',
+                    'challenge_number': challenge_num,
+                    'challenge_description': challenge_interp.get('description', '') if challenge_interp else '',
+                })
+        
+        # Challenges & Opportunities Analysis (premium feature)
+        challenges_opportunities = None
+        if can_access_feature(user, 'detailed_analysis') and user_birth_date:
+            from ..numerology import NumerologyCalculator
+            from ..interpretations import get_interpretation
+            
+            calculator = NumerologyCalculator()
+            challenge_numbers = calculator.calculate_challenges(user_birth_date)
+            
+            challenges = []
+            opportunities = []
+            
+            # Analyze challenges
+            for i, challenge_num in enumerate(challenge_numbers, 1):
+                if challenge_num and challenge_num > 0:
+                    try:
+                        challenge_interp = get_interpretation(challenge_num)
+                        challenges.append({
+                            'cycle': i,
+                            'number': challenge_num,
+                            'title': challenge_interp.get('title', ''),
+                            'description': challenge_interp.get('description', ''),
+                            'lessons': ', '.join(challenge_interp.get('challenges', [])) if isinstance(challenge_interp.get('challenges'), list) else challenge_interp.get('challenges', ''),
+                        })
+                    except ValueError:
+                        pass
+            
+            # Analyze opportunities based on profile
+            # Opportunities come from alignment of numbers
+            if profile.personal_year_number:
+                try:
+                    year_interp = get_interpretation(profile.personal_year_number)
+                    opportunities.append({
+                        'type': 'personal_year',
+                        'number': profile.personal_year_number,
+                        'title': f'Personal Year {profile.personal_year_number} Opportunities',
+                        'description': year_interp.get('description', ''),
+                        'focus_areas': ', '.join(year_interp.get('strengths', [])) if isinstance(year_interp.get('strengths'), list) else year_interp.get('strengths', ''),
+                    })
+                except ValueError:
+                    pass
+            
+            # Karmic debt as opportunity for growth
+            if profile.karmic_debt_number:
+                opportunities.append({
+                    'type': 'karmic_growth',
+                    'number': profile.karmic_debt_number,
+                    'title': f'Karmic Debt {profile.karmic_debt_number} - Growth Opportunity',
+                    'description': f'Working through karmic debt {profile.karmic_debt_number} presents opportunities for deep spiritual growth and resolution of past patterns.',
+                })
+            
+            # Master number opportunities
+            if profile.life_path_number in [11, 22, 33]:
+                opportunities.append({
+                    'type': 'master_number',
+                    'number': profile.life_path_number,
+                    'title': f'Master Number {profile.life_path_number} Potential',
+                    'description': f'Master number {profile.life_path_number} offers exceptional opportunities for spiritual leadership and higher purpose fulfillment.',
+                })
+            
+            challenges_opportunities = {
+                'challenges': challenges,
+                'opportunities': opportunities,
+            }
+        
+        # Build response data
+        report_data = {
+            'user_profile': {
+                'full_name': user_full_name,
+                'email': user.email,
+                'date_of_birth': user_birth_date.isoformat() if user_birth_date else None,
+                'calculation_date': profile.calculated_at.isoformat() if profile.calculated_at else None,
+            },
+            'subscription_tier': subscription_tier,
+            'available_features': available_features,
+            'birth_date_numerology': profile,
+            'birth_date_interpretations': birth_date_interpretations,
+            'name_numerology': name_report,
+            'name_numerology_available': can_access_feature(user, 'name_numerology'),
+            'phone_numerology': phone_report,
+            'phone_numerology_available': can_access_feature(user, 'phone_numerology'),
+            'lo_shu_grid': lo_shu_grid,
+            'lo_shu_grid_available': can_access_feature(user, 'lo_shu_grid'),
+            'rectification_suggestions': rectification_suggestions,
+            'rectification_suggestions_available': can_access_feature(user, 'rectification_suggestions'),
+            'detailed_analysis': detailed_analysis,
+            'detailed_analysis_available': can_access_feature(user, 'detailed_analysis'),
+            'ai_generated_readings': detailed_analysis is not None,  # Indicate if AI readings are included
+            'compatibility_insights': compatibility_insights,
+            'compatibility_insights_available': can_access_feature(user, 'compatibility_insights'),
+            'raj_yog_analysis': raj_yog_analysis,
+            'raj_yog_analysis_available': can_access_feature(user, 'raj_yog_analysis'),
+            'yearly_forecast': yearly_forecast,
+            'yearly_forecast_available': can_access_feature(user, 'yearly_forecast'),
+            'expert_recommendations': expert_recommendations,
+            'expert_recommendations_available': can_access_feature(user, 'expert_recommendations'),
+            'pinnacle_cycles': pinnacle_cycles,
+            'pinnacle_cycles_available': can_access_feature(user, 'detailed_analysis'),
+            'challenges_opportunities': challenges_opportunities,
+            'challenges_opportunities_available': can_access_feature(user, 'detailed_analysis'),
+        }
+        
+        serializer = FullNumerologyReportSerializer(report_data)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+    
+    except Exception as e:
+        logger.error(f'Error generating full numerology report for user {user.id}: {str(e)}\n{traceback.format_exc()}')
+        error_response = {
+            'error': 'Failed to generate full numerology report',
+            'message': str(e) if settings.DEBUG else 'An error occurred while generating your report. Please try again later.'
+        }
+        if settings.DEBUG:
+            error_response['traceback'] = traceback.format_exc()
+        return Response(error_response, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def export_full_numerology_report_pdf(request):
+    """Export comprehensive numerology report as PDF."""
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter
+    user = request.user
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Please calculate your numerology profile first.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    # Get user's full name safely
+    user_full_name = "User"
+    if hasattr(user, 'full_name') and user.full_name:
+        user_full_name = user.full_name
+    elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+        user_full_name = user.profile.full_name
+    
+    # Create PDF response
+    response = HttpResponse(content_type='application/pdf')
+    response['Content-Disposition'] = f'attachment; filename="numerology_report_{user_full_name.replace(" ", "_")}.pdf"'
+    
+    # Create PDF document
+    buffer = BytesIO()
+    p = canvas.Canvas(buffer, pagesize=letter)
+    width, height = letter
+    
+    # Title
+    p.setFont("Helvetica-Bold", 24)
+    p.drawString(50, height - 50, f"Numerology Report for {user_full_name}")
+    
+    # User info
+    p.setFont("Helvetica", 12)
+    if hasattr(user, 'profile') and hasattr(user.profile, 'date_of_birth'):
+        p.drawString(50, height - 80, f"Date of Birth: {user.profile.date_of_birth}")
+    p.drawString(50, height - 100, f"Report Generated: {timezone.now().strftime('%Y-%m-%d')}")
+    
+    # Core Numbers section
+    p.setFont("Helvetica-Bold", 16)
+    p.drawString(50, height - 140, "Core Numbers")
+    
+    p.setFont("Helvetica", 12)
+    y_position = height - 170
+    core_numbers = [
+        ('Life Path', profile.life_path_number),
+        ('Destiny', profile.destiny_number),
+        ('Soul Urge', profile.soul_urge_number),
+        ('Personality', profile.personality_number),
+    ]
+    
+    for name, value in core_numbers:
+        p.drawString(70, y_position, f"{name} Number: {value}")
+        y_position -= 20
+    
+    # Timing Numbers section
+    p.setFont("Helvetica-Bold", 16)
+    p.drawString(50, y_position - 20, "Timing Numbers")
+    
+    p.setFont("Helvetica", 12)
+    y_position -= 50
+    timing_numbers = [
+        ('Personal Year', profile.personal_year_number),
+        ('Personal Month', profile.personal_month_number),
+    ]
+    
+    for name, value in timing_numbers:
+        p.drawString(70, y_position, f"{name} Number: {value}")
+        y_position -= 20
+    
+    # Footer
+    p.setFont("Helvetica", 10)
+    p.drawString(50, 50, "Generated by NumerAI - Your Personal Numerology Guide")
+    
+    p.showPage()
+    p.save()
+    
+    # Get the value of the BytesIO buffer and write it to the response
+    pdf = buffer.getvalue()
+    buffer.close()
+    response.write(pdf)
+    return response
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_weekly_report(request, week_start_date_str=None, person_id=None):
+    """
+    Get weekly report for user or specific person.
+    
+    If week_start_date_str is provided (YYYY-MM-DD), get report for that week.
+    Otherwise, get report for current week.
+    """
+    user = request.user
+    
+    try:
+        from datetime import datetime as dt
+        from ..services.weekly_report_generator import get_weekly_report_generator
+        from accounts.models import UserProfile
+        
+        # Check if user has birth date (required for weekly reports)
+        if not person_id:
+            try:
+                user_profile = UserProfile.objects.get(user=user)
+                if not user_profile.date_of_birth:
+                    return Response({
+                        'error': 'Birth date is required. Please update your profile with your birth date.'
+                    }, status=status.HTTP_400_BAD_REQUEST)
+            except UserProfile.DoesNotExist:
+                return Response({
+                    'error': 'User profile not found. Please complete your profile first.'
+                }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Parse week start date
+        today = date.today()
+        if week_start_date_str:
+            try:
+                week_start_date = dt.strptime(week_start_date_str, '%Y-%m-%d').date()
+            except ValueError as ve:
+                return Response({
+                    'error': f'Invalid date format. Use YYYY-MM-DD. Error: {str(ve)}'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            # Validate: don't allow future dates
+            if week_start_date > today:
+                return Response({
+                    'error': f'Cannot generate report for future dates. Requested: {week_start_date}, Today: {today}'
+                }, status=status.HTTP_400_BAD_REQUEST)
+        else:
+            # Default to current week (Sunday)
+            days_since_sunday = today.weekday() + 1  # Monday=0, Sunday=6, so +1
+            week_start_date = today - timedelta(days=days_since_sunday % 7)
+        
+        # Get person if specified
+        person = None
+        if person_id:
+            person = Person.objects.get(id=person_id, user=user)
+        
+        # Check if report already exists
+        existing_report = WeeklyReport.objects.filter(
+            user=user,
+            person=person,
+            week_start_date=week_start_date
+        ).first()
+        
+        if existing_report:
+            serializer = WeeklyReportSerializer(existing_report)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        
+        # Generate new report
+        try:
+            generator = get_weekly_report_generator()
+            report_data = generator.generate_weekly_report(
+                user=user,
+                week_start_date=week_start_date,
+                person=person
+            )
+        except ValueError as ve:
+            return Response({'error': str(ve)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as gen_error:
+            logger.error(f'Error in weekly report generator for user {user.id}: {str(gen_error)}\n{traceback.format_exc()}')
+            return Response({
+                'error': 'Failed to generate weekly report',
+                'message': str(gen_error)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        
+        # Create report instance
+        try:
+            report = WeeklyReport.objects.create(
+                user=user,
+                person=person,
+                **report_data
+            )
+        except Exception as create_error:
+            logger.error(f'Error creating WeeklyReport for user {user.id}: {str(create_error)}\n{traceback.format_exc()}')
+            return Response({
+                'error': 'Failed to save weekly report',
+                'message': str(create_error)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        
+        serializer = WeeklyReportSerializer(report)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        
+    except Person.DoesNotExist:
+        return Response({'error': 'Person not found'}, status=status.HTTP_404_NOT_FOUND)
+    except ValueError as e:
+        logger.error(f'ValueError in get_weekly_report: {str(e)}')
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except KeyError as ke:
+        logger.error(f'KeyError in get_weekly_report: {str(ke)}\n{traceback.format_exc()}')
+        return Response({
+            'error': f'Missing required data: {str(ke)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    except AttributeError as ae:
+        logger.error(f'AttributeError in get_weekly_report: {str(ae)}\n{traceback.format_exc()}')
+        return Response({
+            'error': f'Data access error: {str(ae)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    except Exception as e:
+        logger.error(f'Unexpected error in get_weekly_report for user {request.user.id if hasattr(request, "user") and request.user else "unknown"}: {str(e)}\n{traceback.format_exc()}')
+        return Response({
+            'error': 'Error generating weekly report',
+            'message': str(e) if settings.DEBUG else 'An unexpected error occurred. Please try again later.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_yearly_report(request, year=None, person_id=None):
+    """
+    Get yearly report for user or specific person.
+    
+    If year is provided, get report for that year.
+    Otherwise, get report for current year.
+    """
+    user = request.user
+    
+    try:
+        from ..services.yearly_report_generator import get_yearly_report_generator
+        from accounts.models import UserProfile
+        
+        # Use provided year or current year
+        if year is None:
+            year = date.today().year
+        
+        # Validate year is reasonable
+        if year < 1900 or year > 2100:
+            return Response({
+                'error': 'Invalid year. Please provide a year between 1900 and 2100.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Validate: don't allow future years
+        current_year = date.today().year
+        if year > current_year:
+            return Response({
+                'error': f'Cannot generate report for future years. Requested: {year}, Current year: {current_year}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Get person if specified
+        person = None
+        if person_id:
+            try:
+                person = Person.objects.get(id=person_id, user=user, is_active=True)
+            except Person.DoesNotExist:
+                return Response({
+                    'error': 'Person not found or you do not have access to this person'
+                }, status=status.HTTP_404_NOT_FOUND)
+        
+        # Validate numerology profile exists
+        if person:
+            # Check if person has numerology profile
+            if not PersonNumerologyProfile.objects.filter(person=person).exists():
+                return Response({
+                    'error': 'Numerology profile not found for this person. Please calculate the numerology profile first.'
+                }, status=status.HTTP_400_BAD_REQUEST)
+        else:
+            # Check if user has numerology profile
+            if not NumerologyProfile.objects.filter(user=user).exists():
+                return Response({
+                    'error': 'Numerology profile not found. Please complete your numerology profile first.'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            # Check if user has UserProfile with date_of_birth
+            try:
+                user_profile = UserProfile.objects.get(user=user)
+                if not user_profile.date_of_birth:
+                    return Response({
+                        'error': 'Date of birth is required to generate yearly report. Please update your profile.'
+                    }, status=status.HTTP_400_BAD_REQUEST)
+            except UserProfile.DoesNotExist:
+                return Response({
+                    'error': 'User profile not found. Please complete your profile with date of birth.'
+                }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Check if report already exists
+        existing_report = YearlyReport.objects.filter(
+            user=user,
+            person=person,
+            year=year
+        ).first()
+        
+        if existing_report:
+            serializer = YearlyReportSerializer(existing_report)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        
+        # Generate new report
+        try:
+            generator = get_yearly_report_generator()
+            report_data = generator.generate_yearly_report(
+                user=user,
+                year=year,
+                person=person
+            )
+        except ValueError as ve:
+            logger.error(f'ValueError generating yearly report for user {user.id}, year {year}: {str(ve)}')
+            return Response({
+                'error': str(ve)
+            }, status=status.HTTP_400_BAD_REQUEST)
+        except KeyError as ke:
+            logger.error(f'KeyError generating yearly report for user {user.id}, year {year}: {str(ke)}\n{traceback.format_exc()}')
+            return Response({
+                'error': f'Missing required data: {str(ke)}'
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        except AttributeError as ae:
+            logger.error(f'AttributeError generating yearly report for user {user.id}, year {year}: {str(ae)}\n{traceback.format_exc()}')
+            return Response({
+                'error': f'Data access error: {str(ae)}'
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        except Exception as e:
+            logger.error(f'Unexpected error generating yearly report for user {user.id}, year {year}: {str(e)}\n{traceback.format_exc()}')
+            return Response({
+                'error': 'Failed to generate yearly report',
+                'message': str(e) if settings.DEBUG else 'An unexpected error occurred while generating the report. Please try again later.'
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        
+        # Create report instance
+        try:
+            report = YearlyReport.objects.create(
+                user=user,
+                person=person,
+                **report_data
+            )
+        except Exception as create_error:
+            logger.error(f'Error creating YearlyReport for user {user.id}, year {year}: {str(create_error)}\n{traceback.format_exc()}')
+            return Response({
+                'error': 'Failed to save yearly report',
+                'message': str(create_error) if settings.DEBUG else 'The report was generated but could not be saved. Please try again.'
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        
+        serializer = YearlyReportSerializer(report)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        
+    except Person.DoesNotExist:
+        return Response({'error': 'Person not found'}, status=status.HTTP_404_NOT_FOUND)
+    except ValueError as e:
+        logger.error(f'ValueError in get_yearly_report: {str(e)}')
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except KeyError as ke:
+        logger.error(f'KeyError in get_yearly_report: {str(ke)}\n{traceback.format_exc()}')
+        return Response({
+            'error': f'Missing required data: {str(ke)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    except AttributeError as ae:
+        logger.error(f'AttributeError in get_yearly_report: {str(ae)}\n{traceback.format_exc()}')
+        return Response({
+            'error': f'Data access error: {str(ae)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    except Exception as e:
+        logger.error(f'Unexpected error in get_yearly_report for user {request.user.id if hasattr(request, "user") and request.user else "unknown"}: {str(e)}\n{traceback.format_exc()}')
+        return Response({
+            'error': 'Error generating yearly report',
+            'message': str(e) if settings.DEBUG else 'An unexpected error occurred. Please try again later.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
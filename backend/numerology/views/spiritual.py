@@ -0,0 +1,391 @@
+"""
+API views for spiritual numerology endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from ..models import NumerologyProfile, SpiritualNumerologyProfile
+from ..serializers import SpiritualNumerologyProfileSerializer
+from ..services.spiritual_numerology import SpiritualNumerologyService
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['GET', 'POST'])
+@permission_classes([IsAuthenticated])
+def get_spiritual_numerology(request):
+    """Get or calculate Spiritual Numerology profile for user."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    # Check subscription access
+    if not can_access_feature(user, 'numerology_spiritual'):
+        return Response({
+            'error': 'Spiritual Numerology is available for Elite plan subscribers.',
+            'required_tier': 'elite',
+            'feature': 'numerology_spiritual'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        # Get user info
+        user_full_name = None
+        if hasattr(user, 'full_name') and user.full_name:
+            user_full_name = user.full_name
+        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        if not user_full_name or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Full name and birth date are required for Spiritual Numerology calculation.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Get or create profile
+        profile, created = SpiritualNumerologyProfile.objects.get_or_create(
+            user=user,
+            defaults={}
+        )
+        
+        # Get numerology profile for calculation system
+        numerology_profile = NumerologyProfile.objects.get(user=user)
+        system = numerology_profile.calculation_system
+        
+        # Calculate spiritual profile
+        service = SpiritualNumerologyService(system=system)
+        spiritual_data = service.calculate_spiritual_profile(
+            user_full_name,
+            user.profile.date_of_birth
+        )
+        
+        # Update profile
+        profile.soul_contracts = spiritual_data['soul_contracts']
+        profile.karmic_cycles = spiritual_data['karmic_cycles']
+        profile.rebirth_cycles = spiritual_data['rebirth_cycles']
+        profile.divine_gifts = spiritual_data['divine_gifts']
+        profile.spiritual_alignment = spiritual_data['spiritual_alignment']
+        profile.past_life_connections = spiritual_data['past_life_connections']
+        profile.save()
+        
+        # Serialize response
+        serializer = SpiritualNumerologyProfileSerializer(profile)
+        response_data = serializer.data
+        response_data['interpretation'] = spiritual_data['interpretation']
+        
+        return Response(response_data, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Numerology profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_soul_contracts(request):
+    """Get detailed soul contracts for user."""
+    from ..subscription_utils import can_access_feature
+    from ..models import SoulContract
+    
+    user = request.user
+    
+    if not can_access_feature(user, 'numerology_spiritual'):
+        return Response({
+            'error': 'Spiritual Numerology is available for Elite plan subscribers.',
+            'required_tier': 'elite',
+            'feature': 'numerology_spiritual'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        numerology_profile = NumerologyProfile.objects.get(user=user)
+        system = numerology_profile.calculation_system
+        
+        user_full_name = None
+        if hasattr(user, 'full_name') and user.full_name:
+            user_full_name = user.full_name
+        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        if not user_full_name or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Full name and birth date are required.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        service = SpiritualNumerologyService(system=system)
+        contracts = service.identify_soul_contracts_detailed(
+            user_full_name,
+            user.profile.date_of_birth
+        )
+        
+        # Get or create spiritual profile
+        spiritual_profile, _ = SpiritualNumerologyProfile.objects.get_or_create(user=user)
+        
+        # Save contracts to database
+        SoulContract.objects.filter(user=user).delete()  # Clear old contracts
+        for contract in contracts:
+            SoulContract.objects.create(
+                user=user,
+                spiritual_profile=spiritual_profile,
+                contract_number=contract['contract_number'],
+                contract_type=contract['type'],
+                description=contract['description'],
+                lessons=contract['lessons']
+            )
+        
+        return Response({
+            'success': True,
+            'contracts': contracts
+        })
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Numerology profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f"Error getting soul contracts: {str(e)}")
+        return Response({
+            'error': f'Failed to get soul contracts: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_karmic_timeline(request):
+    """Get karmic timeline visualization data."""
+    from ..subscription_utils import can_access_feature
+    from ..models import KarmicTimeline
+    
+    user = request.user
+    
+    if not can_access_feature(user, 'numerology_spiritual'):
+        return Response({
+            'error': 'Spiritual Numerology is available for Elite plan subscribers.',
+            'required_tier': 'elite',
+            'feature': 'numerology_spiritual'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        if not user.profile.date_of_birth:
+            return Response({
+                'error': 'Birth date is required.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        numerology_profile = NumerologyProfile.objects.get(user=user)
+        system = numerology_profile.calculation_system
+        
+        forecast_years = int(request.query_params.get('forecast_years', 50))
+        forecast_years = min(max(forecast_years, 10), 100)
+        
+        service = SpiritualNumerologyService(system=system)
+        timeline_data = service.analyze_karmic_timeline(
+            user.profile.date_of_birth,
+            forecast_years
+        )
+        
+        # Get or create spiritual profile
+        spiritual_profile, _ = SpiritualNumerologyProfile.objects.get_or_create(user=user)
+        
+        # Save timeline to database
+        KarmicTimeline.objects.filter(user=user).delete()
+        for cycle in timeline_data['cycles']:
+            KarmicTimeline.objects.create(
+                user=user,
+                spiritual_profile=spiritual_profile,
+                start_year=cycle['start_year'],
+                end_year=cycle['end_year'],
+                cycle_number=cycle['cycle_number'],
+                karmic_theme=cycle['karmic_theme'],
+                lessons=cycle['lessons'],
+                is_current=cycle.get('is_current', False),
+                timeline_data=cycle
+            )
+        
+        return Response({
+            'success': True,
+            'timeline': timeline_data
+        })
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Numerology profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f"Error getting karmic timeline: {str(e)}")
+        return Response({
+            'error': f'Failed to get karmic timeline: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_rebirth_cycles(request):
+    """Get detailed rebirth cycles."""
+    from ..subscription_utils import can_access_feature
+    from ..models import RebirthCycle
+    
+    user = request.user
+    
+    if not can_access_feature(user, 'numerology_spiritual'):
+        return Response({
+            'error': 'Spiritual Numerology is available for Elite plan subscribers.',
+            'required_tier': 'elite',
+            'feature': 'numerology_spiritual'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        if not user.profile.date_of_birth:
+            return Response({
+                'error': 'Birth date is required.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        numerology_profile = NumerologyProfile.objects.get(user=user)
+        system = numerology_profile.calculation_system
+        
+        service = SpiritualNumerologyService(system=system)
+        cycles = service.calculate_rebirth_cycles_detailed(user.profile.date_of_birth)
+        
+        # Get or create spiritual profile
+        spiritual_profile, _ = SpiritualNumerologyProfile.objects.get_or_create(user=user)
+        
+        # Save cycles to database
+        RebirthCycle.objects.filter(user=user).delete()
+        for cycle in cycles:
+            RebirthCycle.objects.create(
+                user=user,
+                spiritual_profile=spiritual_profile,
+                rebirth_number=cycle['rebirth_number'],
+                start_year=cycle['start_year'],
+                end_year=cycle['end_year'],
+                duration_years=cycle['duration_years'],
+                transformation_theme=cycle['transformation_theme'],
+                spiritual_growth=cycle['spiritual_growth'],
+                is_current=cycle.get('is_current', False),
+                transition_warnings=cycle.get('transition_periods', []),
+                preparation_guidance=cycle.get('preparation_steps', [])
+            )
+        
+        return Response({
+            'success': True,
+            'rebirth_cycles': cycles
+        })
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Numerology profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f"Error getting rebirth cycles: {str(e)}")
+        return Response({
+            'error': f'Failed to get rebirth cycles: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_divine_gifts(request):
+    """Get divine gifts identification."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    if not can_access_feature(user, 'numerology_spiritual'):
+        return Response({
+            'error': 'Spiritual Numerology is available for Elite plan subscribers.',
+            'required_tier': 'elite',
+            'feature': 'numerology_spiritual'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        user_full_name = None
+        if hasattr(user, 'full_name') and user.full_name:
+            user_full_name = user.full_name
+        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        if not user_full_name or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Full name and birth date are required.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        numerology_profile = NumerologyProfile.objects.get(user=user)
+        system = numerology_profile.calculation_system
+        
+        service = SpiritualNumerologyService(system=system)
+        spiritual_data = service.calculate_spiritual_profile(
+            user_full_name,
+            user.profile.date_of_birth
+        )
+        
+        return Response({
+            'success': True,
+            'divine_gifts': spiritual_data['divine_gifts']
+        })
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Numerology profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f"Error getting divine gifts: {str(e)}")
+        return Response({
+            'error': f'Failed to get divine gifts: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_meditation_timing(request):
+    """Get optimal meditation timing based on numerology."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    
+    if not can_access_feature(user, 'numerology_spiritual'):
+        return Response({
+            'error': 'Spiritual Numerology is available for Elite plan subscribers.',
+            'required_tier': 'elite',
+            'feature': 'numerology_spiritual'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        if not user.profile.date_of_birth:
+            return Response({
+                'error': 'Birth date is required.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        numerology_profile = NumerologyProfile.objects.get(user=user)
+        system = numerology_profile.calculation_system
+        
+        # Get target date from query params or use today
+        target_date_str = request.query_params.get('target_date')
+        target_date = None
+        if target_date_str:
+            from datetime import datetime as dt
+            target_date = dt.strptime(target_date_str, '%Y-%m-%d').date()
+        
+        service = SpiritualNumerologyService(system=system)
+        timing_data = service.optimize_meditation_timing(
+            user.profile.date_of_birth,
+            target_date
+        )
+        
+        return Response({
+            'success': True,
+            'meditation_timing': timing_data
+        })
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Numerology profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f"Error getting meditation timing: {str(e)}")
+        return Response({
+            'error': f'Failed to get meditation timing: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
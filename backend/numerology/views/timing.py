@@ -0,0 +1,317 @@
+"""
+API views for timing numerology endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from datetime import datetime
+from ..models import NumerologyProfile, Person
+from ..services.timing_numerology import TimingNumerologyService
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def find_best_dates(request):
+    """Find best dates for an event."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_timing_optimization'):
+        return Response({
+            'error': 'Timing optimization is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_timing_optimization'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    user_birth_date_str = request.data.get('birth_date')
+    event_type = request.data.get('event_type')
+    start_date_str = request.data.get('start_date')
+    end_date_str = request.data.get('end_date')
+    limit = int(request.data.get('limit', 10))
+    
+    if not all([user_birth_date_str, event_type, start_date_str, end_date_str]):
+        return Response({
+            'error': 'birth_date, event_type, start_date, and end_date are required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        user_birth_date = datetime.strptime(user_birth_date_str, '%Y-%m-%d').date()
+        start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
+        end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
+        
+        service = TimingNumerologyService()
+        result = service.find_best_dates(
+            user_birth_date,
+            event_type,
+            start_date,
+            end_date,
+            limit
+        )
+        
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error finding best dates: {str(e)}")
+        return Response({
+            'error': f'Failed to find best dates: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def find_danger_dates(request):
+    """Find danger dates to avoid."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_danger_dates'):
+        return Response({
+            'error': 'Danger dates identification is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_danger_dates'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    user_birth_date_str = request.data.get('birth_date')
+    start_date_str = request.data.get('start_date')
+    end_date_str = request.data.get('end_date')
+    
+    if not all([user_birth_date_str, start_date_str, end_date_str]):
+        return Response({
+            'error': 'birth_date, start_date, and end_date are required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        user_birth_date = datetime.strptime(user_birth_date_str, '%Y-%m-%d').date()
+        start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
+        end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
+        
+        service = TimingNumerologyService()
+        result = service.find_danger_dates(
+            user_birth_date,
+            start_date,
+            end_date
+        )
+        
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error finding danger dates: {str(e)}")
+        return Response({
+            'error': f'Failed to find danger dates: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def optimize_event_timing(request):
+    """Optimize timing for an event."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_timing_optimization'):
+        return Response({
+            'error': 'Event timing optimization is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_timing_optimization'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    user_birth_date_str = request.data.get('birth_date')
+    event_type = request.data.get('event_type')
+    preferred_month = request.data.get('preferred_month')
+    preferred_year = request.data.get('preferred_year')
+    
+    if not user_birth_date_str or not event_type:
+        return Response({
+            'error': 'birth_date and event_type are required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        user_birth_date = datetime.strptime(user_birth_date_str, '%Y-%m-%d').date()
+        
+        if preferred_month:
+            preferred_month = int(preferred_month)
+        if preferred_year:
+            preferred_year = int(preferred_year)
+        
+        service = TimingNumerologyService()
+        result = service.optimize_event_timing(
+            user_birth_date,
+            event_type,
+            preferred_month,
+            preferred_year
+        )
+        
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error optimizing event timing: {str(e)}")
+        return Response({
+            'error': f'Failed to optimize timing: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def find_joint_dates(request):
+    """
+    Find event dates that suit several people at once.
+    Each entry in people has a birth_date (or the id of one of the user's
+    saved people), an optional name and an optional weight.
+    """
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'compatibility_insights'):
+        return Response({
+            'error': 'Joint date planning is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'compatibility_insights'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    people_data = request.data.get('people')
+    event_type = request.data.get('event_type')
+    start_date_str = request.data.get('start_date')
+    end_date_str = request.data.get('end_date')
+    
+    if not people_data or not isinstance(people_data, list) or not all([event_type, start_date_str, end_date_str]):
+        return Response({
+            'error': 'people, event_type, start_date, and end_date are required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        saved_people = {
+            str(person.id): person
+            for person in Person.objects.filter(
+                user=user,
+                id__in=[entry.get('person_id') for entry in people_data if entry.get('person_id')]
+            )
+        }
+        people = []
+        for entry in people_data:
+            person_id = entry.get('person_id')
+            if person_id:
+                if str(person_id) not in saved_people:
+                    return Response({
+                        'error': f'Person {person_id} not found'
+                    }, status=status.HTTP_404_NOT_FOUND)
+                birth_date = saved_people[str(person_id)].birth_date
+                name = entry.get('name') or saved_people[str(person_id)].name
+            else:
+                birth_date = datetime.strptime(entry['birth_date'], '%Y-%m-%d').date()
+                name = entry.get('name')
+            people.append({'name': name, 'birth_date': birth_date, 'weight': entry.get('weight', 1)})
+        
+        start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
+        end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
+        blackout_dates = [
+            datetime.strptime(value, '%Y-%m-%d').date()
+            for value in request.data.get('blackout_dates') or []
+        ]
+        allowed_weekdays = request.data.get('allowed_weekdays')
+        if allowed_weekdays is not None:
+            allowed_weekdays = [int(day) for day in allowed_weekdays]
+        
+        service = TimingNumerologyService()
+        result = service.find_joint_dates(
+            people,
+            event_type,
+            start_date,
+            end_date,
+            strategy=request.data.get('strategy', 'maximin'),
+            allowed_weekdays=allowed_weekdays,
+            blackout_dates=blackout_dates,
+            limit=int(request.data.get('limit', 10))
+        )
+        
+        return Response(result, status=status.HTTP_200_OK)
+    except (KeyError, ValueError, TypeError) as e:
+        return Response({
+            'error': f'Invalid joint date request: {str(e)}'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        logger.error(f"Error finding joint dates: {str(e)}")
+        return Response({
+            'error': f'Failed to find joint dates: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET', 'POST'])
+@permission_classes([IsAuthenticated])
+def analyze_global_influences(request):
+    """Analyze global numerology influences."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_timing'):
+        return Response({
+            'error': 'Timing numerology is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_timing'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    target_date_str = request.data.get('target_date') if request.method == 'POST' else request.query_params.get('target_date')
+    year = request.data.get('year') if request.method == 'POST' else request.query_params.get('year')
+    
+    try:
+        target_date = None
+        if target_date_str:
+            target_date = datetime.strptime(target_date_str, '%Y-%m-%d').date()
+        
+        year_int = None
+        if year:
+            year_int = int(year)
+        
+        profile = NumerologyProfile.objects.get(user=user)
+        service = TimingNumerologyService(profile.calculation_system)
+        result = service.analyze_global_influences(target_date, year_int)
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error analyzing global influences: {str(e)}")
+        return Response({
+            'error': f'Failed to analyze global influences: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def calculate_timing_compatibility(request):
+    """Calculate timing compatibility between two people."""
+    from ..subscription_utils import can_access_feature
+    
+    user = request.user
+    if not can_access_feature(user, 'numerology_timing'):
+        return Response({
+            'error': 'Timing numerology is available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_timing'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    birth_date_1_str = request.data.get('birth_date_1')
+    birth_date_2_str = request.data.get('birth_date_2')
+    target_date_str = request.data.get('target_date')
+    
+    if not all([birth_date_1_str, birth_date_2_str, target_date_str]):
+        return Response({
+            'error': 'birth_date_1, birth_date_2, and target_date are required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        birth_date_1 = datetime.strptime(birth_date_1_str, '%Y-%m-%d').date()
+        birth_date_2 = datetime.strptime(birth_date_2_str, '%Y-%m-%d').date()
+        target_date = datetime.strptime(target_date_str, '%Y-%m-%d').date()
+        
+        profile = NumerologyProfile.objects.get(user=user)
+        service = TimingNumerologyService(profile.calculation_system)
+        result = service.calculate_timing_compatibility(birth_date_1, birth_date_2, target_date)
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        logger.error(f"Error calculating timing compatibility: {str(e)}")
+        return Response({
+            'error': f'Failed to calculate timing compatibility: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,283 @@
+"""
+API views for numerology visualization endpoints.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from ..models import NumerologyProfile
+from ..chart import get_chart
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_numerology_wheel(request):
+    """Get numerology wheel visualization data."""
+    from ..subscription_utils import can_access_feature
+    from ..services.visualization_service import VisualizationService
+    
+    user = request.user
+    
+    # Check subscription access
+    if not can_access_feature(user, 'numerology_visualizations'):
+        return Response({
+            'error': 'Numerology visualizations are available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_visualizations'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        
+        # Get user info
+        user_full_name = None
+        if hasattr(user, 'full_name') and user.full_name:
+            user_full_name = user.full_name
+        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        if not user_full_name or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Full name and birth date are required for numerology wheel.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        service = VisualizationService(profile.calculation_system)
+        chart = get_chart(user_full_name, user.profile.date_of_birth, profile.calculation_system, request=request)
+        wheel_data = service.generate_numerology_wheel(profile, chart=chart)
+        
+        return Response(wheel_data, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f'Error getting numerology wheel: {str(e)}')
+        return Response({
+            'error': 'Failed to generate numerology wheel data.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_numerology_timeline(request):
+    """Get numerology timeline visualization data."""
+    from ..subscription_utils import can_access_feature
+    from ..services.visualization_service import VisualizationService
+    
+    user = request.user
+    
+    # Check subscription access
+    if not can_access_feature(user, 'numerology_visualizations'):
+        return Response({
+            'error': 'Numerology visualizations are available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_visualizations'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        
+        if not user.profile.date_of_birth:
+            return Response({
+                'error': 'Birth date is required for timeline visualization.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        years_ahead = int(request.query_params.get('years_ahead', 10))
+        
+        service = VisualizationService(profile.calculation_system)
+        timeline_data = service.create_timeline_data(
+            profile,
+            user.profile.full_name or '',
+            user.profile.date_of_birth,
+            years_ahead
+        )
+        
+        return Response(timeline_data, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f'Error getting timeline: {str(e)}')
+        return Response({
+            'error': 'Failed to generate timeline data.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def get_numerology_comparison_charts(request):
+    """Get comparison charts data for multiple profiles."""
+    from ..subscription_utils import can_access_feature
+    from ..services.visualization_service import VisualizationService
+    
+    user = request.user
+    
+    # Check subscription access
+    if not can_access_feature(user, 'numerology_visualizations'):
+        return Response({
+            'error': 'Numerology visualizations are available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_visualizations'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        person_ids = request.data.get('person_ids', [])
+        
+        if not person_ids:
+            return Response({
+                'error': 'At least one person_id is required.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Get person profiles
+        from ..models import Person, PersonNumerologyProfile
+        people = Person.objects.filter(id__in=person_ids, user=user, is_active=True)
+        
+        if people.count() != len(person_ids):
+            return Response({
+                'error': 'Some persons not found or not accessible.'
+            }, status=status.HTTP_404_NOT_FOUND)
+        
+        profiles_data = []
+        names = []
+        
+        for person in people:
+            try:
+                person_profile = PersonNumerologyProfile.objects.get(person=person)
+                profiles_data.append({
+                    'life_path_number': person_profile.life_path_number,
+                    'destiny_number': person_profile.destiny_number,
+                    'soul_urge_number': person_profile.soul_urge_number,
+                    'personality_number': person_profile.personality_number,
+                    'attitude_number': person_profile.attitude_number,
+                    'maturity_number': person_profile.maturity_number,
+                    'balance_number': person_profile.balance_number,
+                })
+                names.append(person.name)
+            except PersonNumerologyProfile.DoesNotExist:
+                return Response({
+                    'error': f'Numerology profile not found for {person.name}. Please calculate it first.'
+                }, status=status.HTTP_400_BAD_REQUEST)
+        
+        service = VisualizationService(profile.calculation_system)
+        comparison_data = service.generate_comparison_charts(profiles_data, names)
+        
+        return Response(comparison_data, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f'Error getting comparison charts: {str(e)}')
+        return Response({
+            'error': 'Failed to generate comparison charts data.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_numerology_heatmap(request):
+    """Get numerology heatmap visualization data."""
+    from ..subscription_utils import can_access_feature
+    from ..services.visualization_service import VisualizationService
+    
+    user = request.user
+    
+    # Check subscription access
+    if not can_access_feature(user, 'numerology_visualizations'):
+        return Response({
+            'error': 'Numerology visualizations are available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_visualizations'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        
+        # Get user info
+        user_full_name = None
+        if hasattr(user, 'full_name') and user.full_name:
+            user_full_name = user.full_name
+        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        if not user_full_name or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Full name and birth date are required for heatmap visualization.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        service = VisualizationService(profile.calculation_system)
+        chart = get_chart(user_full_name, user.profile.date_of_birth, profile.calculation_system, request=request)
+        heatmap_data = service.create_heatmap_data(profile, chart=chart)
+        
+        return Response(heatmap_data, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f'Error getting heatmap: {str(e)}')
+        return Response({
+            'error': 'Failed to generate heatmap data.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_3d_numerology_visualization(request):
+    """Get 3D numerology visualization data."""
+    from ..subscription_utils import can_access_feature
+    from ..services.visualization_service import VisualizationService
+    
+    user = request.user
+    
+    # Check subscription access
+    if not can_access_feature(user, 'numerology_visualizations'):
+        return Response({
+            'error': 'Numerology visualizations are available for Premium plan and above.',
+            'required_tier': 'premium',
+            'feature': 'numerology_visualizations'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    try:
+        profile = NumerologyProfile.objects.get(user=user)
+        
+        # Get user info
+        user_full_name = None
+        if hasattr(user, 'full_name') and user.full_name:
+            user_full_name = user.full_name
+        elif hasattr(user, 'profile') and hasattr(user.profile, 'full_name') and user.profile.full_name:
+            user_full_name = user.profile.full_name
+        
+        if not user_full_name or not user.profile.date_of_birth:
+            return Response({
+                'error': 'Full name and birth date are required for 3D visualization.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        service = VisualizationService(profile.calculation_system)
+        chart = get_chart(user_full_name, user.profile.date_of_birth, profile.calculation_system, request=request)
+        visualization_data = service.generate_3d_visualization_data(profile, chart=chart)
+        
+        return Response(visualization_data, status=status.HTTP_200_OK)
+    
+    except NumerologyProfile.DoesNotExist:
+        return Response({
+            'error': 'Profile not found. Please calculate your profile first.'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        logger.error(f'Error getting 3D visualization: {str(e)}')
+        return Response({
+            'error': 'Failed to generate 3D visualization data.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
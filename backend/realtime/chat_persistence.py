@@ -0,0 +1,268 @@
+"""
+Write-behind persistence for consultation chat messages.
+
+The chat consumer assigns each message its id and timestamp, broadcasts it
+and hands it to ChatWriteBehind, which persists messages and read receipts
+in micro-batches from a background task instead of on the send path.
+
+Guarantees:
+
+* Order: messages are stored in the order they were enqueued, in a single
+  transaction per batch, with the ``created_at`` that was broadcast. Since a
+  connection's messages are enqueued in receive order, stored history
+  matches what its room saw.
+* Durability: a message is durable once the batch containing it commits,
+  normally within ``CHAT_WRITE_BEHIND_FLUSH_INTERVAL`` seconds. Consumers
+  flush on disconnect; a process crash before that loses at most the
+  pending batch. Failed batches are retried (inserts are idempotent by
+  message id) and dropped after ``CHAT_WRITE_BEHIND_MAX_RETRIES`` attempts,
+  which is logged and counted in ``chat_write_behind.dropped``.
+* Backpressure: once ``CHAT_WRITE_BEHIND_MAX_PENDING`` messages are pending,
+  senders wait for a flush rather than buffering without bound.
+* Read receipts are coalesced: per conversation and reader side only the
+  latest receipt is applied, marking every earlier message from the other
+  side as read. They are applied after the batch's messages commit, so a
+  receipt for a message still in the buffer is not lost. Each conversation's
+  receipt has its own transaction; one that fails is logged and skipped
+  without affecting messages or other receipts. Receipts whose message id
+  is not a UUID are dropped when enqueued.
+"""
+import asyncio
+import logging
+import time
+import uuid
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from channels.db import database_sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Max
+from django.db.models.signals import post_save
+from django.utils import timezone
+
+from consultations.models import ExpertChatConversation, ExpertChatMessage
+from utils.metrics import increment, observe
+
+logger = logging.getLogger(__name__)
+
+ReceiptKey = Tuple[str, str]
+
+
+def parse_message_id(message_id: Any) -> Optional[uuid.UUID]:
+    """The UUID in a client-supplied message id, or None if it is not one."""
+    try:
+        return uuid.UUID(str(message_id))
+    except ValueError:
+        return None
+
+
+class ChatWriteBehind:
+    """Per-process buffer that persists chat messages and read receipts in batches."""
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_pending: Optional[int] = None,
+        max_retries: Optional[int] = None
+    ):
+        self.batch_size = batch_size or settings.CHAT_WRITE_BEHIND_BATCH_SIZE
+        self.flush_interval = flush_interval if flush_interval is not None else settings.CHAT_WRITE_BEHIND_FLUSH_INTERVAL
+        self.max_pending = max_pending or settings.CHAT_WRITE_BEHIND_MAX_PENDING
+        self.max_retries = max_retries if max_retries is not None else settings.CHAT_WRITE_BEHIND_MAX_RETRIES
+        self._messages: List[Dict[str, Any]] = []
+        self._receipts: Dict[ReceiptKey, Set[uuid.UUID]] = defaultdict(set)
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._messages)
+
+    def _ensure_running(self):
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+            self._task = loop.create_task(self._run())
+
+    async def enqueue_message(
+        self,
+        conversation_id: str,
+        sender_type: str,
+        sender_user_id: Optional[str],
+        content: str,
+        message_type: str = 'text'
+    ) -> Dict[str, Any]:
+        """
+        Assign an id and timestamp to a message and queue it for persistence.
+
+        Returns:
+            The message record, ready to broadcast
+        """
+        self._ensure_running()
+        if self.pending >= self.max_pending:
+            increment('chat_write_behind.backpressure')
+            await self.flush()
+
+        record = {
+            'id': uuid.uuid4(),
+            'conversation_id': conversation_id,
+            'sender_type': sender_type,
+            'sender_user_id': sender_user_id,
+            'message_content': content,
+            'message_type': message_type,
+            'created_at': timezone.now(),
+        }
+        self._messages.append(record)
+        if self.pending >= self.batch_size:
+            self._wakeup.set()
+        return record
+
+    def enqueue_read_receipt(self, conversation_id: str, reader_type: str, message_id: Any):
+        """Queue a read receipt; receipts for the same conversation and reader coalesce."""
+        parsed = parse_message_id(message_id)
+        if parsed is None:
+            increment('chat_write_behind.invalid_receipt')
+            logger.debug(f"Ignoring read receipt with invalid message id {message_id!r}")
+            return
+        self._ensure_running()
+        self._receipts[(conversation_id, reader_type)].add(parsed)
+
+    async def flush(self):
+        """Persist everything queued so far."""
+        if self._flush_lock is None:
+            return
+        self._ensure_running()
+        async with self._flush_lock:
+            while self._messages or self._receipts:
+                messages = self._messages[:self.batch_size]
+                receipts = {}
+                if len(messages) == len(self._messages):
+                    receipts, self._receipts = self._receipts, defaultdict(set)
+                await self._persist_with_retry(messages, receipts)
+                del self._messages[:len(messages)]
+
+    async def close(self):
+        """Flush and stop the background task."""
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Chat write-behind flush failed: {str(e)}", exc_info=True)
+
+    async def _persist_with_retry(self, messages: List[Dict[str, Any]], receipts: Dict[ReceiptKey, Set[uuid.UUID]]):
+        for attempt in range(self.max_retries + 1):
+            try:
+                started = time.monotonic()
+                await database_sync_to_async(persist_batch)(messages, receipts)
+                observe('chat_write_behind.batch_size', len(messages))
+                observe('chat_write_behind.flush_ms', (time.monotonic() - started) * 1000)
+                return
+            except Exception as e:
+                increment('chat_write_behind.retry')
+                logger.warning(f"Chat write-behind batch failed (attempt {attempt + 1}): {str(e)}")
+                await asyncio.sleep(min(self.flush_interval * 2 ** attempt, 2))
+        increment('chat_write_behind.dropped', len(messages))
+        logger.error(
+            f"Dropped {len(messages)} chat messages and {len(receipts)} read receipts after "
+            f"{self.max_retries + 1} attempts: {[str(m['id']) for m in messages]}"
+        )
+
+
+def persist_batch(messages: List[Dict[str, Any]], receipts: Dict[ReceiptKey, Set[uuid.UUID]]):
+    """Store one batch of messages, then apply coalesced read receipts."""
+    with transaction.atomic():
+        objects = [ExpertChatMessage(**record) for record in messages]
+        existing = set(
+            ExpertChatMessage.objects.filter(id__in=[obj.id for obj in objects]).values_list('id', flat=True)
+        )
+        created = ExpertChatMessage.objects.bulk_create([obj for obj in objects if obj.id not in existing])
+        _update_conversations(messages)
+
+    # Receipts are best effort and must never cost the batch its messages.
+    for (conversation_id, reader_type), message_ids in receipts.items():
+        try:
+            with transaction.atomic():
+                _apply_read_receipt(conversation_id, reader_type, message_ids)
+        except Exception as e:
+            increment('chat_write_behind.receipt_failed')
+            logger.error(f"Failed to apply read receipt for conversation {conversation_id}: {str(e)}")
+
+    # bulk_create skips post_save; send it so chat notifications still go out.
+    for obj in created:
+        responses = post_save.send_robust(
+            sender=ExpertChatMessage, instance=obj, created=True, update_fields=None, raw=False, using='default'
+        )
+        for receiver, response in responses:
+            if isinstance(response, Exception):
+                logger.error(f"Chat message post_save receiver {receiver} failed: {str(response)}")
+
+
+def _update_conversations(messages: List[Dict[str, Any]]):
+    latest = {}
+    unread = defaultdict(lambda: {'user': 0, 'expert': 0})
+    for record in messages:
+        conversation_id = record['conversation_id']
+        latest[conversation_id] = record
+        if record['sender_type'] == 'user':
+            unread[conversation_id]['expert'] += 1
+        elif record['sender_type'] == 'expert':
+            unread[conversation_id]['user'] += 1
+
+    for conversation_id, record in latest.items():
+        ExpertChatConversation.objects.filter(id=conversation_id).update(
+            last_message_at=record['created_at'],
+            last_message_preview=record['message_content'][:200],
+            unread_count_user=F('unread_count_user') + unread[conversation_id]['user'],
+            unread_count_expert=F('unread_count_expert') + unread[conversation_id]['expert'],
+            updated_at=timezone.now(),
+        )
+
+
+def _apply_read_receipt(conversation_id: str, reader_type: str, message_ids: Set[uuid.UUID]):
+    up_to = ExpertChatMessage.objects.filter(
+        conversation_id=conversation_id, id__in=message_ids
+    ).aggregate(latest=Max('created_at'))['latest']
+    if up_to is None:
+        return
+
+    unread = ExpertChatMessage.objects.filter(
+        conversation_id=conversation_id, is_read=False
+    ).exclude(sender_type=reader_type)
+    unread.filter(created_at__lte=up_to).update(is_read=True, read_at=timezone.now())
+
+    if reader_type in ('user', 'expert'):
+        ExpertChatConversation.objects.filter(id=conversation_id).update(
+            **{f'unread_count_{reader_type}': unread.count()}
+        )
+
+
+_writer: Optional[ChatWriteBehind] = None
+
+
+def get_chat_writer() -> ChatWriteBehind:
+    """Return the process-wide chat writer."""
+    global _writer
+    if _writer is None:
+        _writer = ChatWriteBehind()
+    return _writer
@@ -4,11 +4,13 @@ WebSocket consumers for real-time features.
 import json
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
+from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
-from django.utils import timezone
-from consultations.models import Consultation, ExpertChatMessage, ExpertChatConversation
+from consultations.models import Consultation, Expert, ExpertChatConversation
 from accounts.models import Notification
+from .chat_persistence import get_chat_writer
+from .presence import get_presence_registry
 import logging
 
 logger = logging.getLogger(__name__)
@@ -35,6 +37,9 @@ class ChatConsumer(AsyncWebsocketConsumer):
             await self.close()
             return
         
+        # Resolve the conversation once so sending needs no database access
+        self.chat_context = await self.get_chat_context(self.user, self.consultation_id)
+        
         # Join room group
         await self.channel_layer.group_add(
             self.room_group_name,
@@ -52,6 +57,10 @@ class ChatConsumer(AsyncWebsocketConsumer):
     
     async def disconnect(self, close_code):
         """Handle WebSocket disconnection."""
+        # Make this connection's messages and receipts durable before leaving
+        if getattr(self, 'chat_context', None):
+            await get_chat_writer().flush()
+        
         # Leave room group
         await self.channel_layer.group_discard(
             self.room_group_name,
@@ -81,29 +90,28 @@ class ChatConsumer(AsyncWebsocketConsumer):
         if not message_text:
             return
         
-        # Save message to database
-        message = await self.save_message(
-            self.consultation_id,
-            self.user.id,
+        # Assign id and timestamp, broadcast now, persist in the background
+        message = await get_chat_writer().enqueue_message(
+            self.chat_context['conversation_id'],
+            self.chat_context['sender_type'],
+            str(self.user.id) if self.chat_context['sender_type'] == 'user' else None,
             message_text
         )
         
-        if message:
-            # Broadcast message to room group
-            await self.channel_layer.group_send(
-                self.room_group_name,
-                {
-                    'type': 'chat_message',
-                    'message': {
-                        'id': str(message['id']),
-                        'sender_id': str(message['sender_id']),
-                        'sender_name': message['sender_name'],
-                        'content': message['content'],
-                        'created_at': message['created_at'],
-                        'message_type': message.get('message_type', 'text'),
-                    }
+        await self.channel_layer.group_send(
+            self.room_group_name,
+            {
+                'type': 'chat_message',
+                'message': {
+                    'id': str(message['id']),
+                    'sender_id': str(self.user.id),
+                    'sender_name': self.user.full_name or self.user.email,
+                    'content': message['message_content'],
+                    'created_at': message['created_at'].isoformat(),
+                    'message_type': message['message_type'],
                 }
-            )
+            }
+        )
     
     async def handle_typing_indicator(self, data):
         """Handle typing indicator."""
@@ -124,7 +132,11 @@ class ChatConsumer(AsyncWebsocketConsumer):
         """Handle read receipt."""
         message_id = data.get('message_id')
         if message_id:
-            await self.mark_message_read(message_id, self.user.id)
+            get_chat_writer().enqueue_read_receipt(
+                self.chat_context['conversation_id'],
+                self.chat_context['sender_type'],
+                message_id
+            )
     
     async def chat_message(self, event):
         """Send chat message to WebSocket."""
@@ -159,49 +171,27 @@ class ChatConsumer(AsyncWebsocketConsumer):
             return False
     
     @database_sync_to_async
-    def save_message(self, consultation_id, user_id, content):
-        """Save message to database."""
-        try:
-            consultation = Consultation.objects.get(id=consultation_id)
-            
-            # Get or create conversation
-            conversation, created = ExpertChatConversation.objects.get_or_create(
-                consultation=consultation,
-                defaults={'created_by_id': user_id}
-            )
-            
-            # Create message
-            message = ExpertChatMessage.objects.create(
-                conversation=conversation,
-                sender_id=user_id,
-                content=content,
-                message_type='text'
+    def get_chat_context(self, user, consultation_id):
+        """Get or create the consultation's conversation and the user's side in it."""
+        consultation = Consultation.objects.select_related('expert').get(id=consultation_id)
+        conversation = (
+            ExpertChatConversation.objects.filter(consultation=consultation).first() or
+            ExpertChatConversation.objects.filter(
+                user=consultation.user, expert=consultation.expert, status='active'
+            ).first() or
+            ExpertChatConversation.objects.create(
+                user=consultation.user, expert=consultation.expert, consultation=consultation
             )
-            
-            return {
-                'id': message.id,
-                'sender_id': user_id,
-                'sender_name': message.sender.full_name or message.sender.email,
-                'content': message.content,
-                'created_at': message.created_at.isoformat(),
-                'message_type': message.message_type,
-            }
-        except Exception as e:
-            logger.error(f"Error saving message: {str(e)}", exc_info=True)
-            return None
-    
-    @database_sync_to_async
-    def mark_message_read(self, message_id, user_id):
-        """Mark message as read."""
-        try:
-            message = ExpertChatMessage.objects.get(id=message_id)
-            # Only mark as read if user is not the sender
-            if message.sender_id != user_id:
-                message.is_read = True
-                message.read_at = timezone.now()
-                message.save(update_fields=['is_read', 'read_at'])
-        except ExpertChatMessage.DoesNotExist:
-            pass
+        )
+        
+        if consultation.user_id == user.id:
+            sender_type = 'user'
+        elif consultation.expert.user_id == user.id:
+            sender_type = 'expert'
+        else:
+            sender_type = 'system'
+        
+        return {'conversation_id': str(conversation.id), 'sender_type': sender_type}
 
 
 class NotificationConsumer(AsyncWebsocketConsumer):
@@ -269,7 +259,13 @@ class NotificationConsumer(AsyncWebsocketConsumer):
 
 
 class PresenceConsumer(AsyncWebsocketConsumer):
-    """WebSocket consumer for user presence tracking."""
+    """
+    WebSocket consumer for user presence tracking.
+    
+    Each connection is a session in the presence registry. Clients send
+    ``{"type": "heartbeat"}`` more often than ``PRESENCE_TTL``; sessions that
+    stop heartbeating are expired by the presence sweeper.
+    """
     
     async def connect(self):
         """Handle WebSocket connection."""
@@ -281,6 +277,7 @@ class PresenceConsumer(AsyncWebsocketConsumer):
             return
         
         self.room_group_name = 'presence'
+        self.is_expert = await self.get_is_expert()
         
         # Join presence group
         await self.channel_layer.group_add(
@@ -290,32 +287,66 @@ class PresenceConsumer(AsyncWebsocketConsumer):
         
         await self.accept()
         
-        # Broadcast user online status
-        await self.channel_layer.group_send(
-            self.room_group_name,
-            {
-                'type': 'user_online',
-                'user_id': str(self.user.id),
-                'user_name': self.user.full_name or self.user.email,
-            }
-        )
+        await self.heartbeat()
     
     async def disconnect(self, close_code):
         """Handle WebSocket disconnection."""
-        # Broadcast user offline status
-        await self.channel_layer.group_send(
-            self.room_group_name,
-            {
-                'type': 'user_offline',
-                'user_id': str(self.user.id),
-            }
-        )
+        if not hasattr(self, 'room_group_name'):
+            return
+        
+        # Broadcast user offline status once their last session is gone
+        if await self.update_presence('disconnect'):
+            await self.channel_layer.group_send(
+                self.room_group_name,
+                {
+                    'type': 'user_offline',
+                    'user_id': str(self.user.id),
+                }
+            )
         
         await self.channel_layer.group_discard(
             self.room_group_name,
             self.channel_name
         )
     
+    async def receive(self, text_data):
+        """Receive message from WebSocket."""
+        try:
+            data = json.loads(text_data)
+            if data.get('type') == 'heartbeat':
+                await self.heartbeat()
+        except json.JSONDecodeError:
+            logger.error("Invalid JSON received")
+    
+    async def heartbeat(self):
+        """Record a heartbeat and broadcast online status if the user was offline."""
+        # True on the first live session, and after the sweeper marked the user offline
+        if await self.update_presence('heartbeat', self.is_expert):
+            await self.channel_layer.group_send(
+                self.room_group_name,
+                {
+                    'type': 'user_online',
+                    'user_id': str(self.user.id),
+                    'user_name': self.user.full_name or self.user.email,
+                }
+            )
+    
+    async def update_presence(self, action, *args):
+        """Run a presence registry update; failures read as a status change."""
+        try:
+            method = getattr(get_presence_registry(), action)
+            return await sync_to_async(method, thread_sensitive=False)(
+                str(self.user.id), self.channel_name, *args
+            )
+        except Exception as e:
+            logger.error(f"Presence {action} failed: {str(e)}")
+            return True
+    
+    @database_sync_to_async
+    def get_is_expert(self):
+        """Whether the connected user has an expert profile."""
+        return Expert.objects.filter(user=self.user).exists()
+    
     async def user_online(self, event):
         """Handle user online event."""
         # Don't send own status
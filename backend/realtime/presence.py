@@ -0,0 +1,282 @@
+"""
+Queryable presence state for realtime connections.
+
+Each WebSocket session heartbeats into sorted sets scored by the time of its
+last heartbeat:
+
+* ``{presence}:sessions`` holds ``<user_id>|<session_id>`` members, so stale
+  sessions can be found with one range query;
+* ``{presence}:user:<user_id>`` holds the live sessions of one user;
+* ``{presence}:users`` and ``{presence}:experts`` hold user ids scored by
+  that user's latest heartbeat.
+
+A user is online while their score is newer than ``PRESENCE_TTL`` seconds,
+so "is online" is a ZSCORE, a listing page is one ZMSCORE and "online
+experts" is a score range over the experts set. Sockets that drop without a
+disconnect simply stop heartbeating; they read as offline as soon as their
+TTL lapses, and ``sweep()`` (run periodically by
+``realtime.tasks.sweep_presence``) removes them and reports which users went
+offline so their ``user_offline`` events can be broadcast.
+
+Updates run as Lua scripts so a heartbeat, a disconnect and the sweeper
+never interleave. All keys share the ``{presence}`` hash tag to stay on one
+Redis Cluster slot. When ``PRESENCE_BACKEND`` is ``'local'`` an in-process
+registry with the same behaviour is used instead, for development and tests.
+"""
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+USERS_KEY = '{presence}:users'
+EXPERTS_KEY = '{presence}:experts'
+SESSIONS_KEY = '{presence}:sessions'
+USER_SESSIONS_PREFIX = '{presence}:user:'
+
+_HEARTBEAT_SCRIPT = """
+local previous = redis.call('ZSCORE', KEYS[1], ARGV[3])
+redis.call('ZADD', KEYS[3], ARGV[1], ARGV[3] .. '|' .. ARGV[4])
+redis.call('ZADD', KEYS[4], ARGV[1], ARGV[4])
+redis.call('EXPIRE', KEYS[4], ARGV[6])
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[3])
+if ARGV[5] == '1' then
+    redis.call('ZADD', KEYS[2], ARGV[1], ARGV[3])
+end
+if previous and tonumber(previous) >= tonumber(ARGV[2]) then
+    return 0
+end
+return 1
+"""
+
+_DISCONNECT_SCRIPT = """
+redis.call('ZREM', KEYS[3], ARGV[2] .. '|' .. ARGV[3])
+redis.call('ZREM', KEYS[4], ARGV[3])
+if redis.call('ZCOUNT', KEYS[4], ARGV[1], '+inf') > 0 then
+    return 0
+end
+redis.call('DEL', KEYS[4])
+redis.call('ZREM', KEYS[2], ARGV[2])
+return redis.call('ZREM', KEYS[1], ARGV[2])
+"""
+
+_SWEEP_SCRIPT = """
+local stale = redis.call('ZRANGEBYSCORE', KEYS[3], '-inf', '(' .. ARGV[1], 'LIMIT', 0, ARGV[2])
+local offline = {}
+for _, member in ipairs(stale) do
+    redis.call('ZREM', KEYS[3], member)
+    local sep = string.find(member, '|', 1, true)
+    local user_id = string.sub(member, 1, sep - 1)
+    local user_key = ARGV[3] .. user_id
+    redis.call('ZREM', user_key, string.sub(member, sep + 1))
+    if redis.call('ZCOUNT', user_key, ARGV[1], '+inf') == 0 then
+        redis.call('DEL', user_key)
+        redis.call('ZREM', KEYS[2], user_id)
+        if redis.call('ZREM', KEYS[1], user_id) == 1 then
+            table.insert(offline, user_id)
+        end
+    end
+end
+return offline
+"""
+
+
+class PresenceRegistry(ABC):
+    """Heartbeat-based presence; subclasses provide the storage."""
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = ttl if ttl is not None else settings.PRESENCE_TTL
+
+    def _cutoff(self, now: Optional[float]) -> float:
+        return (now if now is not None else time.time()) - self.ttl
+
+    @abstractmethod
+    def heartbeat(self, user_id, session_id: str, is_expert: bool = False, now: Optional[float] = None) -> bool:
+        """
+        Record that a session is alive.
+
+        Returns:
+            True if the user was offline before this heartbeat
+        """
+
+    @abstractmethod
+    def disconnect(self, user_id, session_id: str, now: Optional[float] = None) -> bool:
+        """
+        Remove a session.
+
+        Returns:
+            True if it was the user's last live session
+        """
+
+    @abstractmethod
+    def last_seen(self, user_ids: Iterable) -> Dict[str, Optional[float]]:
+        """Return each user's latest heartbeat timestamp, or None."""
+
+    @abstractmethod
+    def online_experts(self, limit: Optional[int] = None, now: Optional[float] = None) -> List[str]:
+        """Return user ids of online experts, most recently active first."""
+
+    @abstractmethod
+    def sweep(self, limit: int = 1000, now: Optional[float] = None) -> List[str]:
+        """Drop sessions whose TTL has lapsed and return users that went offline."""
+
+    def statuses(self, user_ids: Iterable, now: Optional[float] = None) -> Dict[str, bool]:
+        """Return whether each user is online, in one round trip."""
+        cutoff = self._cutoff(now)
+        return {
+            user_id: score is not None and score >= cutoff
+            for user_id, score in self.last_seen(user_ids).items()
+        }
+
+    def is_online(self, user_id, now: Optional[float] = None) -> bool:
+        """Return whether a user has a live session."""
+        return self.statuses([user_id], now=now)[str(user_id)]
+
+
+class RedisPresenceRegistry(PresenceRegistry):
+    """Presence registry stored in Redis sorted sets."""
+
+    def __init__(self, client=None, ttl: Optional[float] = None):
+        super().__init__(ttl)
+        if client is None:
+            import redis
+            client = redis.Redis.from_url(settings.PRESENCE_REDIS_URL)
+        self.client = client
+        self._heartbeat = client.register_script(_HEARTBEAT_SCRIPT)
+        self._disconnect = client.register_script(_DISCONNECT_SCRIPT)
+        self._sweep = client.register_script(_SWEEP_SCRIPT)
+
+    def heartbeat(self, user_id, session_id, is_expert=False, now=None):
+        now = now if now is not None else time.time()
+        came_online = self._heartbeat(
+            keys=[USERS_KEY, EXPERTS_KEY, SESSIONS_KEY, f'{USER_SESSIONS_PREFIX}{user_id}'],
+            args=[now, self._cutoff(now), str(user_id), session_id, int(bool(is_expert)), int(self.ttl * 2) + 1],
+        )
+        return bool(came_online)
+
+    def disconnect(self, user_id, session_id, now=None):
+        went_offline = self._disconnect(
+            keys=[USERS_KEY, EXPERTS_KEY, SESSIONS_KEY, f'{USER_SESSIONS_PREFIX}{user_id}'],
+            args=[self._cutoff(now), str(user_id), session_id],
+        )
+        return bool(went_offline)
+
+    def last_seen(self, user_ids):
+        user_ids = [str(user_id) for user_id in user_ids]
+        if not user_ids:
+            return {}
+        return dict(zip(user_ids, self.client.zmscore(USERS_KEY, user_ids)))
+
+    def online_experts(self, limit=None, now=None):
+        members = self.client.zrevrangebyscore(
+            EXPERTS_KEY, '+inf', self._cutoff(now),
+            start=0 if limit else None, num=limit or None
+        )
+        return [member.decode() for member in members]
+
+    def sweep(self, limit=1000, now=None):
+        offline = self._sweep(
+            keys=[USERS_KEY, EXPERTS_KEY, SESSIONS_KEY],
+            args=[self._cutoff(now), limit, USER_SESSIONS_PREFIX],
+        )
+        return [user_id.decode() for user_id in offline]
+
+
+class LocalPresenceRegistry(PresenceRegistry):
+    """In-process presence registry for development and tests."""
+
+    def __init__(self, ttl: Optional[float] = None):
+        super().__init__(ttl)
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, Dict[str, float]] = {}
+        self._users: Dict[str, float] = {}
+        self._experts: Dict[str, float] = {}
+
+    def heartbeat(self, user_id, session_id, is_expert=False, now=None):
+        now = now if now is not None else time.time()
+        user_id = str(user_id)
+        with self._lock:
+            previous = self._users.get(user_id)
+            self._sessions.setdefault(user_id, {})[session_id] = now
+            self._users[user_id] = now
+            if is_expert:
+                self._experts[user_id] = now
+        return previous is None or previous < self._cutoff(now)
+
+    def disconnect(self, user_id, session_id, now=None):
+        user_id = str(user_id)
+        cutoff = self._cutoff(now)
+        with self._lock:
+            sessions = self._sessions.get(user_id, {})
+            sessions.pop(session_id, None)
+            return self._drop_if_idle(user_id, cutoff)
+
+    def _drop_if_idle(self, user_id: str, cutoff: float) -> bool:
+        sessions = self._sessions.get(user_id, {})
+        if any(seen >= cutoff for seen in sessions.values()):
+            return False
+        self._sessions.pop(user_id, None)
+        self._experts.pop(user_id, None)
+        return self._users.pop(user_id, None) is not None
+
+    def last_seen(self, user_ids):
+        with self._lock:
+            return {str(user_id): self._users.get(str(user_id)) for user_id in user_ids}
+
+    def online_experts(self, limit=None, now=None):
+        cutoff = self._cutoff(now)
+        with self._lock:
+            online = sorted(
+                (item for item in self._experts.items() if item[1] >= cutoff),
+                key=lambda item: item[1], reverse=True
+            )
+        return [user_id for user_id, _ in online[:limit]]
+
+    def sweep(self, limit=1000, now=None):
+        cutoff = self._cutoff(now)
+        offline = []
+        with self._lock:
+            stale = sorted(
+                (seen, user_id, session_id)
+                for user_id, sessions in self._sessions.items()
+                for session_id, seen in sessions.items()
+                if seen < cutoff
+            )[:limit]
+            for _, user_id, session_id in stale:
+                self._sessions.get(user_id, {}).pop(session_id, None)
+                if self._drop_if_idle(user_id, cutoff):
+                    offline.append(user_id)
+        return offline
+
+
+_registry: Optional[PresenceRegistry] = None
+
+
+def get_presence_registry() -> PresenceRegistry:
+    """Return the process-wide presence registry."""
+    global _registry
+    if _registry is None:
+        if settings.PRESENCE_BACKEND == 'local':
+            _registry = LocalPresenceRegistry()
+        else:
+            _registry = RedisPresenceRegistry()
+    return _registry
+
+
+def online_statuses(user_ids: Iterable) -> Dict[str, bool]:
+    """
+    Batch online lookup for API responses.
+
+    Presence is advisory, so a registry outage reports everyone as offline
+    instead of failing the request.
+    """
+    user_ids = [str(user_id) for user_id in user_ids if user_id]
+    try:
+        return get_presence_registry().statuses(user_ids)
+    except Exception as e:
+        logger.warning(f"Presence lookup failed: {str(e)}")
+        return dict.fromkeys(user_ids, False)
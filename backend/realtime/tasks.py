@@ -0,0 +1,22 @@
+"""
+Celery tasks for real-time features.
+"""
+import logging
+
+from celery import shared_task
+
+from .presence import get_presence_registry
+from .utils import broadcast_presence_update
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def sweep_presence():
+    """Expire presence sessions that stopped heartbeating and announce who went offline."""
+    offline = get_presence_registry().sweep()
+    for user_id in offline:
+        broadcast_presence_update(user_id, None, is_online=False)
+    if offline:
+        logger.info(f"Presence sweep marked {len(offline)} users offline")
+    return len(offline)
@@ -0,0 +1,174 @@
+"""
+Unit tests for write-behind chat persistence.
+"""
+from datetime import timedelta
+from unittest import mock
+
+from channels.db import database_sync_to_async
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from django.core.cache import cache
+from django.test import TransactionTestCase, override_settings
+from django.utils import timezone
+
+from accounts.models import User
+from consultations.models import Consultation, Expert, ExpertChatConversation, ExpertChatMessage
+from realtime import chat_persistence
+from realtime.chat_persistence import ChatWriteBehind, persist_batch
+from realtime.routing import websocket_urlpatterns
+from utils.metrics import get_metric
+
+
+@override_settings(
+    CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}},
+    CHAT_WRITE_BEHIND_FLUSH_INTERVAL=60,
+)
+class ChatWriteBehindTest(TransactionTestCase):
+    """Test cases for ordering, durability and receipt coalescing."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        cache.clear()
+        self.client_user = User.objects.create(email='client@example.com', full_name='Client')
+        self.expert_user = User.objects.create(email='astro@example.com', full_name='Astro')
+        self.expert = Expert.objects.create(
+            name='Astro', email='astro-expert@example.com', specialty='general',
+            experience_years=5, bio='Numerologist', user=self.expert_user
+        )
+        self.consultation = Consultation.objects.create(
+            user=self.client_user, expert=self.expert,
+            consultation_type='chat', scheduled_at=timezone.now() + timedelta(days=1), status='confirmed'
+        )
+        chat_persistence._writer = None
+        self.addCleanup(setattr, chat_persistence, '_writer', None)
+
+    async def _connect(self, user):
+        communicator = WebsocketCommunicator(
+            URLRouter(websocket_urlpatterns), f'/ws/chat/{self.consultation.id}/'
+        )
+        communicator.scope['user'] = user
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+        await communicator.receive_json_from()
+        return communicator
+
+    async def test_messages_broadcast_before_persisting_in_order(self):
+        """The room sees messages immediately; storage keeps their ids, order and timestamps."""
+        client = await self._connect(self.client_user)
+        expert = await self._connect(self.expert_user)
+
+        for text in ('first', 'second', 'third'):
+            await client.send_json_to({'type': 'chat_message', 'message': text})
+        received = [(await expert.receive_json_from())['data'] for _ in range(3)]
+
+        self.assertEqual([m['content'] for m in received], ['first', 'second', 'third'])
+        self.assertEqual(await database_sync_to_async(ExpertChatMessage.objects.count)(), 0)
+        self.assertEqual(chat_persistence.get_chat_writer().pending, 3)
+
+        await client.disconnect()
+
+        stored = await database_sync_to_async(list)(
+            ExpertChatMessage.objects.order_by('created_at').values('id', 'message_content', 'created_at', 'sender_type')
+        )
+        self.assertEqual([str(m['id']) for m in stored], [m['id'] for m in received])
+        self.assertEqual([m['created_at'].isoformat() for m in stored], [m['created_at'] for m in received])
+        self.assertEqual({m['sender_type'] for m in stored}, {'user'})
+        conversation = await database_sync_to_async(ExpertChatConversation.objects.get)()
+        self.assertEqual(conversation.unread_count_expert, 3)
+        self.assertEqual(conversation.last_message_preview, 'third')
+        await expert.disconnect()
+
+    async def test_read_receipts_coalesce_per_conversation(self):
+        """Receipts in one window become a single read-up-to update, even for buffered messages."""
+        client = await self._connect(self.client_user)
+        expert = await self._connect(self.expert_user)
+        for text in ('one', 'two', 'three'):
+            await client.send_json_to({'type': 'chat_message', 'message': text})
+        received = [(await expert.receive_json_from())['data'] for _ in range(3)]
+
+        for message in (received[1], received[0], received[2], received[1]):
+            await expert.send_json_to({'type': 'read_receipt', 'message_id': message['id']})
+        await expert.receive_nothing()
+
+        with mock.patch(
+            'realtime.chat_persistence.persist_batch', wraps=persist_batch
+        ) as persist:
+            await chat_persistence.get_chat_writer().flush()
+
+        self.assertEqual(persist.call_count, 1)
+        self.assertEqual(len(persist.call_args.args[1]), 1)
+        unread = await database_sync_to_async(ExpertChatMessage.objects.filter(is_read=False).count)()
+        self.assertEqual(unread, 0)
+        conversation = await database_sync_to_async(ExpertChatConversation.objects.get)()
+        self.assertEqual(conversation.unread_count_expert, 0)
+        await client.disconnect()
+        await expert.disconnect()
+
+    async def test_invalid_receipts_do_not_affect_messages(self):
+        """Receipts with a non-UUID id are dropped; a failing receipt does not roll back messages."""
+        client = await self._connect(self.client_user)
+        expert = await self._connect(self.expert_user)
+        await client.send_json_to({'type': 'chat_message', 'message': 'hello'})
+        received = (await expert.receive_json_from())['data']
+
+        await expert.send_json_to({'type': 'read_receipt', 'message_id': 'not-a-uuid'})
+        await expert.receive_nothing()
+        writer = chat_persistence.get_chat_writer()
+        self.assertEqual(get_metric('chat_write_behind.invalid_receipt'), 1)
+
+        await expert.send_json_to({'type': 'read_receipt', 'message_id': received['id']})
+        await expert.receive_nothing()
+        with mock.patch('realtime.chat_persistence._apply_read_receipt', side_effect=RuntimeError('deadlock')):
+            await writer.flush()
+
+        self.assertEqual(get_metric('chat_write_behind.receipt_failed'), 1)
+        self.assertEqual(get_metric('chat_write_behind.dropped'), 0)
+        stored = await database_sync_to_async(list)(ExpertChatMessage.objects.values_list('id', flat=True))
+        self.assertEqual([str(message_id) for message_id in stored], [received['id']])
+        await client.disconnect()
+        await expert.disconnect()
+
+    async def test_failed_batches_are_retried_without_duplicates(self):
+        """A batch that failed after writing is retried idempotently; a hopeless one is dropped."""
+        conversation = await database_sync_to_async(ExpertChatConversation.objects.create)(
+            user=self.client_user, expert=self.expert, consultation=self.consultation
+        )
+        writer = ChatWriteBehind(flush_interval=0, max_retries=1)
+        await writer.enqueue_message(str(conversation.id), 'user', str(self.client_user.id), 'hello')
+
+        calls = []
+
+        def flaky(messages, receipts):
+            persist_batch(messages, receipts)
+            calls.append(len(messages))
+            if len(calls) == 1:
+                raise RuntimeError('connection reset after commit')
+
+        with mock.patch('realtime.chat_persistence.persist_batch', side_effect=flaky):
+            await writer.flush()
+        self.assertEqual(calls, [1, 1])
+        self.assertEqual(await database_sync_to_async(ExpertChatMessage.objects.count)(), 1)
+
+        await writer.enqueue_message(str(conversation.id), 'user', str(self.client_user.id), 'lost')
+        with mock.patch('realtime.chat_persistence.persist_batch', side_effect=RuntimeError('db down')):
+            await writer.flush()
+        self.assertEqual(writer.pending, 0)
+        self.assertEqual(get_metric('chat_write_behind.dropped'), 1)
+        await writer.close()
+
+    async def test_background_flush_batches_messages(self):
+        """Reaching the batch size wakes the flusher without waiting for the interval."""
+        conversation = await database_sync_to_async(ExpertChatConversation.objects.create)(
+            user=self.client_user, expert=self.expert, consultation=self.consultation
+        )
+        writer = ChatWriteBehind(batch_size=5, flush_interval=60)
+        for i in range(5):
+            await writer.enqueue_message(str(conversation.id), 'expert', None, f'message {i}')
+
+        for _ in range(100):
+            if not writer.pending:
+                break
+            await database_sync_to_async(lambda: None)()
+        self.assertEqual(writer.pending, 0)
+        self.assertEqual(await database_sync_to_async(ExpertChatMessage.objects.count)(), 5)
+        await writer.close()
@@ -0,0 +1,163 @@
+"""
+Unit tests for the presence registry.
+"""
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.models import User
+from consultations.models import Consultation, Expert
+from consultations.views import get_experts, get_upcoming_consultations
+from realtime import presence
+from realtime.presence import LocalPresenceRegistry, RedisPresenceRegistry
+from realtime.routing import websocket_urlpatterns
+from realtime.tasks import sweep_presence
+
+
+def _redis_registry():
+    import redis
+    client = redis.Redis.from_url('redis://localhost:6379/15', socket_connect_timeout=0.2)
+    try:
+        client.ping()
+    except redis.RedisError:
+        pytest.skip('Redis server not available')
+    client.flushdb()
+    return RedisPresenceRegistry(client=client, ttl=60)
+
+
+@pytest.fixture(params=['local', 'redis'])
+def registry(request):
+    if request.param == 'redis':
+        return _redis_registry()
+    return LocalPresenceRegistry(ttl=60)
+
+
+def test_sessions_and_ttl(registry):
+    """A user stays online until their last session disconnects or stops heartbeating."""
+    assert registry.heartbeat('u1', 'a', now=1000) is True
+    assert registry.heartbeat('u1', 'b', now=1010) is False
+    assert registry.disconnect('u1', 'a', now=1020) is False
+    assert registry.is_online('u1', now=1020)
+
+    assert registry.is_online('u1', now=1070)
+    assert not registry.is_online('u1', now=1071)
+    assert registry.heartbeat('u1', 'b', now=1200) is True
+    assert registry.disconnect('u1', 'b', now=1210) is True
+    assert registry.statuses(['u1', 'u2'], now=1210) == {'u1': False, 'u2': False}
+
+
+def test_online_experts_and_sweep(registry):
+    """Only live experts are listed; the sweeper reports users whose sessions all lapsed."""
+    registry.heartbeat('client', 's1', now=1000)
+    registry.heartbeat('e1', 's2', is_expert=True, now=1000)
+    registry.heartbeat('e2', 's3', is_expert=True, now=1030)
+    registry.heartbeat('e2', 's4', is_expert=True, now=1050)
+
+    assert registry.online_experts(now=1059) == ['e2', 'e1']
+    assert registry.online_experts(now=1061) == ['e2']
+    assert registry.online_experts(limit=1, now=1000) == ['e2']
+
+    assert sorted(registry.sweep(now=1095)) == ['client', 'e1']
+    assert registry.sweep(now=1095) == []
+    assert registry.statuses(['e2'], now=1095) == {'e2': True}
+    assert registry.sweep(now=1200) == ['e2']
+    assert registry.online_experts(now=1000) == []
+
+
+@override_settings(
+    CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}},
+    PRESENCE_BACKEND='local',
+)
+class PresenceConsumerTest(TransactionTestCase):
+    """Test cases for presence events and live status in API responses."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        presence._registry = None
+        self.addCleanup(setattr, presence, '_registry', None)
+        self.factory = APIRequestFactory()
+        self.client_user = User.objects.create(email='client@example.com', full_name='Client')
+        self.experts = []
+        for i in range(3):
+            user = User.objects.create(email=f'expert{i}@example.com', full_name=f'Expert {i}')
+            self.experts.append(Expert.objects.create(
+                name=f'Expert {i}', email=f'expert{i}-profile@example.com', specialty='general',
+                experience_years=10 - i, bio='Numerologist', user=user,
+                verification_status='approved', is_active=True
+            ))
+
+    async def _connect(self, user):
+        communicator = WebsocketCommunicator(URLRouter(websocket_urlpatterns), '/ws/presence/')
+        communicator.scope['user'] = user
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+        return communicator
+
+    async def test_events_follow_first_and_last_session(self):
+        """Second tabs do not re-announce; the sweeper announces lapsed sessions and heartbeats revive them."""
+        watcher = await self._connect(self.client_user)
+        expert_user = self.experts[0].user
+
+        first = await self._connect(expert_user)
+        self.assertEqual((await watcher.receive_json_from())['type'], 'user_online')
+        second = await self._connect(expert_user)
+        await first.send_json_to({'type': 'heartbeat'})
+        await first.disconnect()
+        self.assertTrue(await watcher.receive_nothing())
+        registry = presence.get_presence_registry()
+        self.assertEqual(registry.online_experts(), [str(expert_user.id)])
+
+        # The second socket drops without a disconnect and stops heartbeating
+        registry.ttl = 0
+        with mock.patch('realtime.tasks.broadcast_presence_update') as broadcast:
+            self.assertEqual(sweep_presence(), 2)
+        offline = {call.args[0] for call in broadcast.call_args_list}
+        self.assertEqual(offline, {str(expert_user.id), str(self.client_user.id)})
+
+        # A late heartbeat from the swept socket brings the user back online
+        registry.ttl = 60
+        await second.send_json_to({'type': 'heartbeat'})
+        event = await watcher.receive_json_from()
+        self.assertEqual((event['type'], event['user_id']), ('user_online', str(expert_user.id)))
+        await second.send_json_to({'type': 'heartbeat'})
+        self.assertTrue(await watcher.receive_nothing())
+        await second.disconnect()
+        await watcher.disconnect()
+
+    def test_listings_show_live_status_without_queries(self):
+        """Expert and consultation listings read presence in one batch, adding no queries."""
+        registry = presence.get_presence_registry()
+        registry.heartbeat(self.experts[1].user_id, 'socket', is_expert=True)
+        Consultation.objects.create(
+            user=self.client_user, expert=self.experts[1], consultation_type='chat',
+            scheduled_at=timezone.now() + timedelta(days=1), status='confirmed'
+        )
+
+        request = self.factory.get('/api/v1/consultations/experts/')
+        force_authenticate(request, user=self.client_user)
+        with CaptureQueriesContext(connection) as queries:
+            response = get_experts(request)
+        self.assertEqual(
+            [e['is_online'] for e in response.data['results']], [False, True, False]
+        )
+        self.assertEqual(len(queries), 2)
+
+        request = self.factory.get('/api/v1/consultations/experts/', {'online': 'true'})
+        force_authenticate(request, user=self.client_user)
+        response = get_experts(request)
+        self.assertEqual([e['id'] for e in response.data['results']], [str(self.experts[1].id)])
+
+        request = self.factory.get('/api/v1/consultations/upcoming/')
+        force_authenticate(request, user=self.client_user)
+        with mock.patch.object(registry, 'last_seen', wraps=registry.last_seen) as last_seen:
+            response = get_upcoming_consultations(request)
+        self.assertTrue(response.data['results'][0]['expert']['is_online'])
+        self.assertEqual(last_seen.call_count, 1)
@@ -0,0 +1,21 @@
+# Composite (owner, timestamp, id) index backing keyset pagination
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0003_auto_20251125_0730'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='generatedreport',
+            name='generated_r_user_id_33f950_idx',
+        ),
+        migrations.AddIndex(
+            model_name='generatedreport',
+            index=models.Index(fields=['user', 'generated_at', 'id'], name='gen_report_user_gen_id_idx'),
+        ),
+    ]
@@ -68,7 +68,7 @@ class GeneratedReport(models.Model):
         verbose_name_plural = 'Generated Reports'
         ordering = ['-generated_at']
         indexes = [
-            models.Index(fields=['user', 'generated_at']),
+            models.Index(fields=['user', 'generated_at', 'id'], name='gen_report_user_gen_id_idx'),
             models.Index(fields=['person', 'template']),
         ]
     
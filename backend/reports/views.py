@@ -14,6 +14,7 @@ from .serializers import (
     ReportTemplateSerializer, GeneratedReportSerializer, ScheduledReportSerializer, ReportComparisonSerializer
 )
 from numerology.models import Person, PersonNumerologyProfile
+from utils.pagination import KeysetPagination
 from io import BytesIO
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
@@ -226,29 +227,15 @@ def bulk_generate_reports(request):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def get_generated_reports(request):
-    """Get user's generated reports."""
+    """Get user's generated reports, newest first, with keyset pagination."""
     user = request.user
     
-    # Get pagination params
-    page = int(request.query_params.get('page', 1))
-    page_size = int(request.query_params.get('page_size', 10))
-    
-    # Get reports
-    reports = GeneratedReport.objects.filter(user=user).order_by('-generated_at')
-    
-    # Paginate
-    start = (page - 1) * page_size
-    end = start + page_size
-    paginated_reports = reports[start:end]
-    
-    serializer = GeneratedReportSerializer(paginated_reports, many=True)
+    reports = GeneratedReport.objects.filter(user=user)
     
-    return Response({
-        'count': reports.count(),
-        'page': page,
-        'page_size': page_size,
-        'results': serializer.data
-    }, status=status.HTTP_200_OK)
+    paginator = KeysetPagination('generated_at')
+    page = paginator.paginate_queryset(reports, request)
+    serializer = GeneratedReportSerializer(page, many=True)
+    return paginator.get_paginated_response(serializer.data)
 
 
 @api_view(['GET'])
@@ -2,7 +2,7 @@
 Admin configuration for smart_calendar app.
 """
 from django.contrib import admin
-from .models import NumerologyEvent, PersonalCycle, AuspiciousDate, CalendarReminder
+from .models import NumerologyEvent, PersonalCycle, AuspiciousDate, CalendarReminder, CalendarFeed
 
 
 @admin.register(NumerologyEvent)
@@ -35,3 +35,10 @@ class CalendarReminderAdmin(admin.ModelAdmin):
     list_filter = ['reminder_type', 'is_completed', 'is_recurring', 'reminder_date']
     search_fields = ['user__email', 'user__phone', 'title', 'description']
     ordering = ['reminder_date', 'reminder_time']
+
+
+@admin.register(CalendarFeed)
+class CalendarFeedAdmin(admin.ModelAdmin):
+    list_display = ['user', 'created_at', 'rotated_at']
+    search_fields = ['user__email', 'user__phone']
+    exclude = ['token']
@@ -0,0 +1,165 @@
+"""
+Subscribable iCalendar feed of a user's personal cycles.
+
+A feed covers one calendar year and depends only on the user's birth date,
+so it is built once per (user, birth date, year) and cached as a
+zlib-compressed blob. The ETag is derived from those same inputs, which
+lets conditional requests be answered without reading the cache at all.
+"""
+import hashlib
+import zlib
+from datetime import date, timedelta
+from typing import Iterator, List
+
+from django.core.cache import cache
+
+from .services import CalendarService
+
+# Bump when the feed layout or wording changes so cached blobs are rebuilt.
+FEED_VERSION = 1
+FEED_CACHE_TTL = 60 * 60 * 24 * 400
+FEED_REFRESH_INTERVAL = 'PT12H'
+STREAM_CHUNK_SIZE = 16 * 1024
+
+PERSONAL_DAY_MEANINGS = {
+    1: 'New beginnings and leadership',
+    2: 'Cooperation and partnership',
+    3: 'Creativity and expression',
+    4: 'Stability and foundation',
+    5: 'Change and freedom',
+    6: 'Love and harmony',
+    7: 'Spirituality and introspection',
+    8: 'Success and abundance',
+    9: 'Completion and service',
+}
+
+
+def feed_etag(user_id: str, birth_date: date, year: int) -> str:
+    """Return the strong ETag for a user's feed for ``year``."""
+    source = f'{FEED_VERSION}:{user_id}:{birth_date.isoformat()}:{year}'
+    return '"' + hashlib.sha256(source.encode('utf-8')).hexdigest()[:32] + '"'
+
+
+def _escape(text: str) -> str:
+    return (
+        text.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,').replace('\n', '\\n')
+    )
+
+
+def _fold(line: str) -> str:
+    """Fold a content line to 75 octets as RFC 5545 requires."""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= 75:
+        return line
+    parts = []
+    while len(encoded) > 75:
+        cut = 75 if not parts else 74
+        # Do not split a multi-byte character
+        while cut and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode('utf-8'))
+        encoded = encoded[cut:]
+    parts.append(encoded.decode('utf-8'))
+    return '\r\n '.join(parts)
+
+
+def _all_day_event(uid: str, stamp: str, day: date, summary: str, description: str) -> List[str]:
+    return [
+        'BEGIN:VEVENT',
+        f'UID:{uid}',
+        f'DTSTAMP:{stamp}',
+        f'DTSTART;VALUE=DATE:{day:%Y%m%d}',
+        f'DTEND;VALUE=DATE:{day + timedelta(days=1):%Y%m%d}',
+        f'SUMMARY:{_escape(summary)}',
+        f'DESCRIPTION:{_escape(description)}',
+        'TRANSP:TRANSPARENT',
+        'END:VEVENT',
+    ]
+
+
+def build_ical_feed(user_id: str, birth_date: date, year: int) -> bytes:
+    """
+    Render the iCalendar document for one user-year.
+
+    Contains an all-day event per personal day, the start of each personal
+    month and of the personal year, and the year's most auspicious dates.
+    Output is deterministic for the same inputs so it matches its ETag.
+    """
+    service = CalendarService()
+    calculator = service.calculator
+    stamp = f'{year}0101T000000Z'
+    lines = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        'PRODID:-//NumerAI//Personal Cycles//EN',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        f'X-WR-CALNAME:Personal Cycles {year}',
+        f'REFRESH-INTERVAL;VALUE=DURATION:{FEED_REFRESH_INTERVAL}',
+        f'X-PUBLISHED-TTL:{FEED_REFRESH_INTERVAL}',
+    ]
+
+    personal_year = calculator.calculate_personal_year_number(birth_date, year)
+    try:
+        year_start = date(year, birth_date.month, birth_date.day)
+    except ValueError:
+        # 29 February birthdays fall on the 28th in common years
+        year_start = date(year, 2, 28)
+    lines += _all_day_event(
+        f'personal-year-{year}-{user_id}', stamp, year_start,
+        f'Personal Year {personal_year}',
+        f'Your Personal Year {personal_year} energy is strongest from your birthday this year.'
+    )
+
+    day = date(year, 1, 1)
+    while day.year == year:
+        if day.day == 1:
+            personal_month = calculator.calculate_personal_month_number(birth_date, year, day.month)
+            lines += _all_day_event(
+                f'personal-month-{day:%Y%m}-{user_id}', stamp, day,
+                f'Personal Month {personal_month} Begins',
+                f'Personal Month {personal_month} in Personal Year {personal_year}.'
+            )
+        personal_day = calculator.calculate_personal_day_number(birth_date, day)
+        lines += _all_day_event(
+            f'personal-day-{day:%Y%m%d}-{user_id}', stamp, day,
+            f'Personal Day {personal_day}',
+            PERSONAL_DAY_MEANINGS.get(personal_day, 'A balanced day')
+        )
+        day += timedelta(days=1)
+
+    for auspicious in service.find_auspicious_dates(birth_date, date(year, 1, 1), date(year, 12, 31)):
+        lines += _all_day_event(
+            f'auspicious-{auspicious["date"]:%Y%m%d}-{user_id}', stamp, auspicious['date'],
+            f'Auspicious Day ({auspicious["score"]}/10)',
+            auspicious['reasoning']
+        )
+
+    lines.append('END:VCALENDAR')
+    return ('\r\n'.join(_fold(line) for line in lines) + '\r\n').encode('utf-8')
+
+
+def _cache_key(etag: str) -> str:
+    return 'calendar_feed:' + etag.strip('"')
+
+
+def get_feed_blob(user_id: str, birth_date: date, year: int) -> bytes:
+    """Return the compressed feed, building and caching it on first use."""
+    key = _cache_key(feed_etag(user_id, birth_date, year))
+    blob = cache.get(key)
+    if blob is None:
+        blob = zlib.compress(build_ical_feed(user_id, birth_date, year), 9)
+        cache.set(key, blob, FEED_CACHE_TTL)
+    return blob
+
+
+def stream_feed(blob: bytes) -> Iterator[bytes]:
+    """Decompress a cached feed incrementally for a streaming response."""
+    decompressor = zlib.decompressobj()
+    for start in range(0, len(blob), STREAM_CHUNK_SIZE):
+        chunk = decompressor.decompress(blob[start:start + STREAM_CHUNK_SIZE])
+        if chunk:
+            yield chunk
+    tail = decompressor.flush()
+    if tail:
+        yield tail
@@ -151,3 +151,21 @@ class CalendarReminder(models.Model):
     
     def __str__(self):
         return f"{self.title} reminder for {self.user} on {self.reminder_date}"
+
+
+class CalendarFeed(models.Model):
+    """Secret-token iCalendar subscription for a user's personal cycles."""
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.OneToOneField('accounts.User', on_delete=models.CASCADE, related_name='calendar_feed')
+    token = models.CharField(max_length=64, unique=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    rotated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'calendar_feeds'
+        verbose_name = 'Calendar Feed'
+        verbose_name_plural = 'Calendar Feeds'
+    
+    def __str__(self):
+        return f"Calendar feed for {self.user}"
@@ -1,3 +1,88 @@
-from django.test import TestCase
+"""
+Tests for the smart calendar iCalendar feed.
+"""
+from datetime import date
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import include, path
+from rest_framework.test import APIClient
+
+from accounts.models import User, UserProfile
+from .feeds import build_ical_feed
+from .models import CalendarFeed
+from .services import CalendarService
+
+urlpatterns = [
+    path('api/v1/calendar/', include('smart_calendar.urls')),
+]
+
+
+@override_settings(ROOT_URLCONF='smart_calendar.tests')
+class CalendarFeedTest(TestCase):
+    """Test cases for the subscribable personal cycle feed."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create(email='feed@example.com', full_name='Feed User')
+        UserProfile.objects.update_or_create(user=self.user, defaults={'date_of_birth': date(1990, 5, 17)})
+        self.client.force_authenticate(self.user)
+        response = self.client.get('/api/v1/calendar/feed/')
+        self.feed_url = response.data['feed_url']
+        self.client.force_authenticate(None)
+
+    def _get_feed(self, **headers):
+        return self.client.get(self.feed_url.replace('http://testserver', ''), **headers)
+
+    def test_feed_lists_personal_days_and_cycles(self):
+        """The year's personal days match the calculator and lines are RFC 5545 folded."""
+        feed = build_ical_feed(str(self.user.id), date(1990, 5, 17), 2026).decode('utf-8')
+
+        personal_day = CalendarService().get_personal_day_number(date(1990, 5, 17), date(2026, 3, 9))
+        self.assertIn(
+            f'DTSTART;VALUE=DATE:20260309\r\nDTEND;VALUE=DATE:20260310\r\nSUMMARY:Personal Day {personal_day}',
+            feed
+        )
+        self.assertEqual(feed.count('SUMMARY:Personal Day'), 365)
+        self.assertEqual(feed.count('SUMMARY:Personal Month'), 12)
+        self.assertTrue(all(len(line.encode()) <= 75 for line in feed.split('\r\n')))
+
+    def test_conditional_requests_skip_rebuilding(self):
+        """The feed is built once per user-year and unchanged polls get 304."""
+        with mock.patch('smart_calendar.feeds.build_ical_feed', wraps=build_ical_feed) as build:
+            first = self._get_feed()
+            body = b''.join(first.streaming_content)
+            second = self._get_feed()
+            b''.join(second.streaming_content)
+            not_modified = self._get_feed(HTTP_IF_NONE_MATCH=first['ETag'])
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first['Content-Type'], 'text/calendar; charset=utf-8')
+        self.assertTrue(body.startswith(b'BEGIN:VCALENDAR\r\n'))
+        self.assertEqual(build.call_count, 1)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], first['ETag'])
+
+    def test_birth_date_change_invalidates_etag(self):
+        """Changing the birth date yields a new ETag and body."""
+        etag = self._get_feed()['ETag']
+        UserProfile.objects.filter(user=self.user).update(date_of_birth=date(1991, 6, 2))
+
+        response = self._get_feed(HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_rotating_token_revokes_old_url(self):
+        """POST issues a new token and the old URL stops working."""
+        old_url = self.feed_url
+        self.client.force_authenticate(self.user)
+        new_url = self.client.post('/api/v1/calendar/feed/').data['feed_url']
+        self.client.force_authenticate(None)
+
+        self.assertNotEqual(new_url, old_url)
+        self.assertEqual(self.client.get(old_url.replace('http://testserver', '')).status_code, 404)
+        self.assertEqual(CalendarFeed.objects.count(), 1)
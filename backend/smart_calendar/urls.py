@@ -13,5 +13,7 @@ urlpatterns = [
     path('reminders/<uuid:reminder_id>/', views.reminder_detail, name='reminder-detail'),
     path('cycles/', views.personal_cycles, name='personal-cycles'),
     path('date-insight/', views.date_insight, name='date-insight'),
+    path('feed/', views.calendar_feed_subscription, name='calendar-feed-subscription'),
+    path('feed/<str:token>.ics', views.calendar_feed_ics, name='calendar-feed-ics'),
 ]
 
@@ -5,9 +5,14 @@ from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from django.http import HttpResponse, HttpResponseNotFound, StreamingHttpResponse
+from django.urls import reverse
 from django.utils import timezone
+from django.views.decorators.http import require_GET
 from datetime import date, timedelta
-from .models import NumerologyEvent, PersonalCycle, AuspiciousDate, CalendarReminder
+import secrets
+from .models import NumerologyEvent, PersonalCycle, AuspiciousDate, CalendarReminder, CalendarFeed
+from .feeds import feed_etag, get_feed_blob, stream_feed
 from .serializers import (
     NumerologyEventSerializer, PersonalCycleSerializer,
     AuspiciousDateSerializer, CalendarReminderSerializer
@@ -254,3 +259,65 @@ def date_insight(request):
     }
     
     return Response(insight, status=status.HTTP_200_OK)
+
+
+@api_view(['GET', 'POST'])
+@permission_classes([IsAuthenticated])
+def calendar_feed_subscription(request):
+    """
+    Get the user's iCalendar subscription URL.
+    POST rotates the secret token, invalidating previously shared URLs.
+    """
+    user = request.user
+    feed = CalendarFeed.objects.filter(user=user).first()
+    
+    if feed is None:
+        feed = CalendarFeed.objects.create(user=user, token=secrets.token_urlsafe(32))
+    elif request.method == 'POST':
+        feed.token = secrets.token_urlsafe(32)
+        feed.save(update_fields=['token', 'rotated_at'])
+    
+    url = request.build_absolute_uri(
+        reverse('smart_calendar:calendar-feed-ics', kwargs={'token': feed.token})
+    )
+    return Response({
+        'feed_url': url,
+        'webcal_url': 'webcal://' + url.split('://', 1)[-1],
+        'rotated_at': feed.rotated_at
+    }, status=status.HTTP_200_OK)
+
+
+@require_GET
+def calendar_feed_ics(request, token):
+    """
+    Serve a user's personal cycle calendar (token-authenticated).
+    Calendar clients poll this; unchanged feeds are answered with 304.
+    """
+    feed = CalendarFeed.objects.filter(token=token).select_related('user__profile').first()
+    if feed is None:
+        return HttpResponseNotFound('Unknown calendar feed')
+    
+    try:
+        birth_date = feed.user.profile.date_of_birth
+    except AttributeError:
+        birth_date = None
+    if not birth_date:
+        return HttpResponseNotFound('Birth date is required for the calendar feed')
+    
+    year = timezone.now().year
+    etag = feed_etag(str(feed.user_id), birth_date, year)
+    headers = {
+        'ETag': etag,
+        'Cache-Control': 'private, max-age=3600',
+    }
+    
+    if_none_match = request.headers.get('If-None-Match', '')
+    if etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*':
+        response = HttpResponse(status=304)
+    else:
+        blob = get_feed_blob(str(feed.user_id), birth_date, year)
+        response = StreamingHttpResponse(stream_feed(blob), content_type='text/calendar; charset=utf-8')
+        response['Content-Disposition'] = 'inline; filename="personal-cycles.ics"'
+    for header, value in headers.items():
+        response[header] = value
+    return response
@@ -56,6 +56,18 @@ python manage.py collectstatic --noinput || {
   echo "WARNING: Collectstatic failed, but continuing..."
 }
 
-echo "Starting Gunicorn on port ${PORT:-8000}..."
-exec gunicorn --bind 0.0.0.0:${PORT:-8000} --workers 4 --threads 2 --timeout 120 --access-logfile - --error-logfile - numerai.wsgi:application
+echo "Building birth-date feature table..."
+python manage.py build_date_features || {
+  echo "WARNING: Feature table build failed, dates will be computed live..."
+}
+
+echo "Building encyclopedia retrieval index..."
+python manage.py ingest_numerology_encyclopedia || {
+  echo "WARNING: Retrieval index build failed, prompts will run without reference material..."
+}
+
+# Served over ASGI so streamed chat replies and websockets are not buffered;
+# gunicorn keeps several worker processes, each running one uvicorn event loop
+echo "Starting Gunicorn (uvicorn workers) on port ${PORT:-8000}..."
+exec gunicorn --bind 0.0.0.0:${PORT:-8000} --workers 4 --worker-class uvicorn.workers.UvicornWorker --timeout 120 --access-logfile - --error-logfile - numerai.asgi:application
 
@@ -0,0 +1,20 @@
+"""
+Import-time budget for web and worker cold starts.
+"""
+import pytest
+
+from numerology.tests.test_import_time import SCENARIOS, measure_imports
+
+# Generous multiples of the measured cold start, to catch regressions such as
+# an eager import of a heavy library rather than machine-to-machine noise
+IMPORT_BUDGET_MS = {
+    'web': 3000,
+    'worker': 2500,
+}
+
+
+@pytest.mark.parametrize('scenario', sorted(IMPORT_BUDGET_MS))
+def test_cold_start_import_budget(scenario):
+    """Importing what a fresh process needs stays within its budget."""
+    total_ms, _ = measure_imports(SCENARIOS[scenario])
+    assert total_ms < IMPORT_BUDGET_MS[scenario], f'{scenario} cold start spent {total_ms:.0f}ms importing modules'
@@ -0,0 +1,108 @@
+"""
+Timing checks for numerology kernels and services.
+
+Wall-clock budgets are noisy on shared CI runners, so these live outside
+the configured testpaths; run them with ``pytest tests/performance``.
+Result equivalence is covered by the unit tests of each module.
+"""
+import shutil
+import time
+from datetime import date, timedelta
+
+from numerology.name_kernel import get_letter_table
+from numerology.name_normalizer import NameNormalizer
+from numerology.name_numerology import TRANSLITERATION_MAP
+from numerology.numerology import NumerologyCalculator
+from numerology.phone_ranking import expand_candidate_range, rank_phone_candidates
+from numerology.rag_ingestion import ENCYCLOPEDIA_PATH, get_vector_index, ingest_numerology_data
+from numerology.services.timing_numerology import TimingNumerologyService
+from numerology.tests.test_name_kernel import _corpus, _ScanningReference
+from numerology.tests.test_name_normalization import SCRIPTS, _mixed_script_corpus, _reference
+
+
+def test_rag_search_latency(tmp_path):
+    """Lookups stay well under a millisecond."""
+    source = tmp_path / 'encyclopedia.json'
+    shutil.copy(ENCYCLOPEDIA_PATH, source)
+    ingest_numerology_data(source, tmp_path / 'index')
+    index = get_vector_index(tmp_path / 'index')
+    index.search('warm up')
+
+    runs = 200
+    start = time.perf_counter()
+    for _ in range(runs):
+        index.search('how to reduce numbers and keep master numbers', top_k=4,
+                     filter={'section': 'algorithms'})
+    assert (time.perf_counter() - start) / runs < 0.001
+
+
+def test_ten_thousand_phone_candidates_rank_quickly():
+    """Ranking 10k candidates stays well under a second."""
+    candidates = expand_candidate_range('+1415555', '0000', '9999')
+
+    started = time.perf_counter()
+    rank_phone_candidates(candidates, owner_e164='+14155552671', preferred_numbers=[5], top_k=10)
+    assert time.perf_counter() - started < 1.0
+
+
+def test_ten_people_full_year_joint_dates_is_fast():
+    """A 10-person, 365-day search runs in milliseconds."""
+    service = TimingNumerologyService()
+    people = [
+        {'name': f'Person {i}', 'birth_date': date(1950, 1, 1) + timedelta(days=1999 * i)}
+        for i in range(10)
+    ]
+    service.find_joint_dates(people, 'business_launch', date(2026, 1, 1), date(2026, 1, 7))
+
+    started = time.perf_counter()
+    service.find_joint_dates(people, 'business_launch', date(2026, 1, 1), date(2026, 12, 31))
+    assert time.perf_counter() - started < 0.1
+
+
+def _rescan(reference, name):
+    """The letter scans calculate_all used to make: six sums, three histograms and the initials."""
+    for vowels_only, consonants_only in ((False, False), (True, False), (False, True)) * 2:
+        reference.sum_name(name, vowels_only=vowels_only, consonants_only=consonants_only)
+    for _ in range(3):
+        reference.counts(name)
+    reference.sum_name(''.join(word[0] for word in name.split()))
+
+
+def test_name_kernel_outpaces_repeated_scans():
+    """On a 20k-name corpus one pass is several times faster than calculate_all's rescans."""
+    calculator = NumerologyCalculator('pythagorean')
+    reference = _ScanningReference(calculator)
+    table = get_letter_table(calculator.letter_values)
+    names = _corpus(20000, seed=5)
+
+    started = time.perf_counter()
+    for name in names:
+        profile = table.analyze(name)
+        profile.total, profile.vowel_total, profile.consonant_total, profile.value_counts
+    kernel_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for name in names:
+        _rescan(reference, name)
+    scan_time = time.perf_counter() - started
+
+    assert kernel_time * 2 < scan_time
+
+
+def test_name_normalization_throughput():
+    """Over a mixed-script corpus the compiled engine is several times faster than the original pipeline."""
+    names = _mixed_script_corpus(20000, seed=3)
+    normalizer = NameNormalizer(TRANSLITERATION_MAP, cache_size=0)
+    normalizer.normalize(''.join(SCRIPTS))
+
+    started = time.perf_counter()
+    for name in names:
+        normalizer.normalize(name)
+    engine_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for name in names:
+        _reference(name, TRANSLITERATION_MAP)
+    reference_time = time.perf_counter() - started
+
+    assert engine_time * 2 < reference_time
@@ -1,4 +1,18 @@
-from .exceptions import custom_exception_handler
-from .notifications import send_push_notification
+import importlib
 
-__all__ = ['custom_exception_handler', 'send_push_notification']
\ No newline at end of file
+# Loaded on first access: utils.notifications pulls in the Firebase SDK
+_EXPORTS = {
+    'custom_exception_handler': 'exceptions',
+    'send_push_notification': 'notifications',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'{__name__}.{module}'), name)
+    globals()[name] = value
+    return value
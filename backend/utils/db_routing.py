@@ -0,0 +1,172 @@
+"""
+Read-replica routing with read-your-writes consistency.
+
+Databases named ``replica_*`` (built from DATABASE_REPLICA_URLS) serve reads
+of safe-method (GET/HEAD/OPTIONS) requests made by authenticated users;
+everything else uses the primary ``default`` database:
+
+- writes, and reads inside a transaction or after the request wrote;
+- reads before the user is authenticated, so a freshly issued token is
+  never checked against a lagging replica;
+- Celery tasks, management commands and other code outside a request.
+
+A request that writes pins its user to the primary for
+DATABASE_REPLICA_STICKY_SECONDS, tracked in the shared Django cache (Redis
+in production), so the pages they load next show their own changes.
+
+``primary_db()`` forces the primary for a block or view, e.g. to poll
+progress written by a worker; ``replica_db()`` sends a block's reads to a
+replica wherever it runs, e.g. for lag-tolerant analytics aggregates.
+"""
+import logging
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+logger = logging.getLogger(__name__)
+
+REPLICA_PREFIX = 'replica_'
+STICKY_PREFIX = 'db_routing:primary'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class _RequestState:
+    """Routing state of the request being handled."""
+    __slots__ = ('request', 'replica', 'wrote', 'pinned', 'resolving')
+
+    def __init__(self, request, replica: Optional[str]):
+        self.request = request
+        # Replica for this request's reads, or None if it must use the primary
+        self.replica = replica
+        self.wrote = False
+        self.pinned = None
+        self.resolving = False
+
+
+_request_state: ContextVar[Optional[_RequestState]] = ContextVar('db_routing_request', default=None)
+# Alias every read in the current block goes to, set by primary_db() / replica_db()
+_forced_alias: ContextVar[Optional[str]] = ContextVar('db_routing_forced', default=None)
+
+
+def replica_aliases() -> List[str]:
+    return [alias for alias in connections if alias.startswith(REPLICA_PREFIX)]
+
+
+def _sticky_key(user_id) -> str:
+    return f"{STICKY_PREFIX}:{user_id}"
+
+
+def pin_to_primary(user_id) -> None:
+    """Send ``user_id``'s reads to the primary for the sticky window."""
+    try:
+        cache.set(_sticky_key(user_id), 1, settings.DATABASE_REPLICA_STICKY_SECONDS)
+    except Exception as e:
+        logger.warning(f"Could not pin user {user_id} to the primary database: {str(e)}")
+
+
+def is_pinned_to_primary(user_id) -> bool:
+    try:
+        return cache.get(_sticky_key(user_id)) is not None
+    except Exception as e:
+        # Without the pin we cannot promise read-your-writes
+        logger.warning(f"Could not read primary database pin for user {user_id}: {str(e)}")
+        return True
+
+
+@contextmanager
+def primary_db():
+    """Send reads to the primary database; usable as a decorator."""
+    token = _forced_alias.set(DEFAULT_DB_ALIAS)
+    try:
+        yield
+    finally:
+        _forced_alias.reset(token)
+
+
+@contextmanager
+def replica_db():
+    """Send reads to a replica, if any is configured; usable as a decorator."""
+    replicas = replica_aliases()
+    token = _forced_alias.set(random.choice(replicas) if replicas else DEFAULT_DB_ALIAS)
+    try:
+        yield
+    finally:
+        _forced_alias.reset(token)
+
+
+def _request_read_alias(state: _RequestState) -> Optional[str]:
+    if state.replica is None or state.wrote or state.resolving:
+        return None
+    if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+        return None
+    if state.pinned is None:
+        # Resolving a lazy session user runs queries; route those to the primary
+        state.resolving = True
+        try:
+            user = getattr(state.request, 'user', None)
+            if user is None or not user.is_authenticated:
+                return None
+            state.pinned = is_pinned_to_primary(user.pk)
+        finally:
+            state.resolving = False
+    return None if state.pinned else state.replica
+
+
+class ReplicaRouter:
+    """Database router sending eligible reads to the replicas."""
+
+    def db_for_read(self, model, **hints):
+        forced = _forced_alias.get()
+        if forced is not None:
+            return forced
+        state = _request_state.get()
+        if state is None:
+            return None
+        return _request_read_alias(state)
+
+    def db_for_write(self, model, **hints):
+        state = _request_state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        pool = {DEFAULT_DB_ALIAS, *replica_aliases()}
+        if obj1._state.db in pool and obj2._state.db in pool:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db.startswith(REPLICA_PREFIX):
+            return False
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Make safe-method requests eligible for replica reads and pin users whose
+    requests wrote to the primary.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        replicas = replica_aliases()
+        replica = random.choice(replicas) if replicas and request.method in SAFE_METHODS else None
+        state = _RequestState(request, replica)
+        token = _request_state.set(state)
+        try:
+            return self.get_response(request)
+        finally:
+            _request_state.reset(token)
+            if state.wrote and replicas:
+                user = getattr(request, 'user', None)
+                if user is not None and user.is_authenticated:
+                    pin_to_primary(user.pk)
@@ -0,0 +1,49 @@
+"""
+Lightweight counters backed by the Django cache.
+
+Counters live in the shared cache (Redis in production) so values from all
+web and Celery workers are aggregated. Recording a metric never raises; a
+cache outage only loses the sample.
+"""
+import logging
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = 'metrics'
+# Counters roll over after 30 days without updates.
+METRIC_TTL = 60 * 60 * 24 * 30
+
+
+def _metric_key(name, tags):
+    key = f"{METRIC_PREFIX}:{name}"
+    for tag, value in sorted(tags.items()):
+        key += f":{tag}={value}"
+    return key
+
+
+def increment(name, value=1, **tags):
+    """Add ``value`` to the counter ``name`` (optionally split by tags)."""
+    key = _metric_key(name, tags)
+    try:
+        if not cache.add(key, value, METRIC_TTL):
+            cache.incr(key, value)
+    except ValueError:
+        # Key expired between add() and incr().
+        cache.set(key, value, METRIC_TTL)
+    except Exception as e:
+        logger.debug(f"Failed to record metric {key}: {str(e)}")
+
+
+def observe(name, value, **tags):
+    """Record one sample of a distribution as count and integer sum."""
+    increment(f"{name}.count", 1, **tags)
+    increment(f"{name}.sum", int(round(value)), **tags)
+
+
+def get_metric(name, **tags):
+    """Return the current value of a counter (0 if never recorded)."""
+    try:
+        return cache.get(_metric_key(name, tags), 0)
+    except Exception:
+        return 0
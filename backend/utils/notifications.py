@@ -2,16 +2,32 @@
 Utility functions for notifications in NumerAI.
 """
 import os
-import firebase_admin
-from firebase_admin import messaging
+import threading
 from django.conf import settings
 from django.utils import timezone
 from accounts.models import DeviceToken, Notification
 
+_firebase_lock = threading.Lock()
+_firebase_initialized = False
 
-# Initialize Firebase Admin SDK if credentials exist
-if os.path.exists(settings.FIREBASE_CREDENTIALS_PATH):
-    firebase_admin.initialize_app()
+
+def _firebase_messaging():
+    """
+    Import the Firebase Admin SDK and initialize it if credentials exist.
+
+    Deferred to the first push so processes that never send one (most web
+    and worker processes) start without loading the SDK.
+    """
+    global _firebase_initialized
+    import firebase_admin
+    from firebase_admin import messaging
+
+    with _firebase_lock:
+        if not _firebase_initialized:
+            if os.path.exists(settings.FIREBASE_CREDENTIALS_PATH):
+                firebase_admin.initialize_app()
+            _firebase_initialized = True
+    return messaging
 
 
 def send_push_notification(user, title, body, data=None):
@@ -34,6 +50,7 @@ def send_push_notification(user, title, body, data=None):
         return False
     
     # Create notification message
+    messaging = _firebase_messaging()
     message = messaging.MulticastMessage(
         notification=messaging.Notification(
             title=title,
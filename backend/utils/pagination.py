@@ -0,0 +1,197 @@
+"""
+Keyset (cursor) pagination for user history endpoints.
+
+Offset pagination makes the database read and discard every row before the
+requested page, and the accompanying ``count()`` scans the whole history
+again. KeysetPagination instead orders by ``(<timestamp field>, pk)`` and
+continues from the last row it returned, so with a matching composite index
+(e.g. ``(user, created_at, id)``) every page costs the same as the first.
+
+Cursors are opaque, URL-safe tokens; clients pass back ``next_cursor`` or
+``previous_cursor`` as ``?cursor=``. The first page keeps the exact
+``count`` these endpoints have always returned (``?count=none`` skips it);
+pages reached by cursor only count when asked with ``?count=exact`` or
+``?count=approximate`` (a planner estimate on PostgreSQL).
+
+Requests that still send ``?page=`` without a cursor get the previous
+offset behaviour and exact ``count``, plus a ``next_cursor`` to move to.
+"""
+import base64
+import json
+import logging
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+logger = logging.getLogger(__name__)
+
+
+def encode_cursor(direction, value, pk):
+    """Encode a page position as an opaque token."""
+    payload = json.dumps({'d': direction, 'v': value, 'pk': pk}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token):
+    """Decode a token from encode_cursor; raises ValidationError if it is malformed."""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        if payload['d'] not in ('next', 'prev'):
+            raise ValueError(payload['d'])
+        return payload['d'], payload['v'], payload['pk']
+    except (ValueError, TypeError, KeyError, UnicodeError):
+        raise ValidationError({'cursor': 'Invalid cursor.'})
+
+
+def estimate_count(queryset):
+    """
+    Planner row estimate for ``queryset`` on PostgreSQL; exact count elsewhere.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return queryset.count()
+    sql, params = queryset.order_by().values('pk').query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class KeysetPagination:
+    """
+    Paginate a queryset by ``(ordering_field, pk)``.
+
+    Mirrors the DRF paginator interface used elsewhere in the project::
+
+        paginator = KeysetPagination('created_at')
+        page = paginator.paginate_queryset(queryset, request)
+        serializer = MySerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+    """
+    page_size = 10
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    count_query_param = 'count'
+    legacy_page_query_param = 'page'
+
+    def __init__(self, ordering_field, descending=True, page_size=None):
+        self.ordering_field = ordering_field
+        self.descending = descending
+        if page_size is not None:
+            self.page_size = page_size
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def _ordering(self, ascending):
+        prefix = '' if ascending else '-'
+        return [f'{prefix}{self.ordering_field}', f'{prefix}pk']
+
+    def _after(self, queryset, value, pk, ascending):
+        field = queryset.model._meta.get_field(self.ordering_field)
+        try:
+            value = field.to_python(value)
+            pk = queryset.model._meta.pk.to_python(pk)
+        except (DjangoValidationError, ValueError, TypeError):
+            raise ValidationError({'cursor': 'Invalid cursor.'})
+        if value is None or pk is None:
+            raise ValidationError({'cursor': 'Invalid cursor.'})
+        strict, bound = ('gt', 'gte') if ascending else ('lt', 'lte')
+        # (field, pk) > (value, pk) written so the leading bound can use the index
+        return queryset.filter(
+            Q(**{f'{self.ordering_field}__{bound}': value}),
+            Q(**{f'{self.ordering_field}__{strict}': value}) | Q(**{f'pk__{strict}': pk}),
+        )
+
+    def _position(self, direction, obj):
+        value = getattr(obj, self.ordering_field)
+        value = value.isoformat() if hasattr(value, 'isoformat') else value
+        return encode_cursor(direction, value, str(obj.pk))
+
+    def paginate_queryset(self, queryset, request):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.page = None
+        self.count = None
+
+        token = request.query_params.get(self.cursor_query_param)
+        legacy_page = request.query_params.get(self.legacy_page_query_param)
+        if not token and legacy_page:
+            return self._paginate_offset(queryset, legacy_page)
+
+        direction, value, pk = decode_cursor(token) if token else ('next', None, None)
+        forward = direction == 'next'
+        ascending = (not self.descending) == forward
+        page_queryset = queryset.order_by(*self._ordering(ascending))
+        if token:
+            page_queryset = self._after(page_queryset, value, pk, ascending)
+
+        rows = list(page_queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if not forward:
+            rows.reverse()
+
+        has_next = has_more if forward else True
+        has_previous = bool(token) if forward else has_more
+        self.next_cursor = self._position('next', rows[-1]) if rows and has_next else None
+        self.previous_cursor = self._position('prev', rows[0]) if rows and has_previous else None
+
+        count_mode = request.query_params.get(self.count_query_param, None if token else 'exact')
+        if count_mode == 'exact':
+            self.count = queryset.count()
+        elif count_mode == 'approximate':
+            self.count = estimate_count(queryset)
+        return rows
+
+    def _paginate_offset(self, queryset, page):
+        try:
+            self.page = max(1, int(page))
+        except (TypeError, ValueError):
+            self.page = 1
+        start = (self.page - 1) * self.page_size
+        ordered = queryset.order_by(*self._ordering(not self.descending))
+        rows = list(ordered[start:start + self.page_size + 1])
+        has_next = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        self.next_cursor = self._position('next', rows[-1]) if rows and has_next else None
+        self.previous_cursor = None
+        self.count = queryset.count()
+        return rows
+
+    def _link(self, cursor):
+        if cursor is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.legacy_page_query_param)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_data(self, data):
+        """Response body for one page of serialized ``data``."""
+        payload = {
+            'next': self._link(self.next_cursor),
+            'previous': self._link(self.previous_cursor),
+            'next_cursor': self.next_cursor,
+            'previous_cursor': self.previous_cursor,
+            'page_size': self.page_size,
+        }
+        if self.page is not None:
+            payload['page'] = self.page
+        if self.count is not None:
+            payload['count'] = self.count
+        payload['results'] = data
+        return payload
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
@@ -0,0 +1,129 @@
+"""
+Distributed single-flight for expensive, idempotent work.
+
+When many requests miss the cache for the same key at once (a cold cache,
+a popular daily reading), only the first caller runs the work; the others
+wait for its result instead of repeating it. Coordination goes through the
+shared Django cache (Redis in production): ``cache.add`` is an atomic
+SET NX, so it doubles as a lease that expires if its holder dies.
+"""
+import hashlib
+import logging
+import random
+import time
+import uuid
+from django.core.cache import cache
+
+from utils import metrics
+
+logger = logging.getLogger(__name__)
+
+LEASE_PREFIX = 'single_flight:lease'
+RESULT_PREFIX = 'single_flight:result'
+# A lease outlives the slowest LLM call; a crashed holder frees it after this.
+LEASE_TTL = 60
+# Followers only need the result long enough to pick it up.
+RESULT_TTL = 60
+WAIT_TIMEOUT = 90
+POLL_INTERVAL = 0.05
+MAX_POLL_INTERVAL = 1.0
+
+_MISSING = object()
+
+
+def _digest(key):
+    return hashlib.sha256(str(key).encode('utf-8')).hexdigest()
+
+
+def _lease_key(key):
+    return f"{LEASE_PREFIX}:{_digest(key)}"
+
+
+def _result_key(key, token):
+    return f"{RESULT_PREFIX}:{_digest(key)}:{token}"
+
+
+def _run_as_leader(key, token, compute, operation, result_ttl):
+    lease_key = _lease_key(key)
+    metrics.increment('single_flight.leader', operation=operation)
+    try:
+        result = compute()
+        cache.set(_result_key(key, token), result, result_ttl)
+        return result
+    finally:
+        # Only release our own lease; it may have expired and been taken over.
+        if cache.get(lease_key) == token:
+            cache.delete(lease_key)
+
+
+def single_flight(
+    key,
+    compute,
+    operation='default',
+    lease_ttl=LEASE_TTL,
+    result_ttl=RESULT_TTL,
+    wait_timeout=WAIT_TIMEOUT,
+    poll_interval=POLL_INTERVAL,
+):
+    """
+    Run ``compute()`` once per ``key`` across all concurrent callers.
+
+    The caller that acquires the lease computes and publishes the result;
+    everyone else polls for that result. If the lease disappears without a
+    result (the leader failed or its lease expired), a waiting caller takes
+    it over. A caller that waits longer than ``wait_timeout`` computes on
+    its own so a stuck leader never blocks requests indefinitely.
+
+    Args:
+        key: Identifies the work (e.g. an explanation cache key)
+        compute: Zero-argument callable producing a picklable result
+        operation: Metric tag identifying the call site
+        lease_ttl: Seconds before an unreleased lease can be taken over
+        result_ttl: Seconds the leader's result stays available to followers
+        wait_timeout: Seconds a follower waits before computing itself
+        poll_interval: Initial delay between polls (doubles up to 1s)
+
+    Returns:
+        The result of ``compute()``, possibly produced by another caller
+    """
+    lease_key = _lease_key(key)
+    token = uuid.uuid4().hex
+    try:
+        acquired = cache.add(lease_key, token, lease_ttl)
+    except Exception as e:
+        logger.warning(f"Single-flight lease unavailable for {operation}: {str(e)}")
+        return compute()
+    if acquired:
+        return _run_as_leader(key, token, compute, operation, result_ttl)
+
+    deadline = time.monotonic() + wait_timeout
+    delay = poll_interval
+    leader_token = cache.get(lease_key)
+    while time.monotonic() < deadline:
+        if leader_token is not None:
+            result = cache.get(_result_key(key, leader_token), _MISSING)
+            if result is not _MISSING:
+                metrics.increment('single_flight.coalesced', operation=operation)
+                return result
+
+        current = cache.get(lease_key)
+        if current is None:
+            # The leader may have published just before releasing the lease.
+            if leader_token is not None:
+                result = cache.get(_result_key(key, leader_token), _MISSING)
+                if result is not _MISSING:
+                    metrics.increment('single_flight.coalesced', operation=operation)
+                    return result
+            if cache.add(lease_key, token, lease_ttl):
+                logger.info(f"Taking over abandoned single-flight lease for {operation}")
+                metrics.increment('single_flight.takeover', operation=operation)
+                return _run_as_leader(key, token, compute, operation, result_ttl)
+            current = cache.get(lease_key)
+        leader_token = current
+
+        time.sleep(delay * random.uniform(0.5, 1.5))
+        delay = min(delay * 2, MAX_POLL_INTERVAL)
+
+    logger.warning(f"Timed out waiting for single-flight result for {operation}")
+    metrics.increment('single_flight.timeout', operation=operation)
+    return compute()
@@ -0,0 +1,60 @@
+"""
+Queue latency of Celery tasks.
+
+Publishers stamp every task message with its publish time. When a worker
+starts the task, the time it waited in the broker is recorded as the
+``celery.queue_latency_ms`` distribution, tagged by queue and task. Tasks
+with an ETA or countdown are measured from the time they became due.
+"""
+import logging
+import time
+from datetime import datetime
+
+from celery.signals import before_task_publish, task_prerun
+
+from utils import metrics
+
+logger = logging.getLogger(__name__)
+
+PUBLISHED_AT_HEADER = 'published_at'
+
+
+@before_task_publish.connect
+def stamp_publish_time(headers=None, **kwargs):
+    # Retries are published again and restamped
+    if headers is not None:
+        headers[PUBLISHED_AT_HEADER] = time.time()
+
+
+def queue_latency_ms(request, now=None):
+    """
+    Milliseconds between a task becoming due and ``now``.
+
+    Returns:
+        Latency, or None if the message carries no publish time (e.g. eager
+        execution or a publisher without this module)
+    """
+    published_at = request.get(PUBLISHED_AT_HEADER)
+    if published_at is None:
+        return None
+    due_at = float(published_at)
+    eta = request.eta
+    if eta:
+        if isinstance(eta, str):
+            eta = datetime.fromisoformat(eta)
+        due_at = max(due_at, eta.timestamp())
+    # Clocks of publisher and worker hosts may disagree slightly
+    return max(0.0, ((now or time.time()) - due_at) * 1000)
+
+
+@task_prerun.connect
+def record_queue_latency(task=None, **kwargs):
+    try:
+        latency = queue_latency_ms(task.request)
+    except (TypeError, ValueError) as e:
+        logger.debug(f"Invalid publish time on task {task.name}: {str(e)}")
+        return
+    if latency is None:
+        return
+    queue = (task.request.delivery_info or {}).get('routing_key') or 'unknown'
+    metrics.observe('celery.queue_latency_ms', latency, queue=queue, task=task.name)